@@ -1,10 +1,16 @@
+import warnings
+
 import pytest
 
 import numpy as np
 import pandas as pd
 import torch
 
-from ray.air.utils.torch_utils import convert_pandas_to_torch_tensor, load_torch_model
+from ray.air.utils.torch_utils import (
+    convert_ndarray_batch_to_torch_tensor,
+    convert_pandas_to_torch_tensor,
+    load_torch_model,
+)
 
 data_batch = pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]})
 
@@ -73,6 +79,32 @@ class TestConvertPandasToTorch:
             )
 
 
+class TestConvertNdarrayBatchToTorch:
+    def test_writeable_shares_memory(self):
+        arr = np.arange(4)
+        tensor = convert_ndarray_batch_to_torch_tensor({"A": arr}, unsqueeze=False)
+        tensor += 1
+        assert np.array_equal(arr, np.arange(1, 5))
+
+    def test_read_only_shares_memory(self):
+        arr = np.arange(4)
+        arr.flags.writeable = False
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            tensor = convert_ndarray_batch_to_torch_tensor({"A": arr}, unsqueeze=False)
+        assert tensor.data_ptr() == arr.ctypes.data
+
+    def test_copy(self):
+        arr = np.arange(4)
+        arr.flags.writeable = False
+        tensor = convert_ndarray_batch_to_torch_tensor(
+            {"A": arr}, unsqueeze=False, copy=True
+        )
+        tensor += 1
+        assert np.array_equal(tensor.numpy(), np.arange(1, 5))
+        assert np.array_equal(arr, np.arange(4))
+
+
 torch_module = torch.nn.Linear(1, 1)
 
 
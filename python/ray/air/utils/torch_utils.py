@@ -1,5 +1,7 @@
+import warnings
 from typing import Optional, Union, List, Dict
 
+import numpy as np
 import pandas as pd
 import torch
 
@@ -101,6 +103,89 @@ def convert_pandas_to_torch_tensor(
         return get_tensor_for_columns(columns=columns, dtype=column_dtypes)
 
 
+def convert_ndarray_batch_to_torch_tensor(
+    data_batch: Dict[str, np.ndarray],
+    columns: Optional[Union[List[str], List[List[str]]]] = None,
+    column_dtypes: Optional[Union[torch.dtype, List[torch.dtype]]] = None,
+    unsqueeze: bool = True,
+    copy: bool = False,
+) -> Union[torch.Tensor, List[torch.Tensor]]:
+    """Converts a dict of ndarrays to a torch Tensor or list of torch Tensors.
+
+    This is the same as ``convert_pandas_to_torch_tensor``, but for a batch of
+    columns in ``Dict[str, np.ndarray]`` format. Unless ``copy`` is set, if the
+    ndarrays already have the requested dtype and only one column is selected per
+    tensor, the tensors share memory with the ndarrays instead of copying them.
+    This includes read-only ndarrays, such as zero-copy views of blocks in the
+    object store, so such tensors must not be modified in-place.
+
+    Args:
+        data_batch: A dict of column name to ndarray of the column values.
+        columns: The names of the columns to include in the torch tensor. If this
+            arg is a List[List[str]], then the return type will be a List of
+            tensors. If None, then use all columns in the ``data_batch``.
+        column_dtypes: The torch dtype to use for the tensor. If set to None,
+            then automatically infer the dtype.
+        unsqueeze: If set to True, the tensors will be unsqueezed (reshaped to
+            (N, 1)) before being concatenated into the final tensor. Otherwise,
+            they will be left as is, that is (N, ). Defaults to True.
+        copy: If set to True, the tensors never share memory with the ndarrays,
+            so they can be safely modified in-place. Defaults to False.
+
+    Returns:
+        Either a torch tensor of size (N, len(columns)) where N is the number of
+        rows in the ``data_batch``, or a list of tensors, where the size of item i
+        is (N, len(columns[i])).
+    """
+
+    multi_input = columns and (isinstance(columns[0], (list, tuple)))
+
+    if not multi_input and column_dtypes and type(column_dtypes) != torch.dtype:
+        raise TypeError(
+            "If `columns` is a list of strings, "
+            "`column_dtypes` must be None or a single `torch.dtype`."
+            f"Got {type(column_dtypes)} instead."
+        )
+
+    def tensorize(vals, dtype):
+        if isinstance(vals, np.ndarray) and vals.dtype != object:
+            if copy:
+                return torch.tensor(vals, dtype=dtype)
+            with warnings.catch_warnings():
+                # Torch warns when wrapping read-only ndarrays, e.g. views of blocks
+                # in the object store, which are documented as not to be mutated.
+                warnings.filterwarnings(
+                    "ignore", message="The given NumPy array is not writ"
+                )
+                return torch.as_tensor(vals, dtype=dtype)
+        # Ragged or nested values, which we assume are sequences.
+        return torch.stack([tensorize(np.asarray(x), dtype) for x in vals])
+
+    def get_tensor_for_columns(columns, dtype):
+        feature_tensors = []
+        for col in columns or list(data_batch):
+            t = tensorize(data_batch[col], dtype=dtype)
+            if unsqueeze:
+                t = t.unsqueeze(1)
+            feature_tensors.append(t)
+
+        if len(feature_tensors) > 1:
+            feature_tensor = torch.cat(feature_tensors, dim=1)
+        else:
+            feature_tensor = feature_tensors[0]
+        return feature_tensor
+
+    if multi_input:
+        if type(column_dtypes) not in [list, tuple]:
+            column_dtypes = [column_dtypes] * len(columns)
+        return [
+            get_tensor_for_columns(columns=subcolumns, dtype=dtype)
+            for subcolumns, dtype in zip(columns, column_dtypes)
+        ]
+    else:
+        return get_tensor_for_columns(columns=columns, dtype=column_dtypes)
+
+
 def load_torch_model(
     saved_model: Union[torch.nn.Module, Dict],
     model_definition: Optional[torch.nn.Module] = None,
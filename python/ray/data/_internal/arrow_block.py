@@ -10,6 +10,7 @@ from typing import (
     Any,
     TypeVar,
     Optional,
+    Union,
     TYPE_CHECKING,
 )
 
@@ -30,12 +31,14 @@ from ray.data.block import (
     KeyType,
 )
 from ray.data.row import TableRow
+from ray.data._internal.hash_partition import hash_partition_indices
 from ray.data._internal.table_block import TableBlockAccessor, TableBlockBuilder
 from ray.data.aggregate import AggregateFn
 
 if TYPE_CHECKING:
     import pandas
     from ray.data._internal.sort import SortKeyT
+    from ray.data.expressions import Expr
 
 T = TypeVar("T")
 
@@ -73,10 +76,10 @@ class ArrowBlockBuilder(TableBlockBuilder[T]):
         super().__init__(pyarrow.Table)
 
     def _table_from_pydict(self, columns: Dict[str, List[Any]]) -> Block:
-        return pyarrow.Table.from_pydict(columns)
+        return pyarrow.Table.from_pydict(_tensor_columns_to_arrow(columns))
 
     def _concat_tables(self, tables: List[Block]) -> Block:
-        return pyarrow.concat_tables(tables, promote=True)
+        return _concat_tables(tables)
 
     @staticmethod
     def _empty_table() -> "pyarrow.Table":
@@ -103,6 +106,26 @@ class ArrowBlockAccessor(TableBlockAccessor):
             view = _copy_table(view)
         return view
 
+    def select(self, columns: List[str]) -> "pyarrow.Table":
+        return self._table.select(columns)
+
+    def filter(self, predicate: "Expr") -> "pyarrow.Table":
+        mask = predicate.eval_arrow(self._table)
+        if not isinstance(mask, (pyarrow.Array, pyarrow.ChunkedArray)):
+            # Constant predicate.
+            return self._table if mask else self._table.slice(0, 0)
+        return self._table.filter(mask)
+
+    def with_column(self, name: str, expr: "Expr") -> "pyarrow.Table":
+        value = expr.eval_arrow(self._table)
+        if not isinstance(value, (pyarrow.Array, pyarrow.ChunkedArray)):
+            # Broadcast constant values.
+            value = pyarrow.array([value] * self.num_rows())
+        index = self._table.schema.get_field_index(name)
+        if index >= 0:
+            return self._table.set_column(index, name, value)
+        return self._table.append_column(name, value)
+
     def random_shuffle(self, random_seed: Optional[int]) -> "pyarrow.Table":
         random = np.random.RandomState(random_seed)
         return self._table.take(random.permutation(self.num_rows()))
@@ -111,7 +134,21 @@ class ArrowBlockAccessor(TableBlockAccessor):
         return self._table.schema
 
     def to_pandas(self) -> "pandas.DataFrame":
-        return self._table.to_pandas()
+        from ray.data.extensions import ArrowVariableShapedTensorType
+
+        ragged = [
+            name
+            for name, type_ in zip(self._table.column_names, self._table.schema.types)
+            if isinstance(type_, ArrowVariableShapedTensorType)
+        ]
+        if not ragged:
+            return self._table.to_pandas()
+        # Pandas has no extension type for variable-shaped tensors, so these
+        # are converted to object columns of ndarrays instead.
+        df = self._table.drop(ragged).to_pandas()
+        for name in ragged:
+            df[name] = self.to_numpy(name)
+        return df[self._table.column_names]
 
     def to_numpy(self, column: str = None) -> np.ndarray:
         if column is None:
@@ -125,14 +162,17 @@ class ArrowBlockAccessor(TableBlockAccessor):
                 f"{self._table.column_names}"
             )
         array = self._table[column]
-        if array.num_chunks > 1:
-            # TODO(ekl) combine fails since we can't concat
-            # ArrowTensorType?
-            array = array.combine_chunks()
-        else:
-            assert array.num_chunks == 1, array
-            array = array.chunk(0)
-        return array.to_numpy(zero_copy_only=False)
+        if array.num_chunks == 1:
+            # This is a zero-copy view for tensor columns, and for primitive
+            # columns without nulls.
+            return array.chunk(0).to_numpy(zero_copy_only=False)
+        if isinstance(array.type, pyarrow.ExtensionType) and array.num_chunks > 1:
+            # Arrow can't concatenate extension arrays (e.g. tensor columns), so
+            # copy the views of each chunk into a single output array instead.
+            return np.concatenate(
+                [chunk.to_numpy(zero_copy_only=False) for chunk in array.chunks]
+            )
+        return array.to_numpy()
 
     def to_arrow(self) -> "pyarrow.Table":
         return self._table
@@ -253,47 +293,33 @@ class ArrowBlockAccessor(TableBlockAccessor):
         )
 
     def sort_and_partition(
-        self, boundaries: List[T], key: "SortKeyT", descending: bool
+        self,
+        boundaries: List[T],
+        key: "SortKeyT",
+        descending: bool,
+        null_placement: str = "at_end",
     ) -> List["Block[T]"]:
-        if len(key) > 1:
-            raise NotImplementedError(
-                "sorting by multiple columns is not supported yet"
-            )
+        from ray.data._internal.sort import count_rows_before, sort_indices
 
         if self._table.num_rows == 0:
             # If the pyarrow table is empty we may not have schema
             # so calling sort_indices() will raise an error.
             return [self._empty_table() for _ in range(len(boundaries) + 1)]
 
-        import pyarrow.compute as pac
-
-        indices = pac.sort_indices(self._table, sort_keys=key)
-        table = self._table.take(indices)
+        if isinstance(key, str):
+            key = [(key, "descending" if descending else "ascending")]
+        table = self._table.take(sort_indices(self._table, key, null_placement))
         if len(boundaries) == 0:
             return [table]
 
-        # For each boundary value, count the number of items that are less
-        # than it. Since the block is sorted, these counts partition the items
-        # such that boundaries[i] <= x < boundaries[i + 1] for each x in
-        # partition[i]. If `descending` is true, `boundaries` would also be
-        # in descending order and we only need to count the number of items
-        # *greater than* the boundary value instead.
-        col, _ = key[0]
-        comp_fn = pac.greater if descending else pac.less
-
-        # TODO(ekl) this is O(n^2) but in practice it's much faster than the
-        # O(n) algorithm, could be optimized.
-        boundary_indices = [pac.sum(comp_fn(table[col], b)).as_py() for b in boundaries]
-        ### Compute the boundary indices in O(n) time via scan.  # noqa
-        # boundary_indices = []
-        # remaining = boundaries.copy()
-        # values = table[col]
-        # for i, x in enumerate(values):
-        #     while remaining and not comp_fn(x, remaining[0]).as_py():
-        #         remaining.pop(0)
-        #         boundary_indices.append(i)
-        # for _ in remaining:
-        #     boundary_indices.append(len(values))
+        # For each boundary, count the number of rows that sort before it. Since
+        # the block is sorted, these counts partition the rows such that
+        # boundaries[i] <= x < boundaries[i + 1] in the sort order for each x in
+        # partition[i]. The boundaries are in the sort order of the key, so this
+        # also holds for descending columns.
+        boundary_indices = [
+            count_rows_before(table, key, b, null_placement) for b in boundaries
+        ]
 
         ret = []
         prev_i = 0
@@ -305,6 +331,27 @@ class ArrowBlockAccessor(TableBlockAccessor):
         ret.append(_copy_table(table.slice(prev_i)))
         return ret
 
+    def hash_partition(
+        self, key: Union[str, List[str]], num_partitions: int
+    ) -> List["pyarrow.Table"]:
+        if self.num_rows() == 0:
+            # Empty blocks may not have the key columns.
+            return [self._table] * num_partitions
+        if isinstance(key, str):
+            columns = [self._table.column(key).to_numpy()]
+        elif isinstance(key, list):
+            columns = [self._table.column(k).to_numpy() for k in key]
+        else:
+            raise ValueError(
+                "key must be a column name or a list of column names when hash "
+                f"partitioning Arrow blocks, but got: {type(key)}."
+            )
+        partitions = hash_partition_indices(columns, num_partitions)
+        return [
+            self._table.take(pyarrow.array(indices, type=pyarrow.int64()))
+            for indices in partitions
+        ]
+
     def combine(self, key: KeyFn, aggs: Tuple[AggregateFn]) -> Block[ArrowRow]:
         """Combine rows with the same key into an accumulator.
 
@@ -384,16 +431,27 @@ class ArrowBlockAccessor(TableBlockAccessor):
 
     @staticmethod
     def merge_sorted_blocks(
-        blocks: List[Block[T]], key: "SortKeyT", _descending: bool
+        blocks: List[Block[T]],
+        key: "SortKeyT",
+        _descending: bool,
+        null_placement: str = "at_end",
     ) -> Tuple[Block[T], BlockMetadata]:
+        from ray.data._internal.sort import sort_indices
+
         stats = BlockExecStats.builder()
         blocks = [b for b in blocks if b.num_rows > 0]
         if len(blocks) == 0:
             ret = ArrowBlockAccessor._empty_table()
+        elif len(blocks) == 1:
+            # A single sorted block is already merged.
+            ret = blocks[0]
         else:
-            ret = pyarrow.concat_tables(blocks, promote=True)
-            indices = pyarrow.compute.sort_indices(ret, sort_keys=key)
-            ret = ret.take(indices)
+            if isinstance(key, str):
+                key = [(key, "descending" if _descending else "ascending")]
+            # Arrow has no merge kernel, so merge the sorted runs with a stable
+            # vectorized sort, which keeps all comparisons out of Python.
+            ret = _concat_tables(blocks)
+            ret = ret.take(sort_indices(ret, key, null_placement))
         return ret, ArrowBlockAccessor(ret).get_metadata(None, exec_stats=stats.build())
 
     @staticmethod
@@ -489,6 +547,99 @@ class ArrowBlockAccessor(TableBlockAccessor):
         return ret, ArrowBlockAccessor(ret).get_metadata(None, exec_stats=stats.build())
 
 
+def _tensor_columns_to_arrow(columns: Dict[str, List[Any]]) -> Dict[str, Any]:
+    """Convert the columns of multi-dimensional ndarrays to tensor arrays.
+
+    Arrow can only build list arrays from 1-dimensional ndarrays, so columns of
+    multi-dimensional ndarrays are converted to (possibly variable-shaped) tensor
+    extension arrays instead.
+    """
+    from ray.data.extensions import ArrowTensorArray
+
+    converted = {}
+    for name, values in columns.items():
+        if (
+            values
+            and isinstance(values, list)
+            and all(isinstance(v, np.ndarray) and v.ndim > 1 for v in values)
+        ):
+            values = ArrowTensorArray.from_numpy(values)
+        converted[name] = values
+    return converted
+
+
+def _concat_tables(tables: List["pyarrow.Table"]) -> "pyarrow.Table":
+    """Concatenate the tables, unifying tensor columns of different shapes.
+
+    Blocks built from different batches of variable-shaped tensors may have
+    fixed-shape tensor columns of different shapes, or a mix of fixed-shape and
+    variable-shaped tensor columns. These are converted to variable-shaped tensor
+    columns before concatenating the tables.
+    """
+    from ray.data.extensions import (
+        ArrowTensorType,
+        ArrowVariableShapedTensorArray,
+        ArrowVariableShapedTensorType,
+    )
+
+    tensor_types = (ArrowTensorType, ArrowVariableShapedTensorType)
+    column_types = collections.defaultdict(set)
+    for table in tables:
+        for name, type_ in zip(table.column_names, table.schema.types):
+            column_types[name].add(type_)
+    ragged = [
+        name
+        for name, types in column_types.items()
+        if len(types) > 1 and all(isinstance(t, tensor_types) for t in types)
+    ]
+    if ragged:
+        unified = []
+        # Empty tables don't contribute any tensors to convert.
+        for table in [t for t in tables if t.num_rows > 0]:
+            accessor = ArrowBlockAccessor(table)
+            for name in ragged:
+                index = table.schema.get_field_index(name)
+                if index < 0 or isinstance(
+                    table.schema.types[index], ArrowVariableShapedTensorType
+                ):
+                    continue
+                array = ArrowVariableShapedTensorArray.from_numpy(
+                    list(accessor.to_numpy(name))
+                )
+                table = table.set_column(index, name, array)
+            unified.append(table)
+        tables = unified
+    # Nested values built from empty lists (e.g. the partially combined states of
+    # approximate aggregations for groups without values) have null-typed
+    # children. Cast these to the type of the other tables.
+    for name, types in column_types.items():
+        if name in ragged or len(types) < 2:
+            continue
+        complete = [t for t in types if not _has_null_type(t)]
+        if len(complete) != 1:
+            continue
+        [target] = complete
+        unified = []
+        for table in tables:
+            index = table.schema.get_field_index(name)
+            if index >= 0 and table.schema.types[index] != target:
+                table = table.set_column(index, name, table.column(index).cast(target))
+            unified.append(table)
+        tables = unified
+    return pyarrow.concat_tables(tables, promote=True)
+
+
+def _has_null_type(type_: "pyarrow.DataType") -> bool:
+    """Whether the type is the null type or a nested type with a null child."""
+    if pyarrow.types.is_null(type_):
+        return True
+    if pyarrow.types.is_list(type_) or pyarrow.types.is_large_list(type_):
+        return _has_null_type(type_.value_type)
+    if pyarrow.types.is_struct(type_):
+        return any(_has_null_type(field.type) for field in type_)
+    return False
+
+
 def _copy_table(table: "pyarrow.Table") -> "pyarrow.Table":
     """Copy the provided Arrow table."""
     import pyarrow as pa
@@ -1,5 +1,7 @@
 from typing import Optional
 
+import numpy as np
+
 from ray.data.block import Block, BlockAccessor
 from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
 
@@ -28,6 +30,10 @@ class Batcher:
         """
         self._buffer.append(block)
 
+    def done_adding(self) -> None:
+        """Indicate to the batcher that no more blocks will be added."""
+        pass
+
     def has_batch(self) -> bool:
         """Whether this Batcher has any full batches."""
         return self._buffer and (
@@ -78,3 +84,119 @@ class Batcher:
         # blocks consumed on the next batch extraction.
         self._buffer = leftover
         return output.build()
+
+
+class ShufflingBatcher:
+    """Chunks blocks into shuffled batches, using a local in-memory shuffle buffer.
+
+    The batcher maintains a buffer of at least ``shuffle_buffer_min_size`` rows,
+    and each batch is a random sample of the rows in the buffer. This yields a
+    "good enough" shuffle of the data within a window of nearby blocks, without
+    the cost of a global ``random_shuffle()`` of the dataset.
+
+    The buffer is compacted and reshuffled only when new blocks have been added
+    since the last batch, so the cost of the shuffle is amortized over all of the
+    batches taken from the buffer until the next block arrives.
+    """
+
+    def __init__(
+        self,
+        batch_size: Optional[int],
+        shuffle_buffer_min_size: int,
+        shuffle_seed: Optional[int] = None,
+    ):
+        """Construct a shuffling batcher.
+
+        Args:
+            batch_size: Record batch size.
+            shuffle_buffer_min_size: The min number of rows to keep in the shuffle
+                buffer while blocks are still being added. Larger buffers give
+                better randomness, at the cost of memory and of a longer delay
+                before the first batch.
+            shuffle_seed: The seed to use for the local shuffle, or None for a
+                non-deterministic shuffle.
+        """
+        if batch_size is None:
+            raise ValueError("Must specify a batch_size if using a local shuffle.")
+        if shuffle_buffer_min_size < 1:
+            raise ValueError(
+                "The shuffle buffer size must be positive, got: "
+                f"{shuffle_buffer_min_size}"
+            )
+        self._batch_size = batch_size
+        self._buffer_min_size = shuffle_buffer_min_size
+        self._random = np.random.RandomState(shuffle_seed)
+        # The blocks added since the last shuffle.
+        self._builder = DelegatingBlockBuilder()
+        # The shuffled rows that haven't been returned yet are those from
+        # self._batch_head onwards.
+        self._shuffle_buffer: Optional[Block] = None
+        self._batch_head = 0
+        self._done_adding = False
+
+    def add(self, block: Block):
+        """Add a block to the shuffle buffer.
+
+        Args:
+            block: Block to add to the shuffle buffer.
+        """
+        assert not self._done_adding
+        if BlockAccessor.for_block(block).num_rows() > 0:
+            self._builder.add_block(block)
+
+    def done_adding(self) -> None:
+        """Indicate to the batcher that no more blocks will be added.
+
+        The remaining rows in the shuffle buffer can then all be returned.
+        """
+        self._done_adding = True
+
+    def has_batch(self) -> bool:
+        """Whether this batcher has any full batches."""
+        num_rows = self._num_rows()
+        if not self._done_adding:
+            # Keep the buffer at its min size until all blocks have been added.
+            return num_rows >= self._buffer_min_size + self._batch_size
+        return num_rows >= self._batch_size
+
+    def has_any(self) -> bool:
+        """Whether this batcher has any data."""
+        return self._num_rows() > 0
+
+    def next_batch(self) -> Block:
+        """Get the next shuffled batch from the shuffle buffer.
+
+        Returns:
+            A batch represented as a Block.
+        """
+        assert self.has_any()
+        if self._builder.num_rows() > 0:
+            # Merge the new blocks into the remaining shuffle buffer, and reshuffle.
+            builder = DelegatingBlockBuilder()
+            if self._shuffle_buffer is not None:
+                accessor = BlockAccessor.for_block(self._shuffle_buffer)
+                if self._batch_head < accessor.num_rows():
+                    builder.add_block(
+                        accessor.slice(self._batch_head, accessor.num_rows(), False)
+                    )
+            builder.add_block(self._builder.build())
+            self._builder = DelegatingBlockBuilder()
+            self._shuffle_buffer = BlockAccessor.for_block(
+                builder.build()
+            ).random_shuffle(self._random.randint(0, 2 ** 32 - 1))
+            self._batch_head = 0
+
+        accessor = BlockAccessor.for_block(self._shuffle_buffer)
+        end = min(self._batch_head + self._batch_size, accessor.num_rows())
+        batch = accessor.slice(self._batch_head, end, False)
+        self._batch_head = end
+        return batch
+
+    def _num_rows(self) -> int:
+        num_rows = self._builder.num_rows()
+        if self._shuffle_buffer is not None:
+            num_rows += (
+                BlockAccessor.for_block(self._shuffle_buffer).num_rows()
+                - self._batch_head
+            )
+        return num_rows
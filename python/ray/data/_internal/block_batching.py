@@ -1,6 +1,6 @@
 import collections
 import itertools
-from typing import Iterator, Iterable, Union, Optional, TYPE_CHECKING
+from typing import Dict, Iterator, Iterable, Union, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     import pyarrow
@@ -13,12 +13,14 @@ from ray.actor import ActorHandle
 from ray.types import ObjectRef
 from ray.data.block import Block, BlockAccessor
 from ray.data.context import DatasetContext
-from ray.data._internal.batcher import Batcher
+from ray.data._internal.batcher import Batcher, ShufflingBatcher
 from ray.data._internal.stats import DatasetStats, DatasetPipelineStats
 from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
 
 # An output type of iter_batches() determined by the batch_format parameter.
-BatchType = Union["pandas.DataFrame", "pyarrow.Table", np.ndarray, list]
+BatchType = Union[
+    "pandas.DataFrame", "pyarrow.Table", np.ndarray, Dict[str, np.ndarray], list
+]
 PREFETCHER_ACTOR_NAMESPACE = "ray.dataset"
 
 
@@ -30,6 +32,8 @@ def batch_blocks(
     batch_size: Optional[int] = None,
     batch_format: str = "native",
     drop_last: bool = False,
+    local_shuffle_buffer_size: Optional[int] = None,
+    local_shuffle_seed: Optional[int] = None,
 ) -> Iterator[BatchType]:
     """Create batches of data from 1 or more blocks.
 
@@ -45,14 +49,28 @@ def batch_blocks(
         batch_format: The format in which to return each batch.
             Specify "native" to use the current block format (promoting
             Arrow to pandas automatically), "pandas" to
-            select ``pandas.DataFrame`` or "pyarrow" to select
-            ``pyarrow.Table``. Default is "native".
+            select ``pandas.DataFrame``, "pyarrow" to select
+            ``pyarrow.Table``, or "numpy" to select ``numpy.ndarray`` for simple
+            datasets and ``Dict[str, numpy.ndarray]`` for tabular datasets.
+            Default is "native".
         drop_last: Whether to drop the last batch if it's incomplete.
+        local_shuffle_buffer_size: If non-None, the data will be randomly shuffled
+            using a local in-memory shuffle buffer, and this value will serve as the
+            minimum number of rows that must be in the local in-memory shuffle
+            buffer in order to yield a batch.
+        local_shuffle_seed: The seed to use for the local random shuffle.
 
     Returns:
         An iterator over record batches.
     """
-    batcher = Batcher(batch_size=batch_size)
+    if local_shuffle_buffer_size is not None:
+        batcher = ShufflingBatcher(
+            batch_size=batch_size,
+            shuffle_buffer_min_size=local_shuffle_buffer_size,
+            shuffle_seed=local_shuffle_seed,
+        )
+    else:
+        batcher = Batcher(batch_size=batch_size)
 
     def batch_block(block: ObjectRef[Block]):
         with stats.iter_get_s.timer():
@@ -84,6 +102,14 @@ def batch_blocks(
     for block in block_window[1:]:
         yield from batch_block(block)
 
+    batcher.done_adding()
+    # Yield any full batches left in the shuffle buffer.
+    while batcher.has_batch():
+        with stats.iter_format_batch_s.timer():
+            result = _format_batch(batcher.next_batch(), batch_format)
+        with stats.iter_user_s.timer():
+            yield result
+
     # Yield any remainder batches.
     if batcher.has_any() and not drop_last:
         with stats.iter_format_batch_s.timer():
@@ -108,6 +134,8 @@ def _format_batch(batch: Block, batch_format: str) -> BatchType:
     elif batch_format == "pyarrow":
         batch = BlockAccessor.for_block(batch)
         return batch.to_arrow()
+    elif batch_format == "numpy":
+        return _to_numpy_batch(batch)
     else:
         raise ValueError(
             f"The given batch format: {batch_format} "
@@ -115,6 +143,28 @@ def _format_batch(batch: Block, batch_format: str) -> BatchType:
         )
 
 
+def _to_numpy_batch(batch: Block) -> Union[np.ndarray, Dict[str, np.ndarray]]:
+    """Convert a batch to an ndarray, or a dict of ndarrays for tabular blocks.
+
+    For Arrow blocks, the columns of a batch that falls within a single block are
+    zero-copy views of the block's buffers (for tensor columns and for primitive
+    columns without nulls), while the columns of a batch spanning multiple blocks
+    are copied once into a single ndarray.
+    """
+    import pandas as pd
+
+    accessor = BlockAccessor.for_block(batch)
+    if isinstance(batch, list):
+        return accessor.to_numpy()
+    if isinstance(batch, pd.DataFrame):
+        columns = batch.columns.tolist()
+    else:
+        batch = accessor.to_arrow()
+        accessor = BlockAccessor.for_block(batch)
+        columns = batch.column_names
+    return {column: accessor.to_numpy(column) for column in columns}
+
+
 def _sliding_window(iterable: Iterable, n: int):
     """Creates an iterator consisting of n-width sliding windows over
     iterable. The sliding windows are constructed lazily such that an
@@ -1,8 +1,13 @@
 import collections
+import math
+import statistics
+import time
 from typing import TypeVar, Any, Union, Callable, List, Tuple, Optional
 
 import ray
+from ray.types import ObjectRef
 from ray.util.annotations import PublicAPI, DeveloperAPI
+from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
 from ray.data.block import (
     Block,
     BlockAccessor,
@@ -22,6 +27,10 @@ U = TypeVar("U")
 # A class type that implements __call__.
 CallableClass = type
 
+# With speculative execution, a task that has been running for this many times the
+# median task duration is considered a straggler and re-submitted to an idle actor.
+_STRAGGLER_DURATION_FACTOR = 2.0
+
 
 @DeveloperAPI
 class ComputeStrategy:
@@ -48,17 +57,38 @@ class TaskPoolStrategy(ComputeStrategy):
         blocks = block_list.get_blocks_with_metadata()
         if name is None:
             name = "map"
+        # The inputs of a stage fused with a read are read tasks put by the driver,
+        # so their locations say nothing about where the data is.
+        is_read_stage = name == "read" or name.startswith("read->")
         name = name.title()
         map_bar = ProgressBar(name, total=len(blocks))
 
+        input_locations = None
+        if (
+            context.locality_aware_scheduling
+            and not is_read_stage
+            and _is_default_scheduling_strategy(remote_args, context)
+        ):
+            input_locations = _get_block_locations([b for b, _ in blocks])
+            block_remote_args = _get_locality_remote_args(input_locations, remote_args)
+        else:
+            block_remote_args = [remote_args] * len(blocks)
+        input_sizes = [m.size_bytes for _, m in blocks]
+
         if context.block_splitting_enabled:
-            map_block = cached_remote_fn(_map_block_split).options(**remote_args)
-            refs = [map_block.remote(b, fn, m.input_files) for b, m in blocks]
+            map_block = cached_remote_fn(_map_block_split)
+            refs = [
+                map_block.options(**args).remote(b, fn, m.input_files)
+                for (b, m), args in zip(blocks, block_remote_args)
+            ]
         else:
-            map_block = cached_remote_fn(_map_block_nosplit).options(
-                **dict(remote_args, num_returns=2)
-            )
-            all_refs = [map_block.remote(b, fn, m.input_files) for b, m in blocks]
+            map_block = cached_remote_fn(_map_block_nosplit)
+            all_refs = [
+                map_block.options(**dict(args, num_returns=2)).remote(
+                    b, fn, m.input_files
+                )
+                for (b, m), args in zip(blocks, block_remote_args)
+            ]
             data_refs = [r[0] for r in all_refs]
             refs = [r[1] for r in all_refs]
 
@@ -84,6 +114,15 @@ class TaskPoolStrategy(ComputeStrategy):
             # Reraise the original task failure exception.
             raise e from None
 
+        if input_locations is not None:
+            # Record how many input bytes each task read from its own node.
+            for result, nodes, size in zip(results, input_locations, input_sizes):
+                if context.block_splitting_enabled:
+                    if not result:
+                        continue
+                    _, result = result[0]
+                _record_input_locality(result.exec_stats, nodes, size)
+
         new_blocks, new_metadata = [], []
         if context.block_splitting_enabled:
             for result in results:
@@ -94,6 +133,10 @@ class TaskPoolStrategy(ComputeStrategy):
             for block, metadata in zip(data_refs, results):
                 new_blocks.append(block)
                 new_metadata.append(metadata)
+            if context.dynamic_block_splitting_enabled:
+                new_blocks, new_metadata = _split_oversized_blocks(
+                    new_blocks, new_metadata, context.target_max_block_size
+                )
         return BlockList(list(new_blocks), list(new_metadata))
 
 
@@ -113,6 +156,10 @@ class ActorPoolStrategy(ComputeStrategy):
     computation and avoiding actor startup delays, set max_tasks_in_flight_per_actor
     to 2 or greater; to try to decrease the delay due to queueing of tasks on the worker
     actors, set max_tasks_in_flight_per_actor to 1.
+
+    Blocks are dispatched to the least loaded actors. Once all blocks have been
+    dispatched, idle actors are released down to ``m`` actors, so that the tail of the
+    transform doesn't hold on to idle resources (e.g. GPUs).
     """
 
     def __init__(
@@ -120,6 +167,7 @@ class ActorPoolStrategy(ComputeStrategy):
         min_size: int = 1,
         max_size: Optional[int] = None,
         max_tasks_in_flight_per_actor: Optional[int] = 2,
+        speculative_execution: bool = False,
     ):
         """Construct ActorPoolStrategy for a Dataset transform.
 
@@ -131,6 +179,10 @@ class ActorPoolStrategy(ComputeStrategy):
                 opportunities for pipelining task dependency prefetching with
                 computation and avoiding actor startup delays, but will also increase
                 queueing delay.
+            speculative_execution: Whether to re-submit straggler tasks to idle
+                actors once all blocks have been submitted, using the output of
+                whichever copy finishes first. Only enable this if the transform
+                has no side effects, since stragglers may be executed twice.
         """
         if min_size < 1:
             raise ValueError("min_size must be > 1", min_size)
@@ -144,6 +196,7 @@ class ActorPoolStrategy(ComputeStrategy):
         self.min_size = min_size
         self.max_size = max_size or float("inf")
         self.max_tasks_in_flight_per_actor = max_tasks_in_flight_per_actor
+        self.speculative_execution = speculative_execution
 
     def _apply(
         self,
@@ -163,7 +216,6 @@ class ActorPoolStrategy(ComputeStrategy):
             block_list.clear()
 
         orig_num_blocks = len(blocks_in)
-        results = []
         if name is None:
             name = "map"
         name = name.title()
@@ -196,25 +248,95 @@ class ActorPoolStrategy(ComputeStrategy):
         tasks_in_flight = collections.defaultdict(int)
         metadata_mapping = {}
         block_indices = {}
+        submit_times = {}
         ready_workers = set()
+        # The winning output of each block, by the block's input index.
+        outputs = {}
+        # The input blocks and the number of submitted copies of each block that
+        # is in flight, for speculative re-execution of stragglers.
+        blocks_in_flight = {}
+        num_copies = collections.defaultdict(int)
+        task_durations = []
+
+        def set_description():
+            map_bar.set_description(
+                "Map Progress ({} actors {} pending)".format(
+                    len(ready_workers), len(workers) - len(ready_workers)
+                )
+            )
 
-        while len(results) < orig_num_blocks:
+        def submit(worker, block_idx: int, block: Block, meta: BlockMetadata):
+            if context.block_splitting_enabled:
+                ref = worker.map_block_split.remote(block, meta.input_files)
+            else:
+                ref, meta_ref = worker.map_block_nosplit.remote(block, meta.input_files)
+                metadata_mapping[ref] = meta_ref
+            tasks[ref] = worker
+            block_indices[ref] = block_idx
+            submit_times[ref] = time.perf_counter()
+            tasks_in_flight[worker] += 1
+            blocks_in_flight[block_idx] = (block, meta)
+            num_copies[block_idx] += 1
+
+        def remove_worker(worker):
+            workers.remove(worker)
+            ready_workers.discard(worker)
+            for ref in [ref for ref, w in tasks.items() if w is worker]:
+                del tasks[ref]
+            ray.kill(worker)
+
+        def speculate():
+            # Re-submit the blocks that have been in flight for much longer than
+            # the median task to idle workers.
+            if not task_durations:
+                return
+            threshold = _STRAGGLER_DURATION_FACTOR * statistics.median(task_durations)
+            now = time.perf_counter()
+            idle_workers = [w for w in ready_workers if tasks_in_flight[w] == 0]
+            for ref, block_idx in list(block_indices.items()):
+                if not idle_workers:
+                    break
+                if num_copies[block_idx] > 1 or now - submit_times[ref] < threshold:
+                    continue
+                block, meta = blocks_in_flight[block_idx]
+                submit(idle_workers.pop(), block_idx, block, meta)
+
+        def scale_down():
+            # Once all blocks have been submitted, release the pending and idle
+            # workers, down to the min pool size.
+            num_keep = self.min_size
+            if self.speculative_execution:
+                # Keep enough idle workers to re-execute the blocks in flight.
+                num_busy = sum(1 for w in workers if tasks_in_flight[w] > 0)
+                num_keep = max(num_keep, num_busy + len(blocks_in_flight))
+            # Release the pending workers first.
+            num_workers = len(workers)
+            for worker in sorted(workers, key=lambda w: w in ready_workers):
+                if len(workers) <= num_keep:
+                    break
+                if tasks_in_flight[worker] == 0:
+                    remove_worker(worker)
+            if len(workers) < num_workers:
+                set_description()
+
+        while len(outputs) < orig_num_blocks:
             ready, _ = ray.wait(
                 list(tasks.keys()), timeout=0.01, num_returns=1, fetch_local=False
             )
             if not ready:
                 if (
-                    len(workers) < self.max_size
+                    blocks_in
+                    and len(workers) < self.max_size
                     and len(ready_workers) / len(workers) > 0.8
                 ):
                     w = BlockWorker.remote()
                     workers.append(w)
                     tasks[w.ready.remote()] = w
-                    map_bar.set_description(
-                        "Map Progress ({} actors {} pending)".format(
-                            len(ready_workers), len(workers) - len(ready_workers)
-                        )
-                    )
+                    set_description()
+                elif not blocks_in and self.speculative_execution:
+                    speculate()
+                if not blocks_in:
+                    scale_down()
                 continue
 
             [obj_id] = ready
@@ -222,38 +344,36 @@ class ActorPoolStrategy(ComputeStrategy):
 
             # Process task result.
             if worker in ready_workers:
-                results.append(obj_id)
+                block_idx = block_indices.pop(obj_id)
                 tasks_in_flight[worker] -= 1
-                map_bar.update(1)
+                duration = time.perf_counter() - submit_times.pop(obj_id)
+                # The first copy of a speculatively re-executed block wins.
+                if block_idx not in outputs:
+                    outputs[block_idx] = obj_id
+                    task_durations.append(duration)
+                    blocks_in_flight.pop(block_idx)
+                    map_bar.update(1)
             else:
                 ready_workers.add(worker)
-                map_bar.set_description(
-                    "Map Progress ({} actors {} pending)".format(
-                        len(ready_workers), len(workers) - len(ready_workers)
-                    )
-                )
+                set_description()
 
-            # Schedule a new task.
-            while (
-                blocks_in
-                and tasks_in_flight[worker] < self.max_tasks_in_flight_per_actor
-            ):
+            # Schedule new tasks on the least loaded workers.
+            while blocks_in and ready_workers:
+                worker = min(ready_workers, key=lambda w: tasks_in_flight[w])
+                if tasks_in_flight[worker] >= self.max_tasks_in_flight_per_actor:
+                    break
                 block, meta = blocks_in.pop()
-                if context.block_splitting_enabled:
-                    ref = worker.map_block_split.remote(block, meta.input_files)
-                else:
-                    ref, meta_ref = worker.map_block_nosplit.remote(
-                        block, meta.input_files
-                    )
-                    metadata_mapping[ref] = meta_ref
-                tasks[ref] = worker
-                block_indices[ref] = len(blocks_in)
-                tasks_in_flight[worker] += 1
+                submit(worker, len(blocks_in), block, meta)
 
         map_bar.close()
+        # Kill the workers still running the losing copies of re-executed blocks,
+        # which would otherwise only exit once those tasks finish.
+        for worker in workers:
+            if tasks_in_flight[worker] > 0:
+                ray.kill(worker)
         new_blocks, new_metadata = [], []
         # Put blocks in input order.
-        results.sort(key=block_indices.get)
+        results = [outputs[i] for i in range(orig_num_blocks)]
         if context.block_splitting_enabled:
             for result in ray.get(results):
                 for block, metadata in result:
@@ -264,6 +384,10 @@ class ActorPoolStrategy(ComputeStrategy):
                 new_blocks.append(block)
                 new_metadata.append(metadata_mapping[block])
             new_metadata = ray.get(new_metadata)
+            if context.dynamic_block_splitting_enabled:
+                new_blocks, new_metadata = _split_oversized_blocks(
+                    new_blocks, new_metadata, context.target_max_block_size
+                )
         return BlockList(new_blocks, new_metadata)
 
 
@@ -304,6 +428,78 @@ def cache_wrapper(
         return fn
 
 
+def _is_default_scheduling_strategy(remote_args: dict, context: DatasetContext) -> bool:
+    strategy = remote_args.get("scheduling_strategy", context.scheduling_strategy)
+    return strategy in ("DEFAULT", "SPREAD")
+
+
+def _get_block_locations(blocks: List[ObjectRef[Block]]) -> List[List[str]]:
+    """Return the ids of the nodes holding a copy of each block."""
+    locations = ray.experimental.get_object_locations(blocks)
+    return [locations.get(b, {}).get("node_ids", []) for b in blocks]
+
+
+def _get_locality_remote_args(
+    input_locations: List[List[str]], remote_args: dict
+) -> List[dict]:
+    """Compute the remote args to schedule each map task near its input block.
+
+    Each task is soft-pinned to the node holding its input block. To avoid piling
+    all of the tasks onto the nodes that produced the inputs, each node is assigned
+    at most its share of the tasks in proportion to its CPUs; the remaining tasks
+    keep the original remote args, and are scheduled wherever there is capacity.
+
+    Args:
+        input_locations: The ids of the nodes holding each input block.
+        remote_args: The remote args of the map stage.
+
+    Returns:
+        The remote args of the task for each input block.
+    """
+    node_cpus = {
+        node["NodeID"]: node["Resources"].get("CPU", 0)
+        for node in ray.nodes()
+        if node["Alive"]
+    }
+    total_cpus = sum(node_cpus.values())
+    num_tasks_per_node = collections.defaultdict(int)
+    node_remote_args = {}
+    block_remote_args = []
+    for node_ids in input_locations:
+        node_id = node_ids[0] if node_ids else None
+        if node_id is None or not node_cpus.get(node_id):
+            block_remote_args.append(remote_args)
+            continue
+        max_tasks = math.ceil(len(input_locations) * node_cpus[node_id] / total_cpus)
+        if num_tasks_per_node[node_id] >= max_tasks:
+            # The node already has its share of tasks, fall back to scheduling
+            # this task anywhere.
+            block_remote_args.append(remote_args)
+            continue
+        num_tasks_per_node[node_id] += 1
+        if node_id not in node_remote_args:
+            node_remote_args[node_id] = dict(
+                remote_args,
+                scheduling_strategy=NodeAffinitySchedulingStrategy(node_id, soft=True),
+            )
+        block_remote_args.append(node_remote_args[node_id])
+    return block_remote_args
+
+
+def _record_input_locality(
+    exec_stats: BlockExecStats, input_node_ids: List[str], input_size: Optional[int]
+) -> None:
+    if input_size is None or not input_node_ids:
+        # The input location is unknown, e.g. the block was already freed.
+        return
+    if exec_stats.node_id in input_node_ids:
+        exec_stats.local_input_bytes = input_size
+        exec_stats.remote_input_bytes = 0
+    else:
+        exec_stats.local_input_bytes = 0
+        exec_stats.remote_input_bytes = input_size
+
+
 def get_compute(compute_spec: Union[str, ComputeStrategy]) -> ComputeStrategy:
     if not compute_spec or compute_spec == "tasks":
         return TaskPoolStrategy()
@@ -345,3 +541,77 @@ def _map_block_nosplit(
     return new_block, accessor.get_metadata(
         input_files=input_files, exec_stats=stats.build()
     )
+
+
+def _split_oversized_blocks(
+    blocks: List[ObjectRef[Block]],
+    metadata: List[BlockMetadata],
+    target_max_block_size: int,
+) -> Tuple[List[ObjectRef[Block]], List[BlockMetadata]]:
+    """Split the blocks larger than the target max block size into smaller blocks.
+
+    This is used to keep the output blocks of map tasks near the target size when
+    the UDF expands the data (e.g. decoding images), without the overhead of
+    putting every output block in the object store as with block splitting.
+
+    Args:
+        blocks: The blocks to split.
+        metadata: The metadata of the blocks.
+        target_max_block_size: The target max size of the output blocks in bytes.
+
+    Returns:
+        The blocks and their metadata, with each oversized block replaced in place
+        by its split blocks.
+    """
+    split_block = cached_remote_fn(_split_block)
+    splits = {}
+    for i, meta in enumerate(metadata):
+        if (
+            meta.size_bytes is None
+            or meta.size_bytes <= target_max_block_size
+            or meta.num_rows is None
+            or meta.num_rows < 2
+        ):
+            continue
+        num_splits = min(
+            math.ceil(meta.size_bytes / target_max_block_size), meta.num_rows
+        )
+        refs = split_block.options(num_returns=2 * num_splits).remote(
+            blocks[i], num_splits, meta.input_files
+        )
+        splits[i] = (refs[:num_splits], refs[num_splits:])
+    if not splits:
+        return blocks, metadata
+
+    split_metadata = iter(ray.get([m for _, metas in splits.values() for m in metas]))
+    new_blocks, new_metadata = [], []
+    for i, (block, meta) in enumerate(zip(blocks, metadata)):
+        if i in splits:
+            split_blocks, _ = splits[i]
+            new_blocks.extend(split_blocks)
+            new_metadata.extend(next(split_metadata) for _ in split_blocks)
+        else:
+            new_blocks.append(block)
+            new_metadata.append(meta)
+    return new_blocks, new_metadata
+
+
+def _split_block(
+    block: Block, num_splits: int, input_files: List[str]
+) -> List[Union[Block, BlockMetadata]]:
+    stats = BlockExecStats.builder()
+    accessor = BlockAccessor.for_block(block)
+    num_rows = accessor.num_rows()
+    split_blocks = []
+    for i in range(num_splits):
+        start = i * num_rows // num_splits
+        end = (i + 1) * num_rows // num_splits
+        split_blocks.append(accessor.slice(start, end, copy=True))
+    split_metadata = []
+    for b in split_blocks:
+        split_metadata.append(
+            BlockAccessor.for_block(b).get_metadata(
+                input_files=input_files, exec_stats=stats.build()
+            )
+        )
+    return split_blocks + split_metadata
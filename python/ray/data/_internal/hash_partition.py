@@ -0,0 +1,130 @@
+import math
+import struct
+import zlib
+from typing import List
+
+import numpy as np
+
+from ray.data.block import KeyType
+
+
+def stable_hash(key: KeyType) -> int:
+    """Hash a groupby key consistently across processes.
+
+    The builtin ``hash()`` of str and bytes is salted per process, so it can't be
+    used to assign keys to partitions on different workers. Equal keys of
+    different numeric types (e.g. ``1``, ``1.0`` and ``np.int64(1)``) hash equal.
+    """
+    if isinstance(key, np.generic):
+        key = key.item()
+    if key is None:
+        return 0
+    if isinstance(key, (bool, int)):
+        return int(key)
+    if isinstance(key, float):
+        if math.isnan(key):
+            return 0
+        if key.is_integer():
+            return int(key)
+        return zlib.crc32(struct.pack("<d", key))
+    if isinstance(key, str):
+        return zlib.crc32(key.encode("utf-8"))
+    if isinstance(key, bytes):
+        return zlib.crc32(key)
+    if isinstance(key, tuple):
+        h = len(key)
+        for k in key:
+            h = (h * 1000003) ^ stable_hash(k)
+        return h & 0xFFFFFFFFFFFFFFFF
+    return zlib.crc32(repr(key).encode("utf-8"))
+
+
+def key_column(keys: List[KeyType]) -> np.ndarray:
+    """Convert the groupby keys of the rows to a column for ``hash_key_columns()``.
+
+    Numbers (with None as NaN) are converted to a numeric column, and other keys,
+    including tuples, to an object column.
+    """
+    import pandas as pd
+
+    if len(keys) == 0:
+        return np.empty(0, dtype=object)
+    return pd.Series(keys).to_numpy()
+
+
+def hash_key_columns(columns: List[np.ndarray]) -> np.ndarray:
+    """Hash the rows of the key columns consistently across processes.
+
+    Equal numbers of different types (e.g. ``1``, ``1.0`` and ``True``) hash equal,
+    and all nulls (None and NaN) hash equal.
+
+    Args:
+        columns: The key columns, e.g. from ``key_column()`` or the numpy
+            conversion of block columns.
+
+    Returns:
+        A uint64 array of the hash of each row.
+    """
+    import pandas as pd
+
+    hashes = None
+    for values in columns:
+        values = np.asarray(values)
+        if values.dtype == object:
+            inferred = pd.api.types.infer_dtype(values, skipna=True)
+            if inferred in ("integer", "floating", "mixed-integer-float", "boolean"):
+                # E.g. nullable pandas integers, with pd.NA as nulls.
+                series = pd.Series(values)
+                series = series.mask(series.isna(), np.nan)
+                values = series.astype(np.float64).to_numpy()
+        if values.dtype.kind in "biuf":
+            floats = values.astype(np.float64)
+            nulls = np.isnan(floats)
+            # Adding 0.0 normalizes -0.0 to 0.0.
+            column_hashes = pd.util.hash_array(
+                np.where(nulls, 0.0, floats) + 0.0, categorize=False
+            )
+        else:
+            values = values.astype(object)
+            nulls = pd.isna(values)
+            column_hashes = pd.util.hash_array(values)
+        column_hashes[nulls] = np.uint64(0)
+        if hashes is None:
+            hashes = column_hashes
+        else:
+            # Integer overflow wraps around for uint64 arrays.
+            hashes = (hashes * np.uint64(1000003)) ^ column_hashes
+    return hashes
+
+
+def hash_key(key: KeyType) -> int:
+    """Hash a single groupby key the same way as ``hash_key_columns()``."""
+    if isinstance(key, tuple):
+        columns = [key_column([k]) for k in key]
+    else:
+        columns = [key_column([key])]
+    return int(hash_key_columns(columns)[0])
+
+
+def hash_partition_indices(
+    columns: List[np.ndarray], num_partitions: int
+) -> List[np.ndarray]:
+    """Compute the row indices of each hash partition of a block.
+
+    Within each partition, the indices of rows with the same key are contiguous, so
+    that taking the rows in this order yields a block that can be combined by
+    ``BlockAccessor.combine()`` without sorting it first.
+
+    Args:
+        columns: The key columns of the block, see ``hash_key_columns()``.
+        num_partitions: The number of partitions.
+
+    Returns:
+        A list of ``num_partitions`` arrays of row indices.
+    """
+    hashes = hash_key_columns(columns)
+    partitions = (hashes % np.uint64(num_partitions)).astype(np.int64)
+    # Sort by partition and then by hash, which keeps equal keys contiguous.
+    order = np.lexsort((hashes, partitions))
+    counts = np.bincount(partitions, minlength=num_partitions)
+    return np.split(order, np.cumsum(counts)[:-1])
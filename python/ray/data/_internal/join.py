@@ -0,0 +1,204 @@
+from typing import List, Optional, Tuple, Union, TYPE_CHECKING
+
+from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
+from ray.data.context import DatasetContext
+from ray.data._internal.block_list import BlockList
+from ray.data._internal.progress_bar import ProgressBar
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data._internal.shuffle import ShuffleOp, SimpleShufflePlan
+
+if TYPE_CHECKING:
+    import pandas
+
+# The supported join types.
+JOIN_TYPES = ("inner", "left", "outer")
+
+
+class _JoinOp(ShuffleOp):
+    """
+    Operator used for the shuffle-based `join` transform.
+
+    The left and right input blocks are passed to the shuffle as a single list of
+    blocks, where the first ``num_left_blocks`` blocks come from the left side.
+    Both sides are hash partitioned on the join columns, so that each reducer
+    receives all of the rows of both sides for a subset of the keys.
+    """
+
+    def __init__(self, on: List[str], how: str, num_left_blocks: int):
+        super().__init__(map_args=[on], reduce_args=[on, how, num_left_blocks])
+
+    @staticmethod
+    def map(
+        idx: int,
+        block: Block,
+        output_num_blocks: int,
+        on: List[str],
+    ) -> List[Union[BlockMetadata, Block]]:
+        stats = BlockExecStats.builder()
+        accessor = BlockAccessor.for_block(block)
+        parts = accessor.hash_partition(on, output_num_blocks)
+        meta = accessor.get_metadata(input_files=None, exec_stats=stats.build())
+        return [meta] + parts
+
+    @staticmethod
+    def reduce(
+        on: List[str], how: str, num_left_blocks: int, *mapper_outputs: List[Block]
+    ) -> (Block, BlockMetadata):
+        return _join_blocks(
+            list(mapper_outputs[:num_left_blocks]),
+            list(mapper_outputs[num_left_blocks:]),
+            on,
+            how,
+        )
+
+
+class SimpleShuffleJoinOp(_JoinOp, SimpleShufflePlan):
+    pass
+
+
+def join_impl(
+    left: BlockList,
+    right: BlockList,
+    on: List[str],
+    how: str,
+    num_blocks: Optional[int],
+    clear_input_blocks: bool,
+) -> Tuple[BlockList, dict]:
+    """Join the left and right blocks on the given columns.
+
+    If one side is smaller than ``DatasetContext.join_broadcast_threshold_bytes``
+    and the join type allows it, that side is broadcast to a join task per block of
+    the other side. Otherwise, both sides are hash partitioned and shuffled.
+
+    Args:
+        left: The left blocks. These are cleared if clear_input_blocks is set.
+        right: The right blocks. These are never cleared.
+        on: The columns to join on.
+        how: The join type, one of JOIN_TYPES.
+        num_blocks: The number of output blocks for a shuffle join, or None to use
+            the max number of blocks of either side.
+        clear_input_blocks: Whether to clear the left blocks.
+
+    Returns:
+        The joined blocks and the stage info.
+    """
+    threshold = DatasetContext.get_current().join_broadcast_threshold_bytes
+    if how in ("inner", "left"):
+        right_size = _size_bytes(right)
+        if right_size is not None and right_size <= threshold:
+            return (
+                _broadcast_join(left, right, on, how, False, clear_input_blocks),
+                {},
+            )
+    if how == "inner":
+        left_size = _size_bytes(left)
+        if left_size is not None and left_size <= threshold:
+            return _broadcast_join(right, left, on, how, True, False), {}
+
+    left_blocks, left_metadata = left.get_blocks(), left.get_metadata()
+    right_blocks, right_metadata = right.get_blocks(), right.get_metadata()
+    if clear_input_blocks:
+        left.clear()
+    if num_blocks is None:
+        num_blocks = max(len(left_blocks), len(right_blocks), 1)
+    input_blocks = BlockList(
+        left_blocks + right_blocks, list(left_metadata) + list(right_metadata)
+    )
+    join_op = SimpleShuffleJoinOp(on, how, len(left_blocks))
+    # The combined input list holds the only other references to the inputs.
+    del left_blocks, right_blocks
+    return join_op.execute(input_blocks, num_blocks, clear_input_blocks=True)
+
+
+def _size_bytes(blocks: BlockList) -> Optional[int]:
+    metadata = blocks.get_metadata()
+    if any(m.size_bytes is None for m in metadata):
+        return None
+    return sum(m.size_bytes for m in metadata)
+
+
+def _broadcast_join(
+    blocks: BlockList,
+    small: BlockList,
+    on: List[str],
+    how: str,
+    small_is_left: bool,
+    clear_input_blocks: bool,
+) -> BlockList:
+    """Join each block with the whole small side, without shuffling either side."""
+    block_refs = blocks.get_blocks()
+    small_refs = small.get_blocks()
+    if clear_input_blocks:
+        blocks.clear()
+    if not block_refs:
+        return BlockList([], [])
+
+    join_block = cached_remote_fn(_broadcast_join_block, num_returns=2)
+    join_bar = ProgressBar("Broadcast Join", total=len(block_refs))
+    join_out = [
+        join_block.remote(block, on, how, small_is_left, *small_refs)
+        for block in block_refs
+    ]
+    del block_refs
+    new_blocks, new_metadata = zip(*join_out)
+    new_metadata = join_bar.fetch_until_complete(list(new_metadata))
+    join_bar.close()
+    return BlockList(list(new_blocks), new_metadata)
+
+
+def _broadcast_join_block(
+    block: Block, on: List[str], how: str, small_is_left: bool, *small: Block
+) -> Tuple[Block, BlockMetadata]:
+    if small_is_left:
+        return _join_blocks(list(small), [block], on, how)
+    return _join_blocks([block], list(small), on, how)
+
+
+def _join_blocks(
+    left_blocks: List[Block], right_blocks: List[Block], on: List[str], how: str
+) -> Tuple[Block, BlockMetadata]:
+    """Join the rows of the left and right blocks with pandas.
+
+    The output is a pandas block if the left blocks are pandas blocks and an Arrow
+    block otherwise. Conflicting non-key column names of the right side are
+    disambiguated with a _1 suffix, as in ``Dataset.zip()``.
+    """
+    import pandas
+    import pyarrow
+
+    stats = BlockExecStats.builder()
+    left = _concat_to_pandas(left_blocks, on)
+    right = _concat_to_pandas(right_blocks, on)
+    # An empty side may not have the key columns or their dtypes, which pandas
+    # refuses to merge with the keys of the other side.
+    if len(left) == 0:
+        left = _cast_keys(left, right, on)
+    if len(right) == 0:
+        right = _cast_keys(right, left, on)
+    joined = left.merge(right, how=how, on=on, suffixes=("", "_1"))
+    if not any(isinstance(b, pandas.DataFrame) for b in left_blocks):
+        joined = pyarrow.Table.from_pandas(joined, preserve_index=False)
+    accessor = BlockAccessor.for_block(joined)
+    return joined, accessor.get_metadata(input_files=None, exec_stats=stats.build())
+
+
+def _concat_to_pandas(blocks: List[Block], on: List[str]) -> "pandas.DataFrame":
+    import pandas
+
+    dfs = [BlockAccessor.for_block(b).to_pandas() for b in blocks]
+    # Empty blocks may have no columns at all.
+    dfs = [df for df in dfs if len(df.columns) > 0]
+    if not dfs:
+        return pandas.DataFrame(columns=on)
+    return pandas.concat(dfs, ignore_index=True)
+
+
+def _cast_keys(
+    df: "pandas.DataFrame", other: "pandas.DataFrame", on: List[str]
+) -> "pandas.DataFrame":
+    for key in on:
+        if key not in df.columns:
+            df[key] = []
+        if key in other.columns:
+            df[key] = df[key].astype(other[key].dtype)
+    return df
@@ -1,3 +1,4 @@
+import copy
 import math
 from typing import List, Iterator, Tuple, Optional, Dict, Any
 import uuid
@@ -15,7 +16,7 @@ from ray.data.block import (
     MaybeBlockPartition,
 )
 from ray.data.context import DatasetContext
-from ray.data.datasource import ReadTask
+from ray.data.datasource import Datasource, ReadTask
 from ray.data._internal.block_list import BlockList
 from ray.data._internal.progress_bar import ProgressBar
 from ray.data._internal.remote_fn import cached_remote_fn
@@ -40,6 +41,9 @@ class LazyBlockList(BlockList):
         cached_metadata: Optional[List[BlockPartitionMetadata]] = None,
         ray_remote_args: Optional[Dict[str, Any]] = None,
         stats_uuid: str = None,
+        datasource: Optional[Datasource] = None,
+        read_parallelism: Optional[int] = None,
+        read_args: Optional[Dict[str, Any]] = None,
     ):
         """Create a LazyBlockList on the provided read tasks.
 
@@ -55,6 +59,12 @@ class LazyBlockList(BlockList):
             ray_remote_args: Ray remote arguments for the read tasks.
             stats_uuid: UUID for the dataset stats, used to group and fetch read task
                 stats. If not provided, a new UUID will be created.
+            datasource: The datasource that produced the read tasks, if known. This is
+                used to re-create the read tasks when pushing down projections and
+                filters into the read.
+            read_parallelism: The parallelism that the read tasks were created with.
+            read_args: The kwargs that were passed to the datasource's
+                ``prepare_read()`` when creating the read tasks.
         """
         self._tasks = tasks
         self._num_blocks = len(self._tasks)
@@ -63,6 +73,10 @@ class LazyBlockList(BlockList):
         self._stats_uuid = stats_uuid
         self._execution_started = False
         self._remote_args = ray_remote_args or {}
+        # The source of the read tasks, used for read pushdown.
+        self._datasource = datasource
+        self._read_parallelism = read_parallelism
+        self._read_args = read_args or {}
         # Block partition metadata that have already been computed and fetched.
         if cached_metadata is not None:
             self._cached_metadata = cached_metadata
@@ -122,6 +136,9 @@ class LazyBlockList(BlockList):
             cached_metadata=self._cached_metadata,
             ray_remote_args=self._remote_args.copy(),
             stats_uuid=self._stats_uuid,
+            datasource=self._datasource,
+            read_parallelism=self._read_parallelism,
+            read_args=self._read_args.copy(),
         )
 
     def clear(self):
@@ -408,15 +425,105 @@ class LazyBlockList(BlockList):
             assert self._block_partition_meta_refs[i], self._block_partition_meta_refs
         return self._block_partition_refs[i], self._block_partition_meta_refs[i]
 
+    def limit(self, limit: int) -> "LazyBlockList":
+        """Return a lazy block list of the first ``limit`` rows of this one.
+
+        The limit is pushed down into the read tasks, which stop reading once they
+        have produced the rows needed. If the pre-read metadata has the number of
+        rows of each task, no task is executed. Otherwise, the tasks are launched
+        in batches of exponentially increasing size, each limited to the rows that
+        are still needed, until enough rows have been read. Each batch is also
+        capped at the number of tasks expected to produce the remaining rows, given
+        the average number of rows of the tasks seen so far.
+
+        Args:
+            limit: The number of rows to keep. Must be positive.
+
+        Returns:
+            A lazy block list over a prefix of the (limited) read tasks, which reuses
+            the blocks that were already computed.
+        """
+        assert limit > 0, limit
+        out = LazyBlockList([], ray_remote_args=self._remote_args.copy())
+        tasks, block_partition_refs, block_partition_meta_refs = [], [], []
+        cached_metadata = []
+        remaining = limit
+        i, batch_size = 0, 1
+        num_tasks_seen, num_rows_seen = 0, 0
+        while remaining > 0 and i < len(self._tasks):
+            if num_rows_seen > 0:
+                # Don't launch more tasks than needed to read the remaining rows.
+                batch_size = min(
+                    batch_size, math.ceil(remaining * num_tasks_seen / num_rows_seen)
+                )
+            batch = range(i, min(i + batch_size, len(self._tasks)))
+            # Tasks with a known number of rows don't need to be executed. The
+            # others are launched for this batch, limited to the remaining rows.
+            batch_tasks, batch_refs = {}, {}
+            for j in batch:
+                task = self._tasks[j]
+                if self._block_partition_refs[j] is not None:
+                    batch_tasks[j] = task
+                    batch_refs[j] = (
+                        self._block_partition_refs[j],
+                        self._block_partition_meta_refs[j],
+                    )
+                elif task.get_metadata().num_rows is None:
+                    batch_tasks[j] = _limit_read_task(task, remaining)
+                    batch_refs[j] = out._submit_read_task(j, batch_tasks[j])
+            batch_num_rows = _fetch_num_rows(list(batch_refs.values()))
+            num_rows_by_idx = dict(zip(batch_refs.keys(), batch_num_rows))
+            for j in batch:
+                if remaining <= 0:
+                    break
+                if j in batch_tasks:
+                    num_rows = num_rows_by_idx[j]
+                    task = batch_tasks[j]
+                    refs = batch_refs[j]
+                else:
+                    task = self._tasks[j]
+                    num_rows = task.get_metadata().num_rows
+                    refs = (None, None)
+                num_tasks_seen += 1
+                num_rows_seen += num_rows
+                if num_rows > remaining:
+                    # Only part of this task's rows are needed, so re-limit it.
+                    # It's re-executed lazily when its blocks are needed.
+                    task = _limit_read_task(task, remaining)
+                    refs = (None, None)
+                    num_rows = remaining
+                tasks.append(task)
+                block_partition_refs.append(refs[0])
+                block_partition_meta_refs.append(refs[1])
+                cached_metadata.append(None)
+                remaining -= num_rows
+            i += len(batch)
+            batch_size *= 2
+        limited = LazyBlockList(
+            tasks,
+            block_partition_refs,
+            block_partition_meta_refs,
+            cached_metadata,
+            ray_remote_args=self._remote_args.copy(),
+            stats_uuid=out._stats_uuid,
+        )
+        limited._execution_started = out._execution_started
+        return limited
+
     def _submit_task(
         self, task_idx: int
     ) -> Tuple[ObjectRef[MaybeBlockPartition], ObjectRef[BlockPartitionMetadata]]:
         """Submit the task with index task_idx."""
+        return self._submit_read_task(task_idx, self._tasks[task_idx])
+
+    def _submit_read_task(
+        self, task_idx: int, task: ReadTask
+    ) -> Tuple[ObjectRef[MaybeBlockPartition], ObjectRef[BlockPartitionMetadata]]:
+        """Submit the given read task, recording its stats under index task_idx."""
         stats_actor = _get_or_create_stats_actor()
         if not self._execution_started:
             stats_actor.record_start.remote(self._stats_uuid)
             self._execution_started = True
-        task = self._tasks[task_idx]
         return (
             cached_remote_fn(_execute_read_task)
             .options(num_returns=2, **self._remote_args)
@@ -459,3 +566,44 @@ def _execute_read_task(
         )
     stats_actor.record_task.remote(stats_uuid, i, metadata)
     return block, metadata
+
+
+def _fetch_num_rows(
+    refs: List[
+        Tuple[ObjectRef[MaybeBlockPartition], ObjectRef[BlockPartitionMetadata]]
+    ],
+) -> List[int]:
+    """Fetch the number of rows read by each of the given read task futures."""
+    if DatasetContext.get_current().block_splitting_enabled:
+        # The partition metadata is the pre-read metadata, so count the rows of
+        # the output blocks instead.
+        parts = ray.get([part_ref for part_ref, _ in refs])
+        return [sum(meta.num_rows for _, meta in part) for part in parts]
+    metadata = ray.get([meta_ref for _, meta_ref in refs])
+    return [meta.num_rows for meta in metadata]
+
+
+def _limit_read_task(task: ReadTask, limit: int) -> ReadTask:
+    """Wrap the read task to stop reading once it has produced ``limit`` rows."""
+    read_fn = task._read_fn
+
+    def limited_read_fn() -> Iterator[Block]:
+        remaining = limit
+        for block in read_fn():
+            accessor = BlockAccessor.for_block(block)
+            num_rows = accessor.num_rows()
+            if num_rows > remaining:
+                block = accessor.slice(0, remaining, copy=True)
+                num_rows = remaining
+            yield block
+            remaining -= num_rows
+            if remaining <= 0:
+                # Stop reading, closing the underlying read generator.
+                break
+
+    metadata = copy.copy(task.get_metadata())
+    if metadata.num_rows is not None and metadata.num_rows > limit:
+        if metadata.size_bytes is not None:
+            metadata.size_bytes = metadata.size_bytes * limit // metadata.num_rows
+        metadata.num_rows = limit
+    return ReadTask(limited_read_fn, metadata)
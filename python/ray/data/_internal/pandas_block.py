@@ -7,6 +7,7 @@ from typing import (
     Any,
     TypeVar,
     Optional,
+    Union,
     TYPE_CHECKING,
 )
 
@@ -15,6 +16,7 @@ import numpy as np
 
 from ray.data.block import BlockAccessor, BlockMetadata, KeyFn, U
 from ray.data.row import TableRow
+from ray.data._internal.hash_partition import hash_partition_indices
 from ray.data._internal.table_block import TableBlockAccessor, TableBlockBuilder
 from ray.data._internal.arrow_block import ArrowBlockAccessor
 from ray.data.aggregate import AggregateFn
@@ -23,6 +25,7 @@ if TYPE_CHECKING:
     import pyarrow
     import pandas
     from ray.data._internal.sort import SortKeyT
+    from ray.data.expressions import Expr
 
 T = TypeVar("T")
 
@@ -101,6 +104,25 @@ class PandasBlockAccessor(TableBlockAccessor):
             view = view.copy(deep=True)
         return view
 
+    def select(self, columns: List[str]) -> "pandas.DataFrame":
+        return self._table[columns]
+
+    def filter(self, predicate: "Expr") -> "pandas.DataFrame":
+        pandas = lazy_import_pandas()
+        mask = predicate.eval_pandas(self._table)
+        if not isinstance(mask, pandas.Series):
+            # Constant predicate.
+            return self._table if mask else self._table.iloc[0:0]
+        # Drop rows with null predicate values, and reset the index so that it
+        # isn't converted into a column when converting to Arrow.
+        mask = mask.fillna(False).astype(bool)
+        return self._table[mask].reset_index(drop=True)
+
+    def with_column(self, name: str, expr: "Expr") -> "pandas.DataFrame":
+        table = self._table.copy(deep=False)
+        table[name] = expr.eval_pandas(self._table)
+        return table
+
     def random_shuffle(self, random_seed: Optional[int]) -> "pandas.DataFrame":
         return self._table.sample(frac=1, random_state=random_seed)
 
@@ -139,7 +161,26 @@ class PandasBlockAccessor(TableBlockAccessor):
     def to_arrow(self) -> "pyarrow.Table":
         import pyarrow
 
-        return pyarrow.table(self._table)
+        from ray.data.extensions import ArrowTensorArray
+
+        df = self._table
+        tensor_columns = [
+            name
+            for name in df.columns
+            if df[name].dtype == object
+            and len(df) > 0
+            and all(isinstance(v, np.ndarray) and v.ndim > 1 for v in df[name])
+        ]
+        if not tensor_columns:
+            return pyarrow.table(df)
+        # Arrow can't infer the type of object columns of multi-dimensional
+        # ndarrays (e.g. variable-shaped tensors), so convert these to tensor
+        # arrays explicitly.
+        table = pyarrow.table(df.drop(columns=tensor_columns))
+        for name in tensor_columns:
+            array = ArrowTensorArray.from_numpy(list(df[name]))
+            table = table.append_column(name, array)
+        return table.select([str(c) for c in df.columns])
 
     def num_rows(self) -> int:
         return self._table.shape[0]
@@ -238,27 +279,55 @@ class PandasBlockAccessor(TableBlockAccessor):
         )
 
     def sort_and_partition(
-        self, boundaries: List[T], key: "SortKeyT", descending: bool
+        self,
+        boundaries: List[T],
+        key: "SortKeyT",
+        descending: bool,
+        null_placement: str = "at_end",
     ) -> List["pandas.DataFrame"]:
         # TODO (kfstorm): A workaround to pass tests. Not efficient.
         delegated_result = BlockAccessor.for_block(self.to_arrow()).sort_and_partition(
-            boundaries, key, descending
+            boundaries, key, descending, null_placement=null_placement
         )
         return [BlockAccessor.for_block(_).to_pandas() for _ in delegated_result]
 
+    def hash_partition(
+        self, key: Union[str, List[str]], num_partitions: int
+    ) -> List["pandas.DataFrame"]:
+        if self.num_rows() == 0:
+            # Empty blocks may not have the key columns.
+            return [self._table] * num_partitions
+        if isinstance(key, str):
+            columns = [self._table[key].to_numpy()]
+        elif isinstance(key, list):
+            columns = [self._table[k].to_numpy() for k in key]
+        else:
+            raise ValueError(
+                "key must be a column name or a list of column names when hash "
+                f"partitioning pandas blocks, but got: {type(key)}."
+            )
+        partitions = hash_partition_indices(columns, num_partitions)
+        return [
+            self._table.take(indices).reset_index(drop=True) for indices in partitions
+        ]
+
     def combine(self, key: KeyFn, aggs: Tuple[AggregateFn]) -> "pandas.DataFrame":
         # TODO (kfstorm): A workaround to pass tests. Not efficient.
         return BlockAccessor.for_block(self.to_arrow()).combine(key, aggs).to_pandas()
 
     @staticmethod
     def merge_sorted_blocks(
-        blocks: List["pandas.DataFrame"], key: "SortKeyT", _descending: bool
+        blocks: List["pandas.DataFrame"],
+        key: "SortKeyT",
+        _descending: bool,
+        null_placement: str = "at_end",
     ) -> Tuple["pandas.DataFrame", BlockMetadata]:
         # TODO (kfstorm): A workaround to pass tests. Not efficient.
         block, metadata = ArrowBlockAccessor.merge_sorted_blocks(
             [BlockAccessor.for_block(block).to_arrow() for block in blocks],
             key,
             _descending,
+            null_placement=null_placement,
         )
         return BlockAccessor.for_block(block).to_pandas(), metadata
 
@@ -1,7 +1,10 @@
-from typing import Any, Callable, List, Optional, TYPE_CHECKING
+from typing import Any, Callable, Deque, List, Optional, Tuple, TYPE_CHECKING
+import collections
 import time
 import concurrent.futures
 import logging
+import threading
+import weakref
 
 import ray
 from ray.data.context import DatasetContext
@@ -23,7 +26,19 @@ def pipeline_stage(fn: Callable[[], Dataset[T]]) -> Dataset[T]:
 
 
 class PipelineExecutor:
+    """Executes the windows of a DatasetPipeline through its optimized stages.
+
+    Each stage executes at most one window at a time, so that e.g. the read of the
+    next window overlaps with the shuffle of the current one. A background thread
+    moves the windows through the stages as soon as they complete, including while
+    the consumer is still processing earlier windows, and buffers up to
+    ``DatasetContext.pipeline_prefetch_windows`` executed windows (and at most
+    ``DatasetContext.pipeline_prefetch_max_bytes`` bytes of them) ahead of the
+    consumer, so that the consumer doesn't stall on window boundaries.
+    """
+
     def __init__(self, pipeline: "DatasetPipeline[T]"):
+        context = DatasetContext.get_current()
         self._pipeline: "DatasetPipeline[T]" = pipeline
         self._stages: List[concurrent.futures.Future[Dataset[Any]]] = [None] * (
             len(self._pipeline._optimized_stages) + 1
@@ -49,7 +64,24 @@ class PipelineExecutor:
         else:
             self._bars = None
 
+        self._max_prefetch_windows = max(1, context.pipeline_prefetch_windows)
+        self._max_prefetch_bytes = context.pipeline_prefetch_max_bytes
+        # The executed windows that are ready to be consumed, with their sizes.
+        self._outputs: Deque[Tuple[Dataset[Any], int]] = collections.deque()
+        self._output_bytes = 0
+        self._done = False
+        self._error: Optional[BaseException] = None
+        self._shutdown = False
+        self._cond = threading.Condition()
+        # The thread only holds a weak reference, so that dropping the executor
+        # shuts it down.
+        self._thread = threading.Thread(
+            target=_run_executor, args=(weakref.ref(self),), daemon=True
+        )
+        self._thread.start()
+
     def __del__(self):
+        self._shutdown = True
         for f in self._stages:
             if f is not None:
                 f.cancel()
@@ -79,55 +111,126 @@ class PipelineExecutor:
         return self
 
     def __next__(self):
-        output = None
         start = time.perf_counter()
 
-        while output is None:
-            if all(s is None for s in self._stages):
+        with self._cond:
+            while not self._outputs and not self._done:
+                self._cond.wait(timeout=0.1)
+            if self._outputs:
+                output, size_bytes = self._outputs.popleft()
+                self._output_bytes -= size_bytes
+                # Wake up the executor thread if it's waiting for buffer space.
+                self._cond.notify_all()
+            elif self._error is not None:
+                raise self._error
+            else:
                 raise StopIteration
 
-            # Wait for any completed stages.
-            pending = [f for f in self._stages if f is not None]
-            ready, _ = concurrent.futures.wait(pending, timeout=0.1)
-
-            # Bubble elements down the pipeline as they become ready.
-            for i in range(len(self._stages))[::-1]:
-                is_last = i + 1 >= len(self._stages)
-                next_slot_free = is_last or self._stages[i + 1] is None
-                if not next_slot_free:
-                    continue
-
-                slot_ready = self._stages[i] in ready
-                if not slot_ready:
-                    continue
-
-                # Bubble.
-                result = self._stages[i].result()
-                if self._bars:
-                    self._bars[i].update(1)
-                self._stages[i] = None
-                if is_last:
-                    output = result
-                else:
-                    self._stages[i + 1] = self._pool.submit(
-                        lambda r, fn: pipeline_stage(lambda: fn(r)),
-                        result,
-                        self._pipeline._optimized_stages[i],
-                    )
-
-            # Pull a new element for the initial slot if possible.
-            if self._stages[0] is None:
-                try:
-                    self._stages[0] = self._pool.submit(
-                        lambda n: pipeline_stage(n), next(self._iter)
-                    )
-                except StopIteration:
-                    pass
-
         self._pipeline._stats.wait_time_s.append(time.perf_counter() - start)
         self._pipeline._stats.add(output._plan.stats())
         return output
 
+    def _step(self) -> bool:
+        """Move the windows through the stages as they complete.
+
+        Returns:
+            Whether all windows have been executed.
+        """
+        if all(s is None for s in self._stages):
+            return True
+
+        # Wait for any running stages to complete, or, if they all have completed
+        # and are blocked on the consumer, for the consumer to take a window.
+        running = [f for f in self._stages if f is not None and not f.done()]
+        if running:
+            concurrent.futures.wait(
+                running, timeout=0.1, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+        else:
+            with self._cond:
+                self._cond.wait(timeout=0.1)
+        ready = [f for f in self._stages if f is not None and f.done()]
+
+        # Bubble elements down the pipeline as they become ready.
+        for i in range(len(self._stages))[::-1]:
+            is_last = i + 1 >= len(self._stages)
+            next_slot_free = is_last or self._stages[i + 1] is None
+            if not next_slot_free:
+                continue
+
+            slot_ready = self._stages[i] in ready
+            if not slot_ready:
+                continue
+
+            # Bubble.
+            result = self._stages[i].result()
+            if is_last and not self._try_add_output(result):
+                # The prefetch buffer is full, so hold on to this window.
+                continue
+            if self._bars:
+                self._bars[i].update(1)
+            self._stages[i] = None
+            if not is_last:
+                self._stages[i + 1] = self._pool.submit(
+                    lambda r, fn: pipeline_stage(lambda: fn(r)),
+                    result,
+                    self._pipeline._optimized_stages[i],
+                )
+
+        # Pull a new element for the initial slot if possible.
+        if self._stages[0] is None:
+            try:
+                self._stages[0] = self._pool.submit(
+                    lambda n: pipeline_stage(n), next(self._iter)
+                )
+            except StopIteration:
+                pass
+        return False
+
+    def _try_add_output(self, output: Dataset[Any]) -> bool:
+        """Add the executed window to the prefetch buffer if there is room."""
+        size_bytes = _get_size_bytes(output)
+        with self._cond:
+            if self._outputs:
+                if len(self._outputs) >= self._max_prefetch_windows:
+                    return False
+                if (
+                    self._max_prefetch_bytes is not None
+                    and self._output_bytes + size_bytes > self._max_prefetch_bytes
+                ):
+                    return False
+            self._outputs.append((output, size_bytes))
+            self._output_bytes += size_bytes
+            self._cond.notify_all()
+        return True
+
+    def _finish(self, error: Optional[BaseException] = None) -> None:
+        with self._cond:
+            self._done = True
+            self._error = error
+            self._cond.notify_all()
+
+
+def _run_executor(executor_ref: "weakref.ref[PipelineExecutor]") -> None:
+    while True:
+        executor = executor_ref()
+        if executor is None or executor._shutdown:
+            return
+        try:
+            done = executor._step()
+        except BaseException as e:
+            executor._finish(error=e)
+            return
+        if done:
+            executor._finish()
+            return
+        del executor
+
+
+def _get_size_bytes(ds: Dataset[Any]) -> int:
+    """Return the size of the executed dataset, counting unknown sizes as zero."""
+    return sum(m.size_bytes or 0 for m in ds._plan.execute().get_metadata())
+
 
 @ray.remote(num_cpus=0)
 class PipelineSplitExecutorCoordinator:
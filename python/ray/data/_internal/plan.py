@@ -13,14 +13,17 @@ import uuid
 
 if TYPE_CHECKING:
     import pyarrow
+    import pyarrow.dataset
 
 import ray
+from ray.types import ObjectRef
 from ray.data.context import DatasetContext
 from ray.data.block import Block
 from ray.data._internal.block_list import BlockList
 from ray.data._internal.compute import get_compute
-from ray.data._internal.stats import DatasetStats
+from ray.data._internal.stats import DatasetStats, _ObjectStoreSampler
 from ray.data._internal.lazy_block_list import LazyBlockList
+from ray.data._internal.streaming_executor import execute_streaming
 
 # Scheduling strategy can be inherited from prev stage if not specified.
 INHERITABLE_REMOTE_ARGS = ["scheduling_strategy"]
@@ -246,20 +249,9 @@ class ExecutionPlan:
         """
         if not self.has_computed_output():
             blocks, stats, stages = self._optimize()
-            for stage_idx, stage in enumerate(stages):
-                if allow_clear_input_blocks:
-                    clear_input_blocks = self._should_clear_input_blocks(
-                        blocks, stage_idx
-                    )
-                else:
-                    clear_input_blocks = False
-                stats_builder = stats.child_builder(stage.name)
-                blocks, stage_info = stage(blocks, clear_input_blocks)
-                if stage_info:
-                    stats = stats_builder.build_multistage(stage_info)
-                else:
-                    stats = stats_builder.build(blocks)
-                stats.dataset_uuid = uuid.uuid4().hex
+            blocks, stats = self._execute_stages(
+                blocks, stats, stages, allow_clear_input_blocks
+            )
             # Set the snapshot to the output of the final stage.
             self._snapshot_blocks = blocks
             self._snapshot_stats = stats
@@ -270,6 +262,64 @@ class ExecutionPlan:
             self._snapshot_blocks = self._snapshot_blocks.compute_to_blocklist()
         return self._snapshot_blocks
 
+    def execute_to_iterator(
+        self,
+        allow_clear_input_blocks: bool = True,
+    ) -> Tuple[Iterator[ObjectRef[Block]], DatasetStats]:
+        """Execute this plan, returning an iterator over the output blocks.
+
+        If streaming execution is enabled in the DatasetContext and this plan reads
+        from a lazy datasource, the trailing one-to-one stages of the plan are
+        executed in a streaming fashion (see ``execute_streaming()``), so that the
+        output blocks are produced as the iterator is consumed instead of all being
+        materialized in the object store up front. The streamed output is not cached
+        in this plan. Otherwise, this falls back to a full ``execute()``.
+
+        Only these trailing one-to-one stages with the "tasks" compute strategy are
+        streamed; any all-to-all or actor stages before them are executed in bulk.
+        Consumers that don't go through this method, notably
+        ``Dataset.write_datasource()``, always execute the plan in bulk.
+
+        Args:
+            allow_clear_input_blocks: Whether we should try to clear the input blocks
+                for each bulk-executed stage.
+
+        Returns:
+            An iterator over the output blocks, and the stats of the output blocks.
+            The stats are filled out as the iterator is consumed.
+        """
+        context = DatasetContext.get_current()
+        if not self.is_streamable():
+            return self.execute(allow_clear_input_blocks).iter_blocks(), self.stats()
+
+        # The source blocks are lazy, so we don't need to unlink them from the plan
+        # to reclaim memory. Keep them around for future executions, since the
+        # streamed output isn't cached.
+        snapshot_blocks = self._snapshot_blocks
+        blocks, stats, stages = self._optimize()
+        self._snapshot_blocks = snapshot_blocks
+        # Split off the trailing one-to-one task stages for streaming execution.
+        num_streaming_stages = 0
+        for stage in stages[::-1]:
+            if not isinstance(stage, OneToOneStage) or stage.compute != "tasks":
+                break
+            num_streaming_stages += 1
+        if num_streaming_stages == 0:
+            # Nothing to stream.
+            return self.execute(allow_clear_input_blocks).iter_blocks(), self.stats()
+        split_idx = len(stages) - num_streaming_stages
+        blocks, stats = self._execute_stages(
+            blocks, stats, stages[:split_idx], allow_clear_input_blocks
+        )
+        block_iter, stats = execute_streaming(
+            blocks,
+            stats,
+            stages[split_idx:],
+            max_blocks_in_flight=context.streaming_max_blocks_in_flight,
+        )
+        stats.dataset_uuid = self._dataset_uuid
+        return (block for block, _ in block_iter), stats
+
     def clear_block_refs(self) -> None:
         """Clear all cached block references of this plan, including input blocks.
 
@@ -289,6 +339,106 @@ class ExecutionPlan:
         self.execute()
         return self._snapshot_stats
 
+    def explain(self) -> str:
+        """Describe the stages of this plan before and after optimization.
+
+        This never triggers any computation.
+
+        Returns:
+            A description of the source blocks and stages of the next execution of
+            this plan, as given and as they would be optimized.
+        """
+        context = DatasetContext.get_current()
+        if self._snapshot_blocks is not None and not self._snapshot_blocks.is_cleared():
+            blocks = self._snapshot_blocks
+            stages = self._stages_after_snapshot
+        elif self._snapshot_blocks is not None:
+            blocks = self._in_blocks
+            stages = self._stages_before_snapshot + self._stages_after_snapshot
+        else:
+            blocks = self._in_blocks
+            stages = self._stages_after_snapshot
+        out = "Logical plan:\n"
+        out += _describe_stages(_describe_source(blocks), stages)
+
+        optimized = list(stages)
+        if context.optimize_reorder_stages:
+            optimized = _reorder_stages(optimized)
+        source = _describe_source(blocks)
+        if context.optimize_read_pushdown:
+            num_pushed, _, _ = _get_read_pushdown(blocks, optimized)
+            if num_pushed > 0:
+                source += " with {} pushed down".format(
+                    ", ".join(stage.name for stage in optimized[:num_pushed])
+                )
+                optimized = optimized[num_pushed:]
+        if context.optimize_fuse_stages:
+            if context.optimize_fuse_read_stages and _is_lazy(blocks) and optimized:
+                # Only the name of this stand-in for the read stage is used.
+                read_stage = OneToOneStage("read", None, "tasks", blocks._remote_args)
+                optimized.insert(0, read_stage)
+            optimized = _fuse_one_to_one_stages(optimized)
+        out += "Optimized plan:\n"
+        out += _describe_stages(source, optimized)
+        return out
+
+    def _execute_stages(
+        self,
+        blocks: BlockList,
+        stats: DatasetStats,
+        stages: List[Stage],
+        allow_clear_input_blocks: bool,
+    ) -> Tuple[BlockList, DatasetStats]:
+        """Execute the given stages over the given blocks in bulk.
+
+        Args:
+            blocks: The input blocks of the first stage.
+            stats: The stats of the input blocks.
+            stages: The (optimized) stages to execute, in order.
+            allow_clear_input_blocks: Whether we should try to clear the input blocks
+                for each stage.
+
+        Returns:
+            The output blocks of the final stage, and their stats.
+        """
+        object_store_sampler = None
+        if stages and DatasetContext.get_current().object_store_profiling_enabled:
+            object_store_sampler = _ObjectStoreSampler()
+        for stage_idx, stage in enumerate(stages):
+            if allow_clear_input_blocks:
+                clear_input_blocks = self._should_clear_input_blocks(blocks, stage_idx)
+            else:
+                clear_input_blocks = False
+            stats_builder = stats.child_builder(stage.name)
+            blocks, stage_info = stage(blocks, clear_input_blocks)
+            if stage_info:
+                stats = stats_builder.build_multistage(stage_info)
+            else:
+                stats = stats_builder.build(blocks)
+            stats.dataset_uuid = uuid.uuid4().hex
+        if object_store_sampler is not None:
+            stats.object_store_stats = object_store_sampler.finish()
+        return blocks, stats
+
+    def is_streamable(self) -> bool:
+        """Whether ``execute_to_iterator()`` may use streaming execution for this
+        plan."""
+        context = DatasetContext.get_current()
+        return (
+            context.use_streaming_executor
+            and not context.block_splitting_enabled
+            and not self.has_computed_output()
+            and self._has_lazy_source()
+        )
+
+    def _has_lazy_source(self) -> bool:
+        """Whether the source blocks for the next execution of this plan are lazy,
+        i.e. whether they can be re-computed if they're not retained.
+        """
+        if self._snapshot_blocks is not None and not self._snapshot_blocks.is_cleared():
+            return _is_lazy(self._snapshot_blocks)
+        return self.has_lazy_input()
+
     def _should_clear_input_blocks(
         self,
         blocks: BlockList,
@@ -317,6 +467,14 @@ class ExecutionPlan:
         """
         context = DatasetContext.get_current()
         blocks, stats, stages = self._get_source_blocks_and_stages()
+        if context.optimize_reorder_stages:
+            stages = _reorder_stages(stages)
+        if context.optimize_read_pushdown:
+            # If the leading stages are column selections or expression filters over
+            # a datasource that supports pushdown, fold them into the read itself.
+            blocks, stats, stages = _push_down_read_stages(
+                blocks, stats, stages, self._dataset_uuid
+            )
         if context.optimize_fuse_stages:
             if context.optimize_fuse_read_stages:
                 # If using a lazy datasource, rewrite read stage into one-to-one stage
@@ -402,11 +560,40 @@ class OneToOneStage(Stage):
         block_fn: Callable[[Block], Block],
         compute: str,
         ray_remote_args: dict,
+        project_columns: Optional[List[str]] = None,
+        filter_expr: Optional["pyarrow.dataset.Expression"] = None,
+        filter_columns: Optional[List[str]] = None,
+        modified_columns: Optional[List[str]] = None,
     ):
+        """Create a one-to-one stage.
+
+        Args:
+            name: The name of this stage.
+            block_fn: The function to apply to each block.
+            compute: The compute strategy, either "tasks" or an ActorPoolStrategy.
+            ray_remote_args: Ray remote arguments for the stage's tasks or actors.
+            project_columns: If set, this stage is equivalent to selecting these
+                columns, and may be pushed down into a read as a column projection.
+            filter_expr: If set, this stage is equivalent to filtering by this
+                expression, and may be pushed down into a read as a row filter.
+            filter_columns: If set, this stage is a stateless row filter that only
+                reads these columns, and may be moved before the stages that don't
+                modify them.
+            modified_columns: If set, this stage adds or replaces these columns of
+                each row, leaving the other columns and the rows themselves as is.
+        """
         super().__init__(name, None)
         self.block_fn = block_fn
         self.compute = compute or "tasks"
         self.ray_remote_args = ray_remote_args or {}
+        self.project_columns = project_columns
+        self.filter_expr = filter_expr
+        self.filter_columns = filter_columns
+        self.modified_columns = modified_columns
+
+    def is_row_filter(self) -> bool:
+        """Whether this stage is a stateless filter of whole rows."""
+        return self.filter_expr is not None or self.filter_columns is not None
 
     def can_fuse(self, prev: Stage):
         if not isinstance(prev, OneToOneStage):
@@ -455,12 +642,36 @@ class AllToAllStage(Stage):
         supports_block_udf: bool = False,
         block_udf=None,
         remote_args=None,
+        preserves_rows: bool = False,
+        preserves_order: bool = False,
+        ignores_input_order: bool = False,
     ):
+        """Create an all-to-all stage.
+
+        Args:
+            name: The name of this stage.
+            num_blocks: The number of output blocks, or None if this is the number
+                of input blocks.
+            fn: The function to apply to the whole block list.
+            supports_block_udf: Whether a block UDF can be fused into this stage.
+            block_udf: The block UDF fused into this stage, if any.
+            remote_args: Ray remote arguments for the stage's tasks.
+            preserves_rows: Whether this stage outputs exactly the rows of its
+                input, only moving them to other positions or blocks.
+            preserves_order: Whether this stage also preserves the order of the
+                rows, i.e. only changes the blocks that hold them.
+            ignores_input_order: Whether the output of this stage is independent of
+                the order and blocks of its input rows, other than for the number
+                of output blocks if num_blocks is None.
+        """
         super().__init__(name, num_blocks)
         self.fn = fn
         self.supports_block_udf = supports_block_udf
         self.block_udf = block_udf
         self.ray_remote_args = remote_args or {}
+        self.preserves_rows = preserves_rows
+        self.preserves_order = preserves_order
+        self.ignores_input_order = ignores_input_order
 
     def can_fuse(self, prev: Stage):
         context = DatasetContext.get_current()
@@ -498,6 +709,159 @@ class AllToAllStage(Stage):
         return blocks, stage_info
 
 
+def _push_down_read_stages(
+    blocks: BlockList,
+    stats: DatasetStats,
+    stages: List[Stage],
+    dataset_uuid: str,
+) -> Tuple[BlockList, DatasetStats, List[Stage]]:
+    """Push leading projection and filter stages down into the read, if possible.
+
+    For example, [Read -> SelectColumns(a, b) -> Filter(a > 1) -> MapBatches(Fn)]
+    is rewritten to [Read(columns=[a, b], filter=a > 1) -> MapBatches(Fn)], so that
+    the datasource only reads the needed columns and can skip data that doesn't pass
+    the filter (e.g. Parquet row groups whose statistics don't match).
+    """
+    num_pushed, columns, filter_expr = _get_read_pushdown(blocks, stages)
+    if num_pushed == 0:
+        return blocks, stats, stages
+
+    from ray.data.read_api import _get_read_tasks
+
+    read_args = blocks._read_args.copy()
+    read_args["columns"] = columns
+    read_args["filter"] = filter_expr
+    read_tasks = _get_read_tasks(
+        blocks._datasource,
+        DatasetContext.get_current(),
+        blocks._read_parallelism,
+        read_args,
+    )
+    blocks = LazyBlockList(
+        read_tasks,
+        ray_remote_args=blocks._remote_args,
+        datasource=blocks._datasource,
+        read_parallelism=blocks._read_parallelism,
+        read_args=read_args,
+    )
+    stats = blocks.stats()
+    stats.dataset_uuid = dataset_uuid
+    return blocks, stats, stages[num_pushed:]
+
+
+def _get_read_pushdown(
+    blocks: BlockList, stages: List[Stage]
+) -> Tuple[int, Optional[List[str]], Optional["pyarrow.dataset.Expression"]]:
+    """Get the leading stages that can be pushed down into the read.
+
+    Returns:
+        The number of leading stages that can be pushed down, and the columns and
+        filter to read with once they are.
+    """
+    if (
+        not _is_lazy(blocks)
+        or blocks._datasource is None
+        or not blocks._datasource.supports_read_pushdown()
+    ):
+        return 0, None, None
+    columns = blocks._read_args.get("columns")
+    filter_expr = blocks._read_args.get("filter")
+    num_pushed = 0
+    for stage in stages:
+        if not isinstance(stage, OneToOneStage) or stage.compute != "tasks":
+            break
+        if stage.project_columns is not None:
+            if columns is not None and not set(stage.project_columns) <= set(columns):
+                # Let the stage raise the missing column error at execution time.
+                break
+            columns = stage.project_columns
+        elif stage.filter_expr is not None:
+            if filter_expr is None:
+                filter_expr = stage.filter_expr
+            else:
+                filter_expr = filter_expr & stage.filter_expr
+        else:
+            break
+        num_pushed += 1
+    return num_pushed, columns, filter_expr
+
+
+def _reorder_stages(stages: List[Stage]) -> List[Stage]:
+    """Rewrite the stages into an equivalent but cheaper chain of stages.
+
+    This applies the following rules until none of them applies:
+      * Row filters are moved before the preceding stages that don't modify the
+        columns they read, e.g. [WithColumn(b) -> Sort -> Filter(a > 1)] is
+        rewritten to [Filter(a > 1) -> WithColumn(b) -> Sort], so that fewer rows
+        are processed by these stages (and the filter may be pushed into a read).
+      * Stages that only move rows around are dropped if the next stage
+        overwrites their effect, e.g. [Repartition(10) -> Repartition(20)] is
+        rewritten to [Repartition(20)], and [RandomShuffle -> RandomShuffle] to
+        [RandomShuffle].
+
+    Note that the resulting order of rows is still the same, except that the
+    random order of shuffles and the order of rows that compare equal in sorts
+    may differ.
+
+    Args:
+        stages: The stages to rewrite.
+
+    Returns:
+        The rewritten stages.
+    """
+    stages = list(stages)
+    changed = True
+    while changed:
+        changed = False
+        for i in range(1, len(stages)):
+            prev, stage = stages[i - 1], stages[i]
+            if _can_move_filter_before(stage, prev):
+                stages[i - 1], stages[i] = stage, prev
+                changed = True
+            elif _is_overwritten_by(prev, stage):
+                del stages[i - 1]
+                changed = True
+            if changed:
+                break
+    return stages
+
+
+def _can_move_filter_before(stage: Stage, prev: Stage) -> bool:
+    """Whether the row filter stage can be executed before the previous stage."""
+    if not isinstance(stage, OneToOneStage) or not stage.is_row_filter():
+        return False
+    if isinstance(prev, AllToAllStage):
+        return prev.preserves_rows and prev.block_udf is None
+    if (
+        not isinstance(prev, OneToOneStage)
+        or stage.filter_columns is None
+        or prev.is_row_filter()
+    ):
+        return False
+    columns = set(stage.filter_columns)
+    if prev.project_columns is not None:
+        # Otherwise, the filter would read columns dropped by the projection.
+        return columns <= set(prev.project_columns)
+    if prev.modified_columns is not None:
+        return not columns & set(prev.modified_columns)
+    return False
+
+
+def _is_overwritten_by(prev: Stage, stage: Stage) -> bool:
+    """Whether the previous stage can be dropped because its effect is overwritten
+    by the stage."""
+    if not isinstance(prev, AllToAllStage) or not isinstance(stage, AllToAllStage):
+        return False
+    if not prev.preserves_rows or prev.block_udf is not None:
+        return False
+    if not stage.preserves_rows:
+        return False
+    if stage.num_blocks is None and prev.num_blocks is not None:
+        # The number of output blocks depends on the previous stage.
+        return False
+    return stage.ignores_input_order or (prev.preserves_order and stage.preserves_order)
+
+
 def _rewrite_read_stages(
     blocks: BlockList,
     stats: DatasetStats,
@@ -583,6 +947,26 @@ def _are_remote_args_compatible(prev_args, next_args):
     return True
 
 
+def _describe_source(blocks: Optional[BlockList]) -> str:
+    """Describe the source blocks of a plan for explain()."""
+    if blocks is None or blocks.is_cleared():
+        return "Cleared blocks"
+    if _is_lazy(blocks):
+        if blocks._datasource is not None:
+            name = type(blocks._datasource).__name__
+        else:
+            name = "read tasks"
+        return "Read({}, {} blocks)".format(name, blocks.initial_num_blocks())
+    return "Blocks({} blocks)".format(blocks.initial_num_blocks())
+
+
+def _describe_stages(source: str, stages: List[Stage]) -> str:
+    out = "  " + source + "\n"
+    for stage in stages:
+        out += "  -> " + repr(stage) + "\n"
+    return out
+
+
 def _is_lazy(blocks: BlockList) -> bool:
     """Whether the provided block list is lazy."""
     return isinstance(blocks, LazyBlockList)
@@ -0,0 +1,187 @@
+import hashlib
+import logging
+import os
+import uuid
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pyarrow
+    from ray.data.block import Block
+    from ray.data.context import DatasetContext
+
+logger = logging.getLogger(__name__)
+
+# The suffix of cache entry files.
+_ENTRY_SUFFIX = ".blocks"
+
+# The number of read cache hits and misses in this process. These are recorded in
+# the exec stats of the blocks produced by each task, see BlockExecStats.
+_num_hits = 0
+_num_misses = 0
+
+# The read cache of this process, created on first use.
+_read_cache: Optional["ReadCache"] = None
+
+
+def get_read_cache_counts() -> Tuple[int, int]:
+    """Return the number of read cache hits and misses in this process."""
+    return _num_hits, _num_misses
+
+
+def get_read_cache(context: "DatasetContext") -> Optional["ReadCache"]:
+    """Return the read cache of this process, or None if it's disabled."""
+    global _read_cache
+    if not context.read_cache_dir:
+        return None
+    if (
+        _read_cache is None
+        or _read_cache.cache_dir != context.read_cache_dir
+        or _read_cache.max_bytes != context.read_cache_max_bytes
+    ):
+        _read_cache = ReadCache(context.read_cache_dir, context.read_cache_max_bytes)
+    return _read_cache
+
+
+class ReadCache:
+    """A size-bounded LRU cache of the blocks read from files, on local disk.
+
+    Each entry holds the blocks read from a single file (or Parquet fragment), and
+    is keyed by the file path, size and modification time, and the arguments of the
+    read. Changing a file thus invalidates its entries. The cache directory is
+    shared by all of the workers of a node, which only ever write whole entries
+    with an atomic rename, so concurrent reads and writes are safe.
+
+    When the total size of the entries exceeds ``max_bytes``, the least recently
+    used entries are evicted. Each process tracks the total size from the entries
+    it writes and only scans the cache directory once that exceeds ``max_bytes``,
+    so the cache may briefly exceed it by the entries written by other workers.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+        # The estimated total size of the entries, as of the last directory scan
+        # plus the entries written by this process since.
+        self._total_bytes = self._scan()[1]
+
+    def make_key(
+        self,
+        filesystem: "pyarrow.fs.FileSystem",
+        path: str,
+        read_args: Dict[str, Any],
+    ) -> Optional[str]:
+        """Make the cache key for reading the given file.
+
+        Args:
+            filesystem: The filesystem of the file.
+            path: The path of the file.
+            read_args: The arguments that determine the blocks read from the file.
+                These must serialize deterministically to get cache hits.
+
+        Returns:
+            The cache key, or None if the file can't be cached because its
+            modification time is unknown.
+        """
+        info = filesystem.get_file_info(path)
+        if info.mtime_ns is None:
+            return None
+        h = hashlib.sha256()
+        file_id = [type(filesystem).__name__, path, info.size, info.mtime_ns]
+        h.update(repr(file_id).encode("utf-8"))
+        for k, v in sorted(read_args.items()):
+            h.update(k.encode("utf-8"))
+            h.update(_serialize_arg(v))
+        return h.hexdigest()
+
+    def get(self, key: str) -> Optional[List["Block"]]:
+        """Return the cached blocks for the key, or None on a cache miss."""
+        from ray import cloudpickle
+
+        global _num_hits, _num_misses
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as f:
+                blocks = cloudpickle.load(f)
+            # Mark the entry as recently used.
+            os.utime(path)
+        except FileNotFoundError:
+            # The entry doesn't exist or was evicted while we were reading it.
+            _num_misses += 1
+            return None
+        except Exception:
+            # The entry is corrupt, e.g. truncated by a full disk, or was written
+            # by an incompatible version. Drop it so that it gets rewritten.
+            logger.warning(f"Failed to load read cache entry {key}.", exc_info=True)
+            self._remove(path)
+            _num_misses += 1
+            return None
+        _num_hits += 1
+        return blocks
+
+    def put(self, key: str, blocks: List["Block"]) -> None:
+        """Add the blocks read for the key to the cache, evicting old entries."""
+        from ray import cloudpickle
+
+        data = cloudpickle.dumps(blocks)
+        if len(data) > self.max_bytes:
+            return
+        tmp_path = os.path.join(self.cache_dir, f".{key}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._entry_path(key))
+        except OSError:
+            logger.warning(f"Failed to write read cache entry {key}.", exc_info=True)
+            self._remove(tmp_path)
+            return
+        self._total_bytes += len(data)
+        if self._total_bytes > self.max_bytes:
+            self._evict()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + _ENTRY_SUFFIX)
+
+    def _scan(self) -> Tuple[List[Tuple[float, int, str]], int]:
+        """Return the (mtime, size, path) of each entry, and their total size."""
+        entries = []
+        total_bytes = 0
+        for entry in os.scandir(self.cache_dir):
+            if not entry.name.endswith(_ENTRY_SUFFIX):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total_bytes += stat.st_size
+        return entries, total_bytes
+
+    def _evict(self) -> None:
+        entries, total_bytes = self._scan()
+        # Evict the least recently used entries first.
+        entries.sort()
+        for _, size, path in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            self._remove(path)
+            total_bytes -= size
+        self._total_bytes = total_bytes
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            # Another worker removed it concurrently.
+            pass
+
+
+def _serialize_arg(value: Any) -> bytes:
+    from ray import cloudpickle
+
+    try:
+        return cloudpickle.dumps(value)
+    except Exception:
+        # Objects that can't be pickled fall back to their repr, which at worst
+        # includes their address and causes cache misses.
+        return repr(value).encode("utf-8")
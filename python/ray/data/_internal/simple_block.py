@@ -9,6 +9,7 @@ if TYPE_CHECKING:
     import pandas
     import pyarrow
     from ray.data._internal.sort import SortKeyT
+    from ray.data.expressions import Expr
 
 from ray.data.aggregate import AggregateFn
 from ray.data.block import (
@@ -23,6 +24,7 @@ from ray.data.block import (
     KeyFn,
 )
 from ray.data._internal.block_builder import BlockBuilder
+from ray.data._internal.hash_partition import hash_partition_indices, key_column
 from ray.data._internal.size_estimator import SizeEstimator
 
 
@@ -73,6 +75,24 @@ class SimpleBlockAccessor(BlockAccessor):
             view = view.copy()
         return view
 
+    def select(self, columns: List[str]) -> List[T]:
+        raise ValueError(
+            "Column selection is only supported for tabular datasets (Arrow or "
+            "pandas blocks), but got a simple block."
+        )
+
+    def filter(self, predicate: "Expr") -> List[T]:
+        raise ValueError(
+            "Expression filters are only supported for tabular datasets (Arrow or "
+            "pandas blocks), but got a simple block."
+        )
+
+    def with_column(self, name: str, expr: "Expr") -> List[T]:
+        raise ValueError(
+            "Expression columns are only supported for tabular datasets (Arrow or "
+            "pandas blocks), but got a simple block."
+        )
+
     def random_shuffle(self, random_seed: Optional[int]) -> List[T]:
         random = np.random.RandomState(random_seed)
         items = self._items.copy()
@@ -233,7 +253,11 @@ class SimpleBlockAccessor(BlockAccessor):
         )
 
     def sort_and_partition(
-        self, boundaries: List[T], key: "SortKeyT", descending: bool
+        self,
+        boundaries: List[T],
+        key: "SortKeyT",
+        descending: bool,
+        null_placement: str = "at_end",
     ) -> List["Block[T]"]:
         items = sorted(self._items, key=key, reverse=descending)
         if len(boundaries) == 0:
@@ -269,6 +293,17 @@ class SimpleBlockAccessor(BlockAccessor):
         ret.append(items[prev_i:])
         return ret
 
+    def hash_partition(self, key: KeyFn, num_partitions: int) -> List[List[T]]:
+        if not callable(key):
+            raise ValueError(
+                "key must be a callable when hash partitioning Simple blocks, but "
+                f"got: {type(key)}."
+            )
+        partitions = hash_partition_indices(
+            [key_column([key(item) for item in self._items])], num_partitions
+        )
+        return [[self._items[i] for i in indices] for indices in partitions]
+
     def combine(
         self, key: KeyFn, aggs: Tuple[AggregateFn]
     ) -> Block[Tuple[KeyType, AggType]]:
@@ -342,7 +377,10 @@ class SimpleBlockAccessor(BlockAccessor):
 
     @staticmethod
     def merge_sorted_blocks(
-        blocks: List[Block[T]], key: "SortKeyT", descending: bool
+        blocks: List[Block[T]],
+        key: "SortKeyT",
+        descending: bool,
+        null_placement: str = "at_end",
     ) -> Tuple[Block[T], BlockMetadata]:
         stats = BlockExecStats.builder()
         ret = [x for block in blocks for x in block]
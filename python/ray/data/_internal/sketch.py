@@ -0,0 +1,266 @@
+"""Mergeable sketches for the approximate aggregations in ``ray.data.aggregate``.
+
+The sketch states are plain Python bytes, lists and dicts, so that they can be
+stored in the partially combined blocks of any block format (including Arrow) and
+merged by the reducers of a groupby.
+"""
+import collections
+import hashlib
+import math
+import struct
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ray.data.block import Block, BlockAccessor, KeyFn
+from ray.data._internal.hash_partition import stable_hash
+
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+
+def non_null_values(block: Block, on: Optional[KeyFn]) -> np.ndarray:
+    """Return the non-null values of the column or key function in the block."""
+    block_acc = BlockAccessor.for_block(block)
+    if isinstance(on, str):
+        values = block_acc.to_numpy(on)
+    elif on is None:
+        values = block_acc.to_numpy()
+    else:
+        values = np.array([on(r) for r in block_acc.iter_rows()])
+    if values.ndim != 1:
+        raise ValueError(
+            "Approximate aggregations only support scalar values, got values of "
+            f"shape {values.shape[1:]}."
+        )
+    if values.dtype.kind == "f":
+        return values[~np.isnan(values)]
+    if values.dtype == object:
+        return values[np.array([v is not None for v in values], dtype=bool)]
+    return values
+
+
+def _mix64(x: np.ndarray) -> np.ndarray:
+    # The splitmix64 finalizer, which spreads the input bits over all output bits.
+    with np.errstate(over="ignore"):
+        x = x ^ (x >> np.uint64(30))
+        x = x * np.uint64(0xBF58476D1CE4E5B9)
+        x = x ^ (x >> np.uint64(27))
+        x = x * np.uint64(0x94D049BB133111EB)
+        x = x ^ (x >> np.uint64(31))
+    return x
+
+
+def _hash_value(value: Any) -> int:
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, (bool, int)):
+        return value & _MASK64
+    if isinstance(value, float):
+        if math.isfinite(value) and value.is_integer() and abs(value) < 2 ** 63:
+            return int(value) & _MASK64
+        return struct.unpack("<Q", struct.pack("<d", value))[0]
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    if isinstance(value, bytes):
+        return int.from_bytes(hashlib.blake2b(value, digest_size=8).digest(), "little")
+    return stable_hash(value) & _MASK64
+
+
+def hash64(values: np.ndarray) -> np.ndarray:
+    """Hash the values to uint64 consistently across processes.
+
+    Equal numbers of different types (e.g. ``1`` and ``1.0``) hash equal.
+    """
+    if values.dtype.kind in "biu":
+        x = values.astype(np.int64).view(np.uint64)
+    elif values.dtype.kind == "f":
+        values = values.astype(np.float64)
+        with np.errstate(invalid="ignore"):
+            integral = (
+                np.isfinite(values)
+                & (values == np.floor(values))
+                & (np.abs(values) < 2.0 ** 63)
+            )
+        ints = np.where(integral, values, 0).astype(np.int64).view(np.uint64)
+        x = np.where(integral, ints, values.view(np.uint64))
+    else:
+        x = np.array([_hash_value(v) for v in values.tolist()], dtype=np.uint64)
+    return _mix64(x)
+
+
+def hll_init(precision: int) -> bytes:
+    """Return an empty HyperLogLog sketch with 2^precision one-byte registers."""
+    return bytes(1 << precision)
+
+
+def hll_add(registers: bytes, values: np.ndarray) -> bytes:
+    """Add the values to the HyperLogLog sketch."""
+    if len(values) == 0:
+        return registers
+    registers = np.frombuffer(registers, dtype=np.uint8).copy()
+    precision = int(registers.size).bit_length() - 1
+    num_rest_bits = 64 - precision
+    hashes = hash64(values)
+    # The first bits of the hash select the register, and the register keeps the
+    # max position of the first 1 bit in the rest of the hash.
+    idx = (hashes >> np.uint64(num_rest_bits)).astype(np.int64)
+    rest = hashes & np.uint64((1 << num_rest_bits) - 1)
+    bit_length = np.zeros(len(rest), dtype=np.int64)
+    nonzero = rest > 0
+    bit_length[nonzero] = (
+        np.floor(np.log2(rest[nonzero].astype(np.float64))).astype(np.int64) + 1
+    )
+    # Correct for the float conversion rounding up to the next power of 2.
+    rounded_up = nonzero & (
+        (np.uint64(1) << np.maximum(bit_length - 1, 0).astype(np.uint64)) > rest
+    )
+    bit_length[rounded_up] -= 1
+    rank = (num_rest_bits - bit_length + 1).astype(np.uint8)
+    np.maximum.at(registers, idx, rank)
+    return registers.tobytes()
+
+
+def hll_merge(a: bytes, b: bytes) -> bytes:
+    """Merge two HyperLogLog sketches with the same precision."""
+    return np.maximum(
+        np.frombuffer(a, dtype=np.uint8), np.frombuffer(b, dtype=np.uint8)
+    ).tobytes()
+
+
+def hll_estimate(registers: bytes) -> int:
+    """Estimate the number of distinct values added to the HyperLogLog sketch."""
+    registers = np.frombuffer(registers, dtype=np.uint8).astype(np.float64)
+    m = len(registers)
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / np.sum(np.power(2.0, -registers))
+    num_zeros = int(np.sum(registers == 0))
+    if estimate <= 2.5 * m and num_zeros > 0:
+        # Use linear counting for small cardinalities.
+        estimate = m * math.log(m / num_zeros)
+    return int(round(estimate))
+
+
+def kll_add(levels: List[List[float]], values: np.ndarray, k: int) -> List[List[float]]:
+    """Add the values to the KLL quantile sketch with accuracy parameter k."""
+    arrays = [np.asarray(level, dtype=np.float64) for level in levels] or [
+        np.empty(0, dtype=np.float64)
+    ]
+    arrays[0] = np.concatenate([arrays[0], values.astype(np.float64)])
+    return _kll_compact(arrays, k)
+
+
+def kll_merge(a: List[List[float]], b: List[List[float]], k: int) -> List[List[float]]:
+    """Merge two KLL quantile sketches."""
+    if len(a) < len(b):
+        a, b = b, a
+    arrays = [np.asarray(level, dtype=np.float64) for level in a]
+    for i, level in enumerate(b):
+        arrays[i] = np.concatenate([arrays[i], np.asarray(level, dtype=np.float64)])
+    return _kll_compact(arrays, k)
+
+
+def _kll_compact(levels: List[np.ndarray], k: int) -> List[List[float]]:
+    # The items at level i each stand for 2^i values. A level over capacity is
+    # compacted by sorting it and promoting every other item, starting at a
+    # random offset, to the next level. The capacities decrease geometrically
+    # from the top level down, so the sketch holds O(k) items.
+    level = 0
+    while level < len(levels):
+        capacity = max(2, int(math.ceil(k * (2 / 3) ** (len(levels) - 1 - level))))
+        items = levels[level]
+        if len(items) > capacity:
+            items = np.sort(items)
+            # Keep the odd item out at this level.
+            keep = items[len(items) - len(items) % 2 :]
+            items = items[: len(items) - len(items) % 2]
+            promoted = items[np.random.randint(2) :: 2]
+            levels[level] = keep
+            if level + 1 == len(levels):
+                levels.append(promoted)
+            else:
+                levels[level + 1] = np.concatenate([levels[level + 1], promoted])
+        level += 1
+    return [level.tolist() for level in levels]
+
+
+def kll_quantiles(levels: List[List[float]], qs: List[float]) -> List[Optional[float]]:
+    """Estimate the quantiles of the values added to the KLL quantile sketch."""
+    items = np.concatenate(
+        [np.asarray(level, dtype=np.float64) for level in levels]
+        + [np.empty(0, dtype=np.float64)]
+    )
+    if len(items) == 0:
+        return [None] * len(qs)
+    weights = np.concatenate(
+        [np.full(len(level), 2.0 ** i) for i, level in enumerate(levels)]
+    )
+    order = np.argsort(items, kind="stable")
+    items = items[order]
+    cum_weights = np.cumsum(weights[order])
+    ranks = np.asarray(qs, dtype=np.float64) * cum_weights[-1]
+    idx = np.minimum(np.searchsorted(cum_weights, ranks), len(items) - 1)
+    return [float(items[i]) for i in idx]
+
+
+def _cms_columns(values: np.ndarray, depth: int, width: int) -> np.ndarray:
+    # The column of each value in each row of the count-min sketch.
+    hashes = hash64(values)
+    return np.stack(
+        [
+            (_mix64(hashes ^ np.uint64((0x9E3779B97F4A7C15 * (i + 1)) & _MASK64)))
+            % np.uint64(width)
+            for i in range(depth)
+        ]
+    ).astype(np.int64)
+
+
+def topk_init(depth: int, width: int) -> Dict[str, Any]:
+    """Return an empty count-min top-k sketch."""
+    return {"sketch": [[0] * width for _ in range(depth)], "values": [], "counts": []}
+
+
+def topk_add(state: Dict[str, Any], values: np.ndarray, k: int) -> Dict[str, Any]:
+    """Add the values to the count-min top-k sketch."""
+    if len(values) == 0:
+        return state
+    counts = collections.Counter(values.tolist())
+    sketch = np.asarray(state["sketch"], dtype=np.int64)
+    depth, width = sketch.shape
+    new_values = list(counts.keys())
+    columns = _cms_columns(np.array(new_values), depth, width)
+    new_counts = np.array(list(counts.values()), dtype=np.int64)
+    for i in range(depth):
+        np.add.at(sketch[i], columns[i], new_counts)
+    return _topk_candidates(sketch, state["values"] + new_values, k)
+
+
+def topk_merge(a: Dict[str, Any], b: Dict[str, Any], k: int) -> Dict[str, Any]:
+    """Merge two count-min top-k sketches with the same shape."""
+    sketch = np.asarray(a["sketch"], dtype=np.int64) + np.asarray(
+        b["sketch"], dtype=np.int64
+    )
+    return _topk_candidates(sketch, a["values"] + b["values"], k)
+
+
+def _topk_candidates(sketch: np.ndarray, values: List[Any], k: int) -> Dict[str, Any]:
+    # Keep the values with the highest estimated counts as candidates. More
+    # candidates than k are kept, since values whose counts are underestimated
+    # early on may still make it into the final top k.
+    values = list(dict.fromkeys(values))
+    depth, width = sketch.shape
+    if values:
+        columns = _cms_columns(np.array(values), depth, width)
+        estimates = sketch[np.arange(depth)[:, None], columns].min(axis=0)
+        top = np.argsort(-estimates, kind="stable")[: 4 * k]
+        values = [values[i] for i in top]
+        counts = estimates[top].tolist()
+    else:
+        counts = []
+    return {"sketch": sketch.tolist(), "values": values, "counts": counts}
+
+
+def topk_result(state: Dict[str, Any], k: int) -> List[Dict[str, Any]]:
+    """Return the top k values and their estimated counts, most frequent first."""
+    pairs: List[Tuple[Any, int]] = list(zip(state["values"], state["counts"]))
+    pairs.sort(key=lambda p: -p[1])
+    return [{"value": v, "count": c} for v, c in pairs[:k]]
@@ -16,7 +16,7 @@ Merging: a merge task would receive a block from every worker that consists
 of items in a certain range. It then merges the sorted blocks into one sorted
 block and becomes part of the new, sorted dataset.
 """
-from typing import List, Any, Callable, TypeVar, Tuple, Union
+from typing import List, Any, Callable, TypeVar, Tuple, Union, TYPE_CHECKING
 
 import numpy as np
 from ray.types import ObjectRef
@@ -29,6 +29,9 @@ from ray.data._internal.shuffle import ShuffleOp, SimpleShufflePlan
 from ray.data._internal.push_based_shuffle import PushBasedShufflePlan
 from ray.data.context import DatasetContext
 
+if TYPE_CHECKING:
+    import pyarrow
+
 T = TypeVar("T")
 
 # Data can be sorted by value (None), a list of columns and
@@ -36,6 +39,9 @@ T = TypeVar("T")
 # (Callable).
 SortKeyT = Union[None, List[Tuple[str, str]], Callable[[T], Any]]
 
+# Where nulls are placed when sorting by columns, as in pyarrow.
+NULL_PLACEMENTS = ("at_start", "at_end")
+
 
 class _SortOp(ShuffleOp):
     @staticmethod
@@ -46,10 +52,11 @@ class _SortOp(ShuffleOp):
         boundaries: List[T],
         key: SortKeyT,
         descending: bool,
+        null_placement: str,
     ) -> List[Union[BlockMetadata, Block]]:
         stats = BlockExecStats.builder()
         out = BlockAccessor.for_block(block).sort_and_partition(
-            boundaries, key, descending
+            boundaries, key, descending, null_placement=null_placement
         )
         meta = BlockAccessor.for_block(block).get_metadata(
             input_files=None, exec_stats=stats.build()
@@ -58,10 +65,13 @@ class _SortOp(ShuffleOp):
 
     @staticmethod
     def reduce(
-        key: SortKeyT, descending: bool, *mapper_outputs: List[Block]
+        key: SortKeyT,
+        descending: bool,
+        null_placement: str,
+        *mapper_outputs: List[Block],
     ) -> (Block, BlockMetadata):
         return BlockAccessor.for_block(mapper_outputs[0]).merge_sorted_blocks(
-            mapper_outputs, key, descending
+            mapper_outputs, key, descending, null_placement=null_placement
         )
 
 
@@ -74,15 +84,21 @@ class PushBasedSortOp(_SortOp, PushBasedShufflePlan):
 
 
 def sample_boundaries(
-    blocks: List[ObjectRef[Block]], key: SortKeyT, num_reducers: int
+    blocks: List[ObjectRef[Block]],
+    key: SortKeyT,
+    num_reducers: int,
+    null_placement: str = "at_end",
 ) -> List[T]:
     """
     Return (num_reducers - 1) items in ascending order from the blocks that
     partition the domain into ranges with approximately equally many elements.
+
+    For column keys, the items are tuples of the key column values, in the sort
+    order of the key (i.e., taking descending columns and the null placement into
+    account).
     """
-    # TODO(Clark): Support multiple boundary sampling keys.
-    if isinstance(key, list) and len(key) > 1:
-        raise ValueError("Multiple boundary sampling keys not supported.")
+    if isinstance(key, str):
+        key = [(key, "ascending")]
 
     n_samples = int(num_reducers * 10 / len(blocks))
 
@@ -101,8 +117,14 @@ def sample_boundaries(
     for sample in samples:
         builder.add_block(sample)
     samples = builder.build()
-    column = key[0][0] if isinstance(key, list) else None
-    sample_items = BlockAccessor.for_block(samples).to_numpy(column)
+    if isinstance(key, list):
+        return _table_quantiles(
+            BlockAccessor.for_block(samples).to_arrow(),
+            key,
+            null_placement,
+            num_reducers,
+        )
+    sample_items = BlockAccessor.for_block(samples).to_numpy()
     sample_items = np.sort(sample_items)
     ret = [
         np.quantile(sample_items, q, interpolation="nearest")
@@ -111,11 +133,147 @@ def sample_boundaries(
     return ret[1:]
 
 
+def _table_quantiles(
+    samples: "pyarrow.Table",
+    key: List[Tuple[str, str]],
+    null_placement: str,
+    num_reducers: int,
+) -> List[Tuple[Any, ...]]:
+    """Return the key tuples at the num_reducers quantiles of the samples,
+    excluding the first one, in the sort order of the key."""
+    samples = samples.take(sort_indices(samples, key, null_placement))
+    columns = [samples.column(col).to_pylist() for col, _ in key]
+    n = samples.num_rows
+    # Pick the nearest sample to each quantile, as in np.quantile().
+    ret = [
+        tuple(column[int(np.around(q * (n - 1)))] for column in columns)
+        for q in np.linspace(0, 1, num_reducers)
+    ]
+    return ret[1:]
+
+
+def normalize_sort_key(
+    key: Union[None, str, List[str], Callable[[T], Any]],
+    descending: Union[bool, List[bool]],
+) -> SortKeyT:
+    """Normalize column sort keys to a list of (column, order) tuples.
+
+    Args:
+        key: None, a key function, a column name or a list of column names.
+        descending: Whether to sort in descending order, either for all columns or
+            for each column of the key.
+
+    Returns:
+        The key unchanged if it's None or a key function, otherwise a list of
+        (column, "ascending" | "descending") tuples.
+    """
+    if key is None or callable(key):
+        if not isinstance(descending, bool):
+            raise ValueError(
+                "descending must be a bool when not sorting by columns, got: "
+                f"{descending}"
+            )
+        return key
+    if isinstance(key, str):
+        key = [key]
+    if isinstance(descending, bool):
+        descending = [descending] * len(key)
+    elif len(descending) != len(key):
+        raise ValueError(
+            "descending must be a bool or a list with one bool per key column, "
+            f"got {descending} for key {key}"
+        )
+    return [(k, "descending" if d else "ascending") for k, d in zip(key, descending)]
+
+
+def sort_indices(
+    table: "pyarrow.Table", key: List[Tuple[str, str]], null_placement: str
+) -> "pyarrow.Array":
+    """Return the indices that stably sort the table by the key."""
+    import pyarrow
+    import pyarrow.compute as pac
+
+    if null_placement == "at_end":
+        return pac.sort_indices(table, sort_keys=key)
+    # Older pyarrow versions always sort nulls at the end, so sort by whether each
+    # key column is valid before sorting by the column itself.
+    columns = {}
+    sort_keys = []
+    for i, (col, order) in enumerate(key):
+        valid_col = f"__is_valid_{i}"
+        columns[valid_col] = pac.is_valid(table[col])
+        columns[col] = table[col]
+        sort_keys += [(valid_col, "ascending"), (col, order)]
+    return pac.sort_indices(pyarrow.Table.from_pydict(columns), sort_keys=sort_keys)
+
+
+def count_rows_before(
+    table: "pyarrow.Table",
+    key: List[Tuple[str, str]],
+    boundary: Union[Tuple[Any, ...], Any],
+    null_placement: str,
+) -> int:
+    """Count the rows of the table that sort strictly before the boundary.
+
+    This is vectorized over the rows, comparing the key columns lexicographically
+    while respecting the order of each column and the null placement.
+
+    Args:
+        table: The table to count the rows of.
+        key: The sort key.
+        boundary: The key values of the boundary, or a single value for a key with
+            a single column.
+        null_placement: Where the nulls sort, "at_start" or "at_end".
+    """
+    import pyarrow.compute as pac
+
+    if not isinstance(boundary, tuple):
+        boundary = (boundary,)
+    nulls_first = null_placement == "at_start"
+    before = None
+    # Build the lexicographic comparison from the last column to the first.
+    for (col, order), value in reversed(list(zip(key, boundary))):
+        column = table[col]
+        if value is None:
+            is_null = pac.is_null(column)
+            if nulls_first:
+                # No row sorts before a null.
+                col_before = pac.and_(is_null, pac.invert(is_null))
+            else:
+                col_before = pac.invert(is_null)
+            col_equal = is_null
+        else:
+            less = pac.greater if order == "descending" else pac.less
+            # Comparisons with nulls are null, so fill in where nulls sort.
+            col_before = pac.fill_null(less(column, value), nulls_first)
+            col_equal = pac.fill_null(pac.equal(column, value), False)
+        if before is None:
+            before = col_before
+        else:
+            before = pac.or_(col_before, pac.and_(col_equal, before))
+    return pac.sum(before).as_py() or 0
+
+
 # Note: currently the map_groups() API relies on this implementation
 # to partition the same key into the same block.
 def sort_impl(
-    blocks: BlockList, clear_input_blocks: bool, key: SortKeyT, descending: bool = False
+    blocks: BlockList,
+    clear_input_blocks: bool,
+    key: SortKeyT,
+    descending: bool = False,
+    null_placement: str = "at_end",
 ) -> Tuple[BlockList, dict]:
+    """Sort the blocks by the key.
+
+    Args:
+        blocks: The blocks to sort.
+        clear_input_blocks: Whether to clear the input blocks.
+        key: The sort key, see ``normalize_sort_key()``.
+        descending: Whether to sort in descending order. This is ignored for
+            column keys, whose order is given per column.
+        null_placement: Where to sort nulls for column keys, "at_start" or
+            "at_end".
+    """
     stage_info = {}
     blocks_list = blocks.get_blocks()
     if len(blocks_list) == 0:
@@ -124,15 +282,13 @@ def sort_impl(
     if isinstance(key, str):
         key = [(key, "descending" if descending else "ascending")]
 
-    if isinstance(key, list):
-        descending = key[0][1] == "descending"
-
     num_mappers = len(blocks_list)
     # Use same number of output partitions.
     num_reducers = num_mappers
     # TODO(swang): sample_boundaries could be fused with a previous stage.
-    boundaries = sample_boundaries(blocks_list, key, num_reducers)
-    if descending:
+    boundaries = sample_boundaries(blocks_list, key, num_reducers, null_placement)
+    if descending and not isinstance(key, list):
+        # Column key boundaries are already in the sort order.
         boundaries.reverse()
 
     context = DatasetContext.get_current()
@@ -141,7 +297,8 @@ def sort_impl(
     else:
         sort_op_cls = SimpleSortOp
     sort_op = sort_op_cls(
-        map_args=[boundaries, key, descending], reduce_args=[key, descending]
+        map_args=[boundaries, key, descending, null_placement],
+        reduce_args=[key, descending, null_placement],
     )
     return sort_op.execute(
         blocks,
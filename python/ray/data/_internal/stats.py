@@ -1,7 +1,10 @@
 from contextlib import contextmanager
-from typing import List, Optional, Set, Dict, Tuple, Union
+from typing import Any, List, Optional, Set, Dict, Tuple, Union
+import logging
+import threading
 import time
 import collections
+import weakref
 import numpy as np
 
 import ray
@@ -9,6 +12,11 @@ from ray.data.block import BlockMetadata
 from ray.data.context import DatasetContext
 from ray.data._internal.block_list import BlockList
 
+logger = logging.getLogger(__name__)
+
+# The interval between samples of the object store stats while a plan executes.
+OBJECT_STORE_SAMPLE_INTERVAL_S = 1.0
+
 
 def fmt(seconds: float) -> str:
     if seconds > 1:
@@ -40,6 +48,126 @@ class Timer:
         return self._value
 
 
+# Raylet address and the gRPC stub used to sample the object store stats.
+_node_manager_stub: Optional[Tuple[str, Any]] = None
+
+
+def _get_node_manager_stub(address: str) -> Any:
+    """Get a cached gRPC stub for the raylet at the given address."""
+    import ray._private.utils as utils
+    from ray.core.generated import node_manager_pb2_grpc
+
+    global _node_manager_stub
+    # Need to re-create it if Ray restarts on a different raylet.
+    cached = _node_manager_stub
+    if cached is None or cached[0] != address:
+        channel = utils.init_grpc_channel(address)
+        cached = (address, node_manager_pb2_grpc.NodeManagerServiceStub(channel))
+        _node_manager_stub = cached
+    return cached[1]
+
+
+def _get_object_store_stats() -> Optional[Dict[str, int]]:
+    """Get the object store usage and spilling totals of the whole cluster.
+
+    Returns:
+        A dict with the "bytes_used", "spilled_bytes_total" and
+        "restored_bytes_total" of the cluster, or None if these are unavailable
+        (e.g., when connected with Ray Client).
+    """
+    from ray.core.generated import node_manager_pb2
+
+    try:
+        node = ray.worker.global_worker.node
+        stub = _get_node_manager_stub(
+            "{}:{}".format(node.raylet_ip_address, node.node_manager_port)
+        )
+        # Any raylet can be asked for the memory info of the whole cluster.
+        reply = stub.FormatGlobalMemoryInfo(
+            node_manager_pb2.FormatGlobalMemoryInfoRequest(include_memory_info=False),
+            timeout=10.0,
+        )
+    except Exception:
+        logger.debug("Failed to get the object store stats.", exc_info=True)
+        return None
+    return {
+        "bytes_used": reply.store_stats.object_store_bytes_used,
+        "spilled_bytes_total": reply.store_stats.spilled_bytes_total,
+        "restored_bytes_total": reply.store_stats.restored_bytes_total,
+    }
+
+
+class _ObjectStoreSampler:
+    """Helper class for profiling the object store while a plan executes.
+
+    When this class is created, we sample the object store stats of the cluster,
+    and keep sampling them in a background thread until finish() is called. Since
+    the stats are cluster-wide, concurrently executing datasets are included, so
+    they aren't attributed to individual stages."""
+
+    def __init__(self, interval_s: float = OBJECT_STORE_SAMPLE_INTERVAL_S):
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._start = _get_object_store_stats()
+        self._peak_bytes_used = None
+        if self._start is not None:
+            self._peak_bytes_used = self._start["bytes_used"]
+            # The thread only holds a weak reference, so that it exits if the
+            # stage fails before finish() is called.
+            threading.Thread(
+                target=_sample_object_store,
+                args=(weakref.ref(self), self._stopped, interval_s),
+                daemon=True,
+            ).start()
+
+    def add_sample(self, sample: Dict[str, int]) -> None:
+        with self._lock:
+            self._peak_bytes_used = max(self._peak_bytes_used, sample["bytes_used"])
+
+    def finish(self) -> Optional[Dict[str, int]]:
+        """Stop sampling.
+
+        Returns:
+            A dict with the "peak_bytes_used" of the object store, and the
+            "spilled_bytes" and "restored_bytes" since this sampler was created, or
+            None if the object store stats are unavailable.
+        """
+        self._stopped.set()
+        if self._start is None:
+            return None
+        end = _get_object_store_stats()
+        if end is None:
+            return None
+        self.add_sample(end)
+        return {
+            "peak_bytes_used": self._peak_bytes_used,
+            "spilled_bytes": (
+                end["spilled_bytes_total"] - self._start["spilled_bytes_total"]
+            ),
+            "restored_bytes": (
+                end["restored_bytes_total"] - self._start["restored_bytes_total"]
+            ),
+        }
+
+    def __del__(self):
+        self._stopped.set()
+
+
+def _sample_object_store(
+    sampler_ref: "weakref.ref[_ObjectStoreSampler]",
+    stopped: threading.Event,
+    interval_s: float,
+) -> None:
+    while not stopped.wait(interval_s):
+        sample = _get_object_store_stats()
+        sampler = sampler_ref()
+        if sampler is None:
+            return
+        if sample is not None:
+            sampler.add_sample(sample)
+        del sampler
+
+
 class _DatasetStatsBuilder:
     """Helper class for building dataset stats.
 
@@ -180,6 +308,10 @@ class DatasetStats:
         self.time_total_s: float = 0
         self.needs_stats_actor = needs_stats_actor
         self.stats_uuid = stats_uuid
+        # The cluster-wide object store usage and spilling while executing the plan
+        # that produced this Dataset, if object store profiling is enabled. This is
+        # only set on the stats of the last stage. See _ObjectStoreSampler.finish().
+        self.object_store_stats: Optional[Dict[str, int]] = None
 
         # Iteration stats, filled out if the user iterates over the dataset.
         self.iter_wait_s: Timer = Timer()
@@ -210,13 +342,7 @@ class DatasetStats:
         if already_printed is None:
             already_printed = set()
 
-        if self.needs_stats_actor:
-            # XXX this is a super hack, clean it up.
-            stats_map, self.time_total_s = ray.get(
-                self.stats_actor.get.remote(self.stats_uuid)
-            )
-            for i, metadata in stats_map.items():
-                self.stages["read"][i] = metadata
+        self._fetch_stats_actor_metadata()
         out = ""
         if self.parents:
             for p in self.parents:
@@ -233,6 +359,7 @@ class DatasetStats:
             else:
                 already_printed.add(stage_uuid)
                 out += self._summarize_blocks(metadata, is_substage=False)
+                out += self._summarize_object_store()
         elif len(self.stages) > 1:
             rounded_total = round(self.time_total_s, 2)
             if rounded_total <= 0:
@@ -241,6 +368,7 @@ class DatasetStats:
             out += "Stage {} {}: executed in {}s\n".format(
                 self.number, self.base_name, rounded_total
             )
+            out += self._summarize_object_store()
             for n, (stage_name, metadata) in enumerate(self.stages.items()):
                 stage_uuid = self.dataset_uuid + stage_name
                 out += "\n"
@@ -253,6 +381,108 @@ class DatasetStats:
         out += self._summarize_iter()
         return out
 
+    def to_dict(self, already_added: Set[str] = None) -> Dict[str, Any]:
+        """Return a structured summary of this Dataset's stats.
+
+        This holds the same stats as summary_string(), with all of the values
+        in bytes and seconds.
+
+        Returns:
+            A dict with a "stages" list, holding a dict for each stage executed to
+            create this Dataset and its parents in execution order, and an "iter"
+            dict holding the iterator time breakdown of this Dataset.
+        """
+        if already_added is None:
+            already_added = set()
+
+        self._fetch_stats_actor_metadata()
+        stages = []
+        if self.parents:
+            for p in self.parents:
+                stages.extend(p.to_dict(already_added)["stages"])
+        substages = []
+        for stage_name, metadata in self.stages.items():
+            stage_uuid = self.dataset_uuid + stage_name
+            if stage_uuid in already_added:
+                continue
+            already_added.add(stage_uuid)
+            substage = {"name": stage_name}
+            substage.update(self._blocks_to_dict(metadata))
+            substages.append(substage)
+        if substages:
+            stages.append(
+                {
+                    "number": self.number,
+                    "name": self.base_name or substages[0]["name"],
+                    "time_total_s": max(self.time_total_s, 0),
+                    "cluster_object_store": self.object_store_stats,
+                    "substages": substages,
+                }
+            )
+        return {
+            "stages": stages,
+            "iter": {
+                "wait_s": self.iter_wait_s.get(),
+                "get_s": self.iter_get_s.get(),
+                "format_batch_s": self.iter_format_batch_s.get(),
+                "user_s": self.iter_user_s.get(),
+                "total_s": self.iter_total_s.get(),
+            },
+        }
+
+    def _fetch_stats_actor_metadata(self) -> None:
+        if self.needs_stats_actor:
+            # XXX this is a super hack, clean it up.
+            stats_map, self.time_total_s = ray.get(
+                self.stats_actor.get.remote(self.stats_uuid)
+            )
+            for i, metadata in stats_map.items():
+                # Tasks launched past the end of a limited read are discarded.
+                if i < len(self.stages["read"]):
+                    self.stages["read"][i] = metadata
+
+    def _blocks_to_dict(self, blocks: List[BlockMetadata]) -> Dict[str, Any]:
+        exec_stats = [m.exec_stats for m in blocks if m.exec_stats is not None]
+        node_counts = collections.Counter(e.node_id for e in exec_stats)
+        local_bytes = [
+            e.local_input_bytes for e in exec_stats if e.local_input_bytes is not None
+        ]
+        remote_bytes = [
+            e.remote_input_bytes for e in exec_stats if e.remote_input_bytes is not None
+        ]
+        return {
+            "num_blocks": len(blocks),
+            "num_blocks_executed": len(exec_stats),
+            "wall_time_s": _min_max_mean_total([e.wall_time_s for e in exec_stats]),
+            "cpu_time_s": _min_max_mean_total([e.cpu_time_s for e in exec_stats]),
+            "output_num_rows": _min_max_mean_total(
+                [m.num_rows for m in blocks if m.num_rows is not None]
+            ),
+            "output_size_bytes": _min_max_mean_total(
+                [m.size_bytes for m in blocks if m.size_bytes is not None]
+            ),
+            "rss_bytes": _min_max_mean_total(
+                [e.rss_bytes for e in exec_stats if e.rss_bytes is not None]
+            ),
+            "read_cache_hits": sum(e.read_cache_hits for e in exec_stats),
+            "read_cache_misses": sum(e.read_cache_misses for e in exec_stats),
+            "local_input_bytes": sum(local_bytes) if local_bytes else None,
+            "remote_input_bytes": sum(remote_bytes) if remote_bytes else None,
+            "num_nodes": len(node_counts),
+        }
+
+    def _summarize_object_store(self) -> str:
+        if self.object_store_stats is None:
+            return ""
+        return (
+            "* Cluster object store during execution: {} peak bytes used, {} bytes "
+            "spilled, {} bytes restored\n".format(
+                self.object_store_stats["peak_bytes_used"],
+                self.object_store_stats["spilled_bytes"],
+                self.object_store_stats["restored_bytes"],
+            )
+        )
+
     def _summarize_iter(self) -> str:
         out = ""
         if (
@@ -335,6 +565,32 @@ class DatasetStats:
                 sum(output_size_bytes),
             )
 
+        rss_bytes = [e.rss_bytes for e in exec_stats if e.rss_bytes is not None]
+        if rss_bytes:
+            out += indent
+            out += "* Worker RSS at task end: {} min, {} max, {} mean bytes\n".format(
+                min(rss_bytes), max(rss_bytes), int(np.mean(rss_bytes))
+            )
+
+        cache_hits = sum(e.read_cache_hits for e in exec_stats)
+        cache_misses = sum(e.read_cache_misses for e in exec_stats)
+        if cache_hits or cache_misses:
+            out += indent
+            out += "* Read cache: {} hits, {} misses\n".format(cache_hits, cache_misses)
+
+        local_bytes = [
+            e.local_input_bytes for e in exec_stats if e.local_input_bytes is not None
+        ]
+        remote_bytes = [
+            e.remote_input_bytes for e in exec_stats if e.remote_input_bytes is not None
+        ]
+        if local_bytes or remote_bytes:
+            out += indent
+            out += (
+                "* Input locality: {} bytes read locally, {} bytes transferred "
+                "from remote nodes\n".format(sum(local_bytes), sum(remote_bytes))
+            )
+
         if exec_stats:
             node_counts = collections.defaultdict(int)
             for s in exec_stats:
@@ -350,6 +606,17 @@ class DatasetStats:
         return out
 
 
+def _min_max_mean_total(values: List[float]) -> Optional[Dict[str, float]]:
+    if not values:
+        return None
+    return {
+        "min": min(values),
+        "max": max(values),
+        "mean": float(np.mean(values)),
+        "total": sum(values),
+    }
+
+
 class DatasetPipelineStats:
     """Holds the execution times for a pipeline of Datasets."""
 
@@ -401,6 +668,34 @@ class DatasetPipelineStats:
 
         return out
 
+    def to_dict(self, exclude_first_window: bool = True) -> Dict[str, Any]:
+        """Return a structured summary of this pipeline's stats.
+
+        Returns:
+            A dict with a "windows" list holding the DatasetStats.to_dict() of each
+            tracked window, the "wait_time_s" stalled waiting for windows, and an
+            "iter" dict holding the iterator time breakdown of this pipeline.
+        """
+        already_added = set()
+        windows = []
+        for i, stats in self.history_buffer:
+            window = stats.to_dict(already_added)
+            window["window"] = i
+            windows.append(window)
+        wait_time_s = self.wait_time_s[1 if exclude_first_window else 0 :]
+        return {
+            "windows": windows,
+            "wait_time_s": _min_max_mean_total(wait_time_s),
+            "iter": {
+                "ds_wait_s": self.iter_ds_wait_s.get(),
+                "wait_s": self.iter_wait_s.get(),
+                "get_s": self.iter_get_s.get(),
+                "format_batch_s": self.iter_format_batch_s.get(),
+                "user_s": self.iter_user_s.get(),
+                "total_s": self.iter_total_s.get(),
+            },
+        }
+
     def summary_string(self, exclude_first_window: bool = True) -> str:
         """Return a human-readable summary of this pipeline's stats."""
         already_printed = set()
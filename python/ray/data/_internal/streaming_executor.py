@@ -0,0 +1,106 @@
+import collections
+import time
+import uuid
+from typing import Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+import ray
+from ray.types import ObjectRef
+from ray.data.block import Block, BlockMetadata
+from ray.data._internal.block_list import BlockList
+from ray.data._internal.compute import _map_block_nosplit
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data._internal.stats import DatasetStats
+
+if TYPE_CHECKING:
+    from ray.data._internal.plan import OneToOneStage
+
+
+def default_max_blocks_in_flight() -> int:
+    """The default bound on in-flight blocks for streaming execution.
+
+    This is sized to keep every CPU in the cluster busy with some slack for
+    straggler tasks, so that object store usage is proportional to the cluster
+    parallelism rather than to the dataset size.
+    """
+    return max(1, int(ray.cluster_resources().get("CPU", 1))) * 2
+
+
+def execute_streaming(
+    blocks: BlockList,
+    stats: DatasetStats,
+    stages: List["OneToOneStage"],
+    max_blocks_in_flight: Optional[int] = None,
+) -> Tuple[Iterator[Tuple[ObjectRef[Block], BlockMetadata]], DatasetStats]:
+    """Execute a chain of one-to-one task stages in a streaming fashion.
+
+    Instead of running each stage to completion over all blocks before starting the
+    next one, each input block is pushed through the whole chain of stages as soon as
+    it is submitted, and output blocks are yielded in order as they complete. At most
+    ``max_blocks_in_flight`` blocks are submitted but not yet consumed at any time,
+    so a slow consumer applies backpressure to the upstream stages. Since the
+    stages are chained per block, this bound covers the whole chain: there is no
+    separate bound on the blocks in flight between two of the stages.
+
+    Args:
+        blocks: The input blocks. These are not cleared by this function.
+        stats: The stats of the input blocks.
+        stages: The one-to-one stages to apply, which must use the "tasks" compute
+            strategy.
+        max_blocks_in_flight: The max number of blocks to have in flight at once,
+            or None to size this based on the cluster CPUs.
+
+    Returns:
+        An iterator over the output blocks and their metadata, and the stats for the
+        output blocks. The stats are filled out as the iterator is consumed.
+    """
+    assert stages, stages
+    if max_blocks_in_flight is None:
+        max_blocks_in_flight = default_max_blocks_in_flight()
+    if max_blocks_in_flight < 1:
+        raise ValueError(
+            f"max_blocks_in_flight must be >= 1, got: {max_blocks_in_flight}"
+        )
+    name = "->".join(stage.name for stage in stages)
+    # The output metadata is appended to this list as blocks complete.
+    output_metadata: List[BlockMetadata] = []
+    output_stats = DatasetStats(stages={name: output_metadata}, parent=stats)
+    output_stats.dataset_uuid = uuid.uuid4().hex
+    map_blocks = [
+        cached_remote_fn(_map_block_nosplit).options(
+            **dict(stage.ray_remote_args, num_returns=2)
+        )
+        for stage in stages
+    ]
+
+    def submit(
+        block: ObjectRef[Block], meta: BlockMetadata
+    ) -> Tuple[ObjectRef[Block], ObjectRef[BlockMetadata]]:
+        # Chain the per-block tasks of each stage; Ray pipelines these through
+        # their data dependencies, so we only wait on the final output.
+        meta_ref = None
+        for stage, map_block in zip(stages, map_blocks):
+            block, meta_ref = map_block.remote(block, stage.block_fn, meta.input_files)
+        return block, meta_ref
+
+    def gen() -> Iterator[Tuple[ObjectRef[Block], BlockMetadata]]:
+        start_time = time.perf_counter()
+        input_iter = iter(blocks.iter_blocks_with_metadata())
+        in_flight = collections.deque()
+        input_done = False
+        while True:
+            while not input_done and len(in_flight) < max_blocks_in_flight:
+                try:
+                    block, meta = next(input_iter)
+                except StopIteration:
+                    input_done = True
+                else:
+                    in_flight.append(submit(block, meta))
+            if not in_flight:
+                break
+            block, meta_ref = in_flight.popleft()
+            meta = ray.get(meta_ref)
+            output_metadata.append(meta)
+            output_stats.time_total_s = time.perf_counter() - start_time
+            yield block, meta
+
+    return gen(), output_stats
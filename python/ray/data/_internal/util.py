@@ -1,7 +1,12 @@
 import logging
-from typing import Union
+from typing import Optional, Union, TYPE_CHECKING
 from types import ModuleType
 
+import ray
+
+if TYPE_CHECKING:
+    from ray.data.context import DatasetContext
+
 logger = logging.getLogger(__name__)
 
 MIN_PYARROW_VERSION = (6, 0, 1)
@@ -51,3 +56,39 @@ def _check_pyarrow_version():
             )
         else:
             _VERSION_VALIDATED = True
+
+
+def _autodetect_parallelism(
+    parallelism: int, ctx: "DatasetContext", mem_size: Optional[int] = None
+) -> int:
+    """Returns parallelism to use, autodetecting it if parallelism is -1.
+
+    The autodetected parallelism is the largest of:
+        * ``ctx.min_parallelism``, as long as this doesn't make the blocks smaller
+          than ``ctx.target_min_block_size``.
+        * The number of blocks needed to keep the blocks smaller than
+          ``ctx.target_max_block_size``.
+        * Twice the number of CPUs in the cluster, to use all of them.
+
+    Args:
+        parallelism: The user-requested parallelism, or -1 for auto-detection.
+        ctx: The current dataset context.
+        mem_size: The estimated in-memory size of the data in bytes, or None if
+            unknown.
+
+    Returns:
+        The parallelism to use.
+    """
+    if parallelism > 0:
+        return parallelism
+    if parallelism != -1:
+        raise ValueError(f"parallelism must be positive or -1, got: {parallelism}")
+    min_parallelism = ctx.min_parallelism
+    if mem_size is not None and mem_size > 0:
+        min_safe_parallelism = -(-mem_size // ctx.target_max_block_size)
+        max_reasonable_parallelism = max(1, mem_size // ctx.target_min_block_size)
+        min_parallelism = max(
+            min(min_parallelism, max_reasonable_parallelism), min_safe_parallelism
+        )
+    num_cpus = int(ray.cluster_resources().get("CPU", 1)) if ray.is_initialized() else 1
+    return max(min_parallelism, 2 * num_cpus)
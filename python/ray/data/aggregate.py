@@ -1,5 +1,5 @@
 import math
-from typing import Callable, Optional, List, TYPE_CHECKING
+from typing import Callable, Optional, List, Union, TYPE_CHECKING
 
 from ray.util.annotations import PublicAPI
 from ray.data.block import (
@@ -305,6 +305,115 @@ class AbsMax(_AggregateOnKeyBase):
         )
 
 
+@PublicAPI(stability="alpha")
+class ApproxCountDistinct(_AggregateOnKeyBase):
+    """Defines approximate distinct count aggregation with HyperLogLog.
+
+    The accumulator is a HyperLogLog sketch of ``2^precision`` one-byte registers,
+    with a relative standard error of about ``1.04 / sqrt(2^precision)`` (1.6% for
+    the default precision). Nulls are ignored.
+    """
+
+    def __init__(self, on: Optional[KeyFn] = None, precision: int = 12):
+        from ray.data._internal import sketch
+
+        if not 4 <= precision <= 16:
+            raise ValueError(f"precision must be in [4, 16], got: {precision}")
+        self._set_key_fn(on)
+
+        super().__init__(
+            init=lambda k: sketch.hll_init(precision),
+            merge=sketch.hll_merge,
+            accumulate_block=lambda a, block: sketch.hll_add(
+                a, sketch.non_null_values(block, on)
+            ),
+            finalize=sketch.hll_estimate,
+            name=(f"approx_count_distinct({str(on)})"),
+        )
+
+
+@PublicAPI(stability="alpha")
+class ApproxQuantile(_AggregateOnKeyBase):
+    """Defines approximate quantile aggregation with a KLL sketch.
+
+    The accumulator holds ``O(k)`` sampled values, and the rank error of the
+    quantiles is about ``1.7 / k`` (under 1% for the default ``k``). Nulls are
+    ignored, and the result is None if there are no values.
+    """
+
+    def __init__(
+        self,
+        on: Optional[KeyFn] = None,
+        q: Union[float, List[float]] = 0.5,
+        k: int = 200,
+    ):
+        from ray.data._internal import sketch
+
+        qs = [q] if isinstance(q, (int, float)) else list(q)
+        if not all(0 <= x <= 1 for x in qs):
+            raise ValueError(f"quantiles must be in [0, 1], got: {q}")
+        if k < 8:
+            raise ValueError(f"k must be >= 8, got: {k}")
+        self._set_key_fn(on)
+
+        def finalize(a: List[List[float]]) -> Union[float, List[float]]:
+            result = sketch.kll_quantiles(a, qs)
+            return result[0] if isinstance(q, (int, float)) else result
+
+        super().__init__(
+            init=lambda k_: [],
+            merge=lambda a1, a2: sketch.kll_merge(a1, a2, k),
+            accumulate_block=lambda a, block: sketch.kll_add(
+                a, sketch.non_null_values(block, on), k
+            ),
+            finalize=finalize,
+            name=(f"approx_quantile({str(on)})"),
+        )
+
+
+@PublicAPI(stability="alpha")
+class ApproxTopK(_AggregateOnKeyBase):
+    """Defines approximate most frequent values aggregation with a count-min sketch.
+
+    The accumulator is a ``depth`` x ``width`` count-min sketch of the value counts
+    plus a bounded set of candidate values. The counts are overestimated by at most
+    ``e / width`` times the number of values, with probability ``1 - e^-depth``.
+    Nulls are ignored.
+
+    The whole sketch is kept for every group of a groupby, so the partially
+    combined blocks hold ``depth * width`` counts (4096 by default) per group and
+    block. Lower the ``width`` when aggregating over many groups.
+
+    The result is a list of up to ``k`` ``{"value": value, "count": count}`` dicts,
+    with the most frequent values first.
+    """
+
+    def __init__(
+        self,
+        on: Optional[KeyFn] = None,
+        k: int = 10,
+        width: int = 1024,
+        depth: int = 4,
+    ):
+        from ray.data._internal import sketch
+
+        if k < 1 or width < 1 or depth < 1:
+            raise ValueError(
+                f"k, width and depth must be >= 1, got: {k}, {width}, {depth}"
+            )
+        self._set_key_fn(on)
+
+        super().__init__(
+            init=lambda k_: sketch.topk_init(depth, width),
+            merge=lambda a1, a2: sketch.topk_merge(a1, a2, k),
+            accumulate_block=lambda a, block: sketch.topk_add(
+                a, sketch.non_null_values(block, on), k
+            ),
+            finalize=lambda a: sketch.topk_result(a, k),
+            name=(f"approx_top_k({str(on)})"),
+        )
+
+
 def _to_on_fn(on: Optional[KeyFn]):
     if on is None:
         return lambda r: r
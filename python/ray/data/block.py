@@ -21,10 +21,13 @@ if TYPE_CHECKING:
     from ray.data._internal.block_builder import BlockBuilder
     from ray.data.aggregate import AggregateFn
     from ray.data import Dataset
+    from ray.data.expressions import Expr
 
 import ray
 from ray.types import ObjectRef
 from ray.util.annotations import DeveloperAPI
+from ray.data.context import DatasetContext
+from ray.data._internal.read_cache import get_read_cache_counts
 from ray.data._internal.util import _check_pyarrow_version
 
 T = TypeVar("T")
@@ -103,11 +106,25 @@ class BlockExecStats:
         wall_time_s: The wall-clock time it took to compute this block.
         cpu_time_s: The CPU time it took to compute this block.
         node_id: A unique id for the node that computed this block.
+        read_cache_hits: The number of files read from the read cache.
+        read_cache_misses: The number of files not found in the read cache.
+        local_input_bytes: The size of the input block if it was read from the
+            same node, or None if unknown.
+        remote_input_bytes: The size of the input block if it was transferred
+            from another node, or None if unknown.
+        rss_bytes: The resident memory of the worker process that computed this
+            block, sampled at the end of the task, or None if worker RSS profiling
+            is disabled.
     """
 
     def __init__(self):
         self.wall_time_s: Optional[float] = None
         self.cpu_time_s: Optional[float] = None
+        self.read_cache_hits: int = 0
+        self.read_cache_misses: int = 0
+        self.local_input_bytes: Optional[int] = None
+        self.remote_input_bytes: Optional[int] = None
+        self.rss_bytes: Optional[int] = None
         self.node_id = ray.runtime_context.get_runtime_context().node_id.hex()
 
     @staticmethod
@@ -134,11 +151,22 @@ class _BlockExecStatsBuilder:
     def __init__(self):
         self.start_time = time.perf_counter()
         self.start_cpu = time.process_time()
+        self.start_cache_hits, self.start_cache_misses = get_read_cache_counts()
 
     def build(self) -> "BlockExecStats":
         stats = BlockExecStats()
         stats.wall_time_s = time.perf_counter() - self.start_time
         stats.cpu_time_s = time.process_time() - self.start_cpu
+        cache_hits, cache_misses = get_read_cache_counts()
+        stats.read_cache_hits = cache_hits - self.start_cache_hits
+        stats.read_cache_misses = cache_misses - self.start_cache_misses
+        if DatasetContext.get_current().worker_rss_profiling_enabled:
+            # Import psutil after ray so the packaged version is used.
+            import psutil
+
+            # Workers are reused across tasks, so the process's lifetime peak RSS
+            # (ru_maxrss) would be misleading here. Sample the current RSS instead.
+            stats.rss_bytes = psutil.Process().memory_info().rss
         return stats
 
 
@@ -202,6 +230,42 @@ class BlockAccessor(Generic[T]):
         """
         raise NotImplementedError
 
+    def select(self, columns: List[str]) -> Block:
+        """Return a new block containing only the given columns.
+
+        Args:
+            columns: The names of the columns to select, in output order.
+
+        Returns:
+            The projected block.
+        """
+        raise NotImplementedError
+
+    def filter(self, predicate: "Expr") -> Block:
+        """Return a new block containing only the rows satisfying the predicate.
+
+        Rows for which the predicate evaluates to null are dropped.
+
+        Args:
+            predicate: A boolean expression over the columns of this block.
+
+        Returns:
+            The filtered block.
+        """
+        raise NotImplementedError
+
+    def with_column(self, name: str, expr: "Expr") -> Block:
+        """Return a new block with the given column set to the expression's value.
+
+        Args:
+            name: The name of the column to add or replace.
+            expr: The expression to evaluate over the columns of this block.
+
+        Returns:
+            The block with the column added or replaced.
+        """
+        raise NotImplementedError
+
     def random_shuffle(self, random_seed: Optional[int]) -> Block:
         """Randomly shuffle this block."""
         raise NotImplementedError
@@ -286,9 +350,24 @@ class BlockAccessor(Generic[T]):
         raise NotImplementedError
 
     def sort_and_partition(
-        self, boundaries: List[T], key: Any, descending: bool
+        self,
+        boundaries: List[T],
+        key: Any,
+        descending: bool,
+        null_placement: str = "at_end",
     ) -> List["Block[T]"]:
-        """Return a list of sorted partitions of this block."""
+        """Return a list of sorted partitions of this block.
+
+        The null placement only applies to tabular blocks sorted by columns.
+        """
+        raise NotImplementedError
+
+    def hash_partition(self, key: KeyFn, num_partitions: int) -> List["Block[T]"]:
+        """Return a list of hash partitions of this block by key.
+
+        The key may also be a list of column names for tabular blocks. The rows
+        with the same key are contiguous within each partition.
+        """
         raise NotImplementedError
 
     def combine(self, key: KeyFn, agg: "AggregateFn") -> Block[U]:
@@ -297,7 +376,10 @@ class BlockAccessor(Generic[T]):
 
     @staticmethod
     def merge_sorted_blocks(
-        blocks: List["Block[T]"], key: Any, descending: bool
+        blocks: List["Block[T]"],
+        key: Any,
+        descending: bool,
+        null_placement: str = "at_end",
     ) -> Tuple[Block[T], BlockMetadata]:
         """Return a sorted block by merging a list of sorted blocks."""
         raise NotImplementedError
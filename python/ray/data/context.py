@@ -13,6 +13,20 @@ _context_lock = threading.Lock()
 # The max target block size in bytes for reads and transformations.
 DEFAULT_TARGET_MAX_BLOCK_SIZE = 2048 * 1024 * 1024
 
+# The min target block size in bytes, below which reads with autodetected
+# parallelism won't split the data further.
+DEFAULT_TARGET_MIN_BLOCK_SIZE = 1 * 1024 * 1024
+
+# The min parallelism of reads with autodetected parallelism, as long as this
+# doesn't create blocks smaller than the target min block size.
+DEFAULT_MIN_PARALLELISM = 200
+
+# Whether to dynamically split the output blocks of map tasks that exceed the target
+# max block size. Unlike block splitting, this doesn't require a block owner actor.
+DEFAULT_DYNAMIC_BLOCK_SPLITTING_ENABLED = bool(
+    os.environ.get("RAY_DATASET_DYNAMIC_BLOCK_SPLITTING", None)
+)
+
 # Whether block splitting is on by default
 DEFAULT_BLOCK_SPLITTING_ENABLED = False
 
@@ -30,14 +44,79 @@ DEFAULT_OPTIMIZE_FUSE_READ_STAGES = True
 # Whether to furthermore fuse prior map tasks with shuffle stages.
 DEFAULT_OPTIMIZE_FUSE_SHUFFLE_STAGES = True
 
+# Whether to push down column selections and expression filters into reads, for
+# datasources that support it (e.g. Parquet).
+DEFAULT_OPTIMIZE_READ_PUSHDOWN = True
+
+# Whether to rewrite the stages of lazy datasets before executing them, e.g. to
+# filter rows before other stages and to drop redundant shuffles and repartitions.
+DEFAULT_OPTIMIZE_REORDER_STAGES = True
+
 # Wether to use actor based block prefetcher.
 DEFAULT_ACTOR_PREFETCHER_ENABLED = True
 
+# Whether to schedule the tasks of map stages on the nodes holding their input
+# blocks, instead of wherever there is capacity.
+DEFAULT_LOCALITY_AWARE_SCHEDULING = bool(
+    os.environ.get("RAY_DATASET_LOCALITY_AWARE_SCHEDULING", None)
+)
+
 # Whether to use push-based shuffle by default.
 DEFAULT_USE_PUSH_BASED_SHUFFLE = bool(
     os.environ.get("RAY_DATASET_PUSH_BASED_SHUFFLE", None)
 )
 
+# Whether to use hash partitioning with map-side combining for groupby aggregations,
+# instead of sampling key boundaries and sorting each block.
+DEFAULT_USE_HASH_BASED_GROUPBY = bool(
+    os.environ.get("RAY_DATASET_HASH_BASED_GROUPBY", None)
+)
+
+# The max size in bytes of a join side for it to be broadcast to every block of the
+# other side, instead of shuffling both sides.
+DEFAULT_JOIN_BROADCAST_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+# The local directory to cache the blocks read from files in, or None to disable
+# the read cache.
+DEFAULT_READ_CACHE_DIR = os.environ.get("RAY_DATASET_READ_CACHE_DIR", None)
+
+# The max total size in bytes of the read cache on each node.
+DEFAULT_READ_CACHE_MAX_BYTES = 10 * 1024 * 1024 * 1024
+
+# Whether to execute the trailing one-to-one task stages of lazy datasets in a
+# streaming fashion when iterating over them, instead of materializing each stage in
+# full. This only applies to iteration (iter_batches(), to_torch(), etc.); writes and
+# other consumers still execute the plan in bulk.
+DEFAULT_USE_STREAMING_EXECUTOR = bool(
+    os.environ.get("RAY_DATASET_USE_STREAMING_EXECUTOR", None)
+)
+
+# The max number of blocks in flight for streaming execution, or None to size this
+# based on the number of CPUs in the cluster. The bound applies to the whole chain of
+# streamed stages (a block counts once while it moves through all of them), not to
+# each stage separately.
+DEFAULT_STREAMING_MAX_BLOCKS_IN_FLIGHT = None
+
+# Whether to sample the object store usage and spilling of the cluster while a
+# dataset's stages execute, for the dataset stats.
+DEFAULT_OBJECT_STORE_PROFILING_ENABLED = bool(
+    os.environ.get("RAY_DATASET_OBJECT_STORE_PROFILING", None)
+)
+
+# Whether to record the resident memory of the worker that computed each block, for
+# the dataset stats.
+DEFAULT_WORKER_RSS_PROFILING_ENABLED = bool(
+    os.environ.get("RAY_DATASET_WORKER_RSS_PROFILING", None)
+)
+
+# The max number of executed windows that a DatasetPipeline buffers ahead of its
+# consumer.
+DEFAULT_PIPELINE_PREFETCH_WINDOWS = 1
+
+# The max total size in bytes of the windows that a DatasetPipeline buffers ahead
+# of its consumer, or None for no limit. At least one window is always buffered.
+DEFAULT_PIPELINE_PREFETCH_MAX_BYTES = None
+
 # The default global scheduling strategy.
 DEFAULT_SCHEDULING_STRATEGY = "DEFAULT"
 
@@ -55,24 +134,56 @@ class DatasetContext:
         block_owner: ray.actor.ActorHandle,
         block_splitting_enabled: bool,
         target_max_block_size: int,
+        target_min_block_size: int,
+        min_parallelism: int,
+        dynamic_block_splitting_enabled: bool,
         enable_pandas_block: bool,
         optimize_fuse_stages: bool,
         optimize_fuse_read_stages: bool,
         optimize_fuse_shuffle_stages: bool,
+        optimize_read_pushdown: bool,
+        optimize_reorder_stages: bool,
         actor_prefetcher_enabled: bool,
+        locality_aware_scheduling: bool,
         use_push_based_shuffle: bool,
+        use_hash_based_groupby: bool,
+        join_broadcast_threshold_bytes: int,
+        read_cache_dir: Optional[str],
+        read_cache_max_bytes: int,
+        use_streaming_executor: bool,
+        streaming_max_blocks_in_flight: Optional[int],
+        object_store_profiling_enabled: bool,
+        worker_rss_profiling_enabled: bool,
+        pipeline_prefetch_windows: int,
+        pipeline_prefetch_max_bytes: Optional[int],
         scheduling_strategy: SchedulingStrategyT,
     ):
         """Private constructor (use get_current() instead)."""
         self.block_owner = block_owner
         self.block_splitting_enabled = block_splitting_enabled
         self.target_max_block_size = target_max_block_size
+        self.target_min_block_size = target_min_block_size
+        self.min_parallelism = min_parallelism
+        self.dynamic_block_splitting_enabled = dynamic_block_splitting_enabled
         self.enable_pandas_block = enable_pandas_block
         self.optimize_fuse_stages = optimize_fuse_stages
         self.optimize_fuse_read_stages = optimize_fuse_read_stages
         self.optimize_fuse_shuffle_stages = optimize_fuse_shuffle_stages
+        self.optimize_read_pushdown = optimize_read_pushdown
+        self.optimize_reorder_stages = optimize_reorder_stages
         self.actor_prefetcher_enabled = actor_prefetcher_enabled
+        self.locality_aware_scheduling = locality_aware_scheduling
         self.use_push_based_shuffle = use_push_based_shuffle
+        self.use_hash_based_groupby = use_hash_based_groupby
+        self.join_broadcast_threshold_bytes = join_broadcast_threshold_bytes
+        self.read_cache_dir = read_cache_dir
+        self.read_cache_max_bytes = read_cache_max_bytes
+        self.use_streaming_executor = use_streaming_executor
+        self.streaming_max_blocks_in_flight = streaming_max_blocks_in_flight
+        self.object_store_profiling_enabled = object_store_profiling_enabled
+        self.worker_rss_profiling_enabled = worker_rss_profiling_enabled
+        self.pipeline_prefetch_windows = pipeline_prefetch_windows
+        self.pipeline_prefetch_max_bytes = pipeline_prefetch_max_bytes
         self.scheduling_strategy = scheduling_strategy
 
     @staticmethod
@@ -91,12 +202,36 @@ class DatasetContext:
                     block_owner=None,
                     block_splitting_enabled=DEFAULT_BLOCK_SPLITTING_ENABLED,
                     target_max_block_size=DEFAULT_TARGET_MAX_BLOCK_SIZE,
+                    target_min_block_size=DEFAULT_TARGET_MIN_BLOCK_SIZE,
+                    min_parallelism=DEFAULT_MIN_PARALLELISM,
+                    dynamic_block_splitting_enabled=(
+                        DEFAULT_DYNAMIC_BLOCK_SPLITTING_ENABLED
+                    ),
                     enable_pandas_block=DEFAULT_ENABLE_PANDAS_BLOCK,
                     optimize_fuse_stages=DEFAULT_OPTIMIZE_FUSE_STAGES,
                     optimize_fuse_read_stages=DEFAULT_OPTIMIZE_FUSE_READ_STAGES,
                     optimize_fuse_shuffle_stages=DEFAULT_OPTIMIZE_FUSE_SHUFFLE_STAGES,
+                    optimize_read_pushdown=DEFAULT_OPTIMIZE_READ_PUSHDOWN,
+                    optimize_reorder_stages=DEFAULT_OPTIMIZE_REORDER_STAGES,
                     actor_prefetcher_enabled=DEFAULT_ACTOR_PREFETCHER_ENABLED,
+                    locality_aware_scheduling=DEFAULT_LOCALITY_AWARE_SCHEDULING,
                     use_push_based_shuffle=DEFAULT_USE_PUSH_BASED_SHUFFLE,
+                    use_hash_based_groupby=DEFAULT_USE_HASH_BASED_GROUPBY,
+                    join_broadcast_threshold_bytes=(
+                        DEFAULT_JOIN_BROADCAST_THRESHOLD_BYTES
+                    ),
+                    read_cache_dir=DEFAULT_READ_CACHE_DIR,
+                    read_cache_max_bytes=DEFAULT_READ_CACHE_MAX_BYTES,
+                    use_streaming_executor=DEFAULT_USE_STREAMING_EXECUTOR,
+                    streaming_max_blocks_in_flight=(
+                        DEFAULT_STREAMING_MAX_BLOCKS_IN_FLIGHT
+                    ),
+                    object_store_profiling_enabled=(
+                        DEFAULT_OBJECT_STORE_PROFILING_ENABLED
+                    ),
+                    worker_rss_profiling_enabled=DEFAULT_WORKER_RSS_PROFILING_ENABLED,
+                    pipeline_prefetch_windows=DEFAULT_PIPELINE_PREFETCH_WINDOWS,
+                    pipeline_prefetch_max_bytes=DEFAULT_PIPELINE_PREFETCH_MAX_BYTES,
                     scheduling_strategy=DEFAULT_SCHEDULING_STRATEGY,
                 )
 
@@ -66,6 +66,7 @@ from ray.data.datasource.file_based_datasource import (
     _unwrap_arrow_serialization_workaround,
 )
 from ray.data.row import TableRow
+from ray.data.expressions import Expr, _get_referenced_columns, _try_to_pyarrow
 from ray.data.aggregate import AggregateFn, Sum, Max, Min, Mean, Std
 from ray.data.random_access_dataset import RandomAccessDataset
 from ray.data._internal.remote_fn import cached_remote_fn
@@ -81,9 +82,11 @@ from ray.data._internal.shuffle_and_partition import (
 )
 from ray.data._internal.fast_repartition import fast_repartition
 from ray.data._internal.sort import sort_impl
+from ray.data._internal.join import join_impl, JOIN_TYPES
 from ray.data._internal.block_list import BlockList
 from ray.data._internal.lazy_block_list import LazyBlockList
 from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
+from ray.data._internal.util import _lazy_import_pyarrow_dataset
 from ray._private.usage import usage_lib
 
 logger = logging.getLogger(__name__)
@@ -424,6 +427,103 @@ class Dataset(Generic[T]):
             process_batch, batch_format="pandas", compute=compute, **ray_remote_args
         )
 
+    def select_columns(
+        self,
+        cols: List[str],
+        *,
+        compute: Optional[str] = None,
+        **ray_remote_args,
+    ) -> "Dataset[T]":
+        """Select one or more columns from the dataset.
+
+        This is only supported for tabular datasets. If this directly follows a
+        read from a datasource that supports projection pushdown (e.g.
+        ``read_parquet()``), only the selected columns will be read.
+
+        Examples:
+            >>> import ray
+            >>> ds = ray.data.read_parquet("s3://bucket/path") # doctest: +SKIP
+            >>> # Only columns "a" and "b" will be read from the Parquet files.
+            >>> ds.select_columns(["a", "b"]) # doctest: +SKIP
+
+        Time complexity: O(dataset size / parallelism)
+
+        Args:
+            cols: Names of the columns to select. If any name is not included in the
+                dataset schema, an exception will be raised.
+            compute: The compute strategy, either "tasks" (default) to use Ray
+                tasks, or ActorPoolStrategy(min, max) to use an autoscaling actor pool.
+            ray_remote_args: Additional resource requirements to request from
+                ray (e.g., num_gpus=1 to request GPUs for the map tasks).
+        """
+        cols = list(cols)
+
+        def transform(block: Block) -> Iterable[Block]:
+            return [BlockAccessor.for_block(block).select(cols)]
+
+        plan = self._plan.with_stage(
+            OneToOneStage(
+                "select_columns",
+                transform,
+                compute,
+                ray_remote_args,
+                project_columns=cols,
+            )
+        )
+        return Dataset(plan, self._epoch, self._lazy)
+
+    def with_column(
+        self,
+        col: str,
+        expr: Expr,
+        *,
+        compute: Optional[str] = None,
+        **ray_remote_args,
+    ) -> "Dataset[T]":
+        """Add or replace a column, computed from an expression over other columns.
+
+        This is a vectorized alternative to ``add_column()``: the expression is
+        evaluated over whole blocks with ``pyarrow.compute`` (for Arrow blocks) or
+        pandas (for pandas blocks), without converting Arrow blocks to pandas.
+
+        This is only supported for tabular datasets.
+
+        Examples:
+            >>> import ray
+            >>> from ray.data.expressions import col
+            >>> ds = ray.data.range_table(100) # doctest: +SKIP
+            >>> # Add a new column equal to value * 2.
+            >>> ds = ds.with_column("new_col", col("value") * 2) # doctest: +SKIP
+
+        Time complexity: O(dataset size / parallelism)
+
+        Args:
+            col: Name of the column to add. If the name already exists, the
+                column will be overwritten.
+            expr: The expression (see :py:mod:`ray.data.expressions`) generating
+                the column values.
+            compute: The compute strategy, either "tasks" (default) to use Ray
+                tasks, or ActorPoolStrategy(min, max) to use an autoscaling actor pool.
+            ray_remote_args: Additional resource requirements to request from
+                ray (e.g., num_gpus=1 to request GPUs for the map tasks).
+        """
+        if not isinstance(expr, Expr):
+            raise ValueError(f"`expr` must be an Expr, got {expr}")
+
+        def transform(block: Block) -> Iterable[Block]:
+            return [BlockAccessor.for_block(block).with_column(col, expr)]
+
+        plan = self._plan.with_stage(
+            OneToOneStage(
+                "with_column",
+                transform,
+                compute,
+                ray_remote_args,
+                modified_columns=[col],
+            )
+        )
+        return Dataset(plan, self._epoch, self._lazy)
+
     def flat_map(
         self,
         fn: Union[CallableClass, Callable[[T], Iterable[U]]],
@@ -477,7 +577,9 @@ class Dataset(Generic[T]):
 
     def filter(
         self,
-        fn: Union[CallableClass, Callable[[T], bool]],
+        fn: Union[
+            CallableClass, Callable[[T], bool], Expr, "pyarrow.dataset.Expression"
+        ],
         *,
         compute: Optional[str] = None,
         **ray_remote_args,
@@ -487,22 +589,36 @@ class Dataset(Generic[T]):
         This is a blocking operation. Consider using ``.map_batches()`` for
         better performance (you can implement filter by dropping records).
 
+        For tabular datasets, the predicate can also be given as an expression
+        (see :py:mod:`ray.data.expressions`) or a ``pyarrow.dataset.Expression``,
+        which is evaluated in a vectorized manner over each block. This is much
+        faster than a per-record Python predicate. If this directly follows a read
+        from a datasource that supports filter pushdown (e.g. ``read_parquet()``),
+        the expression will be applied during the read.
+
         Examples:
             >>> import ray
             >>> ds = ray.data.range(100) # doctest: +SKIP
             >>> ds.filter(lambda x: x % 2 == 0) # doctest: +SKIP
+            >>> from ray.data.expressions import col
+            >>> ds = ray.data.read_parquet("s3://bucket/path") # doctest: +SKIP
+            >>> ds.filter((col("a") > 1) & (col("b") == "x")) # doctest: +SKIP
 
         Time complexity: O(dataset size / parallelism)
 
         Args:
             fn: The predicate to apply to each record, or a class type
                 that can be instantiated to create such a callable. Callable classes are
-                only supported for the actor compute strategy.
+                only supported for the actor compute strategy. For tabular datasets,
+                this can also be an ``Expr`` or a ``pyarrow.dataset.Expression``.
             compute: The compute strategy, either "tasks" (default) to use Ray
                 tasks, or ActorPoolStrategy(min, max) to use an autoscaling actor pool.
             ray_remote_args: Additional resource requirements to request from
                 ray (e.g., num_gpus=1 to request GPUs for the map tasks).
         """
+        pa_ds = _lazy_import_pyarrow_dataset()
+        if isinstance(fn, Expr) or (pa_ds and isinstance(fn, pa_ds.Expression)):
+            return self._filter_expr(fn, compute, ray_remote_args)
 
         self._warn_slow()
         fn = cache_wrapper(fn, compute)
@@ -522,6 +638,45 @@ class Dataset(Generic[T]):
         )
         return Dataset(plan, self._epoch, self._lazy)
 
+    def _filter_expr(
+        self,
+        expr: Union[Expr, "pyarrow.dataset.Expression"],
+        compute: Optional[str],
+        ray_remote_args: Dict[str, Any],
+    ) -> "Dataset[T]":
+        """Filter this dataset by an ``Expr`` or ``pyarrow.dataset.Expression``."""
+
+        filter_columns = None
+        if isinstance(expr, Expr):
+            pushdown_expr = _try_to_pyarrow(expr)
+            columns = _get_referenced_columns(expr)
+            if columns is not None:
+                filter_columns = sorted(columns)
+
+            def transform(block: Block) -> Iterable[Block]:
+                return [BlockAccessor.for_block(block).filter(expr)]
+
+        else:
+            pushdown_expr = expr
+
+            def transform(block: Block) -> Iterable[Block]:
+                import pyarrow.dataset as pa_ds
+
+                table = BlockAccessor.for_block(block).to_arrow()
+                return [pa_ds.dataset(table).to_table(filter=expr)]
+
+        plan = self._plan.with_stage(
+            OneToOneStage(
+                "filter",
+                transform,
+                compute,
+                ray_remote_args,
+                filter_expr=pushdown_expr,
+                filter_columns=filter_columns,
+            )
+        )
+        return Dataset(plan, self._epoch, self._lazy)
+
     def repartition(self, num_blocks: int, *, shuffle: bool = False) -> "Dataset[T]":
         """Repartition the dataset into exactly this number of blocks.
 
@@ -575,7 +730,11 @@ class Dataset(Generic[T]):
 
             plan = self._plan.with_stage(
                 AllToAllStage(
-                    "repartition", num_blocks, do_shuffle, supports_block_udf=True
+                    "repartition",
+                    num_blocks,
+                    do_shuffle,
+                    supports_block_udf=True,
+                    preserves_rows=True,
                 )
             )
 
@@ -590,7 +749,13 @@ class Dataset(Generic[T]):
                 return fast_repartition(blocks, num_blocks)
 
             plan = self._plan.with_stage(
-                AllToAllStage("repartition", num_blocks, do_fast_repartition)
+                AllToAllStage(
+                    "repartition",
+                    num_blocks,
+                    do_fast_repartition,
+                    preserves_rows=True,
+                    preserves_order=True,
+                )
             )
 
         return Dataset(plan, self._epoch, self._lazy)
@@ -626,8 +791,8 @@ class Dataset(Generic[T]):
         """
 
         def do_shuffle(block_list, clear_input_blocks: bool, block_udf, remote_args):
-            num_blocks = block_list.executed_num_blocks()  # Blocking.
-            if num_blocks == 0:
+            num_input_blocks = block_list.executed_num_blocks()  # Blocking.
+            if num_input_blocks == 0:
                 return block_list, {}
             if clear_input_blocks:
                 blocks = block_list.copy()
@@ -644,7 +809,7 @@ class Dataset(Generic[T]):
             )
             return random_shuffle_op.execute(
                 blocks,
-                num_blocks,
+                num_blocks or num_input_blocks,
                 clear_input_blocks,
                 map_ray_remote_args=remote_args,
                 reduce_ray_remote_args=remote_args,
@@ -652,7 +817,12 @@ class Dataset(Generic[T]):
 
         plan = self._plan.with_stage(
             AllToAllStage(
-                "random_shuffle", num_blocks, do_shuffle, supports_block_udf=True
+                "random_shuffle",
+                num_blocks,
+                do_shuffle,
+                supports_block_udf=True,
+                preserves_rows=True,
+                ignores_input_order=True,
             )
         )
         return Dataset(plan, self._epoch, self._lazy)
@@ -1595,7 +1765,10 @@ class Dataset(Generic[T]):
         return self._aggregate_result(ret)
 
     def sort(
-        self, key: Optional[KeyFn] = None, descending: bool = False
+        self,
+        key: Union[None, KeyFn, List[str]] = None,
+        descending: Union[bool, List[bool]] = False,
+        null_placement: str = "at_end",
     ) -> "Dataset[T]":
         # TODO ds.sort(lambda ...) fails with:
         #  Callable key '<function <lambda> at 0x1b07a4cb0>' requires
@@ -1614,6 +1787,10 @@ class Dataset(Generic[T]):
             >>> ds = ray.data.from_items( # doctest: +SKIP
             ...     [{"value": i} for i in range(1000)])
             >>> ds.sort("value", descending=True) # doctest: +SKIP
+            >>> # Sort by multiple columns, the second one in descending order.
+            >>> ds = ray.data.from_items( # doctest: +SKIP
+            ...     [{"a": i % 10, "b": i} for i in range(1000)])
+            >>> ds.sort(["a", "b"], descending=[False, True]) # doctest: +SKIP
             >>> # Sort by a key function.
             >>> ds.sort(lambda record: record["value"]) # doctest: +SKIP
 
@@ -1621,15 +1798,27 @@ class Dataset(Generic[T]):
 
         Args:
             key:
-                - For Arrow tables, key must be a single column name.
+                - For Arrow tables, key must be a column name or a list of column
+                  names, which are compared lexicographically.
                 - For datasets of Python objects, key can be either a lambda
                   function that returns a comparison key to sort by, or None
                   to sort by the original value.
-            descending: Whether to sort in descending order.
+            descending: Whether to sort in descending order. For a list of
+                columns, this can also be a list with the order of each column.
+            null_placement: Where to sort nulls in the key columns of Arrow
+                tables, either "at_start" or "at_end".
 
         Returns:
             A new, sorted dataset.
         """
+        from ray.data._internal.sort import NULL_PLACEMENTS, normalize_sort_key
+
+        if null_placement not in NULL_PLACEMENTS:
+            raise ValueError(
+                f"null_placement must be one of {NULL_PLACEMENTS}, got: "
+                f"{null_placement}"
+            )
+        sort_key = normalize_sort_key(key, descending)
 
         def do_sort(block_list, clear_input_blocks: bool, *_):
             # Handle empty dataset.
@@ -1647,9 +1836,18 @@ class Dataset(Generic[T]):
                     _validate_key_fn(self, subkey)
             else:
                 _validate_key_fn(self, key)
-            return sort_impl(blocks, clear_input_blocks, key, descending)
+            return sort_impl(
+                blocks,
+                clear_input_blocks,
+                sort_key,
+                # Column sort keys carry the order of each column.
+                descending=not isinstance(sort_key, list) and descending,
+                null_placement=null_placement,
+            )
 
-        plan = self._plan.with_stage(AllToAllStage("sort", None, do_sort))
+        plan = self._plan.with_stage(
+            AllToAllStage("sort", None, do_sort, preserves_rows=True)
+        )
         return Dataset(plan, self._epoch, self._lazy)
 
     def zip(self, other: "Dataset[U]") -> "Dataset[(T, U)]":
@@ -1721,6 +1919,79 @@ class Dataset(Generic[T]):
         plan = self._plan.with_stage(AllToAllStage("zip", None, do_zip_all))
         return Dataset(plan, self._epoch, self._lazy)
 
+    def join(
+        self,
+        other: "Dataset[U]",
+        on: Union[str, List[str]],
+        how: str = "inner",
+        *,
+        num_blocks: Optional[int] = None,
+    ) -> "Dataset[Any]":
+        """Join this dataset with another on the given key columns.
+
+        If one side is smaller than ``DatasetContext.join_broadcast_threshold_bytes``
+        (and the join type allows it), that side is broadcast to every block of
+        the other side. Otherwise, both sides are hash partitioned on the key
+        columns and shuffled, so that each output block is joined in parallel.
+        Either way, no data is pulled to the driver.
+
+        This is a blocking operation.
+
+        NOTE: Joined datasets are not lineage-serializable, i.e. they can not be used
+        as a tunable hyperparameter in Ray Tune.
+
+        Examples:
+            >>> import ray
+            >>> users = ray.data.from_items( # doctest: +SKIP
+            ...     [{"id": i, "name": f"user{i}"} for i in range(100)])
+            >>> orders = ray.data.from_items( # doctest: +SKIP
+            ...     [{"id": i % 100, "amount": i} for i in range(1000)])
+            >>> orders.join(users, on="id").take(1) # doctest: +SKIP
+            [{'id': 0, 'amount': 0, 'name': 'user0'}]
+
+        Time complexity: O(dataset size / parallelism)
+
+        Args:
+            other: The dataset to join with on the right hand side.
+            on: The name of the key column, or a list of names of key columns,
+                which must be present in both datasets.
+            how: The type of join: "inner" to keep only the keys present in both
+                datasets, "left" to keep all rows of this dataset, or "outer" to
+                keep all rows of both datasets. Missing values are filled with
+                nulls.
+            num_blocks: The number of output blocks if both sides are shuffled,
+                or None to use the max number of blocks of either dataset.
+
+        Returns:
+            A tabular dataset with the columns of this dataset followed by the
+            non-key columns of the other dataset. Duplicate column names of the
+            other dataset are disambiguated with a _1 suffix.
+        """
+        if how not in JOIN_TYPES:
+            raise ValueError(f"`how` must be one of {JOIN_TYPES}, got: {how}")
+        if isinstance(on, str):
+            on = [on]
+        if not on or not all(isinstance(key, str) for key in on):
+            raise ValueError(
+                f"`on` must be a column name or a list of column names, got: {on}"
+            )
+        for key in on:
+            _validate_key_fn(self, key)
+            _validate_key_fn(other, key)
+
+        def do_join(block_list, clear_input_blocks: bool, *_):
+            return join_impl(
+                block_list,
+                other._plan.execute(),
+                on,
+                how,
+                num_blocks,
+                clear_input_blocks,
+            )
+
+        plan = self._plan.with_stage(AllToAllStage("join", num_blocks, do_join))
+        return Dataset(plan, self._epoch, self._lazy)
+
     def limit(self, limit: int) -> "Dataset[T]":
         """Limit the dataset to the first number of records specified.
 
@@ -1737,7 +2008,17 @@ class Dataset(Generic[T]):
         Returns:
             The truncated dataset.
         """
-
+        if (
+            limit > 0
+            and self._plan.is_read_stage()
+            and DatasetContext.get_current().optimize_read_pushdown
+        ):
+            # Push the limit down into the read tasks, so that only the rows
+            # needed are read.
+            blocks = self._plan.execute().limit(limit)
+            return Dataset(
+                ExecutionPlan(blocks, blocks.stats()), self._epoch, self._lazy
+            )
         left, _ = self._split(limit, return_right_half=False)
         return left
 
@@ -1752,8 +2033,16 @@ class Dataset(Generic[T]):
         Returns:
             A list of up to ``limit`` records from the dataset.
         """
+        ds = self
+        if (
+            limit > 0
+            and self._plan.is_read_stage()
+            and DatasetContext.get_current().optimize_read_pushdown
+        ):
+            # Only read the rows that are needed.
+            ds = self.limit(limit)
         output = []
-        for row in self.iter_rows():
+        for row in ds.iter_rows():
             output.append(row)
             if len(output) >= limit:
                 break
@@ -1892,21 +2181,40 @@ class Dataset(Generic[T]):
         block_path_provider: BlockWritePathProvider = DefaultBlockWritePathProvider(),
         arrow_parquet_args_fn: Callable[[], Dict[str, Any]] = lambda: {},
         ray_remote_args: Dict[str, Any] = None,
+        partition_cols: Optional[List[str]] = None,
+        max_rows_per_file: Optional[int] = None,
+        target_file_size: Optional[int] = None,
         **arrow_parquet_args,
     ) -> None:
         """Write the dataset to parquet.
 
         This is only supported for datasets convertible to Arrow records.
-        To control the number of files, use ``.repartition()``.
+        By default, each block is written to a single file. To control the
+        number of files, use ``.repartition()``, or set ``target_file_size`` or
+        ``max_rows_per_file`` to combine consecutive blocks into files of
+        bounded size.
+
+        With ``partition_cols``, rows are written to Hive-style partition
+        directories such as ``{path}/year=2022/month=1/``, and the partition
+        columns are encoded in the directory names instead of the files. Readers
+        can then skip whole partitions, e.g. with a ``PathPartitionFilter``.
 
         Unless a custom block path provider is given, the format of the output
         files will be {uuid}_{block_idx}.parquet, where ``uuid`` is an unique
-        id for the dataset.
+        id for the dataset. With partition columns or file size limits, this
+        becomes {uuid}_{task_idx}_{file_idx}.parquet, where each write task
+        writes one or more files per partition.
 
         Examples:
             >>> import ray
             >>> ds = ray.data.range(100) # doctest: +SKIP
             >>> ds.write_parquet("s3://bucket/path") # doctest: +SKIP
+            >>> ds = ray.data.range_table(100) # doctest: +SKIP
+            >>> ds = ds.add_column("part", lambda df: df["value"] % 2) # doctest: +SKIP
+            >>> ds.write_parquet( # doctest: +SKIP
+            ...     "s3://bucket/path",
+            ...     partition_cols=["part"],
+            ...     target_file_size=128 * 1024 * 1024)
 
         Time complexity: O(dataset size / parallelism)
 
@@ -1927,6 +2235,13 @@ class Dataset(Generic[T]):
                 cannot be pickled, or if you'd like to lazily resolve the write
                 arguments for each dataset block.
             ray_remote_args: Kwargs passed to ray.remote in the write tasks.
+            partition_cols: The columns to partition the output directories by.
+                Null values are written to the ``__HIVE_DEFAULT_PARTITION__``
+                partition.
+            max_rows_per_file: The max number of rows per output file.
+            target_file_size: The size in bytes at which output files are
+                closed and new ones started. Files may exceed this size by up
+                to one row group.
             arrow_parquet_args: Options to pass to
                 pyarrow.parquet.write_table(), which is used to write out each
                 block to a file.
@@ -1941,6 +2256,9 @@ class Dataset(Generic[T]):
             open_stream_args=arrow_open_stream_args,
             block_path_provider=block_path_provider,
             write_args_fn=arrow_parquet_args_fn,
+            partition_cols=partition_cols,
+            max_rows_per_file=max_rows_per_file,
+            target_file_size=target_file_size,
             **arrow_parquet_args,
         )
 
@@ -2148,6 +2466,8 @@ class Dataset(Generic[T]):
         """
 
         ctx = DatasetContext.get_current()
+        # Note that writes don't use streaming execution, since
+        # Datasource.do_write() takes the full list of blocks to write.
         blocks, metadata = zip(*self._plan.execute().get_blocks_with_metadata())
 
         # TODO(ekl) remove this feature flag.
@@ -2205,7 +2525,10 @@ class Dataset(Generic[T]):
         # current dataset format in order to eliminate unnecessary copies and type
         # conversions.
         try:
-            dataset_format = self._dataset_format()
+            # Don't force execution to get the schema if we can stream the output.
+            dataset_format = self._dataset_format(
+                fetch_if_missing=not self._plan.is_streamable()
+            )
         except ValueError:
             # Dataset is empty or cleared, so fall back to "native".
             batch_format = "native"
@@ -2231,6 +2554,8 @@ class Dataset(Generic[T]):
         batch_size: Optional[int] = None,
         batch_format: str = "native",
         drop_last: bool = False,
+        local_shuffle_buffer_size: Optional[int] = None,
+        local_shuffle_seed: Optional[int] = None,
     ) -> Iterator[BatchType]:
         """Return a local batched iterator over the dataset.
 
@@ -2248,25 +2573,35 @@ class Dataset(Generic[T]):
             batch_format: The format in which to return each batch.
                 Specify "native" to use the current block format (promoting
                 Arrow to pandas automatically), "pandas" to
-                select ``pandas.DataFrame`` or "pyarrow" to select
-                ``pyarrow.Table``. Default is "native".
+                select ``pandas.DataFrame``, "pyarrow" to select
+                ``pyarrow.Table``, or "numpy" to select ``numpy.ndarray`` for
+                simple datasets and ``Dict[str, numpy.ndarray]`` for tabular
+                datasets. Default is "native".
             drop_last: Whether to drop the last batch if it's incomplete.
+            local_shuffle_buffer_size: If non-None, the data will be randomly
+                shuffled using a local in-memory shuffle buffer, and this value
+                will serve as the minimum number of rows that must be in the local
+                in-memory shuffle buffer in order to yield a batch. This is a
+                light-weight alternative to a global ``random_shuffle()`` of the
+                dataset, and requires ``batch_size`` to be set. Default is None.
+            local_shuffle_seed: The seed to use for the local random shuffle.
 
         Returns:
             An iterator over record batches.
         """
-        blocks = self._plan.execute()
-        stats = self._plan.stats()
+        blocks, stats = self._plan.execute_to_iterator()
 
         time_start = time.perf_counter()
 
         yield from batch_blocks(
-            blocks.iter_blocks(),
+            blocks,
             stats,
             prefetch_blocks=prefetch_blocks,
             batch_size=batch_size,
             batch_format=batch_format,
             drop_last=drop_last,
+            local_shuffle_buffer_size=local_shuffle_buffer_size,
+            local_shuffle_seed=local_shuffle_seed,
         )
 
         stats.iter_total_s.add(time.perf_counter() - time_start)
@@ -2287,6 +2622,8 @@ class Dataset(Generic[T]):
         drop_last: bool = False,
         unsqueeze_label_tensor: bool = True,
         unsqueeze_feature_tensors: bool = True,
+        local_shuffle_buffer_size: Optional[int] = None,
+        local_shuffle_seed: Optional[int] = None,
     ) -> "torch.utils.data.IterableDataset":
         """Return a Torch IterableDataset over this dataset.
 
@@ -2326,6 +2663,10 @@ class Dataset(Generic[T]):
         Note that you probably want to call ``.split()`` on this dataset if
         there are to be multiple Torch workers consuming the data.
 
+        Tensors of a single column that already has the requested dtype share
+        memory with the dataset's blocks, which may be read-only in the object
+        store, so they must not be modified in-place; clone them first.
+
         Time complexity: O(1)
 
         Args:
@@ -2362,6 +2703,13 @@ class Dataset(Generic[T]):
                 will be unsqueezed (reshaped to (N, 1)) before being concatenated into
                 the final features tensor. Otherwise, they will be left as is, that is
                 (N, ). Defaults to True.
+            local_shuffle_buffer_size: If non-None, the data will be randomly
+                shuffled using a local in-memory shuffle buffer, and this value
+                will serve as the minimum number of rows that must be in the local
+                in-memory shuffle buffer in order to yield a batch. This is a
+                light-weight alternative to a global ``random_shuffle()`` of the
+                dataset, and requires ``batch_size`` to be set. Default is None.
+            local_shuffle_seed: The seed to use for the local random shuffle.
 
         Returns:
             A torch IterableDataset.
@@ -2369,7 +2717,7 @@ class Dataset(Generic[T]):
         import torch
 
         from ray.data._internal.torch_iterable_dataset import TorchIterableDataset
-        from ray.air.utils.torch_utils import convert_pandas_to_torch_tensor
+        from ray.air.utils.torch_utils import convert_ndarray_batch_to_torch_tensor
 
         # If an empty collection is passed in, treat it the same as None
         if not feature_columns:
@@ -2408,12 +2756,17 @@ class Dataset(Generic[T]):
         def make_generator():
             for batch in self.iter_batches(
                 batch_size=batch_size,
-                batch_format="pandas",
+                batch_format="numpy",
                 prefetch_blocks=prefetch_blocks,
                 drop_last=drop_last,
+                local_shuffle_buffer_size=local_shuffle_buffer_size,
+                local_shuffle_seed=local_shuffle_seed,
             ):
+                if not isinstance(batch, dict):
+                    # Simple datasets are converted as a single "value" column.
+                    batch = {"value": batch}
                 if label_column:
-                    label_tensor = convert_pandas_to_torch_tensor(
+                    label_tensor = convert_ndarray_batch_to_torch_tensor(
                         batch,
                         [label_column],
                         label_column_dtype,
@@ -2425,7 +2778,7 @@ class Dataset(Generic[T]):
 
                 if isinstance(feature_columns, dict):
                     features_tensor = {
-                        key: convert_pandas_to_torch_tensor(
+                        key: convert_ndarray_batch_to_torch_tensor(
                             batch,
                             feature_columns[key],
                             feature_column_dtypes[key]
@@ -2436,7 +2789,7 @@ class Dataset(Generic[T]):
                         for key in feature_columns
                     }
                 else:
-                    features_tensor = convert_pandas_to_torch_tensor(
+                    features_tensor = convert_ndarray_batch_to_torch_tensor(
                         batch,
                         columns=feature_columns,
                         column_dtypes=feature_column_dtypes,
@@ -2460,6 +2813,8 @@ class Dataset(Generic[T]):
         prefetch_blocks: int = 0,
         batch_size: int = 1,
         drop_last: bool = False,
+        local_shuffle_buffer_size: Optional[int] = None,
+        local_shuffle_seed: Optional[int] = None,
     ) -> "tf.data.Dataset":
         """Return a TF Dataset over this dataset.
 
@@ -2517,6 +2872,13 @@ class Dataset(Generic[T]):
                 if the dataset size is not divisible by the batch size. If
                 False and the size of dataset is not divisible by the batch
                 size, then the last batch will be smaller. Defaults to False.
+            local_shuffle_buffer_size: If non-None, the data will be randomly
+                shuffled using a local in-memory shuffle buffer, and this value
+                will serve as the minimum number of rows that must be in the local
+                in-memory shuffle buffer in order to yield a batch. This is a
+                light-weight alternative to a global ``random_shuffle()`` of the
+                dataset, and requires ``batch_size`` to be set. Default is None.
+            local_shuffle_seed: The seed to use for the local random shuffle.
 
         Returns:
             A tf.data.Dataset.
@@ -2542,6 +2904,8 @@ class Dataset(Generic[T]):
                 batch_size=batch_size,
                 batch_format="pandas",
                 drop_last=drop_last,
+                local_shuffle_buffer_size=local_shuffle_buffer_size,
+                local_shuffle_seed=local_shuffle_seed,
             ):
                 if label_column:
                     targets = convert_pandas_to_tf_tensor(batch[[label_column]])
@@ -2789,6 +3153,9 @@ class Dataset(Generic[T]):
         self,
         key: str,
         num_workers: Optional[int] = None,
+        *,
+        index: str = "sort",
+        max_in_flight_per_worker: Optional[int] = None,
     ) -> RandomAccessDataset:
         """Convert this Dataset into a distributed RandomAccessDataset (EXPERIMENTAL).
 
@@ -2809,10 +3176,22 @@ class Dataset(Generic[T]):
                 in the cluster by four. As a rule of thumb, you can expect each worker
                 to provide ~3000 records / second via ``get_async()``, and
                 ~10000 records / second via ``multiget()``.
+            index: How to partition the dataset by key, either "sort" to range
+                partition it with a full sort, or "hash" to hash partition it. A
+                hash index is cheaper to build, since each partition is only
+                sorted locally.
+            max_in_flight_per_worker: The max number of concurrent
+                ``multiget_async()`` calls to each worker, or None for no limit.
         """
         if num_workers is None:
             num_workers = 4 * len(ray.nodes())
-        return RandomAccessDataset(self, key, num_workers=num_workers)
+        return RandomAccessDataset(
+            self,
+            key,
+            num_workers=num_workers,
+            index=index,
+            max_in_flight_per_worker=max_in_flight_per_worker,
+        )
 
     def repeat(self, times: Optional[int] = None) -> "DatasetPipeline[T]":
         """Convert this into a DatasetPipeline by looping over this dataset.
@@ -3063,6 +3442,23 @@ class Dataset(Generic[T]):
         """Returns a string containing execution timing information."""
         return self._plan.stats().summary_string()
 
+    def stats_dict(self) -> Dict[str, Any]:
+        """Returns a dict containing execution timing and memory information.
+
+        This holds the same stats as ``stats()`` in a structured form, with one
+        entry per executed stage. Set ``DatasetContext.object_store_profiling_enabled``
+        to also include the peak object store usage and spilling of the whole
+        cluster during each execution, and
+        ``DatasetContext.worker_rss_profiling_enabled`` to include the resident
+        memory of the workers that computed the blocks.
+
+        Returns:
+            A dict with a "stages" list, holding the stats of each stage executed
+            to create this dataset in execution order, and an "iter" dict holding
+            the time breakdown of iterating over this dataset.
+        """
+        return self._plan.stats().to_dict()
+
     @DeveloperAPI
     def get_internal_block_refs(self) -> List[ObjectRef[Block]]:
         """Get a list of references to the underlying blocks of this dataset.
@@ -3089,6 +3485,29 @@ class Dataset(Generic[T]):
         ds._set_uuid(self._get_uuid())
         return ds
 
+    def explain(self) -> None:
+        """Print the execution plan of this dataset, before and after optimization.
+
+        This shows the stages that have not been executed yet, which is all of the
+        stages of a lazy dataset (see ``experimental_lazy()``), and how they would be
+        rewritten, pushed down into the read and fused. This doesn't trigger any
+        computation.
+
+        Examples:
+            >>> import ray
+            >>> ds = ray.data.range_table(100, parallelism=10) # doctest: +SKIP
+            >>> ds = ds.experimental_lazy() # doctest: +SKIP
+            >>> ds.map_batches(lambda x: x).random_shuffle().explain() # doctest: +SKIP
+            Logical plan:
+              Read(RangeDatasource, 10 blocks)
+              -> OneToOneStage("map_batches")
+              -> AllToAllStage("random_shuffle")
+            Optimized plan:
+              Read(RangeDatasource, 10 blocks)
+              -> AllToAllStage("read->map_batches->random_shuffle")
+        """
+        print(self._plan.explain(), end="")
+
     def has_serializable_lineage(self) -> bool:
         """Whether this dataset's lineage is able to be serialized for storage and
         later deserialized, possibly on a different cluster.
@@ -3279,16 +3698,16 @@ class Dataset(Generic[T]):
         )
         return l_ds, r_ds
 
-    def _dataset_format(self) -> str:
+    def _dataset_format(self, fetch_if_missing: bool = True) -> str:
         """Determine the format of the dataset. Possible values are: "arrow",
         "pandas", "simple".
 
-        This may block; if the schema is unknown, this will synchronously fetch
-        the schema for the first block.
+        This may block; if the schema is unknown and fetch_if_missing is True, this
+        will synchronously fetch the schema for the first block.
         """
         # We need schema to properly validate, so synchronously
         # fetch it if necessary.
-        schema = self.schema(fetch_if_missing=True)
+        schema = self.schema(fetch_if_missing=fetch_if_missing)
         if schema is None:
             raise ValueError(
                 "Dataset is empty or cleared, can't determine the format of "
@@ -5,6 +5,7 @@ import time
 from typing import (
     Any,
     Callable,
+    Dict,
     List,
     Iterator,
     Iterable,
@@ -36,7 +37,15 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 # Operations that can be naively applied per dataset row in the pipeline.
-_PER_DATASET_OPS = ["map", "map_batches", "add_column", "flat_map", "filter"]
+_PER_DATASET_OPS = [
+    "map",
+    "map_batches",
+    "add_column",
+    "select_columns",
+    "with_column",
+    "flat_map",
+    "filter",
+]
 
 # Operations that apply to each dataset holistically in the pipeline.
 _HOLISTIC_PER_DATASET_OPS = ["repartition", "random_shuffle", "sort"]
@@ -143,6 +152,8 @@ class DatasetPipeline(Generic[T]):
         batch_size: int = None,
         batch_format: str = "native",
         drop_last: bool = False,
+        local_shuffle_buffer_size: Optional[int] = None,
+        local_shuffle_seed: Optional[int] = None,
     ) -> Iterator[BatchType]:
         """Return a local batched iterator over the data in the pipeline.
 
@@ -161,9 +172,18 @@ class DatasetPipeline(Generic[T]):
             batch_format: The format in which to return each batch.
                 Specify "native" to use the current block format (promoting
                 Arrow to pandas automatically), "pandas" to
-                select ``pandas.DataFrame`` or "pyarrow" to select
-                ``pyarrow.Table``. Default is "native".
+                select ``pandas.DataFrame``, "pyarrow" to select
+                ``pyarrow.Table``, or "numpy" to select ``numpy.ndarray`` for
+                simple datasets and ``Dict[str, numpy.ndarray]`` for tabular
+                datasets. Default is "native".
             drop_last: Whether to drop the last batch if it's incomplete.
+            local_shuffle_buffer_size: If non-None, the data will be randomly
+                shuffled using a local in-memory shuffle buffer, and this value
+                will serve as the minimum number of rows that must be in the local
+                in-memory shuffle buffer in order to yield a batch. This is a
+                light-weight alternative to a global ``random_shuffle()`` of the
+                dataset, and requires ``batch_size`` to be set. Default is None.
+            local_shuffle_seed: The seed to use for the local random shuffle.
 
         Returns:
             An iterator over record batches.
@@ -176,6 +196,8 @@ class DatasetPipeline(Generic[T]):
             batch_size=batch_size,
             batch_format=batch_format,
             drop_last=drop_last,
+            local_shuffle_buffer_size=local_shuffle_buffer_size,
+            local_shuffle_seed=local_shuffle_seed,
         )
         self._stats.iter_total_s.add(time.perf_counter() - time_start)
 
@@ -721,6 +743,22 @@ class DatasetPipeline(Generic[T]):
         """
         return self._stats.summary_string(exclude_first_window)
 
+    def stats_dict(self, exclude_first_window: bool = True) -> Dict[str, Any]:
+        """Returns a dict containing execution timing and memory information.
+
+        This holds the same stats as ``stats()`` in a structured form.
+
+        Args:
+            exclude_first_window: Whether to exclude the first window from
+                the pipeline wait times.
+
+        Returns:
+            A dict with a "windows" list holding the stats of each recent window,
+            the "wait_time_s" stalled waiting for windows, and an "iter" dict
+            holding the time breakdown of iterating over this pipeline.
+        """
+        return self._stats.to_dict(exclude_first_window)
+
     @staticmethod
     def from_iterable(
         iterable: Iterable[Callable[[], Dataset[T]]],
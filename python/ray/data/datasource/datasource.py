@@ -51,6 +51,17 @@ class Datasource(Generic[T]):
         """
         raise NotImplementedError
 
+    def supports_read_pushdown(self) -> bool:
+        """Return whether ``prepare_read()`` supports projection and filter pushdown.
+
+        Datasources that return True must accept a ``columns`` read arg (a list of
+        column names to read) and a ``filter`` read arg (a
+        ``pyarrow.dataset.Expression`` that rows must satisfy). The Dataset
+        execution plan will then push column selections and expression filters
+        that directly follow the read into these read args.
+        """
+        return False
+
     def do_write(
         self,
         blocks: List[ObjectRef[Block]],
@@ -26,13 +26,14 @@ from ray.data.context import DatasetContext
 from ray.data._internal.arrow_block import ArrowRow
 from ray.data._internal.block_list import BlockMetadata
 from ray.data._internal.output_buffer import BlockOutputBuffer
+from ray.data._internal.read_cache import get_read_cache
 from ray.data.datasource.datasource import Datasource, ReadTask, WriteResult
 from ray.data.datasource.file_meta_provider import (
     BaseFileMetadataProvider,
     DefaultFileMetadataProvider,
 )
 from ray.util.annotations import DeveloperAPI
-from ray.data._internal.util import _check_pyarrow_version
+from ray.data._internal.util import _autodetect_parallelism, _check_pyarrow_version
 from ray.data._internal.remote_fn import cached_remote_fn
 
 logger = logging.getLogger(__name__)
@@ -177,6 +178,7 @@ class FileBasedDatasource(Datasource[Union[ArrowRow, Any]]):
             output_buffer = BlockOutputBuffer(
                 block_udf=_block_udf, target_max_block_size=ctx.target_max_block_size
             )
+            read_cache = get_read_cache(ctx)
             for read_path in read_paths:
                 compression = open_stream_args.pop("compression", None)
                 if compression is None:
@@ -206,15 +208,42 @@ class FileBasedDatasource(Datasource[Union[ArrowRow, Any]]):
                     # Non-Snappy compression, pass as open_input_stream() arg so Arrow
                     # can take care of streaming decompression for us.
                     open_stream_args["compression"] = compression
+                cache_key = None
+                if read_cache is not None:
+                    cache_key = read_cache.make_key(
+                        fs,
+                        read_path,
+                        _get_read_cache_args(self, open_stream_args, reader_args),
+                    )
+                cached_blocks = None
+                if cache_key is not None:
+                    cached_blocks = read_cache.get(cache_key)
+                if cached_blocks is not None:
+                    for data in cached_blocks:
+                        output_buffer.add_block(data)
+                        if output_buffer.has_next():
+                            yield output_buffer.next()
+                    continue
+                file_blocks = []
                 with self._open_input_source(fs, read_path, **open_stream_args) as f:
                     for data in read_stream(f, read_path, **reader_args):
+                        if cache_key is not None:
+                            file_blocks.append(data)
                         output_buffer.add_block(data)
                         if output_buffer.has_next():
                             yield output_buffer.next()
+                if cache_key is not None:
+                    read_cache.put(cache_key, file_blocks)
             output_buffer.finalize()
             if output_buffer.has_next():
                 yield output_buffer.next()
 
+        mem_size = None
+        if all(s is not None for s in file_sizes):
+            mem_size = sum(file_sizes)
+        parallelism = _autodetect_parallelism(
+            parallelism, DatasetContext.get_current(), mem_size
+        )
         # fix https://github.com/ray-project/ray/issues/24296
         parallelism = min(parallelism, len(paths))
 
@@ -371,6 +400,20 @@ class FileBasedDatasource(Datasource[Union[ArrowRow, Any]]):
 # _expand_paths.
 
 
+def _get_read_cache_args(
+    datasource: FileBasedDatasource,
+    open_stream_args: Dict[str, Any],
+    reader_args: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Get the args that determine the blocks read from a file, for the read cache."""
+    return dict(
+        datasource=type(datasource).__qualname__,
+        open_stream_args=open_stream_args,
+        # The filesystem is already part of the cache key.
+        reader_args={k: v for k, v in reader_args.items() if k != "filesystem"},
+    )
+
+
 def _resolve_paths_and_filesystem(
     paths: Union[str, List[str]],
     filesystem: "pyarrow.fs.FileSystem" = None,
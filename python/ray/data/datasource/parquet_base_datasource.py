@@ -1,23 +1,51 @@
 import logging
+import posixpath
+import urllib.parse
 from typing import (
     Dict,
     Any,
     Callable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
     TYPE_CHECKING,
 )
 
 if TYPE_CHECKING:
     import pyarrow
 
-from ray.data.block import BlockAccessor
+import ray
+from ray.types import ObjectRef
+from ray.data.block import Block, BlockAccessor, BlockMetadata
+from ray.data.datasource.datasource import WriteResult
 from ray.data.datasource.file_based_datasource import (
+    BlockWritePathProvider,
+    DefaultBlockWritePathProvider,
     FileBasedDatasource,
     _resolve_kwargs,
+    _resolve_paths_and_filesystem,
+    _S3FileSystemWrapper,
+    _wrap_s3_serialization_workaround,
 )
+from ray.data.datasource.partitioning import PartitionStyle, PathPartitionEncoder
+from ray.data._internal.arrow_block import _concat_tables, _has_null_type
+from ray.data._internal.remote_fn import cached_remote_fn
 from ray.util.annotations import PublicAPI
 
 logger = logging.getLogger(__name__)
 
+# The directory name of the Hive partition of null partition values.
+HIVE_DEFAULT_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+# The max in-memory size of the rows buffered per output file before they're
+# written out as a row group.
+MAX_ROW_GROUP_BUFFER_BYTES = 64 * 1024 * 1024
+
+# The in-memory size of the rows written to estimate the compression ratio of the
+# output files.
+COMPRESSION_SAMPLE_BYTES = 1024 * 1024
+
 
 @PublicAPI
 class ParquetBaseDatasource(FileBasedDatasource):
@@ -50,5 +78,513 @@ class ParquetBaseDatasource(FileBasedDatasource):
         writer_args = _resolve_kwargs(writer_args_fn, **writer_args)
         pq.write_table(block.to_arrow(), f, **writer_args)
 
+    def do_write(
+        self,
+        blocks: List[ObjectRef[Block]],
+        metadata: List[BlockMetadata],
+        path: str,
+        dataset_uuid: str,
+        filesystem: Optional["pyarrow.fs.FileSystem"] = None,
+        try_create_dir: bool = True,
+        open_stream_args: Optional[Dict[str, Any]] = None,
+        block_path_provider: BlockWritePathProvider = DefaultBlockWritePathProvider(),
+        write_args_fn: Callable[[], Dict[str, Any]] = lambda: {},
+        _block_udf: Optional[Callable[[Block], Block]] = None,
+        ray_remote_args: Dict[str, Any] = None,
+        partition_cols: Optional[List[str]] = None,
+        max_rows_per_file: Optional[int] = None,
+        target_file_size: Optional[int] = None,
+        **write_args,
+    ) -> List[ObjectRef[WriteResult]]:
+        """Creates and returns write tasks for Parquet files.
+
+        Without partition columns or file size limits, each block is written to a
+        single file. Otherwise, consecutive blocks are combined into write tasks of
+        about ``target_file_size`` bytes or ``max_rows_per_file`` rows, and each
+        task writes its rows to Hive-style partition directories under the path,
+        starting a new file whenever the current one reaches either limit. Since the
+        files are rolled over by their written size, the blocks are grouped by their
+        in-memory size divided by the compression ratio, which is estimated by
+        writing a sample of the largest block.
+        """
+        if (
+            not partition_cols
+            and max_rows_per_file is None
+            and target_file_size is None
+        ):
+            return super().do_write(
+                blocks,
+                metadata,
+                path,
+                dataset_uuid,
+                filesystem=filesystem,
+                try_create_dir=try_create_dir,
+                open_stream_args=open_stream_args,
+                block_path_provider=block_path_provider,
+                write_args_fn=write_args_fn,
+                _block_udf=_block_udf,
+                ray_remote_args=ray_remote_args,
+                **write_args,
+            )
+        if max_rows_per_file is not None and max_rows_per_file < 1:
+            raise ValueError(
+                f"max_rows_per_file must be at least 1, got {max_rows_per_file}."
+            )
+        if target_file_size is not None and target_file_size < 1:
+            raise ValueError(
+                f"target_file_size must be at least 1, got {target_file_size}."
+            )
+
+        path, filesystem = _resolve_paths_and_filesystem(path, filesystem)
+        path = path[0]
+        if try_create_dir:
+            filesystem.create_dir(path, recursive=True)
+        filesystem = _wrap_s3_serialization_workaround(filesystem)
+
+        if open_stream_args is None:
+            open_stream_args = {}
+
+        if ray_remote_args is None:
+            ray_remote_args = {}
+
+        if not block_path_provider:
+            block_path_provider = DefaultBlockWritePathProvider()
+
+        compression_ratio = 1.0
+        if target_file_size is not None and blocks:
+            # The file metadata dominates the written size of small blocks, so
+            # sample the largest one.
+            sample_idx = max(
+                range(len(blocks)), key=lambda i: metadata[i].size_bytes or 0
+            )
+            if metadata[sample_idx].num_rows:
+                estimate_compression_ratio = cached_remote_fn(
+                    _estimate_compression_ratio
+                ).options(**ray_remote_args)
+                compression_ratio = ray.get(
+                    estimate_compression_ratio.remote(
+                        blocks[sample_idx], _block_udf, write_args_fn, write_args
+                    )
+                )
+
+        write_files = cached_remote_fn(_write_files).options(**ray_remote_args)
+        write_tasks = []
+        groups = _group_blocks(
+            blocks, metadata, max_rows_per_file, target_file_size, compression_ratio
+        )
+        for task_idx, group in enumerate(groups):
+            write_task = write_files.remote(
+                _ParquetFileWriterFactory(
+                    path,
+                    filesystem,
+                    dataset_uuid,
+                    task_idx,
+                    try_create_dir,
+                    open_stream_args,
+                    block_path_provider,
+                    self._file_format(),
+                ),
+                partition_cols or [],
+                max_rows_per_file,
+                target_file_size,
+                _block_udf,
+                write_args_fn,
+                write_args,
+                *group,
+            )
+            write_tasks.append(write_task)
+
+        return write_tasks
+
     def _file_format(self) -> str:
         return "parquet"
+
+
+def _group_blocks(
+    blocks: List[ObjectRef[Block]],
+    metadata: List[BlockMetadata],
+    max_rows_per_file: Optional[int],
+    target_file_size: Optional[int],
+    compression_ratio: float = 1.0,
+) -> List[List[ObjectRef[Block]]]:
+    """Group consecutive blocks into write tasks of about one file each.
+
+    A group is closed once its blocks reach either the target file size (by their
+    in-memory size divided by the compression ratio) or the max rows per file.
+    Blocks of unknown size are written by their own task.
+    """
+    groups = []
+    group = []
+    num_rows = 0
+    size_bytes = 0
+    for block, meta in zip(blocks, metadata):
+        group.append(block)
+        if meta.num_rows is None or meta.size_bytes is None:
+            full = True
+        else:
+            num_rows += meta.num_rows
+            size_bytes += meta.size_bytes / compression_ratio
+            full = (target_file_size is None and max_rows_per_file is None) or (
+                (target_file_size is not None and size_bytes >= target_file_size)
+                or (max_rows_per_file is not None and num_rows >= max_rows_per_file)
+            )
+        if full:
+            groups.append(group)
+            group = []
+            num_rows = 0
+            size_bytes = 0
+    if group:
+        groups.append(group)
+    return groups
+
+
+def _estimate_compression_ratio(
+    block: Block,
+    block_udf: Optional[Callable[[Block], Block]],
+    writer_args_fn: Callable[[], Dict[str, Any]],
+    writer_args: Dict[str, Any],
+) -> float:
+    """Estimate the ratio of the in-memory size to the written size of the rows.
+
+    This writes up to ``COMPRESSION_SAMPLE_BYTES`` of the rows of the block to an
+    in-memory Parquet file with the given writer args.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if block_udf is not None:
+        block = block_udf(block)
+    table = BlockAccessor.for_block(block).to_arrow()
+    if table.num_rows == 0 or table.nbytes == 0:
+        return 1.0
+    bytes_per_row = table.nbytes / table.num_rows
+    num_rows = max(
+        1, min(table.num_rows, int(COMPRESSION_SAMPLE_BYTES / bytes_per_row))
+    )
+    writer_args = _resolve_kwargs(writer_args_fn, **writer_args)
+    buf = pa.BufferOutputStream()
+    pq.write_table(table.slice(0, num_rows), buf, **writer_args)
+    # The size of a slice counts the whole buffers of the table, so use the
+    # average row size instead. Don't group more than the in-memory size, since
+    # the file metadata may dominate the written size of a small sample.
+    return max(1.0, num_rows * bytes_per_row / buf.getvalue().size)
+
+
+def _partition_table(
+    table: "pyarrow.Table", partition_cols: List[str]
+) -> Iterator[Tuple[Tuple[Any, ...], "pyarrow.Table"]]:
+    """Split the table by the values of the partition columns.
+
+    Yields the partition values and the rows of each partition, without the
+    partition columns, since they're encoded in the partition directories.
+    """
+    if not partition_cols:
+        yield (), table
+        return
+    missing = [c for c in partition_cols if c not in table.column_names]
+    if missing:
+        raise ValueError(
+            f"The partition columns {missing} are not in the dataset columns "
+            f"{table.column_names}."
+        )
+    import numpy as np
+    import pyarrow.compute as pc
+
+    # Encode the partition values of each row as a single integer code.
+    codes = np.zeros(table.num_rows, dtype=np.int64)
+    column_values = []
+    for col in partition_cols:
+        column = table.column(col)
+        values = pc.unique(column)
+        indices = pc.index_in(column, value_set=values)
+        codes = codes * len(values) + np.asarray(indices.to_numpy(), dtype=np.int64)
+        column_values.append(values.to_pylist())
+    unique_codes, inverse = np.unique(codes, return_inverse=True)
+    order = np.argsort(inverse, kind="stable")
+    splits = np.split(order, np.cumsum(np.bincount(inverse))[:-1])
+    data = table.drop(partition_cols)
+    for code, indices in zip(unique_codes.tolist(), splits):
+        key = []
+        for values in reversed(column_values):
+            code, index = divmod(code, len(values))
+            key.append(values[index])
+        yield tuple(reversed(key)), data.take(indices)
+
+
+def _encode_partition_value(value: Any) -> str:
+    if value is None:
+        return HIVE_DEFAULT_PARTITION
+    # Escape path separators and other special characters, which Arrow's Hive
+    # partitioning decodes when reading.
+    return urllib.parse.quote(str(value), safe="")
+
+
+class _ParquetFileWriterFactory:
+    """Opens the output files of a write task."""
+
+    def __init__(
+        self,
+        path: str,
+        filesystem: "pyarrow.fs.FileSystem",
+        dataset_uuid: str,
+        task_idx: int,
+        try_create_dir: bool,
+        open_stream_args: Dict[str, Any],
+        block_path_provider: BlockWritePathProvider,
+        file_format: str,
+    ):
+        self.path = path
+        self.filesystem = filesystem
+        self.dataset_uuid = dataset_uuid
+        self.task_idx = task_idx
+        self.try_create_dir = try_create_dir
+        self.open_stream_args = open_stream_args
+        self.block_path_provider = block_path_provider
+        self.file_format = file_format
+
+    def get_filesystem(self) -> "pyarrow.fs.FileSystem":
+        if isinstance(self.filesystem, _S3FileSystemWrapper):
+            return self.filesystem.unwrap()
+        return self.filesystem
+
+    def get_dir(self, partition_cols: List[str], values: Tuple[Any, ...]) -> str:
+        """Return the directory of the partition, creating it if needed."""
+        if not partition_cols:
+            return self.path
+        encoder = PathPartitionEncoder.of(
+            style=PartitionStyle.HIVE,
+            base_dir=self.path,
+            field_names=partition_cols,
+            filesystem=self.get_filesystem(),
+        )
+        partition_dir = encoder([_encode_partition_value(v) for v in values])
+        if self.try_create_dir:
+            self.get_filesystem().create_dir(partition_dir, recursive=True)
+        return partition_dir
+
+    def open(self, partition_dir: str, file_idx: int) -> "pyarrow.NativeFile":
+        """Open the file_idx-th output file of this task in the directory."""
+        # The block path provider names a single file per write task, so the file
+        # index is appended to it.
+        block_path = self.block_path_provider(
+            partition_dir,
+            filesystem=self.filesystem,
+            dataset_uuid=self.dataset_uuid,
+            block_index=self.task_idx,
+            file_format=self.file_format,
+        )
+        root, ext = posixpath.splitext(block_path)
+        write_path = f"{root}_{file_idx:06}{ext}"
+        logger.debug(f"Writing {write_path} file.")
+        return self.get_filesystem().open_output_stream(
+            write_path, **self.open_stream_args
+        )
+
+
+class _RollingParquetWriter:
+    """Writes the rows of a partition to files of bounded size.
+
+    Rows are buffered up to a row group, and a new file is started once the
+    current one has ``max_rows_per_file`` rows or its written size reaches
+    ``target_file_size``, so files may exceed the target size by up to one row
+    group.
+    """
+
+    def __init__(
+        self,
+        factory: _ParquetFileWriterFactory,
+        partition_dir: str,
+        max_rows_per_file: Optional[int],
+        target_file_size: Optional[int],
+        writer_args: Dict[str, Any],
+    ):
+        self._factory = factory
+        self._partition_dir = partition_dir
+        self._max_rows_per_file = max_rows_per_file
+        self._target_file_size = target_file_size
+        self._row_group_size = writer_args.pop("row_group_size", None)
+        self._writer_args = writer_args
+        self._buffer: List["pyarrow.Table"] = []
+        self._buffer_rows = 0
+        self._buffer_bytes = 0
+        self._num_files = 0
+        self._file = None
+        self._writer = None
+        # The schema of the rows written so far, which later rows are cast to.
+        self._schema: Optional["pyarrow.Schema"] = None
+        self._file_rows = 0
+
+    def write(self, table: "pyarrow.Table") -> None:
+        """Add the rows of the table, writing out full row groups."""
+        if table.num_rows == 0:
+            return
+        self._buffer.append(table)
+        self._buffer_rows += table.num_rows
+        self._buffer_bytes += table.nbytes
+        max_buffer_bytes = MAX_ROW_GROUP_BUFFER_BYTES
+        if self._target_file_size is not None:
+            max_buffer_bytes = min(max_buffer_bytes, self._target_file_size)
+        rows_left = None
+        if self._max_rows_per_file is not None:
+            rows_left = self._max_rows_per_file - self._file_rows
+        if self._buffer_bytes >= max_buffer_bytes or (
+            rows_left is not None and self._buffer_rows >= rows_left
+        ):
+            self._flush()
+
+    def close(self) -> None:
+        """Write out the buffered rows and close the current file."""
+        self._flush()
+        self._close_file()
+
+    def _flush(self) -> None:
+        import pyarrow as pa
+
+        if not self._buffer:
+            return
+        schemas = [t.schema for t in self._buffer]
+        if self._schema is not None:
+            schemas.insert(0, self._schema)
+        schema = _unify_schemas(schemas)
+        if schema is None:
+            # Leave it to the Arrow concatenation to unify the tables, e.g. tensor
+            # columns of different shapes, or to fail.
+            table = _concat_tables(self._buffer)
+            schema = table.schema
+        else:
+            table = pa.concat_tables([_cast_table(t, schema) for t in self._buffer])
+        if self._schema is not None and not schema.equals(self._schema):
+            # The rows can't be cast to the schema of the current file, e.g. a
+            # column of the file is all nulls, so start a new file.
+            self._close_file()
+        self._buffer = []
+        self._buffer_rows = 0
+        self._buffer_bytes = 0
+        # The number of rows per write that keeps row groups under the target size.
+        rows_per_write = table.num_rows
+        if self._target_file_size is not None and table.nbytes > 0:
+            bytes_per_row = table.nbytes / table.num_rows
+            rows_per_write = max(1, int(self._target_file_size / bytes_per_row))
+        offset = 0
+        while offset < table.num_rows:
+            num_rows = min(table.num_rows - offset, rows_per_write)
+            if self._max_rows_per_file is not None:
+                num_rows = min(num_rows, self._max_rows_per_file - self._file_rows)
+            self._write_rows(table.slice(offset, num_rows))
+            offset += num_rows
+
+    def _write_rows(self, table: "pyarrow.Table") -> None:
+        import pyarrow.parquet as pq
+
+        if self._writer is None:
+            self._file = self._factory.open(self._partition_dir, self._num_files)
+            self._writer = pq.ParquetWriter(
+                self._file, table.schema, **self._writer_args
+            )
+            self._schema = table.schema
+            self._num_files += 1
+        self._writer.write_table(table, row_group_size=self._row_group_size)
+        self._file_rows += table.num_rows
+        if (
+            self._max_rows_per_file is not None
+            and self._file_rows >= self._max_rows_per_file
+        ) or (
+            self._target_file_size is not None
+            and self._file.tell() >= self._target_file_size
+        ):
+            self._close_file()
+
+    def _close_file(self) -> None:
+        if self._writer is None:
+            return
+        self._writer.close()
+        self._file.close()
+        self._writer = None
+        self._file = None
+        self._file_rows = 0
+
+
+def _unify_schemas(schemas: List["pyarrow.Schema"]) -> Optional["pyarrow.Schema"]:
+    """Return the schema that tables of all of the schemas can be cast to.
+
+    Null-typed columns are cast to the type of the other tables, integer columns
+    are cast to double if any table has floating point values, and columns missing
+    from some tables are filled with nulls. Returns None if the schemas can't be
+    unified this way.
+    """
+    import pyarrow as pa
+
+    fields: Dict[str, List["pyarrow.Field"]] = {}
+    for schema in schemas:
+        for field in schema:
+            fields.setdefault(field.name, []).append(field)
+    unified = []
+    for name, column_fields in fields.items():
+        if all(f.equals(column_fields[0]) for f in column_fields):
+            unified.append(column_fields[0])
+            continue
+        types = {f.type for f in column_fields if not _has_null_type(f.type)}
+        if not types:
+            # All of the types have null children, but differ.
+            return None
+        if len(types) > 1:
+            if not all(
+                pa.types.is_integer(t) or pa.types.is_floating(t) for t in types
+            ):
+                return None
+            if any(pa.types.is_floating(t) for t in types):
+                types = {pa.float64()}
+            else:
+                types = {pa.int64()}
+        unified.append(pa.field(name, types.pop()))
+    return pa.schema(unified, metadata=schemas[0].metadata)
+
+
+def _cast_table(table: "pyarrow.Table", schema: "pyarrow.Schema") -> "pyarrow.Table":
+    """Cast the table to the schema, filling missing columns with nulls."""
+    import pyarrow as pa
+
+    if table.schema.equals(schema):
+        return table
+    columns = []
+    for field in schema:
+        index = table.schema.get_field_index(field.name)
+        if index < 0:
+            columns.append(pa.nulls(table.num_rows, field.type))
+        elif table.schema.types[index] != field.type:
+            columns.append(table.column(index).cast(field.type))
+        else:
+            columns.append(table.column(index))
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _write_files(
+    factory: _ParquetFileWriterFactory,
+    partition_cols: List[str],
+    max_rows_per_file: Optional[int],
+    target_file_size: Optional[int],
+    block_udf: Optional[Callable[[Block], Block]],
+    writer_args_fn: Callable[[], Dict[str, Any]],
+    writer_args: Dict[str, Any],
+    *blocks: Block,
+) -> None:
+    writer_args = _resolve_kwargs(writer_args_fn, **writer_args)
+    writers: Dict[Tuple[Any, ...], _RollingParquetWriter] = {}
+    for block in blocks:
+        if block_udf is not None:
+            block = block_udf(block)
+        table = BlockAccessor.for_block(block).to_arrow()
+        for values, part in _partition_table(table, partition_cols):
+            writer = writers.get(values)
+            if writer is None:
+                writer = _RollingParquetWriter(
+                    factory,
+                    factory.get_dir(partition_cols, values),
+                    max_rows_per_file,
+                    target_file_size,
+                    dict(writer_args),
+                )
+                writers[values] = writer
+            writer.write(part)
+    for writer in writers.values():
+        writer.close()
@@ -20,8 +20,9 @@ from ray.data.datasource.file_meta_provider import (
 )
 from ray.data._internal.output_buffer import BlockOutputBuffer
 from ray.data._internal.progress_bar import ProgressBar
+from ray.data._internal.read_cache import get_read_cache
 from ray.data._internal.remote_fn import cached_remote_fn
-from ray.data._internal.util import _check_pyarrow_version
+from ray.data._internal.util import _autodetect_parallelism, _check_pyarrow_version
 from ray.util.annotations import PublicAPI
 
 
@@ -74,6 +75,9 @@ class ParquetDatasource(ParquetBaseDatasource):
         [{"a": 1, "b": "foo"}, ...]
     """
 
+    def supports_read_pushdown(self) -> bool:
+        return True
+
     def prepare_read(
         self,
         parallelism: int,
@@ -137,8 +141,33 @@ class ParquetDatasource(ParquetBaseDatasource):
 
             logger.debug(f"Reading {len(pieces)} parquet pieces")
             use_threads = reader_args.pop("use_threads", False)
+            read_cache = get_read_cache(ctx)
             for piece in pieces:
+                cache_key = None
+                if read_cache is not None:
+                    cache_key = read_cache.make_key(
+                        piece.filesystem,
+                        piece.path,
+                        dict(
+                            columns=columns,
+                            schema=schema,
+                            partition_expression=str(piece.partition_expression),
+                            reader_args=reader_args,
+                        ),
+                    )
+                cached_tables = None
+                if cache_key is not None:
+                    cached_tables = read_cache.get(cache_key)
+                if cached_tables is not None:
+                    for table in cached_tables:
+                        output_buffer.add_block(table)
+                        if output_buffer.has_next():
+                            yield output_buffer.next()
+                    continue
+                piece_tables = []
                 part = _get_partition_keys(piece.partition_expression)
+                # If a filter expression is given in the reader args, Arrow uses the
+                # row group statistics to skip row groups that can't match it.
                 batches = piece.to_batches(
                     use_threads=use_threads,
                     columns=columns,
@@ -150,16 +179,24 @@ class ParquetDatasource(ParquetBaseDatasource):
                     table = pyarrow.Table.from_batches([batch], schema=schema)
                     if part:
                         for col, value in part.items():
+                            field_index = table.schema.get_field_index(col)
+                            if field_index < 0:
+                                # The partition column was projected out.
+                                continue
                             table = table.set_column(
-                                table.schema.get_field_index(col),
+                                field_index,
                                 col,
                                 pa.array([value] * len(table)),
                             )
                     # If the table is empty, drop it.
                     if table.num_rows > 0:
+                        if cache_key is not None:
+                            piece_tables.append(table)
                         output_buffer.add_block(table)
                         if output_buffer.has_next():
                             yield output_buffer.next()
+                if cache_key is not None:
+                    read_cache.put(cache_key, piece_tables)
             output_buffer.finalize()
             if output_buffer.has_next():
                 yield output_buffer.next()
@@ -181,6 +218,11 @@ class ParquetDatasource(ParquetBaseDatasource):
             inferred_schema = schema
         read_tasks = []
         metadata = meta_provider.prefetch_file_metadata(pq_ds.pieces) or []
+        parallelism = _autodetect_parallelism(
+            parallelism,
+            DatasetContext.get_current(),
+            _estimate_inmemory_size(metadata, len(pq_ds.pieces)),
+        )
         try:
             _register_parquet_file_fragment_serialization()
             for pieces, metadata in zip(
@@ -197,6 +239,10 @@ class ParquetDatasource(ParquetBaseDatasource):
                     pieces=pieces,
                     prefetched_metadata=metadata,
                 )
+                if reader_args.get("filter") is not None:
+                    # The file metadata row count is only an upper bound on the
+                    # number of rows that will pass the filter.
+                    meta.num_rows = None
                 read_tasks.append(
                     ReadTask(lambda p=serialized_pieces: read_pieces(p), meta)
                 )
@@ -206,6 +252,25 @@ class ParquetDatasource(ParquetBaseDatasource):
         return read_tasks
 
 
+def _estimate_inmemory_size(
+    metadata: List["pyarrow.parquet.FileMetaData"], num_pieces: int
+) -> Optional[int]:
+    """Estimate the in-memory size of the Parquet files from their metadata.
+
+    This is the total uncompressed size of the row groups, or None if the metadata
+    of some of the files wasn't prefetched.
+    """
+    if len(metadata) != num_pieces:
+        return None
+    total_size = 0
+    for m in metadata:
+        if m is None:
+            return None
+        for i in range(m.num_row_groups):
+            total_size += m.row_group(i).total_byte_size
+    return total_size
+
+
 def _fetch_metadata_remotely(
     pieces: List["pyarrow._dataset.ParquetFileFragment"],
 ) -> List[ObjectRef["pyarrow.parquet.FileMetaData"]]:
@@ -0,0 +1,400 @@
+import operator
+from typing import Any, Callable, Dict, List, Optional, Set, TYPE_CHECKING, Union
+
+from ray.util.annotations import PublicAPI
+
+if TYPE_CHECKING:
+    import pandas
+    import pyarrow
+    import pyarrow.dataset
+
+
+@PublicAPI(stability="alpha")
+class Expr:
+    """A vectorized expression over the columns of a tabular dataset.
+
+    Expressions are built from column references (``col()``) and literals
+    (``lit()``) combined with comparison, boolean and arithmetic operators, and
+    are evaluated over whole blocks at a time with ``pyarrow.compute`` (for Arrow
+    blocks) or pandas (for pandas blocks), without going through per-row Python.
+
+    Note that the boolean combinators are ``&``, ``|`` and ``~``, not ``and``,
+    ``or`` and ``not``, and that comparisons can't be chained.
+
+    Examples:
+        >>> import ray
+        >>> from ray.data.expressions import col
+        >>> ds = ray.data.range_table(100) # doctest: +SKIP
+        >>> ds.filter((col("value") > 10) & (col("value") % 2 == 0)) # doctest: +SKIP
+        >>> ds.with_column("double", col("value") * 2) # doctest: +SKIP
+    """
+
+    def eval_arrow(self, table: "pyarrow.Table") -> Any:
+        """Evaluate this expression over an Arrow table.
+
+        Returns:
+            A ``pyarrow.Array`` or ``pyarrow.ChunkedArray`` with one value per row,
+            or a Python scalar for constant expressions.
+        """
+        raise NotImplementedError
+
+    def eval_pandas(self, df: "pandas.DataFrame") -> Any:
+        """Evaluate this expression over a pandas DataFrame.
+
+        Returns:
+            A ``pandas.Series`` with one value per row, or a Python scalar for
+            constant expressions.
+        """
+        raise NotImplementedError
+
+    def to_pyarrow(self) -> "pyarrow.dataset.Expression":
+        """Convert this expression to an equivalent ``pyarrow.dataset.Expression``.
+
+        This is used to push filters down into datasources (e.g. Parquet).
+
+        Raises:
+            ValueError: If this expression has no ``pyarrow.dataset`` equivalent.
+        """
+        raise NotImplementedError
+
+    def is_null(self) -> "Expr":
+        """Return an expression that is True where this expression is null."""
+        return _UnaryExpr("is_null", self)
+
+    def is_in(self, values: List[Any]) -> "Expr":
+        """Return an expression that is True where this expression is in values."""
+        return _IsInExpr(self, list(values))
+
+    def __eq__(self, other: Any) -> "Expr":
+        return _BinaryExpr("eq", self, other)
+
+    def __ne__(self, other: Any) -> "Expr":
+        return _BinaryExpr("ne", self, other)
+
+    def __lt__(self, other: Any) -> "Expr":
+        return _BinaryExpr("lt", self, other)
+
+    def __le__(self, other: Any) -> "Expr":
+        return _BinaryExpr("le", self, other)
+
+    def __gt__(self, other: Any) -> "Expr":
+        return _BinaryExpr("gt", self, other)
+
+    def __ge__(self, other: Any) -> "Expr":
+        return _BinaryExpr("ge", self, other)
+
+    def __and__(self, other: Any) -> "Expr":
+        return _BinaryExpr("and", self, other)
+
+    def __rand__(self, other: Any) -> "Expr":
+        return _BinaryExpr("and", other, self)
+
+    def __or__(self, other: Any) -> "Expr":
+        return _BinaryExpr("or", self, other)
+
+    def __ror__(self, other: Any) -> "Expr":
+        return _BinaryExpr("or", other, self)
+
+    def __invert__(self) -> "Expr":
+        return _UnaryExpr("not", self)
+
+    def __add__(self, other: Any) -> "Expr":
+        return _BinaryExpr("add", self, other)
+
+    def __radd__(self, other: Any) -> "Expr":
+        return _BinaryExpr("add", other, self)
+
+    def __sub__(self, other: Any) -> "Expr":
+        return _BinaryExpr("sub", self, other)
+
+    def __rsub__(self, other: Any) -> "Expr":
+        return _BinaryExpr("sub", other, self)
+
+    def __mul__(self, other: Any) -> "Expr":
+        return _BinaryExpr("mul", self, other)
+
+    def __rmul__(self, other: Any) -> "Expr":
+        return _BinaryExpr("mul", other, self)
+
+    def __truediv__(self, other: Any) -> "Expr":
+        return _BinaryExpr("div", self, other)
+
+    def __rtruediv__(self, other: Any) -> "Expr":
+        return _BinaryExpr("div", other, self)
+
+    def __neg__(self) -> "Expr":
+        return _UnaryExpr("neg", self)
+
+    def __bool__(self):
+        raise TypeError(
+            "The truth value of an expression is ambiguous. Use `&`, `|` and `~` "
+            "instead of `and`, `or` and `not`, and don't chain comparisons."
+        )
+
+    # Overriding __eq__ makes expressions unhashable by default.
+    __hash__ = object.__hash__
+
+
+@PublicAPI(stability="alpha")
+def col(name: str) -> Expr:
+    """Reference the column with the given name.
+
+    Args:
+        name: The name of the column.
+
+    Returns:
+        An expression evaluating to the column's values.
+    """
+    return _ColumnExpr(name)
+
+
+@PublicAPI(stability="alpha")
+def lit(value: Any) -> Expr:
+    """Create a literal (constant) expression.
+
+    Python scalars are automatically wrapped in literals when combined with other
+    expressions, so this is only needed when both operands are constants.
+
+    Args:
+        value: The constant value.
+
+    Returns:
+        An expression evaluating to the given value.
+    """
+    return _LiteralExpr(value)
+
+
+class _ColumnExpr(Expr):
+    def __init__(self, name: str):
+        self.name = name
+
+    def eval_arrow(self, table: "pyarrow.Table") -> Any:
+        return table.column(self.name)
+
+    def eval_pandas(self, df: "pandas.DataFrame") -> Any:
+        return df[self.name]
+
+    def to_pyarrow(self) -> "pyarrow.dataset.Expression":
+        import pyarrow.dataset as pds
+
+        return pds.field(self.name)
+
+    def __repr__(self):
+        return f"col({self.name!r})"
+
+
+class _LiteralExpr(Expr):
+    def __init__(self, value: Any):
+        self.value = value
+
+    def eval_arrow(self, table: "pyarrow.Table") -> Any:
+        return self.value
+
+    def eval_pandas(self, df: "pandas.DataFrame") -> Any:
+        return self.value
+
+    def to_pyarrow(self) -> "pyarrow.dataset.Expression":
+        import pyarrow.dataset as pds
+
+        return pds.scalar(self.value)
+
+    def __repr__(self):
+        return f"lit({self.value!r})"
+
+
+def _arrow_divide(left: Any, right: Any) -> Any:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    # Match Python's true division semantics, since Arrow's divide is integer
+    # division for integer inputs.
+    def to_float(value: Any) -> Any:
+        if isinstance(value, (pa.Array, pa.ChunkedArray)):
+            return value.cast(pa.float64())
+        if value is None:
+            return pa.scalar(None, pa.float64())
+        return float(value)
+
+    return pc.divide(to_float(left), to_float(right))
+
+
+def _arrow_binary_ops() -> Dict[str, Callable[[Any, Any], Any]]:
+    import pyarrow.compute as pc
+
+    return {
+        "eq": pc.equal,
+        "ne": pc.not_equal,
+        "lt": pc.less,
+        "le": pc.less_equal,
+        "gt": pc.greater,
+        "ge": pc.greater_equal,
+        "and": pc.and_kleene,
+        "or": pc.or_kleene,
+        "add": pc.add,
+        "sub": pc.subtract,
+        "mul": pc.multiply,
+        "div": _arrow_divide,
+    }
+
+
+_PANDAS_BINARY_OPS = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "and": operator.and_,
+    "or": operator.or_,
+    "add": operator.add,
+    "sub": operator.sub,
+    "mul": operator.mul,
+    "div": operator.truediv,
+}
+
+# The binary ops that have a pyarrow.dataset.Expression equivalent.
+_PYARROW_BINARY_OPS = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "and": operator.and_,
+    "or": operator.or_,
+}
+
+_SYMBOLS = {
+    "eq": "==",
+    "ne": "!=",
+    "lt": "<",
+    "le": "<=",
+    "gt": ">",
+    "ge": ">=",
+    "and": "&",
+    "or": "|",
+    "add": "+",
+    "sub": "-",
+    "mul": "*",
+    "div": "/",
+}
+
+
+def _to_expr(value: Any) -> Expr:
+    return value if isinstance(value, Expr) else _LiteralExpr(value)
+
+
+class _BinaryExpr(Expr):
+    def __init__(self, op: str, left: Any, right: Any):
+        self.op = op
+        self.left = _to_expr(left)
+        self.right = _to_expr(right)
+
+    def eval_arrow(self, table: "pyarrow.Table") -> Any:
+        left = self.left.eval_arrow(table)
+        right = self.right.eval_arrow(table)
+        return _arrow_binary_ops()[self.op](left, right)
+
+    def eval_pandas(self, df: "pandas.DataFrame") -> Any:
+        left = self.left.eval_pandas(df)
+        right = self.right.eval_pandas(df)
+        return _PANDAS_BINARY_OPS[self.op](left, right)
+
+    def to_pyarrow(self) -> "pyarrow.dataset.Expression":
+        if self.op not in _PYARROW_BINARY_OPS:
+            raise ValueError(f"Can't convert {self} to a pyarrow expression.")
+        return _PYARROW_BINARY_OPS[self.op](
+            self.left.to_pyarrow(), self.right.to_pyarrow()
+        )
+
+    def __repr__(self):
+        return f"({self.left!r} {_SYMBOLS[self.op]} {self.right!r})"
+
+
+class _UnaryExpr(Expr):
+    def __init__(self, op: str, operand: Expr):
+        self.op = op
+        self.operand = operand
+
+    def eval_arrow(self, table: "pyarrow.Table") -> Any:
+        import pyarrow.compute as pc
+
+        value = self.operand.eval_arrow(table)
+        if self.op == "not":
+            return pc.invert(value)
+        elif self.op == "neg":
+            return pc.negate(value)
+        else:
+            assert self.op == "is_null", self.op
+            return pc.is_null(value)
+
+    def eval_pandas(self, df: "pandas.DataFrame") -> Any:
+        value = self.operand.eval_pandas(df)
+        if self.op == "not":
+            return ~value
+        elif self.op == "neg":
+            return -value
+        else:
+            assert self.op == "is_null", self.op
+            return value.isna()
+
+    def to_pyarrow(self) -> "pyarrow.dataset.Expression":
+        value = self.operand.to_pyarrow()
+        if self.op == "not":
+            return ~value
+        elif self.op == "is_null":
+            return value.is_null()
+        raise ValueError(f"Can't convert {self} to a pyarrow expression.")
+
+    def __repr__(self):
+        if self.op == "not":
+            return f"~{self.operand!r}"
+        elif self.op == "neg":
+            return f"-{self.operand!r}"
+        return f"{self.operand!r}.is_null()"
+
+
+class _IsInExpr(Expr):
+    def __init__(self, operand: Expr, values: List[Any]):
+        self.operand = operand
+        self.values = values
+
+    def eval_arrow(self, table: "pyarrow.Table") -> Any:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        return pc.is_in(self.operand.eval_arrow(table), value_set=pa.array(self.values))
+
+    def eval_pandas(self, df: "pandas.DataFrame") -> Any:
+        return self.operand.eval_pandas(df).isin(self.values)
+
+    def to_pyarrow(self) -> "pyarrow.dataset.Expression":
+        return self.operand.to_pyarrow().isin(self.values)
+
+    def __repr__(self):
+        return f"{self.operand!r}.is_in({self.values!r})"
+
+
+def _get_referenced_columns(expr: Expr) -> Optional[Set[str]]:
+    """Return the names of the columns the expression reads, or None if unknown."""
+    if isinstance(expr, _ColumnExpr):
+        return {expr.name}
+    elif isinstance(expr, _LiteralExpr):
+        return set()
+    elif isinstance(expr, _BinaryExpr):
+        left = _get_referenced_columns(expr.left)
+        right = _get_referenced_columns(expr.right)
+        if left is None or right is None:
+            return None
+        return left | right
+    elif isinstance(expr, (_UnaryExpr, _IsInExpr)):
+        return _get_referenced_columns(expr.operand)
+    return None
+
+
+def _try_to_pyarrow(expr: Expr) -> Union["pyarrow.dataset.Expression", None]:
+    """Convert the expression to a pyarrow expression, or None if not possible."""
+    try:
+        return expr.to_pyarrow()
+    except (ValueError, ImportError):
+        return None
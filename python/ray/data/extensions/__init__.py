@@ -3,6 +3,9 @@ from ray.data.extensions.tensor_extension import (
     TensorArray,
     ArrowTensorType,
     ArrowTensorArray,
+    ArrowVariableShapedTensorType,
+    ArrowVariableShapedTensorArray,
+    pad_tensors,
 )
 
 __all__ = [
@@ -11,4 +14,7 @@ __all__ = [
     "TensorArray",
     "ArrowTensorType",
     "ArrowTensorArray",
+    "ArrowVariableShapedTensorType",
+    "ArrowVariableShapedTensorArray",
+    "pad_tensors",
 ]
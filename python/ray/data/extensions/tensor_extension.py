@@ -18,6 +18,7 @@
 #  limitations under the License.
 
 # Modifications:
+# - Added ArrowVariableShapedTensorType and ArrowVariableShapedTensorArray.
 # - Added ArrowTensorType.to_pandas_type()
 # - Added ArrowTensorArray.__getitem__()
 # - Added ArrowTensorArray.__iter__()
@@ -1220,6 +1221,9 @@ class ArrowTensorArray(pa.ExtensionArray):
         Convert an ndarray or an iterable of fixed-shape ndarrays to an array
         of fixed-shape, homogeneous-typed tensors.
 
+        If given a list of ndarrays with different shapes, this returns an
+        ArrowVariableShapedTensorArray instead.
+
         Args:
             arr: An ndarray or an iterable of fixed-shape ndarrays.
 
@@ -1230,6 +1234,10 @@ class ArrowTensorArray(pa.ExtensionArray):
             if np.isscalar(arr[0]):
                 return pa.array(arr)
             elif isinstance(arr[0], np.ndarray):
+                if any(a.shape != arr[0].shape for a in arr):
+                    # The tensors have different shapes, so they can only be
+                    # represented with the variable-shaped tensor type.
+                    return ArrowVariableShapedTensorArray.from_numpy(arr)
                 # Stack ndarrays and pass through to ndarray handling logic
                 # below.
                 arr = np.stack(arr, axis=0)
@@ -1371,3 +1379,203 @@ class ArrowTensorArray(pa.ExtensionArray):
             A single ndarray representing the entire array of tensors.
         """
         return self._to_numpy(zero_copy_only=zero_copy_only)
+
+
+@PublicAPI(stability="alpha")
+class ArrowVariableShapedTensorType(pa.PyExtensionType):
+    """
+    Arrow ExtensionType for an array of homogeneous-typed tensors with the same
+    number of dimensions, but possibly different shapes (e.g. images of different
+    sizes, or token sequences of different lengths).
+
+    The tensors are stored as a struct with a ``data`` field, holding the
+    flattened elements of all tensors in a single buffer along with the offset of
+    each tensor, and a ``shape`` field, holding the shape of each tensor. This
+    keeps ragged columns compact, and allows zero-copy slicing and conversion to
+    NumPy views.
+    """
+
+    def __init__(self, dtype: pa.DataType, ndim: int):
+        """
+        Construct the Arrow extension type for an array of variable-shaped tensors.
+
+        Args:
+            dtype: pyarrow dtype of tensor elements.
+            ndim: The number of dimensions of the tensors.
+        """
+        self._ndim = ndim
+        super().__init__(
+            pa.struct(
+                [("data", pa.large_list(dtype)), ("shape", pa.list_(pa.int64(), ndim))]
+            )
+        )
+
+    @property
+    def ndim(self) -> int:
+        """
+        The number of dimensions of the contained tensors.
+        """
+        return self._ndim
+
+    @property
+    def value_type(self) -> pa.DataType:
+        """
+        The pyarrow dtype of the tensor elements.
+        """
+        return self.storage_type["data"].type.value_type
+
+    def __reduce__(self):
+        return ArrowVariableShapedTensorType, (self.value_type, self._ndim)
+
+    def __arrow_ext_class__(self):
+        """
+        ExtensionArray subclass with custom logic for this array of tensors
+        type.
+
+        Returns:
+            A subclass of pa.ExtensionArray.
+        """
+        return ArrowVariableShapedTensorArray
+
+    def __str__(self):
+        return "<ArrowVariableShapedTensorType: ndim={}, dtype={}>".format(
+            self.ndim, self.value_type
+        )
+
+
+@PublicAPI(stability="alpha")
+class ArrowVariableShapedTensorArray(pa.ExtensionArray):
+    """
+    An array of homogeneous-typed tensors with possibly different shapes.
+
+    Converting this array to NumPy returns an object ndarray of tensors, each of
+    which is a view of the array's data buffer (except for boolean tensors,
+    which Arrow bit-packs).
+
+    Examples:
+        >>> import numpy as np
+        >>> from ray.data.extensions import ArrowVariableShapedTensorArray
+        >>> arr = ArrowVariableShapedTensorArray.from_numpy(
+        ...     [np.ones((2, 2)), np.ones((3, 2))])
+        >>> [t.shape for t in arr.to_numpy()]
+        [(2, 2), (3, 2)]
+    """
+
+    def __getitem__(self, key):
+        # See ArrowTensorArray.__getitem__() for why we override this.
+        if isinstance(key, slice):
+            return super().__getitem__(key)
+        return self._to_numpy(key)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.__getitem__(i)
+
+    def to_pylist(self):
+        return list(self)
+
+    @classmethod
+    def from_numpy(cls, arr: Sequence[np.ndarray]) -> "ArrowVariableShapedTensorArray":
+        """
+        Convert a sequence of ndarrays with the same number of dimensions to an
+        array of variable-shaped tensors.
+
+        The elements of the ndarrays are copied into a single flat data buffer.
+
+        Args:
+            arr: A sequence of ndarrays with the same number of dimensions.
+
+        Returns:
+            An ArrowVariableShapedTensorArray containing len(arr) tensors.
+        """
+        arrs = [np.asarray(a) for a in arr]
+        if not arrs:
+            raise ValueError("Can't create a tensor array from an empty sequence.")
+        ndim = arrs[0].ndim
+        if ndim == 0:
+            raise ValueError("Variable-shaped tensors must have at least 1 dimension.")
+        if any(a.ndim != ndim for a in arrs):
+            raise ValueError(
+                "Variable-shaped tensors must all have the same number of "
+                f"dimensions, got: {sorted({a.ndim for a in arrs})}"
+            )
+        dtype = np.result_type(*arrs)
+        pa_dtype = pa.from_numpy_dtype(dtype)
+        sizes = np.array([a.size for a in arrs], dtype=np.int64)
+        offsets = np.zeros(len(arrs) + 1, dtype=np.int64)
+        np.cumsum(sizes, out=offsets[1:])
+        values = np.concatenate([a.ravel() for a in arrs]).astype(dtype, copy=False)
+        data = pa.LargeListArray.from_arrays(
+            pa.array(offsets), pa.array(values, type=pa_dtype)
+        )
+        shapes = np.array([a.shape for a in arrs], dtype=np.int64).ravel()
+        shape = pa.FixedSizeListArray.from_arrays(pa.array(shapes), ndim)
+        storage = pa.StructArray.from_arrays([data, shape], names=["data", "shape"])
+        type_ = ArrowVariableShapedTensorType(pa_dtype, ndim)
+        return pa.ExtensionArray.from_storage(type_, storage)
+
+    def _to_numpy(self, index: Optional[int] = None) -> np.ndarray:
+        """
+        Helper for getting either a tensor of the array as an ndarray, or all of
+        the tensors as an object ndarray of ndarrays.
+        """
+        # Flattening applies the offset of this array, e.g. due to a slice, to
+        # the struct fields.
+        data, shape = self.storage.flatten()
+        offsets = data.offsets.to_numpy()
+        shapes = shape.flatten().to_numpy().reshape(-1, self.type.ndim)
+        if pa.types.is_boolean(self.type.value_type):
+            # Arrow bit-packs boolean arrays, so these can't be viewed by NumPy.
+            values = data.values.to_numpy(zero_copy_only=False)
+        else:
+            values = data.values.to_numpy()
+        if index is not None:
+            if index < 0:
+                index += len(self)
+            return values[offsets[index] : offsets[index + 1]].reshape(shapes[index])
+        tensors = np.empty(len(self), dtype=object)
+        for i in range(len(self)):
+            tensors[i] = values[offsets[i] : offsets[i + 1]].reshape(shapes[i])
+        return tensors
+
+    def to_numpy(self, zero_copy_only: bool = True) -> np.ndarray:
+        """
+        Convert the array of tensors into an object ndarray of ndarrays.
+
+        Args:
+            zero_copy_only: This argument is currently ignored; the tensors are
+                views of the array's data buffer, except for boolean tensors.
+
+        Returns:
+            An object ndarray holding an ndarray for each tensor.
+        """
+        return self._to_numpy()
+
+
+@PublicAPI(stability="alpha")
+def pad_tensors(tensors: Sequence[np.ndarray], pad_value: Any = 0) -> np.ndarray:
+    """
+    Pad a batch of variable-shaped tensors into a single dense ndarray.
+
+    This is useful to feed a batch of a variable-shaped tensor column, as
+    returned by ``iter_batches(batch_format="numpy")``, to a model. Each tensor is
+    padded at the end of each dimension to the max size of that dimension in the
+    batch.
+
+    Args:
+        tensors: The tensors, which must have the same number of dimensions.
+        pad_value: The value to pad the tensors with.
+
+    Returns:
+        An ndarray of shape ``(len(tensors),) + max_shape``.
+    """
+    tensors = [np.asarray(t) for t in tensors]
+    if not tensors:
+        return np.array([])
+    max_shape = tuple(np.max([t.shape for t in tensors], axis=0))
+    out = np.full(
+        (len(tensors),) + max_shape, pad_value, dtype=np.result_type(*tensors)
+    )
+    for i, t in enumerate(tensors):
+        out[(i,) + tuple(slice(0, d) for d in t.shape)] = t
+    return out
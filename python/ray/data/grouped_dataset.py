@@ -9,6 +9,7 @@ from ray.data._internal.plan import AllToAllStage
 from ray.data._internal.compute import CallableClass, ComputeStrategy
 from ray.data._internal.shuffle import ShuffleOp, SimpleShufflePlan
 from ray.data.block import Block, BlockAccessor, BlockMetadata, T, U, KeyType
+from ray.data.context import DatasetContext
 
 
 class _GroupbyOp(ShuffleOp):
@@ -47,10 +48,52 @@ class _GroupbyOp(ShuffleOp):
         )
 
 
+class _HashGroupbyOp(_GroupbyOp):
+    @staticmethod
+    def map(
+        idx: int,
+        block: Block,
+        output_num_blocks: int,
+        key: KeyFn,
+        aggs: Tuple[AggregateFn],
+    ) -> List[Union[BlockMetadata, Block]]:
+        """Hash partition the block and combine rows with the same key.
+
+        Unlike ``_GroupbyOp.map``, this doesn't sort the input block. Only the
+        combined partitions, which have a single row per key, are sorted so that
+        they can be merged by ``_GroupbyOp.reduce``.
+        """
+        stats = BlockExecStats.builder()
+        partitions = BlockAccessor.for_block(block).hash_partition(
+            key, output_num_blocks
+        )
+        parts = []
+        for p in partitions:
+            combined = BlockAccessor.for_block(p).combine(key, aggs)
+            parts.append(_sort_combined_block(combined, key))
+        meta = BlockAccessor.for_block(block).get_metadata(
+            input_files=None, exec_stats=stats.build()
+        )
+        return [meta] + parts
+
+
+def _sort_combined_block(block: Block, key: KeyFn) -> Block:
+    accessor = BlockAccessor.for_block(block)
+    if accessor.num_rows() == 0:
+        return block
+    # The key is the first element of each combined row.
+    sort_key = [(key, "ascending")] if isinstance(key, str) else (lambda r: r[0])
+    return accessor.sort_and_partition([], sort_key, descending=False)[0]
+
+
 class SimpleShuffleGroupbyOp(_GroupbyOp, SimpleShufflePlan):
     pass
 
 
+class SimpleShuffleHashGroupbyOp(_HashGroupbyOp, SimpleShufflePlan):
+    pass
+
+
 @PublicAPI
 class GroupedDataset(Generic[T]):
     """Represents a grouped dataset created by calling ``Dataset.groupby()``.
@@ -96,11 +139,15 @@ class GroupedDataset(Generic[T]):
             groupby key and the second through ``n + 1`` columns are the
             results of the aggregations.
             If groupby key is ``None`` then the key part of return is omitted.
+            If ``DatasetContext.use_hash_based_groupby`` is set, the groups are
+            hash partitioned instead of range partitioned, so the output is only
+            sorted by key within each block.
         """
 
         def do_agg(blocks, clear_input_blocks: bool, *_):
             # TODO: implement clear_input_blocks
             stage_info = {}
+            context = DatasetContext.get_current()
             if len(aggs) == 0:
                 raise ValueError("Aggregate requires at least one aggregation")
             for agg in aggs:
@@ -111,6 +158,17 @@ class GroupedDataset(Generic[T]):
 
             num_mappers = blocks.initial_num_blocks()
             num_reducers = num_mappers
+            if self._key is not None and context.use_hash_based_groupby:
+                # Hash partitioning needs neither a sampling pass nor a sort of
+                # the input blocks.
+                shuffle_op = SimpleShuffleHashGroupbyOp(
+                    map_args=[self._key, aggs], reduce_args=[self._key, aggs]
+                )
+                return shuffle_op.execute(
+                    blocks,
+                    num_reducers,
+                    clear_input_blocks,
+                )
             if self._key is None:
                 num_reducers = 1
                 boundaries = []
@@ -1,16 +1,20 @@
+import asyncio
 import bisect
 import logging
 import random
 import time
 from collections import defaultdict
 import numpy as np
-from typing import List, Any, Generic, Optional, TYPE_CHECKING
+from typing import Dict, List, Any, Generic, Optional, Tuple, Union, TYPE_CHECKING
 
 import ray
 from ray.types import ObjectRef
-from ray.data.block import T, BlockAccessor
+from ray.data.block import T, Block, BlockAccessor, BlockExecStats, BlockMetadata
 from ray.data.context import DatasetContext, DEFAULT_SCHEDULING_STRATEGY
+from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
+from ray.data._internal.hash_partition import hash_key
 from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data._internal.shuffle import ShuffleOp, SimpleShufflePlan
 from ray.util.annotations import PublicAPI
 
 if TYPE_CHECKING:
@@ -18,6 +22,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# The supported index types.
+INDEX_TYPES = ("sort", "hash")
+
 
 @PublicAPI(stability="beta")
 class RandomAccessDataset(Generic[T]):
@@ -31,6 +38,8 @@ class RandomAccessDataset(Generic[T]):
         dataset: "Dataset[T]",
         key: str,
         num_workers: int,
+        index: str = "sort",
+        max_in_flight_per_worker: Optional[int] = None,
     ):
         """Construct a RandomAccessDataset (internal API).
 
@@ -40,24 +49,49 @@ class RandomAccessDataset(Generic[T]):
         self._format = dataset._dataset_format()
         if self._format not in ["arrow", "pandas"]:
             raise ValueError("RandomAccessDataset only supports Arrow-format datasets.")
+        if index not in INDEX_TYPES:
+            raise ValueError(f"index must be one of {INDEX_TYPES}, got {index}.")
+        if max_in_flight_per_worker is not None and max_in_flight_per_worker < 1:
+            raise ValueError(
+                "max_in_flight_per_worker must be at least 1, got "
+                f"{max_in_flight_per_worker}."
+            )
+        self._index = index
+        self._max_in_flight_per_worker = max_in_flight_per_worker
+        self._semaphores = None
+        self._semaphores_loop = None
 
         start = time.perf_counter()
-        logger.info("[setup] Indexing dataset by sort key.")
-        sorted_ds = dataset.sort(key)
+        if index == "sort":
+            logger.info("[setup] Indexing dataset by sort key.")
+            blocks = dataset.sort(key).get_internal_block_refs()
+        else:
+            logger.info("[setup] Indexing dataset by key hash.")
+            blocks = _hash_index(dataset, key)
         get_bounds = cached_remote_fn(_get_bounds)
-        blocks = sorted_ds.get_internal_block_refs()
 
         logger.info("[setup] Computing block range bounds.")
         bounds = ray.get([get_bounds.remote(b, key, self._format) for b in blocks])
         self._non_empty_blocks = []
         self._lower_bound = None
         self._upper_bounds = []
+        # The index of the non-empty block of each hash shard, or None if empty.
+        self._shard_to_block: List[Optional[int]] = []
         for i, b in enumerate(bounds):
             if b:
+                self._shard_to_block.append(len(self._non_empty_blocks))
                 self._non_empty_blocks.append(blocks[i])
                 if self._lower_bound is None:
                     self._lower_bound = b[0]
                 self._upper_bounds.append(b[1])
+            else:
+                self._shard_to_block.append(None)
+        # Numeric upper bounds are searched with numpy when routing many keys.
+        self._upper_bounds_array = None
+        if index == "sort":
+            upper_bounds_array = np.array(self._upper_bounds)
+            if upper_bounds_array.ndim == 1 and upper_bounds_array.dtype.kind in "biuf":
+                self._upper_bounds_array = upper_bounds_array
 
         logger.info("[setup] Creating {} random access workers.".format(num_workers))
         ctx = DatasetContext.get_current()
@@ -94,6 +128,13 @@ class RandomAccessDataset(Generic[T]):
         logger.info("[setup] Finished assigning blocks to workers.")
         self._build_time = time.perf_counter() - start
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # The semaphores are bound to the event loop of this process.
+        state["_semaphores"] = None
+        state["_semaphores_loop"] = None
+        return state
+
     def _compute_block_to_worker_assignments(self):
         # Return values.
         block_to_workers: dict[int, List["ray.ActorHandle"]] = defaultdict(list)
@@ -128,13 +169,15 @@ class RandomAccessDataset(Generic[T]):
     def get_async(self, key: Any) -> ObjectRef[Optional[T]]:
         """Asynchronously finds the record for a single key.
 
+        The returned ObjectRef can also be awaited in asyncio code.
+
         Args:
             key: The key of the record to find.
 
         Returns:
             ObjectRef containing the record (in pydict form), or None if not found.
         """
-        block_index = self._find_le(key)
+        block_index = self._find_block(key)
         if block_index is None:
             return ray.put(None)
         return self._worker_for(block_index).get.remote(block_index, key)
@@ -142,30 +185,60 @@ class RandomAccessDataset(Generic[T]):
     def multiget(self, keys: List[Any]) -> List[Optional[T]]:
         """Synchronously find the records for a list of keys.
 
+        The keys are looked up with a single call per worker, each of which
+        searches its blocks for all of their keys at once.
+
         Args:
             keys: List of keys to find the records for.
 
         Returns:
             List of found records (in pydict form), or None for missing records.
         """
-        batches = defaultdict(list)
-        for k in keys:
-            batches[self._find_le(k)].append(k)
-        futures = {}
-        for index, keybatch in batches.items():
-            if index is None:
-                continue
-            fut = self._worker_for(index).multiget.remote(
-                [index] * len(keybatch), keybatch
-            )
-            futures[index] = fut
-        results = {}
-        for i, fut in futures.items():
-            keybatch = batches[i]
-            values = ray.get(fut)
-            for k, v in zip(keybatch, values):
-                results[k] = v
-        return [results.get(k) for k in keys]
+        batches = self._batch_by_worker(keys)
+        futures = [
+            worker.multiget.remote(block_indices, keybatch)
+            for worker, (_, block_indices, keybatch) in batches.items()
+        ]
+        results = [None] * len(keys)
+        for (positions, _, _), values in zip(batches.values(), ray.get(futures)):
+            for i, v in zip(positions, values):
+                results[i] = v
+        return results
+
+    async def multiget_async(self, keys: List[Any]) -> List[Optional[T]]:
+        """Find the records for a list of keys from asyncio code.
+
+        This is the asyncio version of ``multiget()``. If the dataset was created
+        with ``max_in_flight_per_worker``, calls to a worker beyond that limit wait
+        for earlier calls to that worker to finish, which bounds the queueing
+        latency of each lookup under load.
+
+        Args:
+            keys: List of keys to find the records for.
+
+        Returns:
+            List of found records (in pydict form), or None for missing records.
+        """
+        batches = self._batch_by_worker(keys)
+
+        async def fetch(worker, block_indices, keybatch):
+            semaphore = self._get_semaphore(worker)
+            if semaphore is None:
+                return await worker.multiget.remote(block_indices, keybatch)
+            async with semaphore:
+                return await worker.multiget.remote(block_indices, keybatch)
+
+        all_values = await asyncio.gather(
+            *[
+                fetch(worker, block_indices, keybatch)
+                for worker, (_, block_indices, keybatch) in batches.items()
+            ]
+        )
+        results = [None] * len(keys)
+        for (positions, _, _), values in zip(batches.values(), all_values):
+            for i, v in zip(positions, values):
+                results[i] = v
+        return results
 
     def stats(self) -> str:
         """Returns a string containing access timing information."""
@@ -190,6 +263,63 @@ class RandomAccessDataset(Generic[T]):
     def _worker_for(self, block_index: int):
         return random.choice(self._block_to_workers_map[block_index])
 
+    def _get_semaphore(
+        self, worker: "ray.actor.ActorHandle"
+    ) -> Optional[asyncio.Semaphore]:
+        if self._max_in_flight_per_worker is None:
+            return None
+        loop = asyncio.get_event_loop()
+        if self._semaphores is None or self._semaphores_loop is not loop:
+            self._semaphores = {}
+            self._semaphores_loop = loop
+        if worker not in self._semaphores:
+            self._semaphores[worker] = asyncio.Semaphore(self._max_in_flight_per_worker)
+        return self._semaphores[worker]
+
+    def _batch_by_worker(
+        self, keys: List[Any]
+    ) -> Dict["ray.actor.ActorHandle", Tuple[List[int], List[int], List[Any]]]:
+        """Group the keys by the worker to look them up with.
+
+        Returns:
+            A map from each worker to the positions of its keys in the input, their
+            block indices and the keys.
+        """
+        # Pick one of the workers of each block for the whole batch, so that each
+        # worker gets at most one call.
+        block_workers = {}
+        batches = {}
+        for i, (block_index, k) in enumerate(zip(self._find_blocks(keys), keys)):
+            if block_index is None:
+                continue
+            worker = block_workers.get(block_index)
+            if worker is None:
+                worker = self._worker_for(block_index)
+                block_workers[block_index] = worker
+            if worker not in batches:
+                batches[worker] = ([], [], [])
+            positions, block_indices, keybatch = batches[worker]
+            positions.append(i)
+            block_indices.append(block_index)
+            keybatch.append(k)
+        return batches
+
+    def _find_block(self, x: Any) -> Optional[int]:
+        if self._index == "hash":
+            return self._shard_to_block[hash_key(x) % len(self._shard_to_block)]
+        return self._find_le(x)
+
+    def _find_blocks(self, keys: List[Any]) -> List[Optional[int]]:
+        if self._upper_bounds_array is not None and len(keys) > 0:
+            keys_array = np.asarray(keys)
+            if keys_array.ndim == 1 and keys_array.dtype.kind in "biuf":
+                indices = np.searchsorted(self._upper_bounds_array, keys_array)
+                found = (indices < len(self._upper_bounds_array)) & (
+                    keys_array >= self._lower_bound
+                )
+                return [int(i) if f else None for i, f in zip(indices, found)]
+        return [self._find_block(k) for k in keys]
+
     def _find_le(self, x: Any) -> int:
         i = bisect.bisect_left(self._upper_bounds, x)
         if i >= len(self._upper_bounds) or x < self._lower_bound:
@@ -197,6 +327,53 @@ class RandomAccessDataset(Generic[T]):
         return i
 
 
+class _HashIndexOp(ShuffleOp):
+    """Hash partitions the rows into shards by key, each sorted by key."""
+
+    @staticmethod
+    def map(
+        idx: int, block: Block, output_num_blocks: int, key: str
+    ) -> List[Union[BlockMetadata, Block]]:
+        stats = BlockExecStats.builder()
+        accessor = BlockAccessor.for_block(block)
+        parts = accessor.hash_partition(key, output_num_blocks)
+        meta = accessor.get_metadata(input_files=None, exec_stats=stats.build())
+        return [meta] + parts
+
+    @staticmethod
+    def reduce(key: str, *mapper_outputs: List[Block]) -> (Block, BlockMetadata):
+        stats = BlockExecStats.builder()
+        builder = DelegatingBlockBuilder()
+        for block in mapper_outputs:
+            # Empty partitions may not have the key column.
+            if BlockAccessor.for_block(block).num_rows() > 0:
+                builder.add_block(block)
+        block = builder.build()
+        accessor = BlockAccessor.for_block(block)
+        if accessor.num_rows() > 0:
+            block = accessor.sort_and_partition([], key, False)[0]
+            accessor = BlockAccessor.for_block(block)
+        return block, accessor.get_metadata(input_files=None, exec_stats=stats.build())
+
+
+class SimpleShuffleHashIndexOp(_HashIndexOp, SimpleShufflePlan):
+    pass
+
+
+def _hash_index(dataset: "Dataset[T]", key: str) -> List[ObjectRef[Block]]:
+    """Hash partition the dataset by key into shards that are sorted by key.
+
+    Unlike a sort, this doesn't need to sample the keys to find range boundaries,
+    and each shard is only sorted locally. Keys are routed to shards with the same
+    hash as ``BlockAccessor.hash_partition()``.
+    """
+    blocks = dataset._plan.execute()
+    num_shards = max(blocks.initial_num_blocks(), 1)
+    index_op = SimpleShuffleHashIndexOp(map_args=[key], reduce_args=[key])
+    shards, _ = index_op.execute(blocks, num_shards, clear_input_blocks=False)
+    return shards.get_blocks()
+
+
 @ray.remote(num_cpus=0)
 class _RandomAccessWorker:
     def __init__(self, key_field, dataset_format):
@@ -208,29 +385,28 @@ class _RandomAccessWorker:
 
     def assign_blocks(self, block_ref_dict):
         self.blocks = {k: ray.get(ref) for k, ref in block_ref_dict.items()}
+        self.key_columns = {
+            k: BlockAccessor.for_block(block).to_numpy(self.key_field)
+            for k, block in self.blocks.items()
+        }
 
     def get(self, block_index, key):
         start = time.perf_counter()
-        result = self._get(block_index, key)
+        result = self._lookup(block_index, [key])[0]
         self.total_time += time.perf_counter() - start
         self.num_accesses += 1
         return result
 
     def multiget(self, block_indices, keys):
         start = time.perf_counter()
-        if self.dataset_format == "arrow" and len(set(block_indices)) == 1:
-            # Fast path: use np.searchsorted for vectorized search on a single block.
-            # This is ~3x faster than the naive case.
-            block = self.blocks[block_indices[0]]
-            col = block[self.key_field]
-            indices = np.searchsorted(col, keys)
-            acc = BlockAccessor.for_block(block)
-            result = [
-                acc._create_table_row(acc.slice(i, i + 1, copy=True)) for i in indices
-            ]
-            # assert result == [self._get(i, k) for i, k in zip(block_indices, keys)]
-        else:
-            result = [self._get(i, k) for i, k in zip(block_indices, keys)]
+        batches = defaultdict(list)
+        for i, block_index in enumerate(block_indices):
+            batches[block_index].append(i)
+        result = [None] * len(keys)
+        for block_index, positions in batches.items():
+            values = self._lookup(block_index, [keys[i] for i in positions])
+            for i, v in zip(positions, values):
+                result[i] = v
         self.total_time += time.perf_counter() - start
         self.num_accesses += 1
         return result
@@ -245,36 +421,25 @@ class _RandomAccessWorker:
             "total_time": self.total_time,
         }
 
-    def _get(self, block_index, key):
-        if block_index is None:
-            return None
+    def _lookup(self, block_index, keys):
+        """Find the rows of the keys in the block, which is sorted by key."""
         block = self.blocks[block_index]
-        column = block[self.key_field]
-        if self.dataset_format == "arrow":
-            column = _ArrowListWrapper(column)
-        i = _binary_search_find(column, key)
-        if i is None:
-            return None
+        column = self.key_columns[block_index]
+        try:
+            # Search for all of the keys at once. This is much faster than a
+            # binary search per key for large batches.
+            indices = np.searchsorted(column, keys)
+        except TypeError:
+            # The keys aren't comparable with the column in numpy.
+            indices = [bisect.bisect_left(column, k) for k in keys]
         acc = BlockAccessor.for_block(block)
-        return acc._create_table_row(acc.slice(i, i + 1, copy=True))
-
-
-def _binary_search_find(column, x):
-    i = bisect.bisect_left(column, x)
-    if i != len(column) and column[i] == x:
-        return i
-    return None
-
-
-class _ArrowListWrapper:
-    def __init__(self, arrow_col):
-        self.arrow_col = arrow_col
-
-    def __getitem__(self, i):
-        return self.arrow_col[i].as_py()
-
-    def __len__(self):
-        return len(self.arrow_col)
+        result = []
+        for i, k in zip(indices, keys):
+            if i < len(column) and column[i] == k:
+                result.append(acc._create_table_row(acc.slice(i, i + 1, copy=True)))
+            else:
+                result.append(None)
+        return result
 
 
 def _get_bounds(block, key, dataset_format):
@@ -41,6 +41,7 @@ from ray.data.datasource import (
     ParquetDatasource,
     BinaryDatasource,
     NumpyDatasource,
+    FileBasedDatasource,
     ReadTask,
     BaseFileMetadataProvider,
     DefaultFileMetadataProvider,
@@ -61,7 +62,10 @@ from ray.data._internal.lazy_block_list import LazyBlockList
 from ray.data._internal.plan import ExecutionPlan
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.stats import DatasetStats
-from ray.data._internal.util import _lazy_import_pyarrow_dataset
+from ray.data._internal.util import (
+    _autodetect_parallelism,
+    _lazy_import_pyarrow_dataset,
+)
 
 T = TypeVar("T")
 
@@ -114,7 +118,7 @@ def from_items(items: List[Any], *, parallelism: int = 200) -> Dataset[Any]:
 
 
 @PublicAPI
-def range(n: int, *, parallelism: int = 200) -> Dataset[int]:
+def range(n: int, *, parallelism: int = -1) -> Dataset[int]:
     """Create a dataset from a range of integers [0..n).
 
     Examples:
@@ -124,7 +128,8 @@ def range(n: int, *, parallelism: int = 200) -> Dataset[int]:
     Args:
         n: The upper bound of the range of integers.
         parallelism: The amount of parallelism to use for the dataset.
-            Parallelism may be limited by the number of items.
+            Parallelism may be limited by the number of items. If -1 (default),
+            it's chosen automatically based on the available CPUs.
 
     Returns:
         Dataset holding the integers.
@@ -135,7 +140,7 @@ def range(n: int, *, parallelism: int = 200) -> Dataset[int]:
 
 
 @PublicAPI
-def range_table(n: int, *, parallelism: int = 200) -> Dataset[ArrowRow]:
+def range_table(n: int, *, parallelism: int = -1) -> Dataset[ArrowRow]:
     """Create a tabular dataset from a range of integers [0..n).
 
     Examples:
@@ -149,7 +154,8 @@ def range_table(n: int, *, parallelism: int = 200) -> Dataset[ArrowRow]:
     Args:
         n: The upper bound of the range of integer records.
         parallelism: The amount of parallelism to use for the dataset.
-            Parallelism may be limited by the number of items.
+            Parallelism may be limited by the number of items. If -1 (default),
+            it's chosen automatically based on the available CPUs.
 
     Returns:
         Dataset holding the integers as Arrow records.
@@ -166,7 +172,7 @@ def range_arrow(*args, **kwargs):
 
 @PublicAPI
 def range_tensor(
-    n: int, *, shape: Tuple = (1,), parallelism: int = 200
+    n: int, *, shape: Tuple = (1,), parallelism: int = -1
 ) -> Dataset[ArrowRow]:
     """Create a Tensor dataset from a range of integers [0..n).
 
@@ -183,7 +189,8 @@ def range_tensor(
         n: The upper bound of the range of integer records.
         shape: The shape of each record.
         parallelism: The amount of parallelism to use for the dataset.
-            Parallelism may be limited by the number of items.
+            Parallelism may be limited by the number of items. If -1 (default),
+            it's chosen automatically based on the available CPUs.
 
     Returns:
         Dataset holding the integers as Arrow tensor records.
@@ -201,7 +208,7 @@ def range_tensor(
 def read_datasource(
     datasource: Datasource[T],
     *,
-    parallelism: int = 200,
+    parallelism: int = -1,
     ray_remote_args: Dict[str, Any] = None,
     **read_args,
 ) -> Dataset[T]:
@@ -210,7 +217,9 @@ def read_datasource(
     Args:
         datasource: The datasource to read data from.
         parallelism: The requested parallelism of the read. Parallelism may be
-            limited by the available partitioning of the datasource.
+            limited by the available partitioning of the datasource. If -1
+            (default), it's chosen automatically based on the available CPUs, and
+            for file-based datasources, the estimated in-memory data size.
         read_args: Additional kwargs to pass to the datasource impl.
         ray_remote_args: kwargs passed to ray.remote in the read tasks.
 
@@ -218,36 +227,9 @@ def read_datasource(
         Dataset holding the data read from the datasource.
     """
     ctx = DatasetContext.get_current()
-    # TODO(ekl) remove this feature flag.
-    force_local = "RAY_DATASET_FORCE_LOCAL_METADATA" in os.environ
-    pa_ds = _lazy_import_pyarrow_dataset()
-    if pa_ds:
-        partitioning = read_args.get("dataset_kwargs", {}).get("partitioning", None)
-        if isinstance(partitioning, pa_ds.Partitioning):
-            logger.info(
-                "Forcing local metadata resolution since the provided partitioning "
-                f"{partitioning} is not serializable."
-            )
-            force_local = True
-
-    if force_local:
-        read_tasks = datasource.prepare_read(parallelism, **read_args)
-    else:
-        # Prepare read in a remote task so that in Ray client mode, we aren't
-        # attempting metadata resolution from the client machine.
-        prepare_read = cached_remote_fn(
-            _prepare_read, retry_exceptions=False, num_cpus=0
-        )
-        read_tasks = ray.get(
-            prepare_read.remote(
-                datasource,
-                ctx,
-                parallelism,
-                _wrap_arrow_serialization_workaround(read_args),
-            )
-        )
+    read_tasks = _get_read_tasks(datasource, ctx, parallelism, read_args)
 
-    if len(read_tasks) < parallelism and (
+    if (parallelism == -1 or len(read_tasks) < parallelism) and (
         len(read_tasks) < ray.available_resources().get("CPU", 1) // 2
     ):
         logger.warning(
@@ -265,7 +247,13 @@ def read_datasource(
     ):
         ray_remote_args["scheduling_strategy"] = "SPREAD"
 
-    block_list = LazyBlockList(read_tasks, ray_remote_args=ray_remote_args)
+    block_list = LazyBlockList(
+        read_tasks,
+        ray_remote_args=ray_remote_args,
+        datasource=datasource,
+        read_parallelism=parallelism,
+        read_args=read_args,
+    )
     block_list.compute_first_block()
     block_list.ensure_metadata_for_first_block()
 
@@ -282,7 +270,7 @@ def read_parquet(
     *,
     filesystem: Optional["pyarrow.fs.FileSystem"] = None,
     columns: Optional[List[str]] = None,
-    parallelism: int = 200,
+    parallelism: int = -1,
     ray_remote_args: Dict[str, Any] = None,
     tensor_column_schema: Optional[Dict[str, Tuple[np.dtype, Tuple[int, ...]]]] = None,
     meta_provider: ParquetMetadataProvider = DefaultParquetMetadataProvider(),
@@ -303,7 +291,9 @@ def read_parquet(
         filesystem: The filesystem implementation to read from.
         columns: A list of column names to read.
         parallelism: The requested parallelism of the read. Parallelism may be
-            limited by the number of files of the dataset.
+            limited by the number of files of the dataset. If -1 (default), it's
+            chosen automatically based on the estimated in-memory data size and
+            the available CPUs.
         ray_remote_args: kwargs passed to ray.remote in the read tasks.
         tensor_column_schema: A dict of column name --> tensor dtype and shape
             mappings for converting a Parquet column containing serialized
@@ -340,7 +330,7 @@ def read_parquet_bulk(
     *,
     filesystem: Optional["pyarrow.fs.FileSystem"] = None,
     columns: Optional[List[str]] = None,
-    parallelism: int = 200,
+    parallelism: int = -1,
     ray_remote_args: Dict[str, Any] = None,
     arrow_open_file_args: Optional[Dict[str, Any]] = None,
     tensor_column_schema: Optional[Dict[str, Tuple[np.dtype, Tuple[int, ...]]]] = None,
@@ -387,7 +377,9 @@ def read_parquet_bulk(
         filesystem: The filesystem implementation to read from.
         columns: A list of column names to read.
         parallelism: The requested parallelism of the read. Parallelism may be
-            limited by the number of files of the dataset.
+            limited by the number of files of the dataset. If -1 (default), it's
+            chosen automatically based on the estimated in-memory data size and
+            the available CPUs.
         ray_remote_args: kwargs passed to ray.remote in the read tasks.
         arrow_open_file_args: kwargs passed to
             pyarrow.fs.FileSystem.open_input_file
@@ -431,7 +423,7 @@ def read_json(
     paths: Union[str, List[str]],
     *,
     filesystem: Optional["pyarrow.fs.FileSystem"] = None,
-    parallelism: int = 200,
+    parallelism: int = -1,
     ray_remote_args: Dict[str, Any] = None,
     arrow_open_stream_args: Optional[Dict[str, Any]] = None,
     meta_provider: BaseFileMetadataProvider = DefaultFileMetadataProvider(),
@@ -457,7 +449,9 @@ def read_json(
             A list of paths can contain both files and directories.
         filesystem: The filesystem implementation to read from.
         parallelism: The requested parallelism of the read. Parallelism may be
-            limited by the number of files of the dataset.
+            limited by the number of files of the dataset. If -1 (default), it's
+            chosen automatically based on the estimated in-memory data size and
+            the available CPUs.
         ray_remote_args: kwargs passed to ray.remote in the read tasks.
         arrow_open_stream_args: kwargs passed to
             pyarrow.fs.FileSystem.open_input_stream
@@ -488,7 +482,7 @@ def read_csv(
     paths: Union[str, List[str]],
     *,
     filesystem: Optional["pyarrow.fs.FileSystem"] = None,
-    parallelism: int = 200,
+    parallelism: int = -1,
     ray_remote_args: Dict[str, Any] = None,
     arrow_open_stream_args: Optional[Dict[str, Any]] = None,
     meta_provider: BaseFileMetadataProvider = DefaultFileMetadataProvider(),
@@ -514,7 +508,9 @@ def read_csv(
             A list of paths can contain both files and directories.
         filesystem: The filesystem implementation to read from.
         parallelism: The requested parallelism of the read. Parallelism may be
-            limited by the number of files of the dataset.
+            limited by the number of files of the dataset. If -1 (default), it's
+            chosen automatically based on the estimated in-memory data size and
+            the available CPUs.
         ray_remote_args: kwargs passed to ray.remote in the read tasks.
         arrow_open_stream_args: kwargs passed to
             pyarrow.fs.FileSystem.open_input_stream
@@ -548,7 +544,7 @@ def read_text(
     errors: str = "ignore",
     drop_empty_lines: bool = True,
     filesystem: Optional["pyarrow.fs.FileSystem"] = None,
-    parallelism: int = 200,
+    parallelism: int = -1,
     arrow_open_stream_args: Optional[Dict[str, Any]] = None,
     meta_provider: BaseFileMetadataProvider = DefaultFileMetadataProvider(),
     partition_filter: PathPartitionFilter = None,
@@ -570,7 +566,9 @@ def read_text(
             "ignore", or "replace". Defaults to "ignore".
         filesystem: The filesystem implementation to read from.
         parallelism: The requested parallelism of the read. Parallelism may be
-            limited by the number of files of the dataset.
+            limited by the number of files of the dataset. If -1 (default), it's
+            chosen automatically based on the estimated in-memory data size and
+            the available CPUs.
         arrow_open_stream_args: kwargs passed to
             pyarrow.fs.FileSystem.open_input_stream
         meta_provider: File metadata provider. Custom metadata providers may
@@ -603,7 +601,7 @@ def read_numpy(
     paths: Union[str, List[str]],
     *,
     filesystem: Optional["pyarrow.fs.FileSystem"] = None,
-    parallelism: int = 200,
+    parallelism: int = -1,
     arrow_open_stream_args: Optional[Dict[str, Any]] = None,
     meta_provider: BaseFileMetadataProvider = DefaultFileMetadataProvider(),
     partition_filter: PathPartitionFilter = None,
@@ -628,7 +626,9 @@ def read_numpy(
             A list of paths can contain both files and directories.
         filesystem: The filesystem implementation to read from.
         parallelism: The requested parallelism of the read. Parallelism may be
-            limited by the number of files of the dataset.
+            limited by the number of files of the dataset. If -1 (default), it's
+            chosen automatically based on the estimated in-memory data size and
+            the available CPUs.
         arrow_open_stream_args: kwargs passed to
             pyarrow.fs.FileSystem.open_input_stream
         numpy_load_args: Other options to pass to np.load.
@@ -657,7 +657,7 @@ def read_binary_files(
     *,
     include_paths: bool = False,
     filesystem: Optional["pyarrow.fs.FileSystem"] = None,
-    parallelism: int = 200,
+    parallelism: int = -1,
     ray_remote_args: Dict[str, Any] = None,
     arrow_open_stream_args: Optional[Dict[str, Any]] = None,
     meta_provider: BaseFileMetadataProvider = DefaultFileMetadataProvider(),
@@ -682,7 +682,9 @@ def read_binary_files(
         filesystem: The filesystem implementation to read from.
         ray_remote_args: kwargs passed to ray.remote in the read tasks.
         parallelism: The requested parallelism of the read. Parallelism may be
-            limited by the number of files of the dataset.
+            limited by the number of files of the dataset. If -1 (default), it's
+            chosen automatically based on the estimated in-memory data size and
+            the available CPUs.
         arrow_open_stream_args: kwargs passed to
             pyarrow.fs.FileSystem.open_input_stream
         meta_provider: File metadata provider. Custom metadata providers may
@@ -1039,6 +1041,51 @@ def _get_metadata(table: Union["pyarrow.Table", "pandas.DataFrame"]) -> BlockMet
     )
 
 
+def _get_read_tasks(
+    datasource: Datasource, ctx: DatasetContext, parallelism: int, read_args: dict
+) -> List[ReadTask]:
+    """Generate the read tasks for the given datasource and read args.
+
+    Args:
+        datasource: The datasource to read data from.
+        ctx: The current dataset context.
+        parallelism: The requested parallelism of the read, or -1 to autodetect it.
+        read_args: Kwargs to pass to the datasource's ``prepare_read()``.
+
+    Returns:
+        The read tasks for the datasource.
+    """
+    if not isinstance(datasource, FileBasedDatasource):
+        # File-based datasources autodetect the parallelism themselves, based on
+        # the file sizes.
+        parallelism = _autodetect_parallelism(parallelism, ctx)
+    # TODO(ekl) remove this feature flag.
+    force_local = "RAY_DATASET_FORCE_LOCAL_METADATA" in os.environ
+    pa_ds = _lazy_import_pyarrow_dataset()
+    if pa_ds:
+        partitioning = read_args.get("dataset_kwargs", {}).get("partitioning", None)
+        if isinstance(partitioning, pa_ds.Partitioning):
+            logger.info(
+                "Forcing local metadata resolution since the provided partitioning "
+                f"{partitioning} is not serializable."
+            )
+            force_local = True
+
+    if force_local:
+        return datasource.prepare_read(parallelism, **read_args)
+    # Prepare read in a remote task so that in Ray client mode, we aren't
+    # attempting metadata resolution from the client machine.
+    prepare_read = cached_remote_fn(_prepare_read, retry_exceptions=False, num_cpus=0)
+    return ray.get(
+        prepare_read.remote(
+            datasource,
+            ctx,
+            parallelism,
+            _wrap_arrow_serialization_workaround(read_args.copy()),
+        )
+    )
+
+
 def _prepare_read(
     ds: Datasource, ctx: DatasetContext, parallelism: int, kwargs: dict
 ) -> List[ReadTask]:
@@ -28,6 +28,9 @@ from ray.data.extensions.tensor_extension import (
     TensorDtype,
     ArrowTensorType,
     ArrowTensorArray,
+    ArrowVariableShapedTensorType,
+    ArrowVariableShapedTensorArray,
+    pad_tensors,
 )
 import ray.data.tests.util as util
 from ray.data.tests.conftest import *  # noqa
@@ -123,6 +126,66 @@ def test_basic_actors(shutdown_only, pipelined):
         ray.data.range(10).map(lambda x: x, compute=ray.data.ActorPoolStrategy(8, 4))
 
 
+def test_actor_pool_speculative_execution(shutdown_only):
+    ray.init(num_cpus=4)
+
+    @ray.remote(num_cpus=0)
+    class Flag:
+        def __init__(self):
+            self.value = False
+
+        def test_and_set(self):
+            value = self.value
+            self.value = True
+            return value
+
+    flag = Flag.remote()
+
+    # The first execution of the first block never finishes.
+    def straggle_once(x):
+        if x == 0 and not ray.get(flag.test_and_set.remote()):
+            time.sleep(999999)
+        return x + 1
+
+    start = time.time()
+    ds = ray.data.range(8, parallelism=8).map(
+        straggle_once,
+        compute=ray.data.ActorPoolStrategy(2, 4, speculative_execution=True),
+    )
+    assert sorted(ds.take_all()) == list(range(1, 9))
+    assert time.time() - start < 60
+
+    # Without speculation, the actor pool still scales and preserves order.
+    ds = ray.data.range(20, parallelism=20).map(
+        lambda x: x * 2, compute=ray.data.ActorPoolStrategy(1, 4)
+    )
+    assert ds.take_all() == [x * 2 for x in range(20)]
+
+    # Once all blocks have been dispatched, the idle actors are released down to
+    # the min pool size while the last block is still running.
+    def num_alive_workers():
+        return sum(
+            1
+            for actor in ray.state.actors().values()
+            if actor["ActorClassName"] == "BlockWorker" and actor["State"] == "ALIVE"
+        )
+
+    def wait_for_scale_down(x):
+        if x != 0:
+            time.sleep(0.5)
+            return x
+        # The first block is dispatched last.
+        deadline = time.time() + 30
+        while num_alive_workers() > 1 and time.time() < deadline:
+            time.sleep(0.1)
+        return num_alive_workers()
+
+    ds = ray.data.range(8, parallelism=8).map(
+        wait_for_scale_down, compute=ray.data.ActorPoolStrategy(1, 4)
+    )
+    assert ds.take_all() == [1] + list(range(1, 8))
+
+
 @pytest.mark.parametrize("pipelined", [False, True])
 def test_avoid_placement_group_capture(shutdown_only, pipelined):
     ray.init(num_cpus=2)
@@ -359,6 +422,67 @@ def test_zip_arrow(ray_start_regular_shared):
     assert result[0] == {"id": 0, "id_1": 0, "id_2": 0}
 
 
+@pytest.mark.parametrize("broadcast", [False, True])
+@pytest.mark.parametrize("how", ["inner", "left", "outer"])
+def test_join(ray_start_regular_shared, broadcast, how):
+    ctx = DatasetContext.get_current()
+    original = ctx.join_broadcast_threshold_bytes
+    ctx.join_broadcast_threshold_bytes = 1024 * 1024 * 1024 if broadcast else 0
+    try:
+        left = ray.data.from_items(
+            [{"id": i, "a": i * 10} for i in range(10)], parallelism=4
+        )
+        right = ray.data.from_items(
+            [{"id": i % 10 + 5, "a": i, "b": str(i)} for i in range(20)],
+            parallelism=3,
+        )
+        ds = left.join(right, on="id", how=how)
+        rows = [r.as_pydict() for r in ds.iter_rows()]
+        # Columns with nulls are promoted to floats.
+        for r in rows:
+            for k, v in r.items():
+                if isinstance(v, float):
+                    r[k] = None if math.isnan(v) else int(v)
+        rows.sort(key=lambda r: (r["id"], -1 if r["a_1"] is None else r["a_1"]))
+        expected = []
+        for i in range(15):
+            matches = [j for j in range(20) if j % 10 + 5 == i]
+            if i >= 10:
+                if how == "outer":
+                    for j in matches:
+                        expected.append({"id": i, "a": None, "a_1": j, "b": str(j)})
+            elif matches:
+                for j in matches:
+                    expected.append({"id": i, "a": i * 10, "a_1": j, "b": str(j)})
+            elif how != "inner":
+                expected.append({"id": i, "a": i * 10, "a_1": None, "b": None})
+        assert rows == expected
+
+        # Join on multiple columns, with pandas blocks.
+        left = ray.data.from_pandas(pd.DataFrame({"x": [1, 1, 2], "y": [1, 2, 1]}))
+        right = ray.data.from_pandas(
+            pd.DataFrame({"x": [1, 2, 2], "y": [2, 1, 2], "z": [10, 20, 30]})
+        )
+        ds = left.join(right, on=["x", "y"], how=how)
+        df = ds.to_pandas().sort_values(["x", "y"]).reset_index(drop=True)
+        if how == "inner":
+            assert df.to_dict("list") == {"x": [1, 2], "y": [2, 1], "z": [10, 20]}
+        else:
+            assert df["x"].tolist() == ([1, 1, 2] if how == "left" else [1, 1, 2, 2])
+    finally:
+        ctx.join_broadcast_threshold_bytes = original
+
+
+def test_join_errors(ray_start_regular_shared):
+    ds = ray.data.range_table(10)
+    with pytest.raises(ValueError):
+        ds.join(ds, on="value", how="cross")
+    with pytest.raises(ValueError):
+        ds.join(ds, on="missing")
+    with pytest.raises(ValueError):
+        ray.data.range(10).join(ds, on="value")
+
+
 def test_batch_tensors(ray_start_regular_shared):
     import torch
 
@@ -701,6 +825,66 @@ def test_arrow_tensor_array_slice(test_arr, dtype):
     np.testing.assert_array_equal(slice2[1], arr[3])
 
 
+@pytest.mark.parametrize("dtype", [np.int64, np.float32, np.bool_])
+def test_arrow_variable_shaped_tensor_array(dtype):
+    arrs = [
+        np.arange(4).reshape((2, 2)).astype(dtype),
+        np.arange(6).reshape((3, 2)).astype(dtype),
+        np.arange(3).reshape((1, 3)).astype(dtype),
+    ]
+    # Tensors with different shapes are stored as variable-shaped tensors.
+    ata = ArrowTensorArray.from_numpy(arrs)
+    assert isinstance(ata, ArrowVariableShapedTensorArray)
+    assert isinstance(ata.type, ArrowVariableShapedTensorType)
+    assert ata.type.ndim == 2
+    for a, b in zip(ata.to_numpy(), arrs):
+        np.testing.assert_array_equal(a, b)
+    np.testing.assert_array_equal(ata[-1], arrs[-1])
+    # Slicing.
+    sliced = ata.slice(1, 2)
+    assert len(sliced) == 2
+    np.testing.assert_array_equal(sliced[0], arrs[1])
+    np.testing.assert_array_equal(sliced.to_numpy()[1], arrs[2])
+    # Concatenation.
+    table = pa.concat_tables([pa.table({"a": ata}), pa.table({"a": sliced})])
+    assert table.num_rows == 5
+    out = BlockAccessor.for_block(table).to_numpy("a")
+    for a, b in zip(out, arrs + arrs[1:]):
+        np.testing.assert_array_equal(a, b)
+    # Tensors must have the same number of dimensions.
+    with pytest.raises(ValueError):
+        ArrowVariableShapedTensorArray.from_numpy([np.ones(2), np.ones((2, 2))])
+
+
+def test_variable_shaped_tensors(ray_start_regular_shared):
+    arrs = [np.ones((i + 1, 2), dtype=np.int64) * i for i in range(8)]
+    ds = ray.data.from_items([{"id": i, "value": a} for i, a in enumerate(arrs)])
+    ds = ds.repartition(3)
+    assert isinstance(ds.schema().field("value").type, ArrowVariableShapedTensorType)
+    rows = ds.take()
+    assert [r["id"] for r in rows] == list(range(8))
+    for r, a in zip(rows, arrs):
+        np.testing.assert_array_equal(r["value"], a)
+
+    # Numpy batches hold object arrays of the tensors.
+    batches = list(ds.iter_batches(batch_size=4, batch_format="numpy"))
+    assert [len(b["value"]) for b in batches] == [4, 4]
+    for b, a in zip(batches[1]["value"], arrs[4:]):
+        np.testing.assert_array_equal(b, a)
+    padded = pad_tensors(batches[0]["value"], pad_value=-1)
+    assert padded.shape == (4, 4, 2)
+    np.testing.assert_array_equal(padded[1], [[1, 1], [1, 1], [-1, -1], [-1, -1]])
+
+    # Pandas round trip.
+    ds2 = ds.map_batches(lambda df: df, batch_format="pandas").map_batches(
+        lambda t: t, batch_format="pyarrow"
+    )
+    assert isinstance(ds2.schema().field("value").type, ArrowVariableShapedTensorType)
+    assert ds2.schema().names == ["id", "value"]
+    for r, a in zip(ds2.take(), arrs):
+        np.testing.assert_array_equal(r["value"], a)
+
+
 def test_tensors_in_tables_from_pandas(ray_start_regular_shared):
     outer_dim = 3
     inner_shape = (2, 2, 2)
@@ -1563,6 +1747,86 @@ def test_iter_batches_basic(ray_start_regular_shared):
         assert batch.equals(df)
 
 
+def test_iter_batches_numpy(ray_start_regular_shared):
+    # Simple datasets.
+    ds = ray.data.range(10, parallelism=2)
+    batches = list(ds.iter_batches(batch_size=4, batch_format="numpy"))
+    assert all(isinstance(batch, np.ndarray) for batch in batches)
+    np.testing.assert_array_equal(np.concatenate(batches), np.arange(10))
+
+    # Tabular datasets.
+    df1 = pd.DataFrame({"one": [1, 2, 3], "two": [2.0, 3.0, 4.0]})
+    df2 = pd.DataFrame({"one": [4, 5, 6], "two": [5.0, 6.0, 7.0]})
+    tabular = [
+        ray.data.from_pandas([df1, df2]),
+        ray.data.from_arrow([pa.Table.from_pandas(df1), pa.Table.from_pandas(df2)]),
+    ]
+    for ds in tabular:
+        batches = list(ds.iter_batches(batch_size=4, batch_format="numpy"))
+        assert [list(batch) for batch in batches] == [["one", "two"]] * 2
+        np.testing.assert_array_equal(
+            np.concatenate([b["one"] for b in batches]), [1, 2, 3, 4, 5, 6]
+        )
+        np.testing.assert_array_equal(
+            np.concatenate([b["two"] for b in batches]), [2, 3, 4, 5, 6, 7]
+        )
+
+    # Tensor batches within a single block are views of the block.
+    ds = ray.data.range_tensor(8, shape=(2, 3), parallelism=2)
+    batches = list(ds.iter_batches(batch_size=2, batch_format="numpy"))
+    assert len(batches) == 4
+    for i, batch in enumerate(batches):
+        assert batch["value"].shape == (2, 2, 3)
+        assert not batch["value"].flags.owndata
+        np.testing.assert_array_equal(batch["value"][:, 0, 0], [2 * i, 2 * i + 1])
+
+    # Tensor batches spanning blocks are copied into a single ndarray.
+    batches = list(ds.iter_batches(batch_size=3, batch_format="numpy"))
+    assert [len(batch["value"]) for batch in batches] == [3, 3, 2]
+    values = np.concatenate([batch["value"] for batch in batches])
+    np.testing.assert_array_equal(values[:, 1, 2], np.arange(8))
+
+
+def test_iter_batches_local_shuffle(ray_start_regular_shared):
+    ds = ray.data.range(100, parallelism=10)
+
+    def collect(**kwargs):
+        batches = list(ds.iter_batches(batch_size=10, **kwargs))
+        return batches, [x for batch in batches for x in batch]
+
+    batches, rows = collect(local_shuffle_buffer_size=25, local_shuffle_seed=0)
+    assert all(len(batch) == 10 for batch in batches)
+    assert sorted(rows) == list(range(100))
+    assert rows != list(range(100))
+    # The shuffle is deterministic for a given seed.
+    assert collect(local_shuffle_buffer_size=25, local_shuffle_seed=0)[1] == rows
+    assert collect(local_shuffle_buffer_size=25, local_shuffle_seed=1)[1] != rows
+
+    # Partial last batch.
+    batches = list(
+        ds.iter_batches(batch_size=30, local_shuffle_buffer_size=25, drop_last=False)
+    )
+    assert [len(batch) for batch in batches] == [30, 30, 30, 10]
+    assert sorted(x for batch in batches for x in batch) == list(range(100))
+    batches = list(
+        ds.iter_batches(batch_size=30, local_shuffle_buffer_size=25, drop_last=True)
+    )
+    assert [len(batch) for batch in batches] == [30, 30, 30]
+
+    # Tabular datasets and pipelines.
+    pipe = ray.data.range_table(100, parallelism=10).repeat(2)
+    batches = list(
+        pipe.iter_batches(
+            batch_size=10, batch_format="pandas", local_shuffle_buffer_size=50
+        )
+    )
+    rows = pd.concat(batches)["value"].tolist()
+    assert sorted(rows) == sorted(list(range(100)) * 2)
+
+    with pytest.raises(ValueError):
+        list(ds.iter_batches(local_shuffle_buffer_size=10))
+
+
 def test_iter_batches_grid(ray_start_regular_shared):
     # Tests slicing, batch combining, and partial batch dropping logic over
     # a grid of dataset, batching, and dropping configurations.
@@ -1653,6 +1917,89 @@ def test_add_column(ray_start_regular_shared):
         ds = ray.data.range(5).add_column("value", 0)
 
 
+def test_select_columns(ray_start_regular_shared):
+    df = pd.DataFrame({"one": [1, 2, 3], "two": [2, 3, 4], "three": [3, 4, 5]})
+    ds = ray.data.from_pandas(df)
+    assert ds.select_columns(["three", "one"]).take(1) == [{"three": 3, "one": 1}]
+    ds = ray.data.from_arrow(pa.Table.from_pandas(df))
+    assert ds.select_columns(["two"]).take() == [{"two": 2}, {"two": 3}, {"two": 4}]
+
+    with pytest.raises(ValueError):
+        ray.data.range(5).select_columns(["value"])
+
+
+@pytest.mark.parametrize("block_format", ["arrow", "pandas"])
+def test_filter_expr(ray_start_regular_shared, block_format):
+    from ray.data.expressions import col, lit
+
+    df = pd.DataFrame({"a": [1, 2, 3, 4, None], "b": ["x", "y", "x", "y", "x"]})
+    if block_format == "arrow":
+        ds = ray.data.from_arrow(pa.Table.from_pandas(df))
+    else:
+        ds = ray.data.from_pandas(df)
+
+    def values(ds):
+        return [r["a"] for r in ds.take()]
+
+    assert values(ds.filter(col("a") > 2)) == [3, 4]
+    assert values(ds.filter((col("a") <= 2) | (col("a") == 4))) == [1, 2, 4]
+    assert values(ds.filter((col("b") == "x") & ~(col("a") == 1))) == [3]
+    assert values(ds.filter(col("a") * 2 - 1 >= 5)) == [3, 4]
+    assert values(ds.filter(col("a") / 2 == 1.5)) == [3]
+    assert values(ds.filter(col("a").is_in([2, 3]))) == [2, 3]
+    assert ds.filter(col("a").is_null()).count() == 1
+    assert ds.filter(lit(False)).count() == 0
+    if block_format == "arrow":
+        # Dividing by a null literal yields nulls.
+        assert ds.filter((col("a") / lit(None)).is_null()).count() == 5
+    # Comparisons against nulls drop the rows.
+    assert ds.filter(col("a") > 0).count() == 4
+
+    with pytest.raises(TypeError):
+        ds.filter(col("a") > 1 and col("a") < 3)
+    with pytest.raises(ValueError):
+        ray.data.range(5).filter(col("value") > 1)
+
+
+@pytest.mark.parametrize("block_format", ["arrow", "pandas"])
+def test_with_column(ray_start_regular_shared, block_format):
+    from ray.data.expressions import col
+
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [10, 20, 30]})
+    if block_format == "arrow":
+        ds = ray.data.from_arrow(pa.Table.from_pandas(df))
+    else:
+        ds = ray.data.from_pandas(df)
+
+    ds2 = ds.with_column("c", col("a") + col("b"))
+    assert ds2.take() == [
+        {"a": 1, "b": 10, "c": 11},
+        {"a": 2, "b": 20, "c": 22},
+        {"a": 3, "b": 30, "c": 33},
+    ]
+    ds2 = ds.with_column("a", 1 - col("a")).with_column("d", col("b") > 15)
+    assert ds2.take(2) == [
+        {"a": 0, "b": 10, "d": False},
+        {"a": -1, "b": 20, "d": True},
+    ]
+
+    with pytest.raises(ValueError):
+        ds.with_column("c", lambda df: df["a"])
+
+
+def test_expr_to_pyarrow():
+    import pyarrow.dataset as pds
+    from ray.data.expressions import col, _try_to_pyarrow
+
+    expr = ((col("a") > 1) & ~col("b").is_null()) | col("c").is_in([1, 2])
+    assert expr.to_pyarrow().equals(
+        ((pds.field("a") > pds.scalar(1)) & ~pds.field("b").is_null())
+        | pds.field("c").isin([1, 2])
+    )
+    # Arithmetic can't be pushed down.
+    assert _try_to_pyarrow(col("a") + 1 > 2) is None
+
+
 def test_map_batch(ray_start_regular_shared, tmp_path):
     # Test input validation
     ds = ray.data.range(5)
@@ -2168,6 +2515,97 @@ def test_agg_errors(ray_start_regular_shared):
         ds.aggregate(Max("bad_field"))
 
 
+@pytest.mark.parametrize("num_parts", [1, 30])
+def test_approx_aggregations(ray_start_regular_shared, num_parts):
+    from ray.data.aggregate import ApproxCountDistinct, ApproxQuantile, ApproxTopK
+
+    random.seed(0)
+    xs = [random.randint(0, 999) for _ in range(10000)]
+    # Make a few values much more frequent than the others.
+    xs += [7] * 1000 + [42] * 500 + [123] * 300
+    random.shuffle(xs)
+    ds = ray.data.from_items([{"A": x % 3, "B": x} for x in xs]).repartition(num_parts)
+
+    # Global aggregation.
+    result = ds.aggregate(
+        ApproxCountDistinct("B"),
+        ApproxQuantile("B", q=[0.1, 0.5, 0.9]),
+        ApproxTopK("B", k=3),
+    )
+    num_distinct = len(set(xs))
+    assert abs(result["approx_count_distinct(B)"] - num_distinct) < 0.05 * num_distinct
+    expected = np.quantile(xs, [0.1, 0.5, 0.9])
+    for actual, exp in zip(result["approx_quantile(B)"], expected):
+        assert abs(actual - exp) < 50, (actual, exp)
+    assert [r["value"] for r in result["approx_top_k(B)"]] == [7, 42, 123]
+    assert result["approx_top_k(B)"][0]["count"] >= xs.count(7)
+
+    # Groupby aggregation. The group with key 3 has a single value, so its blocks
+    # of nulls have empty partial states.
+    items = [{"A": x % 3, "B": x} for x in xs]
+    items += [{"A": 3, "B": None}] * 100 + [{"A": 3, "B": 5}]
+    random.shuffle(items)
+    ds = ray.data.from_items(items).repartition(num_parts)
+    result = (
+        ds.groupby("A")
+        .aggregate(
+            ApproxCountDistinct("B"),
+            ApproxQuantile("B", q=[0.1, 0.5, 0.9]),
+            ApproxTopK("B", k=2),
+        )
+        .sort("A")
+        .take_all()
+    )
+    assert [row["A"] for row in result] == [0, 1, 2, 3]
+    for row in result[:3]:
+        group = [x for x in xs if x % 3 == row["A"]]
+        expected = len(set(group))
+        assert abs(row["approx_count_distinct(B)"] - expected) < 0.05 * expected
+        expected = np.quantile(group, [0.1, 0.5, 0.9])
+        for actual, exp in zip(row["approx_quantile(B)"], expected):
+            assert abs(actual - exp) < 50, (actual, exp)
+    assert [r["value"] for r in result[0]["approx_top_k(B)"]] == [42, 123]
+    assert result[1]["approx_top_k(B)"][0]["value"] == 7
+    assert result[3]["approx_count_distinct(B)"] == 1
+    assert result[3]["approx_quantile(B)"] == [5, 5, 5]
+    assert result[3]["approx_top_k(B)"] == [{"value": 5, "count": 1}]
+
+    # The empty partial states have null-typed children in Arrow, which are
+    # unified with the other states when partially combined blocks are
+    # concatenated.
+    from ray.data._internal.arrow_block import ArrowBlockBuilder
+
+    aggs = (ApproxQuantile("B"), ApproxTopK("B"))
+    builder = ArrowBlockBuilder()
+    for values in [[None], [1, 2]]:
+        block = pa.table({"A": [3] * len(values), "B": pa.array(values, pa.int64())})
+        builder.add_block(BlockAccessor.for_block(block).combine("A", aggs))
+    combined = builder.build()
+    assert combined.num_rows == 2
+    block, _ = BlockAccessor.for_block(combined).aggregate_combined_blocks(
+        [combined], "A", aggs
+    )
+    assert [r.as_pydict() for r in BlockAccessor.for_block(block).iter_rows()] == [
+        {
+            "A": 3,
+            "approx_quantile(B)": 1.0,
+            "approx_top_k(B)": [{"value": 1, "count": 1}, {"value": 2, "count": 1}],
+        }
+    ]
+
+    # Simple datasets.
+    ds = ray.data.from_items(xs, parallelism=num_parts)
+    result = ds.aggregate(ApproxCountDistinct(), ApproxQuantile(q=0.0), ApproxTopK(k=1))
+    assert abs(result[0] - num_distinct) < 0.05 * num_distinct
+    assert abs(result[1] - min(xs)) < 50
+    assert [r["value"] for r in result[2]] == [7]
+
+    with pytest.raises(ValueError):
+        ApproxCountDistinct("B", precision=20)
+    with pytest.raises(ValueError):
+        ApproxQuantile("B", q=1.5)
+
+
 @pytest.mark.parametrize("num_parts", [1, 30])
 def test_groupby_agg_name_conflict(ray_start_regular_shared, num_parts):
     # Test aggregation name conflict.
@@ -3522,6 +3960,76 @@ def test_groupby_simple_multi_agg(ray_start_regular_shared, num_parts):
             assert result == expected
 
 
+@pytest.mark.parametrize("num_parts", [1, 30])
+@pytest.mark.parametrize("ds_format", ["simple", "arrow", "pandas"])
+def test_groupby_hash_based(ray_start_regular_shared, ds_format, num_parts):
+    ctx = DatasetContext.get_current()
+    original = ctx.use_hash_based_groupby
+    ctx.use_hash_based_groupby = True
+    try:
+        xs = list(range(100))
+        random.shuffle(xs)
+        if ds_format == "simple":
+            ds = ray.data.from_items(xs).repartition(num_parts)
+            grouped = ds.groupby(lambda x: str(x % 3))
+            aggs = [Count(), Sum(), Mean()]
+        else:
+            ds = ray.data.from_items(
+                [{"A": str(x % 3), "B": x if x != 5 else None} for x in xs]
+            ).repartition(num_parts)
+            if ds_format == "pandas":
+                ds = ds.map_batches(lambda x: x, batch_format="pandas")
+            grouped = ds.groupby("A")
+            aggs = [Count(), Sum("B"), Mean("B", ignore_nulls=False)]
+        agg_ds = grouped.aggregate(*aggs)
+        assert agg_ds.num_blocks() == num_parts
+        if ds_format == "simple":
+            result = sorted(agg_ds.take_all())
+            assert result == [
+                ("0", 34, 1683, 49.5),
+                ("1", 33, 1617, 49.0),
+                ("2", 33, 1650, 50.0),
+            ]
+        else:
+            result = [
+                tuple(r.as_pydict().values()) for r in agg_ds.sort("A").iter_rows()
+            ]
+            assert result == [
+                ("0", 34, 1683, 49.5),
+                ("1", 33, 1617, 49.0),
+                # The null in this group propagates since nulls aren't ignored.
+                ("2", 33, 1645, None),
+            ]
+        # Global aggregations are unaffected.
+        assert ray.data.range(10).repartition(num_parts).sum() == 45
+    finally:
+        ctx.use_hash_based_groupby = original
+
+
+def test_hash_partition_indices():
+    from ray.data._internal.hash_partition import (
+        hash_key,
+        hash_partition_indices,
+        key_column,
+    )
+
+    keys = [float("nan"), 1, None, 2, float("nan"), 1.0, 3, np.int64(2)]
+    partitions = hash_partition_indices([key_column(keys)], 3)
+    assert sorted(i for p in partitions for i in p) == list(range(len(keys)))
+    partition_of = {i: j for j, p in enumerate(partitions) for i in p}
+    # Nulls are partitioned together, as are equal numbers of different types.
+    assert partition_of[0] == partition_of[2] == partition_of[4]
+    assert partition_of[1] == partition_of[5]
+    assert partition_of[3] == partition_of[7]
+    for p in partitions:
+        # The rows with the same key are contiguous.
+        hashes = [hash_key(keys[i]) for i in p]
+        groups = [h for i, h in enumerate(hashes) if i == 0 or h != hashes[i - 1]]
+        assert len(groups) == len(set(hashes))
+    for i, key in enumerate(keys):
+        assert partition_of[i] == hash_key(key) % 3
+
+
 def test_column_name_type_check(ray_start_regular_shared):
     df = pd.DataFrame({"1": np.random.rand(10), "a": np.random.rand(10)})
     ds = ray.data.from_pandas(df)
@@ -3770,6 +4278,68 @@ def test_parquet_read_spread(ray_start_cluster, tmp_path):
     assert set(locations) == {node1_id, node2_id}
 
 
+def test_locality_aware_map(ray_start_cluster, tmp_path):
+    cluster = ray_start_cluster
+    cluster.add_node(
+        resources={"bar:1": 100},
+        num_cpus=10,
+        _system_config={"max_direct_call_object_size": 0},
+    )
+    cluster.add_node(resources={"bar:2": 100}, num_cpus=10)
+
+    ray.init(cluster.address)
+
+    data_path = str(tmp_path)
+    for i in range(2):
+        df = pd.DataFrame({"one": list(range(100 * i, 100 * (i + 1)))})
+        df.to_parquet(os.path.join(data_path, f"test{i}.parquet"))
+
+    ctx = DatasetContext.get_current()
+    original = ctx.locality_aware_scheduling
+    try:
+        ctx.locality_aware_scheduling = True
+        ds = ray.data.read_parquet(data_path).fully_executed()
+        blocks = ds.get_internal_block_refs()
+        ray.wait(blocks, num_returns=len(blocks), fetch_local=False)
+        location_data = ray.experimental.get_object_locations(blocks)
+        input_nodes = [location_data[b]["node_ids"] for b in blocks]
+        assert len({n for nodes in input_nodes for n in nodes}) == 2
+
+        mapped = ds.map_batches(lambda df: df * 2)
+        output_nodes = [
+            m.exec_stats.node_id for m in mapped._plan.execute().get_metadata()
+        ]
+        for nodes, node in zip(input_nodes, output_nodes):
+            assert node in nodes, (input_nodes, output_nodes)
+        assert "0 bytes transferred from remote nodes" in mapped.stats()
+        assert sorted(mapped.to_pandas()["one"]) == [2 * i for i in range(200)]
+    finally:
+        ctx.locality_aware_scheduling = original
+
+
+def test_locality_aware_map_fused_read(ray_start_regular_shared, tmp_path):
+    data_path = str(tmp_path)
+    for i in range(2):
+        df = pd.DataFrame({"one": list(range(100 * i, 100 * (i + 1)))})
+        df.to_parquet(os.path.join(data_path, f"test{i}.parquet"))
+
+    ctx = DatasetContext.get_current()
+    original = ctx.locality_aware_scheduling, ctx.optimize_fuse_stages
+    try:
+        ctx.locality_aware_scheduling = True
+        ctx.optimize_fuse_stages = True
+        # The inputs of the fused read->map stage are read tasks on the driver, so
+        # they're neither pinned to its node nor counted as input locality.
+        ds = ray.data.read_parquet(data_path).map_batches(lambda df: df * 2)
+        ds = ds.fully_executed()
+        stats = ds.stats()
+        assert "read->map_batches" in stats, stats
+        assert "Input locality" not in stats, stats
+        assert sorted(ds.to_pandas()["one"]) == [2 * i for i in range(200)]
+    finally:
+        ctx.locality_aware_scheduling, ctx.optimize_fuse_stages = original
+
+
 @ray.remote
 class Counter:
     def __init__(self):
@@ -18,6 +18,7 @@ import ray
 from ray.tests.conftest import *  # noqa
 from ray.types import ObjectRef
 from ray.data.block import Block, BlockAccessor, BlockMetadata
+from ray.data.context import DatasetContext
 from ray.data.datasource import (
     Datasource,
     DummyOutputDatasource,
@@ -644,6 +645,127 @@ def test_parquet_read_partitioned_with_filter(ray_start_regular_shared, tmp_path
     assert sorted(values) == [[1, "a"], [1, "a"]]
 
 
+def test_parquet_read_pushdown(ray_start_regular_shared, tmp_path):
+    df = pd.DataFrame(
+        {"one": [1, 2, 3, 4, 5, 6], "two": ["a", "b", "c", "d", "e", "f"], "three": 0}
+    )
+    table = pa.Table.from_pandas(df)
+    pq.write_table(table, os.path.join(tmp_path, "test.parquet"), row_group_size=2)
+
+    # Projection and filter directly after the read are pushed into the read.
+    ds = (
+        ray.data.read_parquet(str(tmp_path))
+        .experimental_lazy()
+        .select_columns(["one", "two"])
+        .filter(pa.dataset.field("one") > 4)
+        .map_batches(lambda df: df, batch_format="pandas")
+    )
+    assert ds.take() == [{"one": 5, "two": "e"}, {"one": 6, "two": "f"}]
+    stages = ds._plan._last_optimized_stages
+    assert [s.name for s in stages] == ["read->map_batches"], stages
+
+    # Eager datasets push down the stage directly following the read.
+    ds = ray.data.read_parquet(str(tmp_path)).filter(pa.dataset.field("one") < 3)
+    assert ds.take() == [
+        {"one": 1, "two": "a", "three": 0},
+        {"one": 2, "two": "b", "three": 0},
+    ]
+    assert ds.count() == 2
+
+    # Stages after a non-pushable stage are not pushed down.
+    ds = (
+        ray.data.read_parquet(str(tmp_path))
+        .experimental_lazy()
+        .map_batches(lambda df: df, batch_format="pandas")
+        .select_columns(["one"])
+    )
+    assert sorted(r["one"] for r in ds.take()) == [1, 2, 3, 4, 5, 6]
+    stages = ds._plan._last_optimized_stages
+    assert [s.name for s in stages] == ["read->map_batches->select_columns"], stages
+
+    # Pushdown can be disabled.
+    context = DatasetContext.get_current()
+    context.optimize_read_pushdown = False
+    try:
+        ds = (
+            ray.data.read_parquet(str(tmp_path))
+            .experimental_lazy()
+            .select_columns(["two"])
+        )
+        assert [r["two"] for r in ds.take()] == ["a", "b", "c", "d", "e", "f"]
+        stages = ds._plan._last_optimized_stages
+        assert [s.name for s in stages] == ["read->select_columns"], stages
+    finally:
+        context.optimize_read_pushdown = True
+
+
+@pytest.mark.parametrize("file_format", ["csv", "parquet"])
+def test_read_cache(ray_start_regular_shared, tmp_path, file_format):
+    ctx = DatasetContext.get_current()
+    original = ctx.read_cache_dir, ctx.read_cache_max_bytes
+    ctx.read_cache_dir = str(tmp_path / "cache")
+    data_path = tmp_path / "data"
+    os.mkdir(data_path)
+
+    def write(i, num_rows):
+        df = pd.DataFrame({"one": list(range(num_rows)), "two": ["a"] * num_rows})
+        path = os.path.join(data_path, f"test{i}.{file_format}")
+        if file_format == "csv":
+            df.to_csv(path, index=False)
+        else:
+            pq.write_table(pa.Table.from_pandas(df), path)
+
+    def read():
+        if file_format == "csv":
+            ds = ray.data.read_csv(str(data_path))
+        else:
+            ds = ray.data.read_parquet(str(data_path))
+        ds = ds.fully_executed()
+        return ds.count(), ds.stats()
+
+    try:
+        write(1, 3)
+        write(2, 5)
+        count, stats = read()
+        assert count == 8
+        assert "Read cache: 0 hits, 2 misses" in stats, stats
+        count, stats = read()
+        assert count == 8
+        assert "Read cache: 2 hits, 0 misses" in stats, stats
+
+        # Changing a file invalidates its cache entry.
+        write(2, 7)
+        count, stats = read()
+        assert count == 10
+        assert "Read cache: 1 hits, 1 misses" in stats, stats
+
+        # Entries larger than the max cache size are not cached.
+        ctx.read_cache_dir = str(tmp_path / "small_cache")
+        ctx.read_cache_max_bytes = 1
+        read()
+        count, stats = read()
+        assert count == 10
+        assert "Read cache: 0 hits, 2 misses" in stats, stats
+        assert not [f for f in os.listdir(ctx.read_cache_dir) if not f.startswith(".")]
+    finally:
+        ctx.read_cache_dir, ctx.read_cache_max_bytes = original
+
+
+def test_read_cache_corrupt_entry(tmp_path):
+    from ray.data._internal.read_cache import ReadCache
+
+    cache = ReadCache(str(tmp_path), 1024 * 1024)
+    cache.put("key", [pa.table({"one": [1, 2, 3]})])
+    assert cache.get("key")[0].column("one").to_pylist() == [1, 2, 3]
+
+    # A corrupt entry is treated as a miss and removed.
+    path = cache._entry_path("key")
+    with open(path, "wb") as f:
+        f.write(b"not a pickle")
+    assert cache.get("key") is None
+    assert not os.path.exists(path)
+
+
 def test_parquet_read_partitioned_explicit(ray_start_regular_shared, tmp_path):
     df = pd.DataFrame(
         {"one": [1, 1, 1, 3, 3, 3], "two": ["a", "b", "c", "e", "f", "g"]}
@@ -904,6 +1026,114 @@ def test_parquet_write_with_udf(ray_start_regular_shared, tmp_path):
     assert expected_df.equals(dfds)
 
 
+def test_parquet_write_partitioned(ray_start_regular_shared, tmp_path):
+    data_path = str(tmp_path)
+    df = pd.DataFrame(
+        {
+            "one": list(range(12)),
+            "two": ["a", "b", None] * 4,
+            "three": [i % 2 for i in range(12)],
+        }
+    )
+    ds = ray.data.from_pandas(df).repartition(4)
+    ds._set_uuid("data")
+    ds.write_parquet(data_path, partition_cols=["two", "three"])
+
+    assert sorted(os.listdir(data_path)) == [
+        "two=__HIVE_DEFAULT_PARTITION__",
+        "two=a",
+        "two=b",
+    ]
+    rows = []
+    for two in ["a", "b", None]:
+        two_dir = "__HIVE_DEFAULT_PARTITION__" if two is None else two
+        for three in [0, 1]:
+            part_path = os.path.join(data_path, f"two={two_dir}", f"three={three}")
+            if not os.path.exists(part_path):
+                continue
+            for file_name in os.listdir(part_path):
+                assert file_name.startswith("data_")
+                table = pq.read_table(os.path.join(part_path, file_name))
+                # The partition columns are only encoded in the directories.
+                assert table.column_names == ["one"]
+                for one in table.column("one").to_pylist():
+                    assert df["three"][one] == three
+                    assert df["two"][one] == two
+                    rows.append(one)
+    assert sorted(rows) == list(range(12))
+
+    # The partitions can be read back on their own.
+    ds = ray.data.read_parquet(os.path.join(data_path, "two=a"))
+    assert sorted(ds.to_pandas()["one"].tolist()) == [0, 3, 6, 9]
+
+    with pytest.raises(ValueError):
+        ray.data.range_table(10).write_parquet(
+            str(tmp_path / "missing"), partition_cols=["missing"]
+        )
+
+
+def test_parquet_write_file_size(ray_start_regular_shared, tmp_path):
+    def get_files(path):
+        return sorted(os.path.join(path, f) for f in os.listdir(path))
+
+    def read_rows(files):
+        return sorted(
+            v for f in files for v in pq.read_table(f).column("value").to_pylist()
+        )
+
+    # Many small blocks are combined into larger files.
+    path = str(tmp_path / "rows")
+    ds = ray.data.range_table(1000, parallelism=100)
+    ds.write_parquet(path, max_rows_per_file=300)
+    files = get_files(path)
+    assert [pq.read_metadata(f).num_rows for f in files] == [300, 300, 300, 100]
+    assert read_rows(files) == list(range(1000))
+
+    # Files are rolled over at the target size.
+    path = str(tmp_path / "size")
+    ds = ray.data.range_table(100000, parallelism=1)
+    ds.write_parquet(path, target_file_size=100 * 1024)
+    files = get_files(path)
+    assert len(files) > 1
+    for f in files[:-1]:
+        assert os.path.getsize(f) >= 100 * 1024
+    assert read_rows(files) == list(range(100000))
+
+    # Blocks are grouped by their compressed size, so that compressible data isn't
+    # written to files much smaller than the target size.
+    path = str(tmp_path / "compressed")
+    ds = ray.data.range_table(100000, parallelism=100).map_batches(
+        lambda df: df.assign(text="x" * 100), batch_format="pandas"
+    )
+    ds.write_parquet(path, target_file_size=100 * 1024)
+    files = get_files(path)
+    total_size = sum(os.path.getsize(f) for f in files)
+    # Each write task writes a file of the target size, and the rest of its rows.
+    assert len(files) <= 2 * (total_size // (100 * 1024) + 1), len(files)
+    assert read_rows(files) == list(range(100000))
+
+    with pytest.raises(ValueError):
+        ds.write_parquet(str(tmp_path / "invalid"), max_rows_per_file=0)
+
+
+def test_parquet_write_mismatched_schemas(ray_start_regular_shared, tmp_path):
+    path = str(tmp_path)
+    tables = [
+        pa.table({"one": [1, 2], "two": pa.nulls(2)}),
+        pa.table({"one": [3.5, 4.5], "two": ["a", "b"]}),
+        pa.table({"one": [5, 6], "two": ["c", "d"]}),
+    ]
+    # The blocks are written to a single file, with a schema that all of their
+    # rows can be cast to.
+    ray.data.from_arrow(tables).write_parquet(path, max_rows_per_file=6)
+    [file_name] = os.listdir(path)
+    table = pq.read_table(os.path.join(path, file_name))
+    assert table.schema.field("one").type == pa.float64()
+    assert table.schema.field("two").type == pa.string()
+    assert table.column("one").to_pylist() == [1, 2, 3.5, 4.5, 5, 6]
+    assert table.column("two").to_pylist() == [None, None, "a", "b", "c", "d"]
+
+
 @pytest.mark.parametrize(
     "fs,data_path,endpoint_url",
     [
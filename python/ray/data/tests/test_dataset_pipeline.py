@@ -75,6 +75,40 @@ def test_pipeline_is_parallel(shutdown_only):
     assert ray.get(tracker.get_max.remote()) > 1
 
 
+def _wait_for_outputs(executor, num_outputs, timeout=30):
+    start = time.time()
+    while len(executor._outputs) < num_outputs:
+        assert time.time() - start < timeout, executor._outputs
+        time.sleep(0.1)
+
+
+def test_prefetch_windows(ray_start_regular_shared):
+    context = DatasetContext.get_current()
+    original = (context.pipeline_prefetch_windows, context.pipeline_prefetch_max_bytes)
+    try:
+        # The remaining windows are executed ahead of the consumer.
+        context.pipeline_prefetch_windows = 3
+        pipe = ray.data.range(8, parallelism=8).window(blocks_per_window=2)
+        pipe = pipe.map(lambda x: x * 2)
+        pipe._peek()
+        _wait_for_outputs(pipe._dataset_iter, 3)
+        assert pipe.take_all() == [x * 2 for x in range(8)]
+
+        # The windows buffered ahead are bounded by their size in bytes.
+        context.pipeline_prefetch_max_bytes = 1
+        pipe = ray.data.range(8, parallelism=8).window(blocks_per_window=2)
+        pipe._peek()
+        _wait_for_outputs(pipe._dataset_iter, 1)
+        time.sleep(1)
+        assert len(pipe._dataset_iter._outputs) == 1
+        assert pipe.take_all() == list(range(8))
+    finally:
+        (
+            context.pipeline_prefetch_windows,
+            context.pipeline_prefetch_max_bytes,
+        ) = original
+
+
 def test_window_by_bytes(ray_start_regular_shared):
     with pytest.raises(ValueError):
         ray.data.range_table(10).window(blocks_per_window=2, bytes_per_window=2)
@@ -2,6 +2,7 @@ import pytest
 import numpy as np
 import pandas as pd
 import os
+import time
 from typing import List
 
 import ray
@@ -244,6 +245,40 @@ def test_lazy_fanout(shutdown_only, local_path):
     assert ray.get(map_counter.get.remote()) == 2 * 10 + 10 + 10
 
 
+def test_streaming_execution(ray_start_regular_shared):
+    context = DatasetContext.get_current()
+    context.use_streaming_executor = True
+    context.streaming_max_blocks_in_flight = 2
+    map_counter = Counter.remote()
+
+    def inc(x):
+        ray.get(map_counter.increment.remote())
+        return x + 1
+
+    try:
+        ds = ray.data.range(100, parallelism=10).experimental_lazy()
+        ds = ds.map(inc).random_shuffle().map(inc).map(inc)
+        assert ds._plan.is_streamable()
+        it = ds.iter_batches(batch_size=None)
+        first = next(it)
+        # Only the stages after the shuffle are streamed.
+        _assert_has_stages(
+            ds._plan._last_optimized_stages, ["read->map->random_shuffle", "map->map"]
+        )
+        time.sleep(1)
+        # At most 2 blocks of 10 rows should have been run through the streamed
+        # stages, since the consumer hasn't pulled any more blocks.
+        assert ray.get(map_counter.get.remote()) <= 100 + 2 * 2 * 10
+        values = list(first) + [x for batch in it for x in batch]
+        assert sorted(values) == list(range(3, 103))
+        # The streamed output isn't cached.
+        assert not ds.is_fully_executed()
+        assert sorted(ds.take_all()) == list(range(3, 103))
+    finally:
+        context.use_streaming_executor = False
+        context.streaming_max_blocks_in_flight = None
+
+
 def test_spread_hint_inherit(ray_start_regular_shared):
     ds = ray.data.range(10).experimental_lazy()
     ds = ds.map(lambda x: x + 1)
@@ -451,6 +486,155 @@ def test_optimize_lazy_reuse_base_data(
     assert num_reads == num_blocks, num_reads
 
 
+def test_optimize_reorder_stages(ray_start_regular_shared):
+    from ray.data.expressions import col
+
+    ds = ray.data.range_table(100, parallelism=10).experimental_lazy()
+    ds = ds.with_column("double", col("value") * 2)
+    ds = ds.sort("value", descending=True)
+    ds = ds.filter(col("value") < 10)
+    ds = ds.map_batches(lambda x: x)
+    # The filter runs before the sort and with_column stages.
+    _, _, stages = ds._plan._optimize()
+    _assert_has_stages(stages, ["read->filter->with_column", "sort", "map_batches"])
+    assert [r["value"] for r in ds.take_all()] == list(range(9, -1, -1))
+    assert [r["double"] for r in ds.take_all()] == list(range(18, -1, -2))
+
+    # Filters on columns written by the previous stage stay put.
+    ds = ray.data.range_table(100, parallelism=10).experimental_lazy()
+    ds = ds.with_column("value", col("value") * 2).filter(col("value") < 10)
+    _, _, stages = ds._plan._optimize()
+    _assert_has_stages(stages, ["read->with_column->filter"])
+    assert [r["value"] for r in ds.take_all()] == [0, 2, 4, 6, 8]
+
+    # Redundant repartitions and shuffles are dropped.
+    ds = ray.data.range(100, parallelism=10).experimental_lazy()
+    ds = ds.repartition(5).repartition(3).random_shuffle().random_shuffle()
+    _, _, stages = ds._plan._optimize()
+    _assert_has_stages(stages, ["read", "repartition", "random_shuffle"])
+    assert ds.num_blocks() == 3
+    assert sorted(ds.take_all()) == list(range(100))
+
+    # The number of output blocks of the shuffle depends on the repartition.
+    ds = ray.data.range(100, parallelism=10).experimental_lazy()
+    ds = ds.repartition(5, shuffle=True).random_shuffle()
+    _, _, stages = ds._plan._optimize()
+    assert len(stages) == 2, stages
+    assert ds.num_blocks() == 5
+
+    context = DatasetContext.get_current()
+    original = context.optimize_reorder_stages
+    context.optimize_reorder_stages = False
+    try:
+        ds = ray.data.range(100, parallelism=10).experimental_lazy()
+        ds = ds.random_shuffle().random_shuffle()
+        _, _, stages = ds._plan._optimize()
+        assert len(stages) == 2, stages
+    finally:
+        context.optimize_reorder_stages = original
+
+
+@pytest.mark.parametrize("enable_dynamic_splitting", [True, False])
+def test_optimize_limit_pushdown(
+    ray_start_regular_shared, local_path, enable_dynamic_splitting
+):
+    context = DatasetContext.get_current()
+    original = context.block_splitting_enabled
+    context.block_splitting_enabled = enable_dynamic_splitting
+    try:
+        num_files = 8
+        paths = []
+        for i in range(num_files):
+            df = pd.DataFrame({"one": list(range(i * 4, i * 4 + 4))})
+            path = os.path.join(local_path, f"test{i}.csv")
+            df.to_csv(path, index=False)
+            paths.append(path)
+        counter = Counter.remote()
+        source = MySource(counter)
+
+        # The first file is read eagerly, and only one more file is needed.
+        ds = ray.data.read_datasource(source, parallelism=num_files, paths=paths)
+        assert [row["one"] for row in ds.take(6)] == list(range(6))
+        num_reads = ray.get(counter.get.remote())
+        assert num_reads == 2, num_reads
+
+        # The limited dataset is re-read lazily and only has the rows needed.
+        ray.get(counter.reset.remote())
+        ds = ray.data.read_datasource(source, parallelism=num_files, paths=paths)
+        limited = ds.limit(10)
+        assert limited.num_blocks() == 3
+        assert [row["one"] for row in limited.take_all()] == list(range(10))
+        assert limited.count() == 10
+        num_reads = ray.get(counter.get.remote())
+        assert num_reads <= 5, num_reads
+
+        # Limits past the end of the dataset read all of it.
+        assert ds.limit(100).count() == num_files * 4
+
+        # The number of rows of range reads is known up front.
+        ds = ray.data.range(100, parallelism=10)
+        assert ds.limit(15).take_all() == list(range(15))
+        assert ds.limit(15).num_blocks() == 2
+        assert ds.take(3) == [0, 1, 2]
+        assert ds.limit(0).count() == 0
+    finally:
+        context.block_splitting_enabled = original
+
+
+def test_optimize_limit_pushdown_disabled(ray_start_regular_shared, local_path):
+    context = DatasetContext.get_current()
+    context.optimize_read_pushdown = False
+    try:
+        num_files = 8
+        paths = []
+        for i in range(num_files):
+            df = pd.DataFrame({"one": list(range(i * 4, i * 4 + 4))})
+            path = os.path.join(local_path, f"test{i}.csv")
+            df.to_csv(path, index=False)
+            paths.append(path)
+        counter = Counter.remote()
+        source = MySource(counter)
+
+        # take() still iterates over the blocks lazily instead of falling back to
+        # executing every read task in limit().
+        ds = ray.data.read_datasource(source, parallelism=num_files, paths=paths)
+        assert [row["one"] for row in ds.take(6)] == list(range(6))
+        num_reads = ray.get(counter.get.remote())
+        assert num_reads < num_files, num_reads
+    finally:
+        context.optimize_read_pushdown = True
+
+
+def test_explain(ray_start_regular_shared, capsys):
+    from ray.data.expressions import col
+
+    ds = ray.data.range_table(100, parallelism=10).experimental_lazy()
+    ds = ds.map_batches(lambda x: x).filter(col("value") > 1).random_shuffle()
+    ds.explain()
+    out = capsys.readouterr().out
+    assert out == (
+        "Logical plan:\n"
+        "  Read(RangeDatasource, 10 blocks)\n"
+        '  -> OneToOneStage("map_batches")\n'
+        '  -> OneToOneStage("filter")\n'
+        '  -> AllToAllStage("random_shuffle")\n'
+        "Optimized plan:\n"
+        "  Read(RangeDatasource, 10 blocks)\n"
+        '  -> AllToAllStage("read->map_batches->filter->random_shuffle")\n'
+    )
+    # Explaining doesn't execute the plan.
+    assert not ds.is_fully_executed()
+    assert ds.count() == 98
+    ds.explain()
+    out = capsys.readouterr().out
+    assert out == (
+        "Logical plan:\n"
+        "  Blocks(10 blocks)\n"
+        "Optimized plan:\n"
+        "  Blocks(10 blocks)\n"
+    )
+
+
 if __name__ == "__main__":
     import sys
 
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 import pyarrow
 
@@ -40,6 +42,48 @@ def test_empty_blocks(ray_start_regular_shared):
         assert ray.get(rad.get_async(i)) == {"value": i}
 
 
+@pytest.mark.parametrize("index", ["sort", "hash"])
+def test_multiget(ray_start_regular_shared, index):
+    ds = ray.data.range_table(100, parallelism=10)
+    ds = ds.add_column("name", lambda b: "n" + b["value"].astype(str))
+    rad = ds.to_random_access_dataset("value", num_workers=3, index=index)
+
+    def expected(i):
+        return {"value": i, "name": f"n{i}"}
+
+    for i in [-1, 0, 57, 99, 100]:
+        assert ray.get(rad.get_async(i)) == (expected(i) if 0 <= i < 100 else None)
+    keys = [100, 5, -1] + list(range(99, -1, -3)) + [1.5]
+    results = rad.multiget(keys)
+    assert results == [expected(k) if k in range(100) else None for k in keys]
+
+    # Lookups by a string key.
+    rad = ds.to_random_access_dataset("name", num_workers=2, index=index)
+    assert rad.multiget(["n3", "x", "n42"]) == [expected(3), None, expected(42)]
+
+
+def test_multiget_async(ray_start_regular_shared):
+    ds = ray.data.range_table(100, parallelism=10)
+    rad = ds.to_random_access_dataset(
+        "value", num_workers=2, index="hash", max_in_flight_per_worker=1
+    )
+
+    async def lookup():
+        single = await rad.get_async(7)
+        batches = await asyncio.gather(
+            *[rad.multiget_async([i, i + 50, 1000]) for i in range(50)]
+        )
+        return single, batches
+
+    single, batches = asyncio.get_event_loop().run_until_complete(lookup())
+    assert single == {"value": 7}
+    for i, batch in enumerate(batches):
+        assert batch == [{"value": i}, {"value": i + 50}, None]
+
+    with pytest.raises(ValueError):
+        ds.to_random_access_dataset("value", index="invalid")
+
+
 def test_errors(ray_start_regular_shared):
     ds = ray.data.range(10)
     with pytest.raises(ValueError):
@@ -258,6 +258,55 @@ def test_split_map_batches(ray_start_regular_shared):
     assert 4 < nblocks < 7, nblocks
 
 
+def test_dynamic_split_map_batches(ray_start_regular_shared):
+    ctx = ray.data.context.DatasetContext.get_current()
+    original = ctx.target_max_block_size, ctx.dynamic_block_splitting_enabled
+    try:
+        ctx.dynamic_block_splitting_enabled = True
+        ctx.target_max_block_size = 20_000_000
+        ds = ray.data.range(1000, parallelism=1).map(lambda _: ARROW_LARGE_VALUE)
+        ds = ds.map_batches(lambda x: x, batch_size=16)
+        assert ds.num_blocks() == 1, ds._block_num_rows()
+
+        ctx.target_max_block_size = 2_000_000
+        ds = ds.map_batches(lambda x: x, batch_size=16)
+        nrow = ds._block_num_rows()
+        assert 4 < len(nrow) < 7, nrow
+        assert sum(nrow) == 1000, nrow
+        assert ds.take(1) == [ARROW_LARGE_VALUE]
+
+        # Disabled.
+        ctx.dynamic_block_splitting_enabled = False
+        ds = ray.data.range(1000, parallelism=1).map(lambda _: ARROW_LARGE_VALUE)
+        assert ds.map_batches(lambda x: x).num_blocks() == 1
+    finally:
+        ctx.target_max_block_size, ctx.dynamic_block_splitting_enabled = original
+
+
+def test_autodetect_parallelism(ray_start_regular_shared, tmp_path):
+    from ray.data._internal.util import _autodetect_parallelism
+
+    ctx = ray.data.context.DatasetContext.get_current()
+    num_cpus = int(ray.cluster_resources()["CPU"])
+    assert _autodetect_parallelism(7, ctx) == 7
+    assert _autodetect_parallelism(-1, ctx) == max(ctx.min_parallelism, 2 * num_cpus)
+    # Small data isn't split into blocks smaller than the target min block size.
+    mem_size = 10 * ctx.target_min_block_size
+    assert _autodetect_parallelism(-1, ctx, mem_size) == max(10, 2 * num_cpus)
+    # Large data is split into blocks no larger than the target max block size.
+    mem_size = 1000 * ctx.target_max_block_size
+    assert _autodetect_parallelism(-1, ctx, mem_size) == max(1000, 2 * num_cpus)
+    with pytest.raises(ValueError):
+        _autodetect_parallelism(0, ctx)
+
+    # File reads are limited by the number of files.
+    for i in range(3):
+        ray.data.range(10, parallelism=1).write_csv(os.path.join(tmp_path, str(i)))
+    ds = ray.data.read_csv([os.path.join(tmp_path, str(i)) for i in range(3)])
+    assert ds.num_blocks() == 3
+    assert ds.count() == 30
+
+
 if __name__ == "__main__":
     import sys
 
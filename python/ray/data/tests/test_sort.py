@@ -115,6 +115,66 @@ def test_sort_arrow(ray_start_regular, num_items, parallelism, use_push_based_sh
         ctx.use_push_based_shuffle = original
 
 
+@pytest.mark.parametrize("use_push_based_shuffle", [False, True])
+def test_sort_arrow_multi_column(ray_start_regular, use_push_based_shuffle):
+    ctx = ray.data.context.DatasetContext.get_current()
+
+    try:
+        original = ctx.use_push_based_shuffle
+        ctx.use_push_based_shuffle = use_push_based_shuffle
+
+        random.seed(0)
+        rows = [
+            {"a": random.randint(0, 9), "b": random.random(), "c": i}
+            for i in range(1000)
+        ]
+        # Some of the values of "a" are null.
+        for row in rows[::7]:
+            row["a"] = None
+        random.shuffle(rows)
+        ds = ray.data.from_arrow(
+            [
+                pa.Table.from_pydict(
+                    {k: [row[k] for row in rows[i : i + 100]] for k in "abc"}
+                )
+                for i in range(0, 1000, 100)
+            ]
+        )
+
+        def a_key(row, nulls_first):
+            is_null = row["a"] is None
+            return (not is_null if nulls_first else is_null, row["a"] or 0)
+
+        def check(sorted_ds, expected):
+            output = [row.as_pydict() for row in sorted_ds.iter_rows()]
+            assert output == expected
+
+        # Ascending "a", descending "b", with nulls at the end.
+        expected = sorted(rows, key=lambda r: -r["b"])
+        expected.sort(key=lambda r: a_key(r, False))
+        check(ds.sort(["a", "b"], descending=[False, True]), expected)
+
+        # Descending "a", ascending "b", with nulls at the start.
+        expected = sorted(rows, key=lambda r: r["b"])
+        expected.sort(key=lambda r: -a_key(r, True)[1])
+        expected.sort(key=lambda r: r["a"] is not None)
+        check(
+            ds.sort(["a", "b"], descending=[True, False], null_placement="at_start"),
+            expected,
+        )
+
+        # The sort is spread over all blocks.
+        sorted_ds = ds.sort(["a", "c"])
+        assert len([n for n in sorted_ds._block_num_rows() if n > 0]) > 1
+
+        with pytest.raises(ValueError):
+            ds.sort(["a", "b"], descending=[True])
+        with pytest.raises(ValueError):
+            ds.sort("a", null_placement="first")
+    finally:
+        ctx.use_push_based_shuffle = original
+
+
 @pytest.mark.parametrize("use_push_based_shuffle", [False, True])
 def test_sort_arrow_with_empty_blocks(ray_start_regular, use_push_based_shuffle):
     ctx = ray.data.context.DatasetContext.get_current()
@@ -150,6 +150,51 @@ def test_dataset_stats_read_parquet(ray_start_regular_shared, tmp_path):
     )
 
 
+def test_dataset_stats_dict(ray_start_regular_shared):
+    context = DatasetContext.get_current()
+    original = (
+        context.optimize_fuse_stages,
+        context.object_store_profiling_enabled,
+        context.worker_rss_profiling_enabled,
+    )
+    context.optimize_fuse_stages = True
+    context.object_store_profiling_enabled = True
+    context.worker_rss_profiling_enabled = True
+    try:
+        ds = ray.data.range(1000, parallelism=10)
+        ds = ds.map(lambda x: x).random_shuffle()
+        for _ in ds.iter_batches():
+            pass
+        stats = ds.stats_dict()
+        summary = ds.stats()
+    finally:
+        (
+            context.optimize_fuse_stages,
+            context.object_store_profiling_enabled,
+            context.worker_rss_profiling_enabled,
+        ) = original
+    assert [s["name"] for s in stats["stages"]] == ["read->map->random_shuffle"]
+    stage = stats["stages"][0]
+    assert stage["time_total_s"] > 0
+    assert [s["name"] for s in stage["substages"]] == [
+        "read->map->random_shuffle_map",
+        "random_shuffle_reduce",
+    ]
+    for substage in stage["substages"]:
+        assert substage["num_blocks"] == 10
+        assert substage["num_blocks_executed"] == 10
+        assert substage["output_num_rows"]["total"] == 1000
+        assert substage["wall_time_s"]["max"] > 0
+        assert substage["rss_bytes"]["min"] > 0
+        assert substage["num_nodes"] == 1
+    assert stage["cluster_object_store"]["peak_bytes_used"] >= 0
+    assert stage["cluster_object_store"]["spilled_bytes"] >= 0
+    assert stage["cluster_object_store"]["restored_bytes"] >= 0
+    assert stats["iter"]["total_s"] > 0
+    assert "* Cluster object store during execution: " in summary
+    assert "* Worker RSS at task end: " in summary
+
+
 def test_dataset_split_stats(ray_start_regular_shared, tmp_path):
     ds = ray.data.range(100, parallelism=10).map(lambda x: x + 1)
     dses = ds.split_at_indices([50])
@@ -48,7 +48,7 @@ from ray.serve.deployment import Deployment
 from ray.serve.deployment_graph import ClassNode, FunctionNode
 from ray.serve.exceptions import RayServeException
 from ray.serve.handle import RayServeHandle
-from ray.serve.http_util import ASGIHTTPSender, make_fastapi_class_based_view
+from ray.serve.http_util import ASGIAppResponse, make_fastapi_class_based_view
 from ray.serve.logging_utils import LoggingContext
 from ray.serve.pipeline.api import (
     build as pipeline_build,
@@ -315,13 +315,9 @@ def ingress(app: Union["FastAPI", "APIRouter", Callable]):
                     await self._serve_asgi_lifespan.startup()
 
             async def __call__(self, request: Request):
-                sender = ASGIHTTPSender()
-                await self._serve_app(
-                    request.scope,
-                    request.receive,
-                    sender,
-                )
-                return sender.build_asgi_response()
+                # The app runs when the replica sends the response, so that
+                # the response can be streamed.
+                return ASGIAppResponse(self._serve_app, request.scope, request.receive)
 
             # NOTE: __del__ must be async so that we can run asgi shutdown
             # in the same event loop.
@@ -15,6 +15,16 @@ from ray.serve.constants import SERVE_LOGGER_NAME
 logger = logging.getLogger(SERVE_LOGGER_NAME)
 
 
+def get_latency_metric_key(replica_tag: str) -> str:
+    """Returns the metrics store key of the p95 latency of a replica."""
+    return f"{replica_tag}:p95_latency_s"
+
+
+def get_request_rate_metric_key(replica_tag: str) -> str:
+    """Returns the metrics store key of the request arrival rate of a replica."""
+    return f"{replica_tag}:request_rate"
+
+
 def start_metrics_pusher(
     interval_s: float,
     collection_callback: Callable[[], Dict[str, float]],
@@ -1,10 +1,12 @@
 from abc import ABCMeta, abstractmethod
+from collections import deque
 import math
+import time
 
 from ray.serve.config import AutoscalingConfig
 from ray.serve.constants import CONTROL_LOOP_PERIOD_S
 
-from typing import List
+from typing import Deque, Iterable, List, Optional, Tuple
 
 
 def calculate_desired_num_replicas(
@@ -51,6 +53,116 @@ def calculate_desired_num_replicas(
     return desired_num_replicas
 
 
+def calculate_predictive_num_replicas(
+    autoscaling_config: AutoscalingConfig,
+    current_num_ongoing_requests: List[float],
+    current_handle_queued_queries: float,
+    current_p95_latency_s: Optional[float] = None,
+    current_request_rate: Optional[float] = None,
+    forecast_request_rate: Optional[float] = None,
+) -> int:
+    """Returns the number of replicas to scale to for the predictive policy.
+
+    The load of the deployment is the number of ongoing requests of all
+    replicas plus the queries queued at the handles. At a fixed latency, the
+    load is proportional to the request rate (Little's law), so it is scaled by
+    the ratio of the forecast to the current request rate. Independently, if
+    the p95 latency exceeds the target latency while the replicas have more
+    ongoing requests than their target, the number of replicas is scaled up by
+    the ratio of the two latencies. Latency at or under the target number of
+    ongoing requests is intrinsic to the model, so more replicas wouldn't help.
+
+    Args:
+        autoscaling_config: The autoscaling parameters to use for this
+            calculation.
+        current_num_ongoing_requests (List[float]): A list of the number of
+            ongoing requests for each replica, time-averaged over the look-back
+            window.
+        current_handle_queued_queries: The number of queries queued at the
+            handles.
+        current_p95_latency_s: The p95 request latency, if known.
+        current_request_rate: The current request rate, if known.
+        forecast_request_rate: The request rate forecast over the forecast
+            horizon, if known.
+
+    Returns:
+        desired_num_replicas: The desired number of replicas to scale to.
+    """
+    current_num_replicas = len(current_num_ongoing_requests)
+    if current_num_replicas == 0:
+        raise ValueError("Number of replicas cannot be zero")
+
+    load = sum(current_num_ongoing_requests) + current_handle_queued_queries
+    if (
+        current_request_rate is not None
+        and current_request_rate > 0
+        and forecast_request_rate is not None
+    ):
+        load *= forecast_request_rate / current_request_rate
+    desired_num_replicas = (
+        load / autoscaling_config.target_num_ongoing_requests_per_replica
+    )
+
+    target_latency_s = autoscaling_config.target_latency_s
+    num_ongoing_requests_per_replica = (
+        sum(current_num_ongoing_requests) / current_num_replicas
+    )
+    if (
+        target_latency_s > 0
+        and current_p95_latency_s is not None
+        and current_p95_latency_s > target_latency_s
+        and num_ongoing_requests_per_replica
+        > autoscaling_config.target_num_ongoing_requests_per_replica
+    ):
+        desired_num_replicas = max(
+            desired_num_replicas,
+            current_num_replicas * current_p95_latency_s / target_latency_s,
+        )
+
+    # Multiply the distance to the current number of replicas by the
+    # smoothing ("gain") factor, as in calculate_desired_num_replicas.
+    desired_num_replicas = math.ceil(
+        current_num_replicas
+        + (desired_num_replicas - current_num_replicas)
+        * autoscaling_config.smoothing_factor
+    )
+
+    # Ensure min_replicas <= desired_num_replicas <= max_replicas.
+    desired_num_replicas = min(autoscaling_config.max_replicas, desired_num_replicas)
+    desired_num_replicas = max(autoscaling_config.min_replicas, desired_num_replicas)
+
+    return desired_num_replicas
+
+
+def forecast_request_rate(
+    request_rate_history: Iterable[Tuple[float, float]], horizon_s: float
+) -> Optional[float]:
+    """Forecasts the request rate with a linear trend of its recent history.
+
+    Args:
+        request_rate_history: (timestamp, request rate) pairs, in time order.
+        horizon_s: How far past the last timestamp to forecast.
+
+    Returns:
+        The forecast request rate, or None if the history is empty.
+    """
+    history = list(request_rate_history)
+    if len(history) == 0:
+        return None
+
+    # Fit the trend by least squares.
+    n = len(history)
+    mean_t = sum(t for t, _ in history) / n
+    mean_rate = sum(rate for _, rate in history) / n
+    var_t = sum((t - mean_t) ** 2 for t, _ in history)
+    if var_t == 0:
+        return mean_rate
+    slope = sum((t - mean_t) * (rate - mean_rate) for t, rate in history) / var_t
+
+    forecast_t = history[-1][0] + horizon_s
+    return max(0.0, mean_rate + slope * (forecast_t - mean_t))
+
+
 class AutoscalingPolicy:
     """Defines the interface for an autoscaling policy.
 
@@ -72,6 +184,8 @@ class AutoscalingPolicy:
         curr_target_num_replicas: int,
         current_num_ongoing_requests: List[float],
         current_handle_queued_queries: float,
+        current_p95_latency_s: Optional[float] = None,
+        current_request_rate: Optional[float] = None,
     ) -> int:
         """Make a decision to scale replicas.
 
@@ -83,6 +197,10 @@ class AutoscalingPolicy:
             current_handle_queued_queries : The number of handle queued queries,
                 if there are multiple handles, the max number of queries at
                 a single handle should be passed in
+            current_p95_latency_s: The p95 request latency of the replicas,
+                or None if unknown.
+            current_request_rate: The number of requests per second received
+                by all replicas, or None if unknown.
 
         Returns:
             int: The new number of replicas to scale to.
@@ -129,6 +247,8 @@ class BasicAutoscalingPolicy(AutoscalingPolicy):
         curr_target_num_replicas: int,
         current_num_ongoing_requests: List[float],
         current_handle_queued_queries: float,
+        current_p95_latency_s: Optional[float] = None,
+        current_request_rate: Optional[float] = None,
     ) -> int:
 
         if len(current_num_ongoing_requests) == 0:
@@ -137,11 +257,21 @@ class BasicAutoscalingPolicy(AutoscalingPolicy):
                 return max(1, curr_target_num_replicas)
             return curr_target_num_replicas
 
-        decision_num_replicas = curr_target_num_replicas
-
         desired_num_replicas = calculate_desired_num_replicas(
             self.config, current_num_ongoing_requests
         )
+        return self._apply_scaling_delays(
+            curr_target_num_replicas, desired_num_replicas
+        )
+
+    def _apply_scaling_delays(
+        self, curr_target_num_replicas: int, desired_num_replicas: int
+    ) -> int:
+        """Returns the desired number of replicas once it has been desired for
+        upscale_delay_s or downscale_delay_s, and the current one until then.
+        """
+        decision_num_replicas = curr_target_num_replicas
+
         # Scale up.
         if desired_num_replicas > curr_target_num_replicas:
             # If the previous decision was to scale down (the counter was
@@ -176,3 +306,66 @@ class BasicAutoscalingPolicy(AutoscalingPolicy):
             self.decision_counter = 0
 
         return decision_num_replicas
+
+
+class PredictiveAutoscalingPolicy(BasicAutoscalingPolicy):
+    """An autoscaling policy that scales on demand forecasts and latency.
+
+    In addition to the ongoing requests of the replicas, the demand includes
+    the queries queued at the handles, and is scaled by the ratio of the
+    request rate forecast `forecast_horizon_s` ahead to the current request
+    rate. The forecast is a linear trend fit to the request rates of the
+    look-back period, so that replicas are started ahead of a growing load.
+    If the p95 latency exceeds `target_latency_s`, the replicas are scaled up
+    proportionally. Scaling decisions are delayed as in the basic policy.
+    """
+
+    def __init__(self, config: AutoscalingConfig):
+        super().__init__(config)
+        # The (timestamp, request rate) pairs of the look-back period.
+        self.request_rate_history: Deque[Tuple[float, float]] = deque()
+
+    def get_decision_num_replicas(
+        self,
+        curr_target_num_replicas: int,
+        current_num_ongoing_requests: List[float],
+        current_handle_queued_queries: float,
+        current_p95_latency_s: Optional[float] = None,
+        current_request_rate: Optional[float] = None,
+    ) -> int:
+        forecast = None
+        if current_request_rate is not None:
+            now = time.time()
+            self.request_rate_history.append((now, current_request_rate))
+            while self.request_rate_history[0][0] < (
+                now - self.config.look_back_period_s
+            ):
+                self.request_rate_history.popleft()
+            forecast = forecast_request_rate(
+                self.request_rate_history, self.config.forecast_horizon_s
+            )
+
+        if len(current_num_ongoing_requests) == 0:
+            # When 0 replica and queries queued, scale up the replicas
+            if current_handle_queued_queries > 0:
+                return max(1, curr_target_num_replicas)
+            return curr_target_num_replicas
+
+        desired_num_replicas = calculate_predictive_num_replicas(
+            self.config,
+            current_num_ongoing_requests,
+            current_handle_queued_queries,
+            current_p95_latency_s=current_p95_latency_s,
+            current_request_rate=current_request_rate,
+            forecast_request_rate=forecast,
+        )
+        return self._apply_scaling_delays(
+            curr_target_num_replicas, desired_num_replicas
+        )
+
+
+def make_autoscaling_policy(config: AutoscalingConfig) -> AutoscalingPolicy:
+    """Returns a new instance of the autoscaling policy set in the config."""
+    if config.policy == "predictive":
+        return PredictiveAutoscalingPolicy(config)
+    return BasicAutoscalingPolicy(config)
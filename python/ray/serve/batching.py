@@ -3,11 +3,17 @@ from functools import wraps
 from inspect import iscoroutinefunction
 import time
 from typing import Any, Callable, Dict, List, Optional, overload, Tuple, TypeVar
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 from ray._private.signature import extract_signature, flatten_args, recover_args
+from ray.serve.constants import DEFAULT_LATENCY_BUCKET_MS
+from ray.serve.context import get_internal_replica_context
 from ray.serve.exceptions import RayServeException
+from ray.util import metrics
+
+#: Histogram buckets for the batch size metric.
+BATCH_SIZE_BUCKETS = [1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024]
 
 
 @dataclass
@@ -15,6 +21,7 @@ class SingleRequest:
     self_arg: Optional[Any]
     flattened_args: List[Any]
     future: asyncio.Future
+    enqueue_time: float = field(default_factory=time.time)
 
 
 def _batch_args_kwargs(
@@ -42,12 +49,84 @@ def _batch_args_kwargs(
     return recover_args(batched_flattened_args)
 
 
+class _AdaptiveBatchTuner:
+    """Tunes the batch size and wait timeout of a batch queue to a latency SLO.
+
+    The batch size is tuned with additive increase, multiplicative decrease on
+    the latency of each batch's oldest request, i.e. its queue wait time plus
+    the batch execution time. The size is halved when that latency misses the
+    SLO. It grows by a constant step after a full batch that finished well within
+    the SLO, since a larger batch may then get more throughput.
+
+    The wait timeout is the expected time for a batch to fill up at the current
+    request arrival rate, capped by the SLO left after the expected execution
+    time and by the user's batch_wait_timeout_s.
+    """
+
+    # The fraction of the SLO under which a full batch makes the size grow.
+    INCREASE_THRESHOLD = 0.8
+    # The number of requests that the batch size grows by.
+    INCREASE_STEP = 1
+    # The weight of the newest sample in the moving averages.
+    EWMA_ALPHA = 0.2
+
+    def __init__(self, max_batch_size: int, max_timeout_s: float, latency_slo_s: float):
+        self.max_batch_size = max_batch_size
+        self.max_timeout_s = max_timeout_s
+        self.latency_slo_s = latency_slo_s
+        self.batch_size = 1
+        self.timeout_s = 0.0
+        self._execution_time_ewma: Optional[float] = None
+        self._interarrival_time_ewma: Optional[float] = None
+        self._last_arrival_time: Optional[float] = None
+
+    def record_arrival(self, arrival_time: float):
+        if self._last_arrival_time is not None:
+            self._interarrival_time_ewma = self._ewma(
+                self._interarrival_time_ewma, arrival_time - self._last_arrival_time
+            )
+        self._last_arrival_time = arrival_time
+
+    def record_batch(self, batch_size: int, queue_wait_s: float, execution_s: float):
+        """Update the batch size and timeout after executing a batch.
+
+        Arguments:
+            batch_size: the number of requests in the batch.
+            queue_wait_s: the queue wait time of the oldest request.
+            execution_s: the time it took to execute the batch.
+        """
+        self._execution_time_ewma = self._ewma(self._execution_time_ewma, execution_s)
+        latency_s = queue_wait_s + execution_s
+        if latency_s > self.latency_slo_s:
+            self.batch_size = max(1, self.batch_size // 2)
+        elif (
+            batch_size >= self.batch_size
+            and latency_s < self.INCREASE_THRESHOLD * self.latency_slo_s
+        ):
+            self.batch_size = min(
+                self.max_batch_size, self.batch_size + self.INCREASE_STEP
+            )
+
+        if self._interarrival_time_ewma is None:
+            fill_time_s = 0.0
+        else:
+            fill_time_s = (self.batch_size - 1) * self._interarrival_time_ewma
+        slack_s = max(0.0, self.latency_slo_s - self._execution_time_ewma)
+        self.timeout_s = min(fill_time_s, slack_s, self.max_timeout_s)
+
+    def _ewma(self, average: Optional[float], sample: float) -> float:
+        if average is None:
+            return sample
+        return average + self.EWMA_ALPHA * (sample - average)
+
+
 class _BatchQueue:
     def __init__(
         self,
         max_batch_size: int,
         timeout_s: float,
         handle_batch_func: Optional[Callable] = None,
+        latency_slo_s: Optional[float] = None,
     ) -> None:
         """Async queue that accepts individual items and returns batches.
 
@@ -58,29 +137,63 @@ class _BatchQueue:
         If handle_batch_func is passed in, a background coroutine will run to
         poll from the queue and call handle_batch_func on the results.
 
+        If latency_slo_s is passed in, the batch size and timeout are tuned
+        online to meet the latency SLO, up to max_batch_size and timeout_s.
+
         Arguments:
             max_batch_size: max number of elements to return in a batch.
             timeout_s: time to wait before returning an incomplete
                 batch.
             handle_batch_func(Optional[Callable]): callback to run in the
                 background to handle batches if provided.
+            latency_slo_s(Optional[float]): target latency of each request,
+                including its time in the queue, for adaptive batching.
         """
         self.queue: asyncio.Queue[SingleRequest] = asyncio.Queue()
         self.full_batch_event = asyncio.Event()
+        self._tuner = None
+        if latency_slo_s is not None:
+            self._tuner = _AdaptiveBatchTuner(max_batch_size, timeout_s, latency_slo_s)
+            max_batch_size = self._tuner.batch_size
+            timeout_s = self._tuner.timeout_s
         self.max_batch_size = max_batch_size
         self.timeout_s = timeout_s
 
         self._handle_batch_task = None
         if handle_batch_func is not None:
+            self._init_metrics(handle_batch_func.__name__)
             self._handle_batch_task = asyncio.get_event_loop().create_task(
                 self._handle_batches(handle_batch_func)
             )
 
+    def _init_metrics(self, function_name: str):
+        tags = {"function": function_name, "deployment": "", "replica": ""}
+        replica_context = get_internal_replica_context()
+        if replica_context is not None:
+            tags["deployment"] = replica_context.deployment
+            tags["replica"] = replica_context.replica_tag
+        self._batch_size_histogram = metrics.Histogram(
+            "serve_batch_size",
+            description="The number of requests in each batch.",
+            boundaries=BATCH_SIZE_BUCKETS,
+            tag_keys=("deployment", "replica", "function"),
+        )
+        self._batch_size_histogram.set_default_tags(tags)
+        self._queue_wait_histogram = metrics.Histogram(
+            "serve_batch_queue_wait_time_ms",
+            description="The time requests wait in the queue to be batched.",
+            boundaries=DEFAULT_LATENCY_BUCKET_MS,
+            tag_keys=("deployment", "replica", "function"),
+        )
+        self._queue_wait_histogram.set_default_tags(tags)
+
     def put(self, request: Tuple[SingleRequest, asyncio.Future]) -> None:
         self.queue.put_nowait(request)
+        if self._tuner is not None:
+            self._tuner.record_arrival(request.enqueue_time)
         # Signal when the full batch is ready. The event will be reset
         # in wait_for_batch.
-        if self.queue.qsize() == self.max_batch_size:
+        if self.queue.qsize() >= self.max_batch_size:
             self.full_batch_event.set()
 
     async def wait_for_batch(self) -> List[Any]:
@@ -95,6 +208,9 @@ class _BatchQueue:
         """
         curr_timeout = self.timeout_s
         batch = []
+        # The batch size may have shrunk since the requests were queued.
+        if self.queue.qsize() >= self.max_batch_size:
+            self.full_batch_event.set()
         while len(batch) == 0:
             loop_start = time.time()
 
@@ -135,6 +251,13 @@ class _BatchQueue:
             args, kwargs = _batch_args_kwargs([item.flattened_args for item in batch])
             futures = [item.future for item in batch]
 
+            batch_start = time.time()
+            self._batch_size_histogram.observe(len(batch))
+            for item in batch:
+                self._queue_wait_histogram.observe(
+                    (batch_start - item.enqueue_time) * 1000
+                )
+
             try:
                 # Method call.
                 if self_arg is not None:
@@ -156,6 +279,15 @@ class _BatchQueue:
                 for future in futures:
                     future.set_exception(e)
 
+            if self._tuner is not None:
+                self._tuner.record_batch(
+                    len(batch),
+                    batch_start - min(item.enqueue_time for item in batch),
+                    time.time() - batch_start,
+                )
+                self.max_batch_size = self._tuner.batch_size
+                self.timeout_s = self._tuner.timeout_s
+
     def __del__(self):
         if self._handle_batch_task is None or not asyncio.get_event_loop().is_running():
             return
@@ -205,12 +337,14 @@ def batch(func: F) -> G:
 # "Decorator factory" use case (called with arguments).
 @overload
 def batch(
-    max_batch_size: Optional[int] = 10, batch_wait_timeout_s: Optional[float] = 0.0
+    max_batch_size: Optional[int] = 10,
+    batch_wait_timeout_s: Optional[float] = 0.0,
+    latency_slo_s: Optional[float] = None,
 ) -> Callable[[F], G]:
     pass
 
 
-def batch(_func=None, max_batch_size=10, batch_wait_timeout_s=0.0):
+def batch(_func=None, max_batch_size=10, batch_wait_timeout_s=0.0, latency_slo_s=None):
     """Converts a function to asynchronously handle batches.
 
     The function can be a standalone function or a class method. In both
@@ -231,11 +365,24 @@ def batch(_func=None, max_batch_size=10, batch_wait_timeout_s=0.0):
     ...     # Returns s.lower().
     ...     return await handle_batch(s) # doctest: +SKIP
 
+    With `latency_slo_s`, batching is adaptive: the batch size and wait
+    timeout are tuned online from the observed batch latency and request
+    arrival rate, so that requests complete within the latency SLO (including
+    their time waiting to be batched) while batches are as large as the SLO
+    allows. `max_batch_size` and `batch_wait_timeout_s` then bound the tuned
+    values.
+
+    The size of each batch and the time requests wait to be batched are
+    exported as the `serve_batch_size` and `serve_batch_queue_wait_time_ms`
+    metrics.
+
     Arguments:
         max_batch_size: the maximum batch size that will be executed in
             one call to the underlying function.
         batch_wait_timeout_s: the maximum duration to wait for
             `max_batch_size` elements before running the underlying function.
+        latency_slo_s: the target latency of each request in seconds, which
+            enables adaptive batching.
     """
     # `_func` will be None in the case when the decorator is parametrized.
     # See the comment at the end of this function for a detailed explanation.
@@ -263,6 +410,13 @@ def batch(_func=None, max_batch_size=10, batch_wait_timeout_s=0.0):
     if batch_wait_timeout_s < 0:
         raise ValueError("batch_wait_timeout_s must be a float >= 0")
 
+    if latency_slo_s is not None:
+        if not isinstance(latency_slo_s, (float, int)):
+            raise TypeError("latency_slo_s must be a float > 0")
+
+        if latency_slo_s <= 0:
+            raise ValueError("latency_slo_s must be a float > 0")
+
     def _batch_decorator(_func):
         @wraps(_func)
         async def batch_wrapper(*args, **kwargs):
@@ -285,7 +439,9 @@ def batch(_func=None, max_batch_size=10, batch_wait_timeout_s=0.0):
             # runs, we just get a reference to the attribute.
             batch_queue_attr = f"__serve_batch_queue_{_func.__name__}"
             if not hasattr(batch_queue_object, batch_queue_attr):
-                batch_queue = _BatchQueue(max_batch_size, batch_wait_timeout_s, _func)
+                batch_queue = _BatchQueue(
+                    max_batch_size, batch_wait_timeout_s, _func, latency_slo_s
+                )
                 setattr(batch_queue_object, batch_queue_attr, batch_queue)
             else:
                 batch_queue = getattr(batch_queue_object, batch_queue_attr)
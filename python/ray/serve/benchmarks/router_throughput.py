@@ -0,0 +1,113 @@
+# Measures the throughput of the Serve router (the ReplicaSet of a handle) with
+# thousands of concurrent requests, without the controller, handles or HTTP
+# proxy in the way. The replicas are noop actors, so the throughput is bounded
+# by the router and the Ray task submission path.
+#
+# With a small max_concurrent_queries, most requests wait for a free replica,
+# which exercises the completion tracking of in-flight queries. Compare the
+# throughput as --num-concurrent grows: it should stay flat if completing a
+# query costs O(1) rather than O(number of in-flight queries).
+#
+# Example:
+# python router_throughput.py --num-replicas 8 --max-concurrent-queries 100 \
+#     --num-concurrent 100 --num-concurrent 1000 --num-concurrent 5000
+
+import asyncio
+import time
+from typing import List
+
+import click
+
+import ray
+from ray.serve.common import RunningReplicaInfo
+from ray.serve.router import (
+    PowerOfTwoChoicesReplicaSchedulingPolicy,
+    Query,
+    ReplicaSet,
+    RequestMetadata,
+    RoundRobinReplicaSchedulingPolicy,
+)
+
+
+@ray.remote(num_cpus=0)
+class NoopReplica:
+    def ready(self):
+        return "ok"
+
+    @ray.method(num_returns=2)
+    async def handle_request(self, request_metadata, *args, **kwargs):
+        return b"", b"ok"
+
+
+def make_policy(policy: str):
+    if policy == "round_robin":
+        return RoundRobinReplicaSchedulingPolicy()
+    return PowerOfTwoChoicesReplicaSchedulingPolicy()
+
+
+async def run_test(
+    replicas: List[RunningReplicaInfo],
+    policy: str,
+    num_concurrent: int,
+    num_queries: int,
+) -> float:
+    replica_set = ReplicaSet("benchmark", asyncio.get_event_loop(), make_policy(policy))
+    replica_set.update_running_replicas(replicas)
+    query = Query([], {}, RequestMetadata("request-id", "endpoint"))
+
+    async def client(num: int):
+        for _ in range(num):
+            assert await (await replica_set.assign_replica(query)) == b"ok"
+
+    queries_per_client = max(1, num_queries // num_concurrent)
+    start = time.perf_counter()
+    await asyncio.gather(*[client(queries_per_client) for _ in range(num_concurrent)])
+    return queries_per_client * num_concurrent / (time.perf_counter() - start)
+
+
+@click.command()
+@click.option("--num-replicas", type=int, default=8)
+@click.option("--max-concurrent-queries", type=int, default=100)
+@click.option("--num-concurrent", type=int, multiple=True, default=[100, 1000, 5000])
+@click.option("--num-queries", type=int, default=20000)
+@click.option(
+    "--policy",
+    type=click.Choice(["power_of_two_choices", "round_robin"]),
+    default="power_of_two_choices",
+)
+def main(
+    num_replicas: int,
+    max_concurrent_queries: int,
+    num_concurrent: List[int],
+    num_queries: int,
+    policy: str,
+):
+    ray.init()
+    actors = [NoopReplica.remote() for _ in range(num_replicas)]
+    ray.get([actor.ready.remote() for actor in actors])
+    replicas = [
+        RunningReplicaInfo(
+            deployment_name="benchmark",
+            replica_tag=str(i),
+            actor_handle=actor,
+            max_concurrent_queries=max_concurrent_queries,
+        )
+        for i, actor in enumerate(actors)
+    ]
+
+    loop = asyncio.get_event_loop()
+    # Warm up the actors and the task submission path.
+    loop.run_until_complete(run_test(replicas, policy, 100, 1000))
+    for concurrency in num_concurrent:
+        qps = loop.run_until_complete(
+            run_test(replicas, policy, concurrency, num_queries)
+        )
+        print(
+            f"{policy}, {num_replicas} replicas with max_concurrent_queries="
+            f"{max_concurrent_queries}, {concurrency} concurrent requests: "
+            f"{int(qps)} requests/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -283,3 +283,5 @@ class RunningReplicaInfo:
     replica_tag: ReplicaTag
     actor_handle: ActorHandle
     max_concurrent_queries: int
+    # The id of the node the replica is running on, if known.
+    node_id: Optional[str] = None
@@ -33,6 +33,10 @@ from ray._private import ray_option_utils
 from ray._private.utils import resources_from_ray_options
 
 
+# The autoscaling policies that can be set in AutoscalingConfig.
+AUTOSCALING_POLICIES = ("basic", "predictive")
+
+
 class AutoscalingConfig(BaseModel):
     # Please keep these options in sync with those in
     # `src/ray/protobuf/serve.proto`.
@@ -63,6 +67,17 @@ class AutoscalingConfig(BaseModel):
     # How long to wait before scaling up replicas
     upscale_delay_s: NonNegativeFloat = 30.0
 
+    # The autoscaling policy, one of AUTOSCALING_POLICIES. The "predictive"
+    # policy also scales on the handle queue length, the p95 latency and the
+    # forecast request rate.
+    policy: str = "basic"
+    # The p95 latency to scale up for with the predictive policy, or 0 to
+    # not scale on latency.
+    target_latency_s: NonNegativeFloat = 0.0
+    # How far ahead to forecast the request rate with the predictive policy.
+    # This should cover the time it takes to start a replica.
+    forecast_horizon_s: PositiveFloat = 30.0
+
     @validator("max_replicas")
     def max_replicas_greater_than_or_equal_to_min_replicas(cls, v, values):
         if "min_replicas" in values and v < values["min_replicas"]:
@@ -73,6 +88,17 @@ class AutoscalingConfig(BaseModel):
             )
         return v
 
+    @validator("policy")
+    def policy_valid(cls, v):
+        if v == "":
+            # Unset in configs from protobuf.
+            return "basic"
+        if v not in AUTOSCALING_POLICIES:
+            raise ValueError(
+                f"policy must be one of {AUTOSCALING_POLICIES}, got '{v}'."
+            )
+        return v
+
     # TODO(architkulkarni): implement below
     # The number of replicas to start with when creating the deployment
     # initial_replicas: int = 1
@@ -177,6 +203,9 @@ class DeploymentConfig(BaseModel):
             else:
                 data["user_config"] = None
         if "autoscaling_config" in data:
+            if not data["autoscaling_config"].get("forecast_horizon_s"):
+                # Unset in configs from protobuf, e.g. built by older clients.
+                data["autoscaling_config"].pop("forecast_horizon_s", None)
             data["autoscaling_config"] = AutoscalingConfig(**data["autoscaling_config"])
         if "prev_version" in data:
             if data["prev_version"] == "":
@@ -99,6 +99,17 @@ ANONYMOUS_NAMESPACE_PATTERN = re.compile(
 # Handle metric push interval. (This interval will affect the cold start time period)
 HANDLE_METRIC_PUSH_INTERVAL_S = 10
 
+#: HTTP request bodies that are chunked or larger than this are streamed to the
+#: replica instead of being buffered in the HTTP proxy.
+HTTP_REQUEST_BODY_STREAMING_THRESHOLD_BYTES = 1024 * 1024
+
+#: Max number of ASGI messages of a streamed HTTP request or response to buffer.
+HTTP_STREAM_BUFFER_SIZE = 16
+
+#: Time after which a streamed HTTP request or response that isn't being read
+#: is dropped.
+HTTP_STREAM_IDLE_TIMEOUT_S = 60
+
 
 class ServeHandleType(str, Enum):
     SYNC = "SYNC"
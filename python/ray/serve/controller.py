@@ -14,8 +14,12 @@ from ray.actor import ActorHandle
 from ray._private.utils import import_attr
 from ray.exceptions import RayTaskError
 
-from ray.serve.autoscaling_metrics import InMemoryMetricsStore
-from ray.serve.autoscaling_policy import BasicAutoscalingPolicy
+from ray.serve.autoscaling_metrics import (
+    InMemoryMetricsStore,
+    get_latency_metric_key,
+    get_request_rate_metric_key,
+)
+from ray.serve.autoscaling_policy import make_autoscaling_policy
 from ray.serve.common import (
     DeploymentInfo,
     EndpointTag,
@@ -207,20 +211,39 @@ class ServeController:
                 deployment_name
             ]._replicas
             running_replicas = replicas.get([ReplicaState.RUNNING])
+            config = autoscaling_policy.config
 
             current_num_ongoing_requests = []
+            p95_latencies_s = []
+            request_rates = []
             for replica in running_replicas:
                 replica_tag = replica.replica_tag
                 num_ongoing_requests = self.autoscaling_metrics_store.window_average(
                     replica_tag,
-                    time.time() - autoscaling_policy.config.look_back_period_s,
+                    time.time() - config.look_back_period_s,
                 )
                 if num_ongoing_requests is not None:
                     current_num_ongoing_requests.append(num_ongoing_requests)
 
+                p95_latency_s = self.autoscaling_metrics_store.window_average(
+                    get_latency_metric_key(replica_tag),
+                    time.time() - config.look_back_period_s,
+                )
+                if p95_latency_s is not None:
+                    p95_latencies_s.append(p95_latency_s)
+
+                # Only average the latest request rates, so that the policy can
+                # forecast the trend of the request rate over the look-back period.
+                request_rate = self.autoscaling_metrics_store.window_average(
+                    get_request_rate_metric_key(replica_tag),
+                    time.time() - 2 * config.metrics_interval_s,
+                )
+                if request_rate is not None:
+                    request_rates.append(request_rate)
+
             current_handle_queued_queries = self.handle_metrics_store.max(
                 deployment_name,
-                time.time() - autoscaling_policy.config.look_back_period_s,
+                time.time() - config.look_back_period_s,
             )
 
             if current_handle_queued_queries is None:
@@ -232,6 +255,8 @@ class ServeController:
                 curr_target_num_replicas=deployment_config.num_replicas,
                 current_num_ongoing_requests=current_num_ongoing_requests,
                 current_handle_queued_queries=current_handle_queued_queries,
+                current_p95_latency_s=max(p95_latencies_s, default=None),
+                current_request_rate=sum(request_rates) if request_rates else None,
             )
 
             if decision_num_replicas == deployment_config.num_replicas:
@@ -383,7 +408,7 @@ class ServeController:
             # TODO: is this the desired behaviour? Should this be a setting?
             deployment_config.num_replicas = autoscaling_config.min_replicas
 
-            autoscaling_policy = BasicAutoscalingPolicy(autoscaling_config)
+            autoscaling_policy = make_autoscaling_policy(autoscaling_config)
         else:
             autoscaling_policy = None
 
@@ -5,13 +5,15 @@ import logging
 import pickle
 import socket
 import time
-from typing import Callable, List, Dict, Optional, Tuple
+from typing import Any, Callable, List, Dict, Optional, Tuple
+import uuid
 
 import uvicorn
 import starlette.responses
 import starlette.routing
 
 import ray
+from ray.actor import ActorHandle
 from ray.exceptions import RayActorError, RayTaskError
 from ray.util import metrics
 
@@ -23,9 +25,15 @@ from ray.serve.http_util import (
     receive_http_body,
     Response,
     set_socket_reuse_port,
+    StreamingASGIResponse,
+    is_last_response_message,
 )
 from ray.serve.common import EndpointInfo, EndpointTag
-from ray.serve.constants import SERVE_LOGGER_NAME
+from ray.serve.constants import (
+    HTTP_REQUEST_BODY_STREAMING_THRESHOLD_BYTES,
+    HTTP_STREAM_BUFFER_SIZE,
+    SERVE_LOGGER_NAME,
+)
 from ray.serve.long_poll import LongPollClient, LongPollNamespace
 from ray.serve.logging_utils import access_log_msg, configure_component_logger
 from ray.serve.utils import node_id_to_ip_addr
@@ -39,24 +47,103 @@ SOCKET_REUSE_PORT_ENABLED = (
 )
 
 
-async def _send_request_to_handle(handle, scope, receive, send) -> str:
-    http_body_bytes = await receive_http_body(scope, receive, send)
+def should_stream_request_body(scope) -> bool:
+    """Returns whether the body of the HTTP request should be streamed to the
+    replica instead of being buffered in the proxy."""
+    headers = dict(scope["headers"])
+    if b"chunked" in headers.get(b"transfer-encoding", b"").lower():
+        return True
+    try:
+        content_length = int(headers.get(b"content-length", 0))
+    except ValueError:
+        return False
+    return content_length > HTTP_REQUEST_BODY_STREAMING_THRESHOLD_BYTES
+
+
+class RequestBodyStream:
+    """Buffers the chunks of an HTTP request body until a replica pulls them.
+
+    The buffer holds HTTP_STREAM_BUFFER_SIZE chunks, so the body is only read
+    from the client as fast as the replica reads it.
+    """
 
-    # NOTE(edoakes): it's important that we defer building the starlette
-    # request until it reaches the replica to avoid unnecessary
-    # serialization cost, so we use a simple dataclass here.
-    request = HTTPRequestWrapper(scope, http_body_bytes)
+    def __init__(self, proxy_actor: ActorHandle, receive):
+        self.proxy_actor = proxy_actor
+        self.stream_id = uuid.uuid4().hex
+        self._receive = receive
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=HTTP_STREAM_BUFFER_SIZE)
+
+    async def run(self) -> Dict[str, Any]:
+        """Reads the body into the buffer and returns the disconnect message."""
+        while True:
+            message = await self._receive()
+            if message["type"] == "http.disconnect":
+                # Wake up a replica waiting for the rest of the body. If the
+                # buffer is full, the replica isn't waiting.
+                try:
+                    self._queue.put_nowait(None)
+                except asyncio.QueueFull:
+                    pass
+                return message
+            await self._queue.put(message)
+            if not message.get("more_body", False):
+                break
+        # The next `receive` call might never arrive; if it does, it can only
+        # be `http.disconnect`.
+        return await self._receive()
+
+    async def get_chunks(self) -> Optional[Tuple[bytes, bool]]:
+        """Waits for the next chunks of the body and returns them joined, with
+        whether there's more body. Returns None if the client disconnected.
+        """
+        message = await self._queue.get()
+        if message is None:
+            return None
+        chunks = [message["body"]]
+        more_body = message.get("more_body", False)
+        while more_body and not self._queue.empty():
+            message = self._queue.get_nowait()
+            if message is None:
+                return None
+            chunks.append(message["body"])
+            more_body = message.get("more_body", False)
+        return b"".join(chunks), more_body
+
+
+async def _send_request_to_handle(
+    handle,
+    scope,
+    receive,
+    send,
+    request_body_stream: Optional[RequestBodyStream] = None,
+) -> str:
+    loop = asyncio.get_event_loop()
+    max_retries = MAX_REPLICA_FAILURE_RETRIES
+    if request_body_stream is None:
+        http_body_bytes = await receive_http_body(scope, receive, send)
+
+        # NOTE(edoakes): it's important that we defer building the starlette
+        # request until it reaches the replica to avoid unnecessary
+        # serialization cost, so we use a simple dataclass here.
+        request = HTTPRequestWrapper(scope, http_body_bytes)
+
+        # We have received all the http request conent. The next `receive`
+        # call might never arrive; if it does, it can only be `http.disconnect`.
+        client_disconnection_task = loop.create_task(receive())
+    else:
+        # The replica pulls the body from the stream as it reads it.
+        body_stream = (request_body_stream.proxy_actor, request_body_stream.stream_id)
+        request = HTTPRequestWrapper(scope, b"", body_stream=body_stream)
+        client_disconnection_task = loop.create_task(request_body_stream.run())
+        # A streamed body can't be replayed to another replica.
+        max_retries = 1
     # Perform a pickle here to improve latency. Stdlib pickle for simple
     # dataclasses are 10-100x faster than cloudpickle.
     request = pickle.dumps(request)
 
     retries = 0
     backoff_time_s = 0.05
-    loop = asyncio.get_event_loop()
-    # We have received all the http request conent. The next `receive`
-    # call might never arrive; if it does, it can only be `http.disconnect`.
-    client_disconnection_task = loop.create_task(receive())
-    while retries < MAX_REPLICA_FAILURE_RETRIES:
+    while retries < max_retries:
         assignment_task = loop.create_task(handle.remote(request))
         done, _ = await asyncio.wait(
             [assignment_task, client_disconnection_task], return_when=FIRST_COMPLETED
@@ -77,7 +164,8 @@ async def _send_request_to_handle(handle, scope, receive, send) -> str:
         try:
             object_ref = await assignment_task
             result = await object_ref
-            client_disconnection_task.cancel()
+            if not isinstance(result, StreamingASGIResponse):
+                client_disconnection_task.cancel()
             break
         except asyncio.CancelledError:
             # Here because the client disconnected, we will return a custom
@@ -100,11 +188,13 @@ async def _send_request_to_handle(handle, scope, receive, send) -> str:
             backoff_time_s *= 1.5
             retries += 1
     else:
-        error_message = "Task failed with " f"{MAX_REPLICA_FAILURE_RETRIES} retries."
+        error_message = "Task failed with " f"{max_retries} retries."
         await Response(error_message, status_code=500).send(scope, receive, send)
         return "500"
 
-    if isinstance(result, (starlette.responses.Response, RawASGIResponse)):
+    if isinstance(result, StreamingASGIResponse):
+        return await _stream_response(result, client_disconnection_task, send)
+    elif isinstance(result, (starlette.responses.Response, RawASGIResponse)):
         await result(scope, receive, send)
         return str(result.status_code)
     else:
@@ -112,6 +202,42 @@ async def _send_request_to_handle(handle, scope, receive, send) -> str:
         return "200"
 
 
+async def _stream_response(
+    response: StreamingASGIResponse, client_disconnection_task: asyncio.Task, send
+) -> str:
+    """Sends the messages of a streamed response as the replica produces them.
+
+    The response is cancelled on the replica if the client disconnects.
+    """
+    loop = asyncio.get_event_loop()
+    messages = response.messages
+    while True:
+        for message in messages:
+            await send(message)
+        if len(messages) == 0 or is_last_response_message(messages[-1]):
+            break
+
+        next_messages_task = loop.create_task(response.get_next_messages())
+        done, _ = await asyncio.wait(
+            [next_messages_task, client_disconnection_task],
+            return_when=FIRST_COMPLETED,
+        )
+        if client_disconnection_task in done:
+            next_messages_task.cancel()
+            response.cancel()
+            return DISCONNECT_ERROR_CODE
+        try:
+            messages = await next_messages_task
+        except (RayActorError, RayTaskError):
+            # The response can't be completed, so the connection is closed.
+            logger.exception("Streamed response failed:")
+            client_disconnection_task.cancel()
+            return "500"
+
+    client_disconnection_task.cancel()
+    return str(response.status_code)
+
+
 class LongestPrefixRouter:
     """Router that performs longest prefix matches on incoming routes."""
 
@@ -199,7 +325,14 @@ class HTTPProxy:
         self,
         controller_name: str,
         controller_namespace: str,
+        proxy_actor: Optional[ActorHandle] = None,
     ):
+        # The actor this proxy runs in, which replicas pull streamed request
+        # bodies from. Request bodies are buffered if it's not set.
+        self.proxy_actor = proxy_actor
+        # The streamed request bodies, by stream ID.
+        self.request_body_streams: Dict[str, RequestBodyStream] = dict()
+
         # Set the controller name so that serve will connect to the
         # controller instance this proxy is running in.
         ray.serve.context.set_internal_replica_context(
@@ -265,6 +398,16 @@ class HTTPProxy:
                     return
             await asyncio.sleep(0.2)
 
+    async def receive_request_body(
+        self, stream_id: str
+    ) -> Optional[Tuple[bytes, bool]]:
+        """Returns the next chunks of a streamed request body, with whether
+        there's more body, or None if the client disconnected."""
+        stream = self.request_body_streams.get(stream_id)
+        if stream is None:
+            return None
+        return await stream.get_chunks()
+
     async def _not_found(self, scope, receive, send):
         current_path = scope["path"]
         response = Response(
@@ -309,8 +452,20 @@ class HTTPProxy:
             scope["path"] = route_path.replace(route_prefix, "", 1)
             scope["root_path"] = root_path + route_prefix
 
+        request_body_stream = None
+        if self.proxy_actor is not None and should_stream_request_body(scope):
+            request_body_stream = RequestBodyStream(self.proxy_actor, receive)
+            stream_id = request_body_stream.stream_id
+            self.request_body_streams[stream_id] = request_body_stream
+
         start_time = time.time()
-        status_code = await _send_request_to_handle(handle, scope, receive, send)
+        try:
+            status_code = await _send_request_to_handle(
+                handle, scope, receive, send, request_body_stream
+            )
+        finally:
+            if request_body_stream is not None:
+                del self.request_body_streams[stream_id]
         latency_ms = (time.time() - start_time) * 1000.0
         logger.info(
             access_log_msg(
@@ -354,7 +509,11 @@ class HTTPProxyActor:
 
         self.setup_complete = asyncio.Event()
 
-        self.app = HTTPProxy(controller_name, controller_namespace)
+        self.app = HTTPProxy(
+            controller_name,
+            controller_namespace,
+            proxy_actor=ray.get_runtime_context().current_actor,
+        )
 
         self.wrapped_app = self.app
         for middleware in http_middlewares:
@@ -387,6 +546,11 @@ class HTTPProxyActor:
     ):
         await self.app.block_until_endpoint_exists(endpoint, timeout_s)
 
+    async def receive_request_body(
+        self, stream_id: str
+    ) -> Optional[Tuple[bytes, bool]]:
+        return await self.app.receive_request_body(stream_id)
+
     async def run(self):
         sock = socket.socket()
         if SOCKET_REUSE_PORT_ENABLED:
@@ -4,15 +4,20 @@ from dataclasses import dataclass
 import inspect
 import json
 import logging
-from typing import Any, Dict, Type
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 import starlette.responses
 import starlette.requests
 from starlette.types import Send, ASGIApp
 from fastapi.encoders import jsonable_encoder
 
+from ray.actor import ActorHandle
 from ray.serve.exceptions import RayServeException
-from ray.serve.constants import SERVE_LOGGER_NAME
+from ray.serve.constants import (
+    HTTP_STREAM_BUFFER_SIZE,
+    HTTP_STREAM_IDLE_TIMEOUT_S,
+    SERVE_LOGGER_NAME,
+)
 
 
 logger = logging.getLogger(SERVE_LOGGER_NAME)
@@ -22,14 +27,22 @@ logger = logging.getLogger(SERVE_LOGGER_NAME)
 class HTTPRequestWrapper:
     scope: Dict[Any, Any]
     body: bytes
+    # The HTTP proxy actor and the ID of the stream to pull the body from if
+    # the body is streamed, in which case `body` is empty.
+    body_stream: Optional[Tuple[ActorHandle, str]] = None
 
 
-def build_starlette_request(scope, serialized_body: bytes):
+def build_starlette_request(
+    scope, serialized_body: bytes, body_stream: Optional[Tuple[ActorHandle, str]] = None
+):
     """Build and return a Starlette Request from ASGI payload.
 
     This function is intended to be used immediately before task invocation
-    happens.
+    happens. If body_stream is passed in, the body is pulled from the HTTP
+    proxy in chunks as the request reads it.
     """
+    if body_stream is not None:
+        return starlette.requests.Request(scope, _make_streaming_receive(*body_stream))
 
     # Simulates receiving HTTP body from TCP socket.  In reality, the body has
     # already been streamed in chunks and stored in serialized_body.
@@ -51,6 +64,28 @@ def build_starlette_request(scope, serialized_body: bytes):
     return starlette.requests.Request(scope, mock_receive)
 
 
+def _make_streaming_receive(proxy_actor: ActorHandle, stream_id: str):
+    received = False
+
+    async def streaming_receive():
+        nonlocal received
+
+        # Same as in build_starlette_request once the body has been received.
+        if received:
+            block_forever = asyncio.Event()
+            await block_forever.wait()
+
+        chunk = await proxy_actor.receive_request_body.remote(stream_id)
+        if chunk is None:
+            received = True
+            return {"type": "http.disconnect"}
+        body, more_body = chunk
+        received = not more_body
+        return {"body": body, "type": "http.request", "more_body": more_body}
+
+    return streaming_receive
+
+
 class Response:
     """ASGI compliant response class.
 
@@ -159,6 +194,134 @@ class ASGIHTTPSender(Send):
         return RawASGIResponse(self.messages)
 
 
+class ASGIAppResponse(ASGIApp):
+    """Defers running an ASGI app on a request until the response is sent.
+
+    This lets the replica stream the response of the app to the HTTP proxy
+    instead of buffering it.
+    """
+
+    def __init__(self, app: ASGIApp, scope, receive):
+        self.app = app
+        self.scope = scope
+        self.receive = receive
+
+    async def __call__(self, _scope, _receive, send):
+        await self.app(self.scope, self.receive, send)
+
+
+def is_last_response_message(message: Dict[str, Any]) -> bool:
+    """Returns whether the ASGI message completes the HTTP response."""
+    return message["type"] == "http.response.body" and not message.get(
+        "more_body", False
+    )
+
+
+class ResponseStream:
+    """Runs an ASGI response in the background on a replica, buffering its
+    messages until the HTTP proxy pulls them.
+
+    The buffer holds HTTP_STREAM_BUFFER_SIZE messages, so the response is only
+    computed as fast as the client reads it. A response that isn't read for
+    HTTP_STREAM_IDLE_TIMEOUT_S is cancelled.
+    """
+
+    def __init__(self, response: ASGIApp):
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=HTTP_STREAM_BUFFER_SIZE)
+        self._started = False
+        self._complete = False
+        self._error: Optional[Exception] = None
+        self.task = asyncio.get_event_loop().create_task(self._run(response))
+
+    async def _run(self, response: ASGIApp):
+        async def receive():
+            # Starlette polls for a disconnect while streaming. The HTTP proxy
+            # cancels the stream when the client disconnects instead.
+            block_forever = asyncio.Event()
+            await block_forever.wait()
+
+        try:
+            await response(None, receive, self._send)
+        except Exception as e:
+            if self._started:
+                logger.exception("Streamed HTTP response failed:")
+            else:
+                self._error = e
+
+        # Mark the end of the response.
+        try:
+            await asyncio.wait_for(self._queue.put(None), HTTP_STREAM_IDLE_TIMEOUT_S)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _send(self, message: Dict[str, Any]):
+        self._started = True
+        await asyncio.wait_for(self._queue.put(message), HTTP_STREAM_IDLE_TIMEOUT_S)
+
+    async def get_messages(self) -> List[Dict[str, Any]]:
+        """Waits for the next messages of the response and returns them.
+
+        Returns an empty list once the response is complete.
+        """
+        messages = []
+        while not self._complete:
+            if messages and self._queue.empty():
+                break
+            message = await self._queue.get()
+            if message is None:
+                self._complete = True
+            else:
+                messages.append(message)
+        return messages
+
+    async def get_first_messages(self) -> List[Dict[str, Any]]:
+        """Waits for the response to start and returns its messages up to the
+        first body chunk.
+
+        Raises the error of the response if it failed before starting.
+        """
+        messages = []
+        while not any(m["type"] == "http.response.body" for m in messages):
+            new_messages = await self.get_messages()
+            if not new_messages:
+                break
+            messages.extend(new_messages)
+        if not messages:
+            if self._error is not None:
+                raise self._error
+            raise RayServeException("The HTTP response ended before it started.")
+        return messages
+
+    def cancel(self):
+        self.task.cancel()
+
+
+class StreamingASGIResponse:
+    """The start of an HTTP response that a replica streams to the HTTP proxy.
+
+    The proxy sends the first messages and then pulls the rest from the
+    replica until the response is complete.
+    """
+
+    def __init__(
+        self, replica: ActorHandle, stream_id: str, messages: List[Dict[str, Any]]
+    ):
+        self.replica = replica
+        self.stream_id = stream_id
+        self.messages = messages
+
+    @property
+    def status_code(self):
+        return self.messages[0]["status"]
+
+    async def get_next_messages(self) -> List[Dict[str, Any]]:
+        """Returns the next messages, or an empty list if the response ended."""
+        return await self.replica.get_response_stream_messages.remote(self.stream_id)
+
+    def cancel(self):
+        self.replica.cancel_response_stream.remote(self.stream_id)
+
+
 def make_fastapi_class_based_view(fastapi_app, cls: Type) -> None:
     """Transform the `cls`'s methods and class annotations to FastAPI routes.
 
@@ -3,10 +3,11 @@ import asyncio
 from importlib import import_module
 import inspect
 import logging
+import math
 import os
 import pickle
 import time
-from typing import Any, Callable, Optional, Tuple, Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import starlette.responses
 
@@ -17,21 +18,38 @@ from ray.remote_function import RemoteFunction
 from ray.util import metrics
 from ray._private.async_compat import sync_to_async
 
-from ray.serve.autoscaling_metrics import start_metrics_pusher
+from ray.serve.autoscaling_metrics import (
+    get_latency_metric_key,
+    get_request_rate_metric_key,
+    start_metrics_pusher,
+)
 from ray.serve.common import HEALTH_CHECK_CONCURRENCY_GROUP, ReplicaTag
 from ray.serve.config import DeploymentConfig
 from ray.serve.constants import (
     HEALTH_CHECK_METHOD,
     RECONFIGURE_METHOD,
     DEFAULT_LATENCY_BUCKET_MS,
+    HTTP_STREAM_IDLE_TIMEOUT_S,
     SERVE_LOGGER_NAME,
 )
 from ray.serve.deployment import Deployment
 from ray.serve.exceptions import RayServeException
-from ray.serve.http_util import ASGIHTTPSender
+from ray.serve.http_util import (
+    ASGIAppResponse,
+    ASGIHTTPSender,
+    RawASGIResponse,
+    ResponseStream,
+    StreamingASGIResponse,
+    is_last_response_message,
+)
 from ray.serve.logging_utils import access_log_msg, configure_component_logger
 from ray.serve.router import Query, RequestMetadata
-from ray.serve.utils import parse_import_path, parse_request_item, wrap_to_ray_error
+from ray.serve.utils import (
+    get_random_letters,
+    parse_import_path,
+    parse_request_item,
+    wrap_to_ray_error,
+)
 from ray.serve.version import DeploymentVersion
 
 logger = logging.getLogger(SERVE_LOGGER_NAME)
@@ -177,6 +195,14 @@ def create_replica_wrapper(name: str):
             query = Query(request_args, request_kwargs, request_metadata)
             return await self.replica.handle_request(query)
 
+        async def get_response_stream_messages(
+            self, stream_id: str
+        ) -> List[Dict[str, Any]]:
+            return await self.replica.get_response_stream_messages(stream_id)
+
+        def cancel_response_stream(self, stream_id: str):
+            self.replica.cancel_response_stream(stream_id)
+
         async def is_allocated(self) -> str:
             """poke the replica to check whether it's alive.
 
@@ -239,6 +265,8 @@ class RayServeReplica:
         self.user_config = user_config
         self.version = version
         self.rwlock = aiorwlock.RWLock()
+        # The HTTP responses being streamed to the HTTP proxy, by stream ID.
+        self._response_streams: Dict[str, ResponseStream] = dict()
 
         user_health_check = getattr(_callable, HEALTH_CHECK_METHOD, None)
         if not callable(user_health_check):
@@ -306,6 +334,14 @@ class RayServeReplica:
 
         self._shutdown_wait_loop_s = deployment_config.graceful_shutdown_wait_loop_s
 
+        # The latencies of the requests completed and the number of requests
+        # received since the autoscaling metrics were last collected.
+        self._track_request_stats = deployment_config.autoscaling_config is not None
+        self._recent_latencies_s: List[float] = []
+        self._num_requests_received = 0
+        self._last_num_requests_received = 0
+        self._last_metrics_collection_time = time.time()
+
         if deployment_config.autoscaling_config:
             process_remote_func = controller_handle.record_autoscaling_metrics.remote
             config = deployment_config.autoscaling_config
@@ -344,8 +380,30 @@ class RayServeReplica:
         num_inflight_requests = 0
         if method_stat is not None:
             num_inflight_requests = method_stat["pending"] + method_stat["running"]
-
-        return {self.replica_tag: num_inflight_requests}
+        # handle_request() returns after the first chunk of a streamed response,
+        # so count the open streams as ongoing requests too.
+        num_inflight_requests += len(self._response_streams)
+
+        now = time.time()
+        num_requests_received = self._num_requests_received
+        request_rate = (num_requests_received - self._last_num_requests_received) / max(
+            now - self._last_metrics_collection_time, 1e-3
+        )
+        self._last_num_requests_received = num_requests_received
+        self._last_metrics_collection_time = now
+        # Swap the list, since requests append to it concurrently.
+        latencies_s, self._recent_latencies_s = self._recent_latencies_s, []
+
+        data = {
+            self.replica_tag: num_inflight_requests,
+            get_request_rate_metric_key(self.replica_tag): request_rate,
+        }
+        if latencies_s:
+            latencies_s.sort()
+            data[get_latency_metric_key(self.replica_tag)] = latencies_s[
+                math.ceil(0.95 * len(latencies_s)) - 1
+            ]
+        return data
 
     def get_runner_method(self, request_item: Query) -> Callable:
         method_name = request_item.metadata.call_method
@@ -369,7 +427,27 @@ class RayServeReplica:
             return self.callable
         return getattr(self.callable, method_name)
 
-    async def ensure_serializable_response(self, response: Any) -> Any:
+    async def ensure_serializable_response(
+        self, response: Any, stream_http_response: bool = False
+    ) -> Any:
+        """Converts responses that can't be serialized as is.
+
+        If stream_http_response is set, generators and streaming responses are
+        streamed to the HTTP proxy instead of being buffered.
+        """
+        if stream_http_response:
+            if inspect.isgenerator(response) or inspect.isasyncgen(response):
+                response = starlette.responses.StreamingResponse(response)
+            if isinstance(
+                response, (starlette.responses.StreamingResponse, ASGIAppResponse)
+            ):
+                return await self._start_response_stream(response)
+
+        if isinstance(response, ASGIAppResponse):
+            sender = ASGIHTTPSender()
+            await response(None, None, sender)
+            return sender.build_asgi_response()
+
         if isinstance(response, starlette.responses.StreamingResponse):
 
             async def mock_receive():
@@ -384,6 +462,45 @@ class RayServeReplica:
             return sender.build_asgi_response()
         return response
 
+    async def _start_response_stream(self, response: Any) -> Any:
+        stream = ResponseStream(response)
+        messages = await stream.get_first_messages()
+        if is_last_response_message(messages[-1]):
+            # The whole response is already available.
+            return RawASGIResponse(messages)
+
+        stream_id = get_random_letters(16)
+        self._response_streams[stream_id] = stream
+
+        def drop_stream(_):
+            # Drop the stream if the proxy never reads its end.
+            asyncio.get_event_loop().call_later(
+                HTTP_STREAM_IDLE_TIMEOUT_S, self._response_streams.pop, stream_id, None
+            )
+
+        stream.task.add_done_callback(drop_stream)
+        return StreamingASGIResponse(
+            ray.get_runtime_context().current_actor, stream_id, messages
+        )
+
+    async def get_response_stream_messages(
+        self, stream_id: str
+    ) -> List[Dict[str, Any]]:
+        """Returns the next messages of a streamed HTTP response, or an empty
+        list once the response is complete."""
+        stream = self._response_streams.get(stream_id)
+        if stream is None:
+            return []
+        messages = await stream.get_messages()
+        if len(messages) == 0 or is_last_response_message(messages[-1]):
+            self._response_streams.pop(stream_id, None)
+        return messages
+
+    def cancel_response_stream(self, stream_id: str):
+        stream = self._response_streams.pop(stream_id, None)
+        if stream is not None:
+            stream.cancel()
+
     async def invoke_single(self, request_item: Query) -> Tuple[Any, bool]:
         """Executes the provided request on this replica.
 
@@ -419,7 +536,9 @@ class RayServeReplica:
                     # call with non-empty args
                     result = await method_to_call(*args, **kwargs)
 
-            result = await self.ensure_serializable_response(result)
+            result = await self.ensure_serializable_response(
+                result, stream_http_response=request_item.metadata.http_arg_is_pickled
+            )
             self.request_counter.inc()
         except Exception as e:
             logger.exception(f"Request failed due to {type(e).__name__}:")
@@ -461,10 +580,14 @@ class RayServeReplica:
             self.num_processing_items.set(num_running_requests)
 
             start_time = time.time()
+            if self._track_request_stats:
+                self._num_requests_received += 1
             result, success = await self.invoke_single(request)
             latency_ms = (time.time() - start_time) * 1000
 
             self.processing_latency_tracker.observe(latency_ms)
+            if self._track_request_stats:
+                self._recent_latencies_s.append(latency_ms / 1000)
 
             logger.info(
                 access_log_msg(
@@ -492,8 +615,12 @@ class RayServeReplica:
             # The handle_request method wasn't even invoked.
             if method_stat is None:
                 break
-            # The handle_request method has 0 inflight requests.
-            if method_stat["running"] + method_stat["pending"] == 0:
+            # The handle_request method has 0 inflight requests and all the
+            # streamed responses have completed.
+            if (
+                method_stat["running"] + method_stat["pending"] == 0
+                and len(self._response_streams) == 0
+            ):
                 break
             else:
                 logger.info(
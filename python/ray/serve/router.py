@@ -1,11 +1,13 @@
 import asyncio
+from collections import deque
 from dataclasses import dataclass
+import functools
 import itertools
 import logging
 import pickle
 import random
-import sys
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
 
 import ray
 from ray.actor import ActorHandle
@@ -37,6 +39,138 @@ class Query:
     metadata: RequestMetadata
 
 
+class ReplicaSchedulingPolicy:
+    """Chooses the replicas that queries are assigned to.
+
+    The replica set tries the replicas in the order ranked by the policy, and
+    assigns each query to the first one below its max_concurrent_queries.
+    """
+
+    def update_replicas(self, replicas: List[RunningReplicaInfo]):
+        """Called with the running replicas whenever they change."""
+        raise NotImplementedError
+
+    def rank_replicas(
+        self,
+        query: Query,
+        num_in_flight: Callable[[RunningReplicaInfo], int],
+    ) -> Iterator[RunningReplicaInfo]:
+        """Yield the replicas to try to assign the query to, best first.
+
+        The policy should eventually yield every replica, so that a query is only
+        queued when all of the replicas are busy.
+
+        Args:
+            query: The query to assign.
+            num_in_flight: Returns the number of in-flight queries of a replica.
+        """
+        raise NotImplementedError
+
+    def on_query_completed(self, replica: RunningReplicaInfo, latency_s: float):
+        """Called with the latency of each query completed by a replica."""
+        pass
+
+
+class RoundRobinReplicaSchedulingPolicy(ReplicaSchedulingPolicy):
+    """Tries the replicas in a round-robin order, shuffled per client."""
+
+    def __init__(self):
+        self.replica_iterator = itertools.cycle([])
+        self.num_replicas = 0
+
+    def update_replicas(self, replicas: List[RunningReplicaInfo]):
+        # Shuffle the replicas to avoid synchronization across clients.
+        replicas = list(replicas)
+        random.shuffle(replicas)
+        self.replica_iterator = itertools.cycle(replicas)
+        self.num_replicas = len(replicas)
+
+    def rank_replicas(
+        self,
+        query: Query,
+        num_in_flight: Callable[[RunningReplicaInfo], int],
+    ) -> Iterator[RunningReplicaInfo]:
+        for _ in range(self.num_replicas):
+            yield next(self.replica_iterator)
+
+
+class PowerOfTwoChoicesReplicaSchedulingPolicy(ReplicaSchedulingPolicy):
+    """Picks the better of two random replicas, preferring the local node.
+
+    Each replica is scored by its number of in-flight queries weighted by an
+    exponentially weighted moving average of its query latency, so that a slow
+    replica gets fewer queries than a fast one at the same load. Comparing two
+    random replicas instead of all of them avoids herding all clients onto the
+    same least loaded replica.
+
+    If any replicas run on the same node as the caller, the two choices are
+    sampled from those first, which avoids a network hop. Remote replicas are
+    only tried once both local choices are at their max_concurrent_queries.
+    """
+
+    def __init__(
+        self,
+        prefer_local_node: bool = True,
+        latency_ewma_alpha: float = 0.1,
+        node_id: Optional[str] = None,
+    ):
+        self.prefer_local_node = prefer_local_node
+        self.latency_ewma_alpha = latency_ewma_alpha
+        if node_id is None and prefer_local_node:
+            node_id = ray.get_runtime_context().node_id.hex()
+        self.node_id = node_id
+        self.replicas: List[RunningReplicaInfo] = []
+        self.local_replicas: List[RunningReplicaInfo] = []
+        self.latency_ewma: Dict[RunningReplicaInfo, float] = {}
+
+    def update_replicas(self, replicas: List[RunningReplicaInfo]):
+        self.replicas = list(replicas)
+        self.local_replicas = [r for r in replicas if r.node_id == self.node_id]
+        self.latency_ewma = {
+            r: latency for r, latency in self.latency_ewma.items() if r in replicas
+        }
+
+    def rank_replicas(
+        self,
+        query: Query,
+        num_in_flight: Callable[[RunningReplicaInfo], int],
+    ) -> Iterator[RunningReplicaInfo]:
+        tried = set()
+        pools = [self.replicas]
+        if self.prefer_local_node and self.local_replicas:
+            pools.insert(0, self.local_replicas)
+        for pool in pools:
+            candidates = [r for r in pool if r not in tried]
+            choices = random.sample(candidates, min(2, len(candidates)))
+            choices.sort(key=lambda r: self._score(r, num_in_flight(r)))
+            for replica in choices:
+                tried.add(replica)
+                yield replica
+        # Fall back to the other replicas if both choices are busy.
+        rest = [r for r in self.replicas if r not in tried]
+        random.shuffle(rest)
+        yield from rest
+
+    def on_query_completed(self, replica: RunningReplicaInfo, latency_s: float):
+        if replica not in self.latency_ewma:
+            self.latency_ewma[replica] = latency_s
+        else:
+            self.latency_ewma[replica] += self.latency_ewma_alpha * (
+                latency_s - self.latency_ewma[replica]
+            )
+
+    def _score(self, replica: RunningReplicaInfo, num_in_flight: int) -> float:
+        latency = self.latency_ewma.get(replica)
+        if latency is None:
+            # Replicas without completed queries yet are assumed to be as fast as
+            # the average replica, so that they still get queries.
+            if self.latency_ewma:
+                latency = sum(self.latency_ewma.values()) / len(self.latency_ewma)
+            else:
+                latency = 1.0
+        return (num_in_flight + 1) * latency
+
+
 class ReplicaSet:
     """Data structure representing a set of replica actor handles"""
 
@@ -44,27 +178,24 @@ class ReplicaSet:
         self,
         deployment_name,
         event_loop: asyncio.AbstractEventLoop,
+        scheduling_policy: Optional[ReplicaSchedulingPolicy] = None,
     ):
         self.deployment_name = deployment_name
-        self.in_flight_queries: Dict[RunningReplicaInfo, set] = dict()
-        # The iterator used for load balancing among replicas. Using itertools
-        # cycle, we implements a round-robin policy, skipping overloaded
-        # replicas.
-        # NOTE(simon): We can make this more pluggable and consider different
-        # policies like: min load, pick min of two replicas, pick replicas on
-        # the same node.
-        self.replica_iterator = itertools.cycle(self.in_flight_queries.keys())
-
-        # Used to unblock this replica set waiting for free replicas. A newly
-        # added replica or updated max_concurrent_queries value means the
-        # query that waits on a free replica might be unblocked on.
-
-        # Python 3.8 has deprecated the 'loop' parameter, and Python 3.10 has
-        # removed it alltogether. Call accordingly.
-        if sys.version_info.major >= 3 and sys.version_info.minor >= 10:
-            self.config_updated_event = asyncio.Event()
-        else:
-            self.config_updated_event = asyncio.Event(loop=event_loop)
+        self._event_loop = event_loop
+        # The tracker refs of the in-flight queries of each replica, and the times
+        # they were assigned. Queries are removed by a callback when they
+        # complete, so the counts are always up to date.
+        self.in_flight_queries: Dict[
+            RunningReplicaInfo, Dict[ray.ObjectRef, float]
+        ] = dict()
+        if scheduling_policy is None:
+            scheduling_policy = PowerOfTwoChoicesReplicaSchedulingPolicy()
+        self.scheduling_policy = scheduling_policy
+
+        # The futures of the queries waiting for a free replica, in FIFO order.
+        # A completed query wakes up the first waiter, and a newly added
+        # replica or updated max_concurrent_queries value wakes up all of them.
+        self._waiters: Deque[asyncio.Future] = deque()
 
         self.num_queued_queries = 0
         self.num_queued_queries_gauge = metrics.Gauge(
@@ -85,27 +216,27 @@ class ReplicaSet:
         )
 
         for new_replica in added:
-            self.in_flight_queries[new_replica] = set()
+            self.in_flight_queries[new_replica] = dict()
 
         for removed_replica in removed:
             # Delete it directly because shutdown is processed by controller.
             del self.in_flight_queries[removed_replica]
 
         if len(added) > 0 or len(removed) > 0:
-            # Shuffle the keys to avoid synchronization across clients.
-            replicas = list(self.in_flight_queries.keys())
-            random.shuffle(replicas)
-            self.replica_iterator = itertools.cycle(replicas)
+            self.scheduling_policy.update_replicas(list(self.in_flight_queries.keys()))
             logger.debug(f"ReplicaSet: +{len(added)}, -{len(removed)} replicas.")
-            self.config_updated_event.set()
+            self._wake_waiters(len(self._waiters))
 
     def _try_assign_replica(self, query: Query) -> Optional[ray.ObjectRef]:
         """Try to assign query to a replica, return the object ref if succeeded
         or return None if it can't assign this query to any replicas.
         """
-        for _ in range(len(self.in_flight_queries.keys())):
-            replica = next(self.replica_iterator)
-            if len(self.in_flight_queries[replica]) >= replica.max_concurrent_queries:
+
+        def num_in_flight(replica: RunningReplicaInfo) -> int:
+            return len(self.in_flight_queries[replica])
+
+        for replica in self.scheduling_policy.rank_replicas(query, num_in_flight):
+            if num_in_flight(replica) >= replica.max_concurrent_queries:
                 # This replica is overloaded, try next one
                 continue
 
@@ -117,20 +248,39 @@ class ReplicaSet:
             tracker_ref, user_ref = replica.actor_handle.handle_request.remote(
                 pickle.dumps(query.metadata), *query.args, **query.kwargs
             )
-            self.in_flight_queries[replica].add(tracker_ref)
+            self.in_flight_queries[replica][tracker_ref] = time.time()
+            # The future calls back in the event loop when the query completes.
+            asyncio.wrap_future(
+                tracker_ref.future(), loop=self._event_loop
+            ).add_done_callback(
+                functools.partial(self._on_query_completed, replica, tracker_ref)
+            )
             return user_ref
         return None
 
-    @property
-    def _all_query_refs(self):
-        return list(itertools.chain.from_iterable(self.in_flight_queries.values()))
+    def _on_query_completed(
+        self,
+        replica: RunningReplicaInfo,
+        tracker_ref: ray.ObjectRef,
+        future: asyncio.Future,
+    ):
+        if not future.cancelled():
+            # Retrieve any error, which is surfaced to the caller by the user ref.
+            future.exception()
+        queries = self.in_flight_queries.get(replica)
+        if queries is None or tracker_ref not in queries:
+            # The replica was removed.
+            return
+        start = queries.pop(tracker_ref)
+        self.scheduling_policy.on_query_completed(replica, time.time() - start)
+        self._wake_waiters(1)
 
-    def _drain_completed_object_refs(self) -> int:
-        refs = self._all_query_refs
-        done, _ = ray.wait(refs, num_returns=len(refs), timeout=0)
-        for replica_in_flight_queries in self.in_flight_queries.values():
-            replica_in_flight_queries.difference_update(done)
-        return len(done)
+    def _wake_waiters(self, num_waiters: int):
+        while num_waiters > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                num_waiters -= 1
 
     async def assign_replica(self, query: Query) -> ray.ObjectRef:
         """Given a query, submit it to a replica and return the object ref.
@@ -143,31 +293,35 @@ class ReplicaSet:
         self.num_queued_queries_gauge.set(
             self.num_queued_queries, tags={"endpoint": endpoint}
         )
-        assigned_ref = self._try_assign_replica(query)
-        while assigned_ref is None:  # Can't assign a replica right now.
-            logger.debug(
-                "Failed to assign a replica for " f"query {query.metadata.request_id}"
-            )
-            # Maybe there exists a free replica, we just need to refresh our
-            # query tracker.
-            num_finished = self._drain_completed_object_refs()
-            # All replicas are really busy, wait for a query to complete or the
-            # config to be updated.
-            if num_finished == 0:
-                logger.debug("All replicas are busy, waiting for a free replica.")
-                await asyncio.wait(
-                    self._all_query_refs + [self.config_updated_event.wait()],
-                    return_when=asyncio.FIRST_COMPLETED,
-                )
-                if self.config_updated_event.is_set():
-                    self.config_updated_event.clear()
-            # We are pretty sure a free replica is ready now, let's recurse and
-            # assign this query a replica.
+        try:
             assigned_ref = self._try_assign_replica(query)
-        self.num_queued_queries -= 1
-        self.num_queued_queries_gauge.set(
-            self.num_queued_queries, tags={"endpoint": endpoint}
-        )
+            retry = False
+            while assigned_ref is None:  # Can't assign a replica right now.
+                logger.debug(
+                    "All replicas are busy, waiting for a free replica for "
+                    f"query {query.metadata.request_id}."
+                )
+                waiter = self._event_loop.create_future()
+                if retry:
+                    # A query that was woken up but lost the free replica to a
+                    # new query keeps its place at the front of the queue.
+                    self._waiters.appendleft(waiter)
+                else:
+                    self._waiters.append(waiter)
+                try:
+                    await waiter
+                except asyncio.CancelledError:
+                    if waiter.done() and not waiter.cancelled():
+                        # Pass on the wake-up this query won't use.
+                        self._wake_waiters(1)
+                    raise
+                retry = True
+                assigned_ref = self._try_assign_replica(query)
+        finally:
+            self.num_queued_queries -= 1
+            self.num_queued_queries_gauge.set(
+                self.num_queued_queries, tags={"endpoint": endpoint}
+            )
         return assigned_ref
 
 
@@ -177,14 +331,17 @@ class Router:
         controller_handle: ActorHandle,
         deployment_name: str,
         event_loop: asyncio.BaseEventLoop = None,
+        scheduling_policy: Optional[ReplicaSchedulingPolicy] = None,
     ):
         """Router process incoming queries: assign a replica.
 
         Args:
             controller_handle(ActorHandle): The controller handle.
+            scheduling_policy(ReplicaSchedulingPolicy): The policy choosing the
+                replica of each query. Defaults to power-of-two-choices.
         """
         self._event_loop = event_loop
-        self._replica_set = ReplicaSet(deployment_name, event_loop)
+        self._replica_set = ReplicaSet(deployment_name, event_loop, scheduling_policy)
 
         # -- Metrics Registration -- #
         self.num_router_requests = metrics.Counter(
@@ -323,6 +323,67 @@ def test_starlette_request(serve_instance):
     assert resp == long_string
 
 
+@pytest.mark.parametrize("use_async", [False, True])
+def test_streaming_generator_response(serve_instance, use_async):
+    signal = SignalActor.remote()
+
+    if use_async:
+
+        @serve.deployment(name="stream")
+        def stream(_):
+            async def numbers():
+                yield "1"
+                await signal.wait.remote()
+                yield "2"
+
+            return numbers()
+
+    else:
+
+        @serve.deployment(name="stream")
+        def stream(_):
+            yield "1"
+            ray.get(signal.wait.remote())
+            yield "2"
+
+    stream.deploy()
+
+    # The first chunk arrives before the generator completes.
+    resp = requests.get("http://127.0.0.1:8000/stream", stream=True)
+    chunks = resp.iter_content(chunk_size=None, decode_unicode=True)
+    assert resp.headers["transfer-encoding"] == "chunked"
+    assert next(chunks) == "1"
+    ray.get(signal.send.remote())
+    assert "".join(chunks) == "2"
+
+
+def test_streaming_request_body(serve_instance):
+    @serve.deployment(name="api")
+    async def count_body(starlette_request):
+        num_chunks = 0
+        num_bytes = 0
+        async for chunk in starlette_request.stream():
+            num_chunks += 1
+            num_bytes += len(chunk)
+        return {"num_chunks": num_chunks, "num_bytes": num_bytes}
+
+    count_body.deploy()
+
+    def body_chunks():
+        for _ in range(10):
+            yield b"x" * 1024
+
+    # Chunked request bodies are streamed to the replica.
+    resp = requests.post("http://127.0.0.1:8000/api", data=body_chunks()).json()
+    assert resp["num_bytes"] == 10 * 1024
+
+    # Large request bodies are streamed to the replica.
+    long_string = "x" * 4 * 1024 * 1024
+    resp = requests.post("http://127.0.0.1:8000/api", data=long_string).json()
+    assert resp["num_bytes"] == len(long_string)
+    assert resp["num_chunks"] > 1
+
+
 def test_start_idempotent(serve_instance):
     @serve.deployment(name="start")
     def func(*args):
@@ -9,7 +9,11 @@ from typing import List, Iterable
 from ray._private.test_utils import SignalActor, wait_for_condition
 from ray.serve.autoscaling_policy import (
     BasicAutoscalingPolicy,
+    PredictiveAutoscalingPolicy,
     calculate_desired_num_replicas,
+    calculate_predictive_num_replicas,
+    forecast_request_rate,
+    make_autoscaling_policy,
 )
 from ray.serve.common import DeploymentInfo
 from ray.serve.deployment_state import ReplicaState
@@ -95,6 +99,151 @@ class TestCalculateDesiredNumReplicas:
         assert 5 <= desired_num_replicas <= 8  # 10 + 0.5 * (2.5 - 10) = 6.25
 
 
+class TestCalculatePredictiveNumReplicas:
+    def test_handle_queued_queries(self):
+        config = AutoscalingConfig(
+            min_replicas=0, max_replicas=100, target_num_ongoing_requests_per_replica=1
+        )
+        desired_num_replicas = calculate_predictive_num_replicas(
+            config, [1.0] * 10, current_handle_queued_queries=10
+        )
+        assert desired_num_replicas == 20
+
+    def test_forecast_request_rate(self):
+        config = AutoscalingConfig(
+            min_replicas=0, max_replicas=100, target_num_ongoing_requests_per_replica=1
+        )
+        # The load grows with the request rate.
+        desired_num_replicas = calculate_predictive_num_replicas(
+            config,
+            [1.0] * 10,
+            current_handle_queued_queries=0,
+            current_request_rate=100,
+            forecast_request_rate=300,
+        )
+        assert desired_num_replicas == 30
+
+        desired_num_replicas = calculate_predictive_num_replicas(
+            config,
+            [1.0] * 10,
+            current_handle_queued_queries=0,
+            current_request_rate=100,
+            forecast_request_rate=50,
+        )
+        assert desired_num_replicas == 5
+
+    def test_target_latency(self):
+        config = AutoscalingConfig(
+            min_replicas=0,
+            max_replicas=100,
+            target_num_ongoing_requests_per_replica=1,
+            target_latency_s=0.1,
+        )
+        desired_num_replicas = calculate_predictive_num_replicas(
+            config,
+            [1.5] * 10,
+            current_handle_queued_queries=0,
+            current_p95_latency_s=0.2,
+        )
+        assert desired_num_replicas == 20
+
+        # A latency over the target at the target number of ongoing requests is
+        # intrinsic to the model, so it doesn't scale up.
+        desired_num_replicas = calculate_predictive_num_replicas(
+            config,
+            [1.0] * 10,
+            current_handle_queued_queries=0,
+            current_p95_latency_s=0.2,
+        )
+        assert desired_num_replicas == 10
+
+        # A latency under the target doesn't scale down.
+        desired_num_replicas = calculate_predictive_num_replicas(
+            config,
+            [1.5] * 10,
+            current_handle_queued_queries=0,
+            current_p95_latency_s=0.01,
+        )
+        assert desired_num_replicas == 15
+
+    def test_bounds_checking(self):
+        config = AutoscalingConfig(
+            min_replicas=5, max_replicas=15, target_num_ongoing_requests_per_replica=1
+        )
+        desired_num_replicas = calculate_predictive_num_replicas(
+            config, [10.0] * 10, current_handle_queued_queries=100
+        )
+        assert desired_num_replicas == 15
+
+        desired_num_replicas = calculate_predictive_num_replicas(
+            config, [0.0] * 10, current_handle_queued_queries=0
+        )
+        assert desired_num_replicas == 5
+
+
+def test_forecast_request_rate():
+    assert forecast_request_rate([], horizon_s=10) is None
+    assert forecast_request_rate([(0, 5.0)], horizon_s=10) == 5.0
+
+    # The rate grows by 1 per second.
+    history = [(t, 10.0 + t) for t in range(10)]
+    assert forecast_request_rate(history, horizon_s=10) == pytest.approx(29)
+
+    # The forecast rate can't be negative.
+    history = [(t, 10.0 - t) for t in range(10)]
+    assert forecast_request_rate(history, horizon_s=10) == 0
+
+
+def test_make_autoscaling_policy():
+    assert isinstance(
+        make_autoscaling_policy(AutoscalingConfig()), BasicAutoscalingPolicy
+    )
+    assert isinstance(
+        make_autoscaling_policy(AutoscalingConfig(policy="predictive")),
+        PredictiveAutoscalingPolicy,
+    )
+    with pytest.raises(ValueError):
+        AutoscalingConfig(policy="unknown")
+
+
+def test_predictive_scale_up_before_spike():
+    """The predictive policy scales up for a growing request rate."""
+    config = AutoscalingConfig(
+        min_replicas=1,
+        max_replicas=10,
+        target_num_ongoing_requests_per_replica=1,
+        upscale_delay_s=0,
+        look_back_period_s=10,
+        forecast_horizon_s=10,
+        policy="predictive",
+    )
+    policy = make_autoscaling_policy(config)
+    basic_policy = BasicAutoscalingPolicy(config)
+
+    # The request rate almost doubles over 10 seconds, while the replicas still keep
+    # up with the target number of ongoing requests.
+    with mock.patch("time.time") as mock_time:
+        for t in range(10):
+            mock_time.return_value = t
+            new_num_replicas = policy.get_decision_num_replicas(
+                curr_target_num_replicas=2,
+                current_num_ongoing_requests=[1, 1],
+                current_handle_queued_queries=0,
+                current_request_rate=10 + t,
+            )
+
+    assert new_num_replicas > 2
+    assert (
+        basic_policy.get_decision_num_replicas(
+            curr_target_num_replicas=2,
+            current_num_ongoing_requests=[1, 1],
+            current_handle_queued_queries=0,
+            current_request_rate=19,
+        )
+        == 2
+    )
+
+
 def get_running_replicas(controller: ServeController, deployment: Deployment) -> List:
     """Get the replicas currently running for given deployment"""
     replicas = ray.get(
@@ -4,6 +4,7 @@ import pytest
 
 import ray
 from ray import serve
+from ray.serve.batching import _AdaptiveBatchTuner
 
 
 def test_batching(serve_instance):
@@ -133,6 +134,25 @@ async def test_decorator_validation():
             async def method(self, requests):
                 pass
 
+    class LatencySLO:
+        @serve.batch(latency_slo_s=0.1)
+        async def method(self, requests):
+            pass
+
+    with pytest.raises(ValueError):
+
+        class ZeroLatencySLO:
+            @serve.batch(latency_slo_s=0)
+            async def method(self, requests):
+                pass
+
+    with pytest.raises(TypeError):
+
+        class NonLatencySLO:
+            @serve.batch(latency_slo_s="a")
+            async def method(self, requests):
+                pass
+
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize("use_class", [True, False])
@@ -292,6 +312,48 @@ async def test_batch_args_kwargs(mode, use_class):
     assert result == [("hi1", "hi2"), ("hi3", "hi4")]
 
 
+def test_adaptive_batch_tuner():
+    tuner = _AdaptiveBatchTuner(max_batch_size=16, max_timeout_s=0.1, latency_slo_s=1)
+    assert tuner.batch_size == 1
+    assert tuner.timeout_s == 0
+
+    # Requests arrive every 10ms.
+    for i in range(100):
+        tuner.record_arrival(i * 0.01)
+
+    # Full batches well within the SLO grow the batch size up to the max.
+    for _ in range(20):
+        tuner.record_batch(tuner.batch_size, queue_wait_s=0.1, execution_s=0.1)
+    assert tuner.batch_size == 16
+    # The timeout is capped by the max timeout instead of the fill time.
+    assert tuner.timeout_s == pytest.approx(0.1)
+
+    # Partial batches don't grow the batch size.
+    tuner.batch_size = 4
+    tuner.record_batch(2, queue_wait_s=0.1, execution_s=0.1)
+    assert tuner.batch_size == 4
+    # The timeout is the time to fill up the rest of the batch.
+    assert tuner.timeout_s == pytest.approx(0.03)
+
+    # Batches that miss the SLO halve the batch size.
+    tuner.batch_size = 16
+    tuner.record_batch(16, queue_wait_s=0.5, execution_s=0.6)
+    assert tuner.batch_size == 8
+    for _ in range(10):
+        tuner.record_batch(tuner.batch_size, queue_wait_s=0.5, execution_s=0.6)
+    assert tuner.batch_size == 1
+
+
+@pytest.mark.asyncio
+async def test_adaptive_batching():
+    @serve.batch(max_batch_size=16, batch_wait_timeout_s=0.1, latency_slo_s=1)
+    async def func(requests):
+        return requests
+
+    results = await asyncio.gather(*[func(i) for i in range(100)])
+    assert results == list(range(100))
+
+
 if __name__ == "__main__":
     import sys
 
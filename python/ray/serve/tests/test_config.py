@@ -250,6 +250,15 @@ def test_zero_default_proto():
     default_downscale_delay_s = AutoscalingConfig().downscale_delay_s
     assert new_delay_s != default_downscale_delay_s
 
+    # Options unset in the proto get their default value.
+    proto = config.to_proto()
+    proto.autoscaling_config.ClearField("forecast_horizon_s")
+    deserialized_config = DeploymentConfig.from_proto(proto)
+    assert (
+        deserialized_config.autoscaling_config.forecast_horizon_s
+        == AutoscalingConfig().forecast_horizon_s
+    )
+
 
 if __name__ == "__main__":
     import sys
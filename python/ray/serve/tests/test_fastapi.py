@@ -480,6 +480,37 @@ def test_fastapi_multiple_headers(serve_instance):
     assert resp.cookies.get_dict() == {"a": "b", "c": "d"}
 
 
+def test_fastapi_server_sent_events(serve_instance):
+    app = FastAPI()
+    signal = SignalActor.remote()
+
+    @app.get("/")
+    def events():
+        async def event_stream():
+            yield "data: 1\n\n"
+            await signal.wait.remote()
+            yield "data: 2\n\n"
+
+        return starlette.responses.StreamingResponse(
+            event_stream(), media_type="text/event-stream"
+        )
+
+    @serve.deployment(name="f")
+    @serve.ingress(app)
+    class FastAPIApp:
+        pass
+
+    FastAPIApp.deploy()
+
+    # The first event arrives before the stream completes.
+    resp = requests.get("http://localhost:8000/f", stream=True)
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    lines = resp.iter_lines(decode_unicode=True)
+    assert next(lines) == "data: 1"
+    ray.get(signal.send.remote())
+    assert [line for line in lines if line] == ["data: 2"]
+
+
 def test_fastapi_nested_field_in_response_model(serve_instance):
     # https://github.com/ray-project/ray/issues/16757
     class TestModel(BaseModel):
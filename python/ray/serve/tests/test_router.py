@@ -3,12 +3,19 @@ Unit tests for the router class. Please don't add any test that will involve
 controller or the actual replica wrapper, use mock if necessary.
 """
 import asyncio
+import time
 
 import pytest
 
 import ray
 from ray.serve.common import RunningReplicaInfo
-from ray.serve.router import Query, ReplicaSet, RequestMetadata
+from ray.serve.router import (
+    PowerOfTwoChoicesReplicaSchedulingPolicy,
+    Query,
+    ReplicaSet,
+    RequestMetadata,
+    RoundRobinReplicaSchedulingPolicy,
+)
 from ray._private.test_utils import SignalActor
 
 pytestmark = pytest.mark.asyncio
@@ -137,6 +144,122 @@ async def test_replica_set(ray_instance):
     assert num_queries_set == {2, 1}
 
 
+async def test_replica_set_many_queued_queries(ray_instance):
+    signal = SignalActor.remote()
+
+    @ray.remote(num_cpus=0)
+    class MockWorker:
+        @ray.method(num_returns=2)
+        async def handle_request(self, request):
+            await signal.wait.remote()
+            return b"", "DONE"
+
+    rs = ReplicaSet("my_deployment", asyncio.get_event_loop())
+    replica = RunningReplicaInfo(
+        deployment_name="my_deployment",
+        replica_tag="0",
+        actor_handle=MockWorker.remote(),
+        max_concurrent_queries=2,
+    )
+    rs.update_running_replicas([replica])
+    query = Query([], {}, RequestMetadata("request-id", "endpoint"))
+
+    async def send():
+        return await (await rs.assign_replica(query))
+
+    tasks = [asyncio.get_event_loop().create_task(send()) for _ in range(200)]
+    await asyncio.sleep(0.5)
+    assert rs.num_queued_queries == 198
+
+    # A cancelled query must pass its turn on to the next one.
+    tasks[100].cancel()
+    # Each completed query frees a slot for the next queued query, without
+    # polling the in-flight queries.
+    await signal.send.remote()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert isinstance(results[100], asyncio.CancelledError)
+    assert results[:100] + results[101:] == ["DONE"] * 199
+    assert rs.num_queued_queries == 0
+    # The tracker refs may complete just after the user refs.
+    start = time.time()
+    while rs.in_flight_queries[replica] and time.time() - start < 10:
+        await asyncio.sleep(0.1)
+    assert len(rs.in_flight_queries[replica]) == 0
+
+
+def make_replica_infos(node_ids):
+    return [
+        RunningReplicaInfo(
+            deployment_name="my_deployment",
+            replica_tag=str(i),
+            actor_handle=None,
+            max_concurrent_queries=10,
+            node_id=node_id,
+        )
+        for i, node_id in enumerate(node_ids)
+    ]
+
+
+async def test_round_robin_policy():
+    replicas = make_replica_infos(["a", "b", "c"])
+    policy = RoundRobinReplicaSchedulingPolicy()
+    policy.update_replicas(replicas)
+    query = Query([], {}, RequestMetadata("request-id", "endpoint"))
+    first = list(policy.rank_replicas(query, lambda r: 0))
+    second = list(policy.rank_replicas(query, lambda r: 0))
+    assert sorted(first, key=lambda r: r.replica_tag) == replicas
+    assert first == second
+
+
+async def test_power_of_two_choices_policy():
+    replicas = make_replica_infos(["a", "b"])
+    policy = PowerOfTwoChoicesReplicaSchedulingPolicy(node_id="c")
+    policy.update_replicas(replicas)
+    query = Query([], {}, RequestMetadata("request-id", "endpoint"))
+
+    # The replica with fewer in-flight queries is tried first.
+    in_flight = {replicas[0]: 5, replicas[1]: 1}
+    for _ in range(10):
+        ranked = list(policy.rank_replicas(query, in_flight.get))
+        assert ranked == [replicas[1], replicas[0]]
+
+    # A slow replica is tried later, even with fewer in-flight queries.
+    policy.on_query_completed(replicas[0], 0.01)
+    policy.on_query_completed(replicas[1], 1.0)
+    for _ in range(10):
+        ranked = list(policy.rank_replicas(query, in_flight.get))
+        assert ranked == [replicas[0], replicas[1]]
+
+    # All of the replicas are eventually tried.
+    replicas = make_replica_infos(["a"] * 5)
+    policy.update_replicas(replicas)
+    ranked = list(policy.rank_replicas(query, lambda r: 0))
+    assert sorted(ranked, key=lambda r: r.replica_tag) == replicas
+
+
+async def test_power_of_two_choices_policy_locality():
+    replicas = make_replica_infos(["a", "b", "b", "c"])
+    policy = PowerOfTwoChoicesReplicaSchedulingPolicy(node_id="b")
+    policy.update_replicas(replicas)
+    query = Query([], {}, RequestMetadata("request-id", "endpoint"))
+
+    # The replicas on the same node are tried first, even when busier.
+    in_flight = {replicas[0]: 0, replicas[1]: 3, replicas[2]: 2, replicas[3]: 0}
+    for _ in range(10):
+        ranked = list(policy.rank_replicas(query, in_flight.get))
+        assert ranked[:2] == [replicas[2], replicas[1]]
+        assert set(ranked[2:]) == {replicas[0], replicas[3]}
+
+    policy = PowerOfTwoChoicesReplicaSchedulingPolicy(
+        prefer_local_node=False, node_id="b"
+    )
+    policy.update_replicas(replicas)
+    ranked_first = {
+        list(policy.rank_replicas(query, in_flight.get))[0] for _ in range(100)
+    }
+    assert replicas[0] in ranked_first or replicas[3] in ranked_first
+
+
 if __name__ == "__main__":
     import sys
 
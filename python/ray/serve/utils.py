@@ -42,7 +42,7 @@ def parse_request_item(request_item):
         if request_item.metadata.http_arg_is_pickled:
             assert isinstance(arg, bytes)
             arg: HTTPRequestWrapper = pickle.loads(arg)
-            return (build_starlette_request(arg.scope, arg.body),), {}
+            return (build_starlette_request(arg.scope, arg.body, arg.body_stream),), {}
 
     return request_item.args, request_item.kwargs
 